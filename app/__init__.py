@@ -1,11 +1,36 @@
 """
 This is import of the app
+
+Exports are resolved lazily (PEP 562) so that `from app import logger` does
+not pull in settings validation, SQLModel or the database engine.
 """
-from .config.settings import settings
-from .config.logging import logger
-from .database import (get_session, BusinessCreation, Project_Creation, User,
-                       BusinessCreationRepository, UserCreationRepository)  
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "settings": ".config.settings",
+    "logger": ".config.logging",
+    "get_session": ".database",
+    "BusinessCreation": ".database",
+    "Project_Creation": ".database",
+    "User": ".database",
+    "BusinessCreationRepository": ".database",
+    "UserCreationRepository": ".database",
+}
 
 __all__ = ["settings", "logger", "get_session", "BusinessCreation",
            "Project_Creation", "User",
-           "BusinessCreationRepository", "UserCreationRepository"]
\ No newline at end of file
+           "BusinessCreationRepository", "UserCreationRepository"]
+
+
+def __getattr__(name):
+    """Import the backing module on first access of an exported name."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,68 @@
+"""
+Deadlines of MCP tool calls.
+
+A caller that only waits so long for a tool can say so, and the upstream
+requests the tool makes then get only the time that is left of it (see
+app.services.deadlines). The deadline is taken from, in order:
+
+1. `timeout` (seconds) in the `_meta` of the tools/call request
+2. the X-Request-Timeout header (seconds) of the HTTP request
+3. TOOL_CALL_TIMEOUT_SECONDS from settings (0 = no deadline)
+
+Cancelling a tool call (notifications/cancelled, or the client going away)
+cancels its handler task and with it the aiohttp requests in flight, which
+closes their connections and frees their pool and concurrency slots.
+"""
+from typing import Any, Optional
+
+from fastmcp import FastMCP
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.deadlines import deadline
+
+logger = get_logger("app.api.deadline")
+
+TIMEOUT_META_KEY = "timeout"
+TIMEOUT_HEADER = "x-request-timeout"
+
+
+def _seconds(value: Any) -> Optional[float]:
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        logger.warning("Ignoring invalid tool call timeout: %r", value)
+        return None
+    return seconds if seconds > 0 else None
+
+
+def _request_meta(context: MiddlewareContext) -> dict:
+    request_context = getattr(context.fastmcp_context, "request_context", None)
+    meta = getattr(request_context, "meta", None)
+    if meta is not None and not isinstance(meta, dict):
+        meta = meta.model_dump()
+    return meta or {}
+
+
+def tool_call_timeout(context: MiddlewareContext) -> Optional[float]:
+    """Seconds the caller of this tool call is willing to wait, or None."""
+    value = _request_meta(context).get(TIMEOUT_META_KEY)
+    if value is None:
+        value = get_http_headers(include={TIMEOUT_HEADER}).get(TIMEOUT_HEADER)
+    if value is None:
+        value = setting("TOOL_CALL_TIMEOUT_SECONDS", 0.0)
+    return _seconds(value)
+
+
+class DeadlineMiddleware(Middleware):
+    """Run every tool call under the deadline its caller asked for."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        with deadline(tool_call_timeout(context)):
+            return await call_next(context)
+
+
+def register_deadlines(mcp: FastMCP) -> None:
+    mcp.add_middleware(DeadlineMiddleware())
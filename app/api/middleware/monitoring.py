@@ -1,4 +1,83 @@
 """
-monitoring.py - Auto-generated
-Implement your logic here
+Monitoring middleware for the MCP servers.
+
+- ToolMetricsMiddleware: per-tool latency and error counts for every call
+- ToolTracingMiddleware: root span of each tool call when tracing is enabled
+- register_metrics(): installs the metrics middleware and a GET /metrics route
+- register_tracing(): configures tracing and installs the tracing middleware
 """
+import time
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from app.services import tracing_service
+from app.services.monitoring_service import TOOL_CALL_SECONDS, TOOL_CALLS, render_metrics
+
+
+def _is_error_result(result) -> bool:
+    """Tools report most failures as {"success": False, ...} instead of raising."""
+    structured = getattr(result, "structured_content", None)
+    if isinstance(structured, dict):
+        inner = structured.get("result", structured)
+        return isinstance(inner, dict) and inner.get("success") is False
+    return False
+
+
+class ToolMetricsMiddleware(Middleware):
+    """Record latency and outcome of every MCP tool call."""
+
+    def __init__(self, server_name: str):
+        self.server_name = server_name
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        tool_name = context.message.name
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await call_next(context)
+            outcome = "error" if _is_error_result(result) else "success"
+            return result
+        finally:
+            TOOL_CALL_SECONDS.labels(self.server_name, tool_name).observe(
+                time.perf_counter() - start
+            )
+            TOOL_CALLS.labels(self.server_name, tool_name, outcome).inc()
+
+
+class ToolTracingMiddleware(Middleware):
+    """Open the root span of every MCP tool call."""
+
+    def __init__(self, server_name: str):
+        self.server_name = server_name
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        if not tracing_service.tracing_enabled():
+            return await call_next(context)
+
+        tool_name = context.message.name
+        with tracing_service.span(
+            f"tool {tool_name}", **{"mcp.server": self.server_name, "mcp.tool": tool_name}
+        ) as span:
+            result = await call_next(context)
+            if _is_error_result(result):
+                span.set_attribute("mcp.tool.outcome", "error")
+            return result
+
+
+def register_metrics(mcp: FastMCP, server_name: str) -> None:
+    """Instrument tool calls on `mcp` and expose GET /metrics on HTTP transports."""
+    from starlette.responses import Response
+
+    mcp.add_middleware(ToolMetricsMiddleware(server_name))
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics(request) -> Response:
+        payload, content_type = render_metrics()
+        return Response(payload, media_type=content_type)
+
+
+def register_tracing(mcp: FastMCP, server_name: str) -> None:
+    """Configure tracing from settings and trace tool calls on `mcp`."""
+    tracing_service.setup_tracing(server_name)
+    mcp.add_middleware(ToolTracingMiddleware(server_name))
@@ -0,0 +1,23 @@
+"""
+Request priority of MCP tool calls.
+
+Tool calls are made by agents waiting on the answer, so the upstream
+requests they make run as interactive (see app.services.scheduling): they
+are served ahead of bulk jobs and may use the slots reserved for them.
+"""
+from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from app.services.scheduling import INTERACTIVE, request_priority
+
+
+class InteractivePriorityMiddleware(Middleware):
+    """Run every tool call with interactive request priority."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        with request_priority(INTERACTIVE):
+            return await call_next(context)
+
+
+def register_request_priority(mcp: FastMCP) -> None:
+    mcp.add_middleware(InteractivePriorityMiddleware())
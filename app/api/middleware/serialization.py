@@ -0,0 +1,68 @@
+"""
+Tool result serialisation for the MCP servers.
+
+FastMCP turns a tool's dict result into a ToolResult by walking it with
+pydantic twice (once against the return annotation, once again inside
+ToolResult) and encoding the text content separately. Our tools return
+dicts that came straight out of the JSON decoder, so that work is
+redundant: `register_fast_tool_results()` makes every tool registered on
+the server return a ready-built ToolResult, encoded once with the
+configured JSON backend.
+"""
+import functools
+import inspect
+
+from fastmcp import FastMCP
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+
+from app.utils import json_backend
+
+
+def json_tool_result(data: dict):
+    """
+    Build the ToolResult for a plain JSON dict, or return `data` unchanged
+    when it holds values the JSON backend cannot encode natively (FastMCP's
+    own conversion then applies).
+    """
+    try:
+        text = json_backend.dumps_strict(data)
+    except (TypeError, ValueError):
+        return data
+    return ToolResult.model_construct(
+        content=[TextContent(type="text", text=text)],
+        structured_content=data,
+        meta=None,
+        is_error=False,
+    )
+
+
+def _fast_results(fn):
+    if not inspect.iscoroutinefunction(fn):
+        return fn
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        result = await fn(*args, **kwargs)
+        if type(result) is dict:
+            return json_tool_result(result)
+        return result
+
+    return wrapper
+
+
+def register_fast_tool_results(mcp: FastMCP) -> None:
+    """
+    Wrap tools registered through `mcp.tool` so dict results skip FastMCP's
+    re-serialisation. Signatures, docstrings and output schemas are kept.
+    """
+    register_tool = mcp.tool
+
+    @functools.wraps(register_tool)
+    def tool(name_or_fn=None, **kwargs):
+        if callable(name_or_fn):
+            return register_tool(_fast_results(name_or_fn), **kwargs)
+        decorator = register_tool(name_or_fn, **kwargs)
+        return lambda fn: decorator(_fast_results(fn))
+
+    mcp.tool = tool
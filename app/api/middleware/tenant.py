@@ -0,0 +1,123 @@
+"""
+Tenant selection for the MCP servers.
+
+When TENANTS_FILE lists more than the default tenant, every tool call runs
+with the credentials of one tenant, picked in this order:
+
+1. a `tenant_id` argument on the call (advertised as an optional
+   parameter on every tool)
+2. the tenant chosen for the MCP session with the `select_tenant` tool
+   (clients on the stateless protocol have no session and should use 1 or 3)
+3. the X-Tenant-Id header of the HTTP request (HTTP transports)
+4. the default tenant from settings
+
+The client managers read the selection from
+`app.services.tenant_service.current_tenant()`.
+"""
+from typing import Optional
+
+from fastmcp import Context, FastMCP
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from app.api.middleware.serialization import json_tool_result
+from app.services.tenant_service import (UnknownTenantError, get_tenant_registry, reset_tenant,
+                                         tenants_file, use_tenant)
+
+TENANT_ARGUMENT = "tenant_id"
+TENANT_HEADER = "x-tenant-id"
+SESSION_STATE_KEY = "tenant_id"
+SELECT_TENANT_TOOL = "select_tenant"
+
+_TENANT_PARAMETER = {
+    "type": "string",
+    "description": "Tenant to act for; defaults to the tenant selected for this session.",
+}
+
+
+def _unknown_tenant(tenant_id: str):
+    return json_tool_result({
+        "success": False,
+        "error": f"Unknown tenant: {tenant_id}",
+        "tenants": get_tenant_registry().ids(),
+    })
+
+
+class TenantMiddleware(Middleware):
+    """Run each tool call with the credentials of the selected tenant."""
+
+    async def on_list_tools(self, context: MiddlewareContext, call_next):
+        tools = await call_next(context)
+        advertised = []
+        for tool in tools:
+            properties = tool.parameters.get("properties", {})
+            if tool.name == SELECT_TENANT_TOOL or TENANT_ARGUMENT in properties:
+                advertised.append(tool)
+                continue
+            parameters = {**tool.parameters,
+                          "properties": {**properties, TENANT_ARGUMENT: _TENANT_PARAMETER}}
+            advertised.append(tool.model_copy(update={"parameters": parameters}))
+        return advertised
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        message = context.message
+        tenant_id: Optional[str] = None
+        if message.name != SELECT_TENANT_TOOL and TENANT_ARGUMENT in (message.arguments or {}):
+            arguments = dict(message.arguments)
+            tenant_id = arguments.pop(TENANT_ARGUMENT)
+            context = context.copy(message=message.model_copy(update={"arguments": arguments}))
+        if not tenant_id and context.fastmcp_context is not None:
+            tenant_id = await context.fastmcp_context.get_state(SESSION_STATE_KEY)
+        if not tenant_id:
+            tenant_id = get_http_headers(include={TENANT_HEADER}).get(TENANT_HEADER)
+
+        try:
+            tenant = get_tenant_registry().get(tenant_id)
+        except UnknownTenantError:
+            return _unknown_tenant(tenant_id)
+
+        token = use_tenant(tenant)
+        try:
+            return await call_next(context)
+        finally:
+            reset_tenant(token)
+
+
+def register_tenancy(mcp: FastMCP) -> None:
+    """
+    Install tenant selection on `mcp` when TENANTS_FILE is configured;
+    single-tenant servers are left unchanged.
+    """
+    if not tenants_file():
+        return
+
+    mcp.add_middleware(TenantMiddleware())
+
+    @mcp.tool(
+        name=SELECT_TENANT_TOOL,
+        description=(
+            "Selects the tenant (AiSensy partner/business/project credentials) "
+            "used by the following tool calls of this session."
+        ),
+        tags={"tenant", "session"},
+    )
+    async def select_tenant(tenant_id: str, ctx: Context) -> dict:
+        """
+        Select the tenant for this MCP session.
+
+        Args:
+            tenant_id: One of the configured tenant ids
+
+        Returns:
+            Dict containing success, and the tenant's ids or the known tenants
+        """
+        registry = get_tenant_registry()
+        try:
+            tenant = registry.get(tenant_id)
+        except UnknownTenantError:
+            return {"success": False, "error": f"Unknown tenant: {tenant_id}",
+                    "tenants": registry.ids()}
+        await ctx.set_state(SESSION_STATE_KEY, tenant.tenant_id)
+        return {"success": True, "data": {"tenant_id": tenant.tenant_id,
+                                          "partner_id": tenant.partner_id,
+                                          "business_id": tenant.business_id}}
@@ -0,0 +1,47 @@
+"""
+WhatsApp Flows data-exchange endpoint.
+
+POST /flows/data-exchange   encrypted INIT / BACK / data_exchange / ping requests
+
+Decryption, dispatch to the registered screen handlers and encryption of
+the response are done by app.services.flow_service; this only checks the
+request signature (X-Hub-Signature-256 with WEBHOOK_SECRET, when set) and
+maps the outcome to the status codes WhatsApp expects.
+"""
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import PlainTextResponse
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.flow_service import DECRYPTION_FAILED, INVALID_SIGNATURE, handle_exchange
+from app.services.monitoring_service import record_flow_request
+from app.services.webhook_service import SIGNATURE_HEADER, signature_valid
+from app.utils import json_backend
+
+logger = get_logger("app.flows")
+
+router = APIRouter(prefix="/flows", tags=["flows"])
+
+
+@router.post("/data-exchange")
+async def data_exchange(request: Request) -> Response:
+    body = await request.body()
+
+    secret = setting("WEBHOOK_SECRET", "")
+    if secret and not signature_valid(body, request.headers.get(SIGNATURE_HEADER), secret):
+        logger.warning("Flow request with invalid signature refused")
+        record_flow_request("invalid_signature", "unknown", 0.0)
+        return Response(status_code=INVALID_SIGNATURE)
+
+    try:
+        payload = json_backend.loads(body)
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        record_flow_request("decryption_failed", "unknown", 0.0)
+        return Response(status_code=DECRYPTION_FAILED)
+
+    status, text = await handle_exchange(payload)
+    if status != 200:
+        return Response(status_code=status)
+    return PlainTextResponse(text)
@@ -0,0 +1,75 @@
+"""
+AiSensy webhook receiver.
+
+GET  /webhooks/aisensy   subscription handshake (hub.mode, hub.verify_token, hub.challenge)
+POST /webhooks/aisensy   delivery of statuses and inbound messages
+
+Deliveries are only checked, parsed and buffered here; they are written to
+Postgres in batches by app.services.webhook_service.WebhookBuffer, so the
+acknowledgement never waits for the database. Inbound messages also open
+their sender's conversation window (app.services.conversation_window).
+"""
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.conversation_window import get_conversation_windows
+from app.services.monitoring_service import record_webhook_request
+from app.services.webhook_service import (SIGNATURE_HEADER, get_webhook_buffer, parse_events,
+                                          signature_valid)
+from app.utils import json_backend
+
+logger = get_logger("app.webhooks")
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+
+def _refuse(status_code: int, error: str, outcome: str, **headers) -> JSONResponse:
+    record_webhook_request(outcome)
+    return JSONResponse({"success": False, "error": error}, status_code=status_code,
+                        headers=headers or None)
+
+
+@router.get("/aisensy")
+async def verify_subscription(
+    mode: str = Query("", alias="hub.mode"),
+    verify_token: str = Query("", alias="hub.verify_token"),
+    challenge: str = Query("", alias="hub.challenge"),
+) -> Response:
+    expected = setting("WEBHOOK_VERIFY_TOKEN", "")
+    if mode != "subscribe" or not expected or verify_token != expected:
+        logger.warning("Webhook subscription verification refused")
+        return PlainTextResponse("Verification failed", status_code=403)
+    return PlainTextResponse(challenge)
+
+
+@router.post("/aisensy")
+async def receive_webhook(request: Request) -> Response:
+    body = await request.body()
+
+    secret = setting("WEBHOOK_SECRET", "")
+    if secret:
+        if not signature_valid(body, request.headers.get(SIGNATURE_HEADER), secret):
+            logger.warning("Webhook with invalid signature refused")
+            return _refuse(401, "Invalid signature", "invalid_signature")
+    elif not setting("WEBHOOK_ALLOW_UNSIGNED", False):
+        logger.error("WEBHOOK_SECRET is not set; refusing unsigned webhook")
+        return _refuse(401, "Webhook signature cannot be verified", "invalid_signature")
+
+    try:
+        payload = json_backend.loads(body)
+    except ValueError:
+        return _refuse(400, "Invalid JSON payload", "invalid_payload")
+
+    statuses, messages = parse_events(payload)
+    if not get_webhook_buffer().add(statuses, messages):
+        logger.warning("Webhook buffer is full; asking for redelivery")
+        return _refuse(503, "Webhook buffer is full", "rejected", **{"Retry-After": "5"})
+
+    windows = get_conversation_windows()
+    for message in messages:
+        windows.record_inbound(message["from_number"], message["timestamp"])
+
+    record_webhook_request("accepted")
+    return JSONResponse({"success": True, "received": len(statuses) + len(messages)})
@@ -0,0 +1,44 @@
+"""
+ASGI app of the webhook receiver (run by mcp_servers/webhook_server.py),
+which also serves the WhatsApp Flows data-exchange endpoint.
+
+Imports the flow handler modules (FLOW_HANDLER_MODULES) and starts the
+webhook buffer's batch writer with the app, drains it (and waits for the
+conversation windows still being saved) on shutdown, and serves the Prometheus metrics at
+GET /metrics.
+"""
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
+
+from app.api.v1.endpoints.flows import router as flows_router
+from app.api.v1.endpoints.webhooks import router as webhooks_router
+from app.services.conversation_window import get_conversation_windows
+from app.services.flow_service import load_flow_handlers
+from app.services.monitoring_service import render_metrics
+from app.services.webhook_service import get_webhook_buffer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    load_flow_handlers()
+    buffer = get_webhook_buffer()
+    await buffer.start()
+    try:
+        yield
+    finally:
+        await buffer.stop()
+        await get_conversation_windows().flush()
+
+
+def create_webhook_app() -> FastAPI:
+    app = FastAPI(title="AiSensy webhook receiver", lifespan=lifespan)
+    app.include_router(webhooks_router)
+    app.include_router(flows_router)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        payload, content_type = render_metrics()
+        return Response(payload, media_type=content_type)
+
+    return app
@@ -2,8 +2,21 @@
 __init__.py - Auto-generated
 Implement your logic here
 """
+from importlib import import_module
 
-from .settings import settings  # settings.py not setting.py
-from .logging import logger
+_LAZY_EXPORTS = {
+    "settings": ".settings",  # settings.py not setting.py
+    "logger": ".logging",
+}
 
-__all__ = ["settings", "logger"]
\ No newline at end of file
+__all__ = ["settings", "logger"]
+
+
+def __getattr__(name):
+    """Import the backing module on first access of an exported name."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,49 +1,185 @@
 # logging_config.py
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Flag to prevent multiple initializations
 _logging_initialized = False
 
+# Background writer draining the log queue (set by setup_logging)
+_listener = None
 
-def setup_logging(log_level=logging.INFO):
+
+class RateLimitFilter(logging.Filter):
+    """
+    Sample repetitive messages.
+
+    Records are keyed by logger, level and the *unformatted* message template,
+    so `logger.warning("API error: %s - %s", status, text)` counts as one
+    message whatever the arguments. Each key may emit `burst` records per
+    `period` seconds; the rest are dropped and counted, and the first record
+    after the window rolls over reports how many were suppressed.
+
+    Expired windows are swept once per period so one-off messages do not
+    accumulate; a window with suppressed records is kept one period longer
+    so its count can still be reported.
+    """
+
+    def __init__(self, burst: int = 20, period: float = 60.0):
+        super().__init__()
+        self.burst = burst
+        self.period = period
+        self._windows = {}
+        self._next_sweep = time.monotonic() + period
+        self._lock = threading.Lock()
+
+    def _sweep(self, now: float) -> None:
+        self._windows = {
+            key: window for key, window in self._windows.items()
+            if now - window[0] < (2 * self.period if window[2] else self.period)
+        }
+        self._next_sweep = now + self.period
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.burst <= 0:
+            return True
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window is not None else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.burst:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                return False
+        if suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} similar messages suppressed]"
+            record.args = ()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as a single JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "file": record.filename,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves `%`-formatting to the writer thread.
+
+    The stock `prepare()` renders the message and traceback on the calling
+    thread (the event loop); here the record is enqueued untouched and the
+    handlers on the listener thread do all formatting and I/O.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def parse_logger_levels(spec: str) -> dict:
+    """
+    Parse per-logger levels, e.g. "direct_api_mcp.clients=WARNING,aiohttp=ERROR".
+    """
+    levels = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.partition("=")
+        if not sep or not name.strip():
+            continue
+        levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return {name: level for name, level in levels.items() if isinstance(level, int)}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Named logger for hot-path modules.
+
+    Records propagate to the root pipeline; naming them lets LOG_LEVELS gate
+    a module (e.g. keep client DEBUG off in production) independently.
+    """
+    return logging.getLogger(name)
+
+
+def _logging_options() -> dict:
+    from .settings import setting
+
+    # log_level is the one lowercase setting; its environment variable is LOG_LEVEL
+    level = setting("log_level", "") or setting("LOG_LEVEL", "INFO")
+    return {
+        "log_level": logging.getLevelName(str(level).upper()),
+        "logger_levels": setting("LOG_LEVELS", ""),
+        "json_output": setting("LOG_JSON", False),
+        "rate_limit_burst": setting("LOG_RATE_LIMIT_BURST", 20),
+        "rate_limit_period": setting("LOG_RATE_LIMIT_PERIOD", 60.0),
+    }
+
+
+def setup_logging(log_level=logging.INFO, logger_levels: str = "", json_output: bool = False,
+                  rate_limit_burst: int = 20, rate_limit_period: float = 60.0):
     """
     Set up logging with daily folder structure.
     Structure: logs/2024-11-30/application.log
+
+    The root logger only gets a QueueHandler; the console and file handlers
+    run on a QueueListener background thread so writes never block callers.
     """
-    global _logging_initialized
-    
+    global _logging_initialized, _listener
+
     # Skip if already initialized
     if _logging_initialized:
         return logging.getLogger()
-    
+
+    if not isinstance(log_level, int):
+        log_level = logging.INFO
+
     # Create base logs directory
     base_log_dir = Path("logs")
     base_log_dir.mkdir(exist_ok=True)
-    
+
     # Create daily folder (e.g., logs/2024-11-30/)
     daily_folder = base_log_dir / datetime.now().strftime('%Y-%m-%d')
     daily_folder.mkdir(exist_ok=True)
-    
+
     # Define log format
-    log_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    root_logger.handlers.clear()
-    
+    if json_output:
+        log_format = JsonFormatter()
+    else:
+        log_format = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+
     # Console Handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(log_format)
-    root_logger.addHandler(console_handler)
-    
+
     # Application log file
     app_handler = RotatingFileHandler(
         daily_folder / "application.log",
@@ -53,8 +189,7 @@ def setup_logging(log_level=logging.INFO):
     )
     app_handler.setLevel(logging.INFO)
     app_handler.setFormatter(log_format)
-    root_logger.addHandler(app_handler)
-    
+
     # Error log file
     error_handler = RotatingFileHandler(
         daily_folder / "errors.log",
@@ -64,8 +199,7 @@ def setup_logging(log_level=logging.INFO):
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(log_format)
-    root_logger.addHandler(error_handler)
-    
+
     # Debug log file
     debug_handler = RotatingFileHandler(
         daily_folder / "debug.log",
@@ -75,13 +209,78 @@ def setup_logging(log_level=logging.INFO):
     )
     debug_handler.setLevel(logging.DEBUG)
     debug_handler.setFormatter(log_format)
-    root_logger.addHandler(debug_handler)
-    
+
+    # Background writer thread owning all I/O handlers
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue,
+        console_handler, app_handler, error_handler, debug_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    queue_handler = _LazyQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(rate_limit_burst, rate_limit_period))
+
+    # Root logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    # Rebind rather than clear(): the deferred setup handler may be running
+    # from inside Logger.callHandlers(), which is iterating the old list.
+    root_logger.handlers = [queue_handler]
+
+    # Per-logger gating: disabled levels are rejected before the record
+    # (or its message) is ever built.
+    for name, level in parse_logger_levels(logger_levels).items():
+        logging.getLogger(name).setLevel(level)
+
     _logging_initialized = True
-    logging.debug(f"Logging initialized - Directory: {daily_folder.absolute()}")
-    
+    logging.debug("Logging initialized - Directory: %s", daily_folder.absolute())
+
+    return root_logger
+
+
+def shutdown_logging() -> None:
+    """Flush the queue and stop the background writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+class _DeferredSetupHandler(logging.Handler):
+    """
+    Placeholder root handler that runs `setup_logging()` on the first record.
+
+    Importing the logger is on every server's startup path; creating the log
+    directories and opening the rotating files is postponed until something
+    is actually logged.
+    """
+
+    def handle(self, record):
+        root_logger = setup_logging(**_logging_options())
+        for handler in root_logger.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):  # pragma: no cover - handle() is overridden
+        pass
+
+
+def _install_deferred_setup():
+    """Return the root logger with a deferred setup handler attached."""
+    root_logger = logging.getLogger()
+    if not _logging_initialized and not any(
+        isinstance(h, _DeferredSetupHandler) for h in root_logger.handlers
+    ):
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(_DeferredSetupHandler())
     return root_logger
 
 
-# Initialize logging
-logger = setup_logging()
\ No newline at end of file
+# Initialize logging (handlers are created lazily on the first record)
+logger = _install_deferred_setup()
@@ -4,6 +4,10 @@ Implement your logic here
 """
 
 
+import os
+from functools import lru_cache
+from typing import Any
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -22,6 +26,14 @@ class Settings(BaseSettings):
     BUSINESS_ID:str
     BASE_URL:str
     Direct_BASE_URL:str
+    AISENSY_BEARER_TOKEN:str=""   # Direct API JWT (see /users/regenrate-token)
+    AISENSY_PROJECT_API_PWD:str=""   # sent as X-AiSensy-Project-API-Pwd when regenerating the JWT
+
+    #tenants (JSON file of extra tenant credentials, see app/services/tenant_service.py)
+    TENANTS_FILE:str=""
+    TENANT_POOL_SIZE:int=256         # tenants whose clients are kept per client manager
+    TENANT_IDLE_SECONDS:float=900    # unused tenant clients are closed after this long
+    HTTP_POOL_LIMIT:int=200          # connections shared by all clients of a server
 
     #database postgres
     db_host:str
@@ -44,6 +56,99 @@ class Settings(BaseSettings):
 
     #logging
     log_level:str
+    LOG_LEVELS:str=""           # per-logger levels, e.g. "direct_api_mcp.clients=WARNING"
+    LOG_JSON:bool=False
+    LOG_RATE_LIMIT_BURST:int=20  # identical messages allowed per period (0 disables)
+    LOG_RATE_LIMIT_PERIOD:float=60.0
+
+    #metrics (Prometheus /metrics exporter for stdio transport, 0 = disabled)
+    ONBOARDING_METRICS_PORT:int=0
+    DIRECT_API_METRICS_PORT:int=0
+
+    #JSON backend for upstream payloads and tool results ("auto", "orjson" or "stdlib")
+    JSON_BACKEND:str="auto"
+
+    #tracing (OpenTelemetry; exporter "otlp", "console", "memory" or empty = disabled)
+    TRACING_EXPORTER:str=""
+    TRACING_SAMPLE_RATIO:float=0.05
+    OTEL_EXPORTER_OTLP_ENDPOINT:str=""   # e.g. http://localhost:4318/v1/traces
+
+    #circuit breakers (per upstream endpoint group)
+    CIRCUIT_BREAKER_ENABLED:bool=True
+    CIRCUIT_ERROR_RATE:float=0.5          # failed share of recent calls that opens the circuit
+    CIRCUIT_SLOW_CALL_SECONDS:float=10.0  # calls slower than this count as slow
+    CIRCUIT_SLOW_CALL_RATE:float=0.8      # slow share of recent calls that opens the circuit
+    CIRCUIT_OPEN_SECONDS:float=30.0       # how long to fail fast before probing again
+
+    #adaptive concurrency limits (per upstream service)
+    ADAPTIVE_CONCURRENCY_ENABLED:bool=True
+    CONCURRENCY_INITIAL_LIMIT:int=32
+    CONCURRENCY_MIN_LIMIT:int=4
+    CONCURRENCY_MAX_LIMIT:int=0           # 0 = HTTP_POOL_LIMIT
+    CONCURRENCY_LATENCY_TOLERANCE:float=2.0  # recent/long-term latency ratio that backs off
+    INTERACTIVE_RESERVED_SHARE:float=0.2  # share of the limit kept for interactive tool calls
+
+    #cached lookups (stale-while-revalidate / stale-if-error)
+    RESPONSE_CACHE_ENABLED:bool=True
+    RESPONSE_CACHE_MAX_ENTRIES:int=1024   # per cached client method
+
+    #hedged reads (get_template_by_id, get_project_by_id, get_phone_number)
+    HEDGING_ENABLED:bool=False
+    HEDGE_BUDGET_RATIO:float=0.05         # extra upstream requests hedging may add
+
+    #deadline of tool calls whose caller sends none (0 = no deadline)
+    TOOL_CALL_TIMEOUT_SECONDS:float=0.0
+
+    #webhook receiver (app/api/webhook_app.py, see app/services/webhook_service.py)
+    WEBHOOK_SECRET:str=""                 # app secret the X-Hub-Signature-256 header is checked with
+    WEBHOOK_VERIFY_TOKEN:str=""           # hub.verify_token of the subscription handshake
+    WEBHOOK_ALLOW_UNSIGNED:bool=False     # accept deliveries when no WEBHOOK_SECRET is set
+    WEBHOOK_HOST:str="0.0.0.0"
+    WEBHOOK_PORT:int=8090
+    WEBHOOK_BATCH_SIZE:int=1000           # events per database insert
+    WEBHOOK_FLUSH_SECONDS:float=0.5       # longest time an event waits before being written
+    WEBHOOK_MAX_BUFFERED:int=100000       # events held in memory before deliveries get 503
+
+    #24h customer service windows (see app/services/conversation_window.py)
+    CONVERSATION_WINDOW_FILE:str="data/conversation_windows.sqlite3"  # SQLite, shared by webhook receiver and MCP servers
+    CONVERSATION_WINDOW_RETENTION_DAYS:float=30  # closed windows are still refused as "expired" this long
+    CONVERSATION_WINDOW_ENFORCE:bool=False  # refuse free-form sends to recipients with no inbound message on record
+
+    #opt-out / suppression list (see app/services/suppression.py)
+    SUPPRESSION_DB_FILE:str="data/suppression.sqlite3"
+    SUPPRESSION_BLOOM_CAPACITY:int=1000000   # numbers the filter is sized for (grows when exceeded)
+    SUPPRESSION_BLOOM_ERROR_RATE:float=0.001 # share of allowed numbers that need the exact lookup
+
+    #recipient lists (see app/services/recipient_lists.py)
+    DEFAULT_COUNTRY_CODE:str="91"              # country of numbers written without one
+    RECIPIENT_LIST_MAX_IN_MEMORY:int=2000000   # distinct numbers deduplicated in memory before spilling to disk
+
+    #WhatsApp Flows data exchange (see app/services/flow_service.py)
+    FLOW_PRIVATE_KEY_FILE:str=""          # PEM private key of the business public key uploaded to Meta
+    FLOW_PRIVATE_KEY_PASSPHRASE:str=""
+    FLOW_CRYPTO_THREAD_BYTES:int=65536    # encrypted payloads above this are decrypted in a worker thread
+    FLOW_HANDLER_MODULES:str=""           # comma-separated modules registering flow screen handlers
+
+    #QR code images (see app/services/qr_images.py)
+    QR_CACHE_DIR:str="data/qr_codes"      # content-addressed image cache, served as qr://<code>.png/.svg
+    QR_IMAGE_SCALE:int=8                  # pixels per module
+    QR_ERROR_CORRECTION:str="M"           # L, M, Q or H
+
+    #phone number health monitor (see app/services/health_monitor.py)
+    HEALTH_MONITOR_INTERVAL_SECONDS:float=0.0    # background poll interval, e.g. 300; 0 = off (polled on demand)
+    HEALTH_MONITOR_CONCURRENCY:int=8             # upstream requests in flight per poll
+    HEALTH_MONITOR_HISTORY:int=288               # polls kept per number (24h at 5 minutes)
+    HEALTH_MONITOR_WEBHOOK_URL:str=""            # receives {"changes": [...]} when a number's health changes
+
+    #billing records sync (see app/services/billing_sync.py)
+    BILLING_SYNC_INTERVAL_SECONDS:float=0.0      # background sync interval, e.g. 3600; 0 = off (synced on demand)
+    BILLING_SYNC_CONCURRENCY:int=8               # upstream requests in flight per sync
+
+    #partner-wide WCC usage rollup (see app/services/wcc_rollup.py)
+    WCC_ROLLUP_CACHE_DIR:str="data/wcc_usage"    # monthly usage of closed months per project
+    WCC_ROLLUP_CONCURRENCY:int=8                 # upstream requests in flight per report
+    WCC_ROLLUP_CLOSE_DAYS:float=2.0              # days after a month ends before it is closed and cached
+    WCC_EXPORT_DIR:str="data/exports"            # Parquet / Arrow / CSV exports of rollups
 
     #logging Dir
     LOG_DIR:str
@@ -80,4 +185,32 @@ class Settings(BaseSettings):
 
  
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings once, on first use rather than at import time."""
+    return Settings()
+
+
+def setting(name: str, default: Any) -> Any:
+    """
+    Read one setting where incomplete settings must not be fatal (servers
+    started without a full .env, tests): falls back to the environment
+    variable, converted to the type of `default`, and then to `default`.
+    """
+    try:
+        return getattr(get_settings(), name)
+    except Exception:
+        value = os.getenv(name)
+        if value is None or value == "":
+            return default
+        if isinstance(default, bool):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return type(default)(value)
+
+
+def __getattr__(name):
+    # `from app.config.settings import settings` keeps working, but the .env
+    # file is only read and validated when something actually needs it.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,6 +1,6 @@
 from .postgresql_connection import get_session
-from .models import BusinessCreation, Project_Creation, User
-from .postgresql_repositories import BusinessCreationRepository ,UserCreationRepository
+from .models import BusinessCreation, Project_Creation, User, InboundMessage, MessageStatusEvent, BillingRecord
+from .postgresql_repositories import BusinessCreationRepository ,UserCreationRepository, WebhookEventRepository, BillingRecordRepository
 
 
 
@@ -9,4 +9,9 @@ __all__ = ["get_session",
           "Project_Creation", 
           "User",
           "BusinessCreationRepository",
-          "UserCreationRepository"]
\ No newline at end of file
+          "UserCreationRepository",
+          "InboundMessage",
+          "MessageStatusEvent",
+          "WebhookEventRepository",
+          "BillingRecord",
+          "BillingRecordRepository"]
\ No newline at end of file
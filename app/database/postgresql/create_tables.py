@@ -2,11 +2,11 @@ from typing import Annotated
 
 from fastapi import Depends, FastAPI, HTTPException, Query
 from sqlmodel import Field, Session, SQLModel
-from .postgresql_connection import engine
-from .models import User,BusinessCreation, Project_Creation
+from .postgresql_connection import get_engine
+from .models import User,BusinessCreation, Project_Creation, InboundMessage, MessageStatusEvent, BillingRecord
 
 def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(get_engine())
     print("Database and tables created.")
 
 
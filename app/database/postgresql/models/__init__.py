@@ -1,5 +1,7 @@
 from .business_creations import BusinessCreation
 from .project_creation import Project_Creation
 from .user_table import User
+from .webhook_events import InboundMessage, MessageStatusEvent
+from .billing_records import BillingRecord
 
-__all__ = ["BusinessCreation", "Project_Creation", "User"]
\ No newline at end of file
+__all__ = ["BusinessCreation", "Project_Creation", "User", "InboundMessage", "MessageStatusEvent", "BillingRecord"]
@@ -0,0 +1,29 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime, timezone
+from sqlalchemy import Index
+
+
+#Billing record of a project (recharge, plan renewal, message charges), synced from the Partner API
+class BillingRecord(SQLModel, table=True):
+    __tablename__ = "billing_records"
+    __table_args__ = (
+        # High-water mark per project and date-range scans of one project
+        Index("ix_billing_records_project_id_created_at", "project_id", "created_at"),
+        Index("ix_billing_records_month_currency", "month", "currency"),
+    )
+
+    id: str = Field(primary_key=True)   # AiSensy record _id
+    partner_id: Optional[str] = None
+    business_id: Optional[str] = Field(default=None, index=True)
+    project_id: str
+    action: str                         # ADD (credit) or SUBTRACT (spend)
+    amount: float
+    prev_central_balance: Optional[float] = None
+    reason_code: Optional[str] = None
+    message: Optional[str] = None
+    currency: str = ""
+    month: str                          # YYYY-MM of created_at, the monthly grouping key
+    created_at: datetime = Field(index=True)  # UTC
+    updated_at: Optional[datetime] = None
+    synced_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
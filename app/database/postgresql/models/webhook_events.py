@@ -0,0 +1,42 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from sqlalchemy import JSON, Index, UniqueConstraint
+
+
+#Delivery status of an outgoing message (sent, delivered, read, failed), one row per status
+class MessageStatusEvent(SQLModel, table=True):
+    __tablename__ = "message_statuses"
+    __table_args__ = (
+        # Webhook retries deliver the same status again: (message_id, status) is stored once
+        UniqueConstraint("message_id", "status", name="uq_message_statuses_message_id_status"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    message_id: str
+    status: str
+    timestamp: int                      # unix seconds, as sent by WhatsApp
+    recipient_id: Optional[str] = None
+    phone_number_id: Optional[str] = None
+    conversation_id: Optional[str] = None
+    pricing_category: Optional[str] = None
+    errors: Optional[list] = Field(default=None, sa_type=JSON)
+    received_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+#Message received from a WhatsApp user
+class InboundMessage(SQLModel, table=True):
+    __tablename__ = "inbound_messages"
+    __table_args__ = (
+        Index("ix_inbound_messages_from_number_timestamp", "from_number", "timestamp"),
+    )
+
+    message_id: str = Field(primary_key=True)
+    from_number: str
+    timestamp: int = Field(index=True)  # unix seconds, as sent by WhatsApp
+    type: str
+    text: Optional[str] = None
+    contact_name: Optional[str] = None
+    phone_number_id: Optional[str] = None
+    payload: Optional[dict] = Field(default=None, sa_type=JSON)
+    received_at: datetime = Field(default_factory=datetime.utcnow)
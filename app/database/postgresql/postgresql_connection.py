@@ -1,21 +1,38 @@
+from functools import lru_cache
 from typing import Annotated
 from fastapi import Depends
 from sqlmodel import Session, create_engine
-from ...config.settings import settings
+from ...config.settings import get_settings
 from ...config.logging import logger
 
-# PostgreSQL connection setup
-DATABASE_URL = f"postgresql+psycopg://{settings.db_user}:{settings.db_password}@{settings.db_host}:{settings.db_port}/{settings.db_name}"
 
-engine = create_engine(DATABASE_URL)
-logger.info(f"Connecting to database at {settings.db_host}:{settings.db_port}/{settings.db_name}")
+def get_database_url() -> str:
+    settings = get_settings()
+    return f"postgresql+psycopg://{settings.db_user}:{settings.db_password}@{settings.db_host}:{settings.db_port}/{settings.db_name}"
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Create the PostgreSQL engine on first use instead of at import time."""
+    settings = get_settings()
+    logger.info("Connecting to database at %s:%s/%s", settings.db_host, settings.db_port, settings.db_name)
+    return create_engine(get_database_url())
+
+
+def __getattr__(name):
+    # Backwards compatible `from .postgresql_connection import engine`
+    if name == "engine":
+        return get_engine()
+    if name == "DATABASE_URL":
+        return get_database_url()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_session():
     logger.debug("Creating database session")
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
     logger.debug("Database session closed")
 
 
-SessionDep = Annotated[Session, Depends(get_session)]
\ No newline at end of file
+SessionDep = Annotated[Session, Depends(get_session)]
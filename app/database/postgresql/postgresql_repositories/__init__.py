@@ -1,6 +1,8 @@
 from .business_creation_repo import BusinessCreationRepository
 from .users_creation_repo import UserCreationRepository
+from .webhook_event_repo import WebhookEventRepository
+from .billing_record_repo import BillingRecordRepository
 
 
 
-__all__=["BusinessCreationRepository","UserCreationRepository"]
\ No newline at end of file
+__all__=["BusinessCreationRepository","UserCreationRepository","WebhookEventRepository","BillingRecordRepository"]
@@ -0,0 +1,85 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from sqlalchemy import case, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+from ..models import BillingRecord
+from ....config.logging import logger
+
+# Grouping keys of spend(); amounts are always grouped by currency as well
+GROUP_COLUMNS = {
+    "project": BillingRecord.project_id,
+    "business": BillingRecord.business_id,
+    "month": BillingRecord.month,
+    "currency": BillingRecord.currency,
+    "reason": BillingRecord.reason_code,
+}
+
+
+@dataclass
+class BillingRecordRepository:
+    session: Session
+
+    def upsert(self, rows: List[Dict[str, Any]]) -> int:
+        """INSERT ... ON CONFLICT (id) DO UPDATE of a batch of records, in one transaction."""
+        if not rows:
+            return 0
+        dialect = self.session.get_bind().dialect.name
+        insert = (postgresql.insert if dialect == "postgresql" else sqlite.insert)(BillingRecord)
+        updated = {column.name: insert.excluded[column.name]
+                   for column in BillingRecord.__table__.columns if column.name != "id"}
+        try:
+            # executemany: SQLAlchemy sends these as multi-row INSERTs
+            self.session.execute(insert.on_conflict_do_update(index_elements=["id"], set_=updated), rows)
+            self.session.commit()
+            logger.debug("Billing records upserted: %s", len(rows))
+            return len(rows)
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error("Failed to upsert billing records: %s", e)
+            raise e
+
+    def high_water_marks(self) -> Dict[str, datetime]:
+        """Newest created_at stored per project."""
+        rows = self.session.exec(
+            select(BillingRecord.project_id, func.max(BillingRecord.created_at))
+            .group_by(BillingRecord.project_id)
+        ).all()
+        return {project_id: newest for project_id, newest in rows}
+
+    def spend(
+        self,
+        group_by: Sequence[str] = ("project",),
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        project_id: Optional[str] = None,
+        business_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Spend (SUBTRACT) and credits (ADD) summed per group, in the database."""
+        unknown = [name for name in group_by if name not in GROUP_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown group_by {', '.join(unknown)}; use {', '.join(GROUP_COLUMNS)}")
+        names = list(dict.fromkeys((*group_by, "currency")))
+        keys = [GROUP_COLUMNS[name].label(name) for name in names]
+
+        query = select(
+            *keys,
+            func.sum(case((BillingRecord.action == "SUBTRACT", BillingRecord.amount), else_=0)).label("spend"),
+            func.sum(case((BillingRecord.action == "ADD", BillingRecord.amount), else_=0)).label("credits"),
+            func.count().label("records"),
+            func.min(BillingRecord.created_at).label("first_at"),
+            func.max(BillingRecord.created_at).label("last_at"),
+        )
+        if since is not None:
+            query = query.where(BillingRecord.created_at >= since)
+        if until is not None:
+            query = query.where(BillingRecord.created_at < until)
+        if project_id:
+            query = query.where(BillingRecord.project_id == project_id)
+        if business_id:
+            query = query.where(BillingRecord.business_id == business_id)
+        query = query.group_by(*keys).order_by(*keys)
+        return [dict(row._mapping) for row in self.session.exec(query).all()]
@@ -48,10 +48,10 @@ class BusinessCreationRepository:
             self.session.add(business_creation)
             self.session.commit()
             self.session.refresh(business_creation)
-            logger.info(f"BusinessCreation Inserted: {id}")
+            logger.info("BusinessCreation Inserted: %s", id)
             return business_creation
         
         except Exception as e:
             self.session.rollback()
-            logger.error(f"Failed to insert BusinessCreation: {e}")
+            logger.error("Failed to insert BusinessCreation: %s", e)
             raise e
\ No newline at end of file
@@ -28,12 +28,12 @@ class UserCreationRepository:
             self.session.add(user)
             self.session.commit()
             self.session.refresh(user)
-            logger.info(f"User created: {id}")
+            logger.info("User created: %s", id)
             return user
         
         except Exception as e:
             self.session.rollback()
-            logger.error(f"Failed to create User: {e}")
+            logger.error("Failed to create User: %s", e)
             raise e
 
 
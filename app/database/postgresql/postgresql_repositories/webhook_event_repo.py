@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+from ..models import InboundMessage, MessageStatusEvent
+from ....config.logging import logger
+
+# Later statuses win when two arrive with the same timestamp
+STATUS_ORDER = {"sent": 0, "delivered": 1, "read": 2, "failed": 3}
+
+
+@dataclass
+class WebhookEventRepository:
+    session: Session
+
+    def _insert(self, model):
+        """INSERT ... ON CONFLICT DO NOTHING of this session's dialect (webhooks are redelivered)."""
+        dialect = self.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        return insert(model).on_conflict_do_nothing()
+
+    def insert_batch(
+        self,
+        statuses: List[Dict[str, Any]],
+        messages: List[Dict[str, Any]],
+    ) -> Tuple[int, int]:
+        """Insert a batch of status and inbound message rows in one transaction."""
+        try:
+            # executemany: SQLAlchemy sends these as multi-row INSERTs
+            if statuses:
+                self.session.execute(self._insert(MessageStatusEvent), statuses)
+            if messages:
+                self.session.execute(self._insert(InboundMessage), messages)
+            self.session.commit()
+            logger.debug("Webhook events inserted: %s statuses, %s messages", len(statuses), len(messages))
+            return len(statuses), len(messages)
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error("Failed to insert webhook events: %s", e)
+            raise e
+
+    def status_history(self, message_id: str) -> List[MessageStatusEvent]:
+        """Statuses of one message, oldest first."""
+        rows = self.session.exec(
+            select(MessageStatusEvent).where(MessageStatusEvent.message_id == message_id)
+        ).all()
+        return sorted(rows, key=lambda row: (row.timestamp, STATUS_ORDER.get(row.status, -1)))
+
+    def recent_inbound(
+        self,
+        limit: int = 50,
+        from_number: Optional[str] = None,
+        since: Optional[int] = None,
+    ) -> List[InboundMessage]:
+        """Latest inbound messages, newest first."""
+        query = select(InboundMessage)
+        if from_number:
+            query = query.where(InboundMessage.from_number == from_number)
+        if since is not None:
+            query = query.where(InboundMessage.timestamp >= since)
+        query = query.order_by(InboundMessage.timestamp.desc()).limit(limit)
+        return list(self.session.exec(query).all())
@@ -0,0 +1,245 @@
+"""
+Billing records of every project, synced into Postgres.
+
+get_billing_records returns the whole billing history of one project per
+call, so spend across projects took one tool call per project and the sums
+were done by the model. `BillingSync` instead pulls the records of all
+projects of all tenants concurrently (at most BILLING_SYNC_CONCURRENCY
+requests at a time, at bulk priority so agents' calls go first) and upserts
+them into the billing_records table. A sync runs on demand and, when
+BILLING_SYNC_INTERVAL_SECONDS is set (it is off by default, as the sync
+needs Postgres), in the background; concurrent requests for a sync share
+the one in progress.
+
+The Partner API has no "since" filter, so a project's records are still
+fetched whole, but only those at or after the newest created_at already
+stored for that project (its high-water mark) are written. Records are
+upserted on their AiSensy id, so the record on the mark itself and records
+seen twice are harmless (within one sync they are written once).
+
+Spend, credits and record counts per project, business, month, currency or
+reason code are then summed by the database (`BillingSync.spend`); amounts
+are always grouped by currency, since they cannot be added across
+currencies.
+
+The upstream calls are made by a source object (the onboarding server
+provides one backed by its Partner API clients):
+
+    tenants() -> iterable of tenant ids
+    async projects(tenant, slots) -> list of {"id", "business_id", "currency"}
+        (see app.services.partner_projects)
+    async billing_records(tenant, project_id) -> list of billing records
+
+and rows are stored by a store object (`PostgresBillingStore` by default):
+
+    high_water_marks() -> {project_id: datetime}
+    upsert(rows) -> int
+    spend(group_by, since, until, project_id, business_id) -> list of rows
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.config.logging import get_logger
+from app.services.monitoring_service import record_billing_sync
+from app.services.partner_projects import list_projects
+from app.services.scheduling import BULK, request_priority
+
+logger = get_logger("app.billing_sync")
+
+UPSERT_BATCH = 1000
+
+Rows = List[Dict[str, Any]]
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """UTC datetime of an ISO 8601 string, a date or epoch milliseconds (naive values are UTC)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, (int, float)):
+        moment = datetime.fromtimestamp(value / 1000, timezone.utc)
+    else:
+        moment = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def _amount(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def billing_row(record: Dict[str, Any], project: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """billing_records row of one Partner API record; None for records without id or date."""
+    record_id = record.get("_id") or record.get("id")
+    created_at = parse_timestamp(record.get("createdAt") or record.get("created_at"))
+    if not record_id or created_at is None:
+        return None
+    return {
+        "id": str(record_id),
+        "partner_id": record.get("partnerId"),
+        "business_id": record.get("clientId") or project.get("business_id"),
+        "project_id": project["id"],
+        "action": str(record.get("action") or "").upper(),
+        "amount": _amount(record.get("amount")) or 0.0,
+        "prev_central_balance": _amount(record.get("prevCentralBalance")),
+        "reason_code": record.get("reasonCode"),
+        "message": record.get("message"),
+        "currency": record.get("currency") or project.get("currency") or "",
+        "month": created_at.strftime("%Y-%m"),
+        "created_at": created_at,
+        "updated_at": parse_timestamp(record.get("updatedAt") or record.get("updated_at")),
+        "synced_at": datetime.now(timezone.utc),
+    }
+
+
+class PostgresBillingStore:
+    """billing_records in the application database, one session per call."""
+
+    @staticmethod
+    def _repository(session):
+        from app.database.postgresql.postgresql_repositories import BillingRecordRepository
+        return BillingRecordRepository(session=session)
+
+    @staticmethod
+    def _session():
+        from sqlmodel import Session
+
+        from app.database.postgresql.postgresql_connection import get_engine
+        return Session(get_engine())
+
+    def high_water_marks(self) -> Dict[str, datetime]:
+        with self._session() as session:
+            return self._repository(session).high_water_marks()
+
+    def upsert(self, rows: Rows) -> int:
+        with self._session() as session:
+            return self._repository(session).upsert(rows)
+
+    def spend(self, *args, **kwargs) -> Rows:
+        with self._session() as session:
+            return self._repository(session).spend(*args, **kwargs)
+
+
+class BillingSync:
+    """Keeps billing_records up to date and answers spend queries from it."""
+
+    def __init__(self, source, store=None, interval_seconds: float = 3600.0,
+                 concurrency: int = 8, clock=time.time):
+        self.source = source
+        self.store = store if store is not None else PostgresBillingStore()
+        self.interval_seconds = interval_seconds
+        self.concurrency = concurrency
+        self._clock = clock
+        self.last_sync: Optional[Dict[str, Any]] = None
+        self._running: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # ==================== SYNC ====================
+
+    async def sync(self) -> Dict[str, Any]:
+        """Sync all projects now, or wait for the sync already running; returns its summary."""
+        if self._running is None or self._running.done():
+            self._running = asyncio.ensure_future(self._sync())
+        return await asyncio.shield(self._running)
+
+    async def _fetch(self, tenant: str, project: Dict[str, Any], since: Optional[datetime],
+                     slots: asyncio.Semaphore) -> tuple:
+        async with slots:
+            records = await self.source.billing_records(tenant, project["id"])
+        rows = [row for row in (billing_row(record, project) for record in records if isinstance(record, dict))
+                if row is not None and (since is None or row["created_at"] >= since)]
+        return len(records), rows
+
+    async def _sync(self) -> Dict[str, Any]:
+        start = time.monotonic()
+        errors: Dict[str, str] = {}
+        fetched = stored = 0
+        try:
+            marks = {project_id: parse_timestamp(mark) for project_id, mark in
+                     (await asyncio.to_thread(self.store.high_water_marks)).items()}
+            slots = asyncio.Semaphore(self.concurrency)
+            with request_priority(BULK):
+                projects = await list_projects(self.source, slots, errors)
+                results = await asyncio.gather(
+                    *(self._fetch(tenant, project, marks.get(str(project["id"])), slots)
+                      for tenant, project in projects),
+                    return_exceptions=True)
+
+            # Keyed by id, keeping the last copy: one upsert statement cannot
+            # touch the same row twice
+            by_id: Dict[str, Dict[str, Any]] = {}
+            for (_, project), result in zip(projects, results):
+                if isinstance(result, BaseException):
+                    errors[str(project["id"])] = f"{type(result).__name__}: {result}"
+                    logger.warning("Billing records of project %s failed: %s", project["id"], result)
+                    continue
+                fetched += result[0]
+                by_id.update((row["id"], row) for row in result[1])
+            rows = list(by_id.values())
+            for offset in range(0, len(rows), UPSERT_BATCH):
+                stored += await asyncio.to_thread(self.store.upsert, rows[offset:offset + UPSERT_BATCH])
+        except Exception as e:
+            seconds = time.monotonic() - start
+            record_billing_sync("failed", seconds, fetched, stored)
+            logger.exception("Billing sync failed")
+            raise e
+
+        seconds = time.monotonic() - start
+        outcome = "partial" if errors else "ok"
+        record_billing_sync(outcome, seconds, fetched, stored)
+        self.last_sync = {
+            "synced_at": datetime.fromtimestamp(self._clock(), timezone.utc).isoformat(),
+            "seconds": round(seconds, 3),
+            "outcome": outcome,
+            "projects": len(projects),
+            "records_fetched": fetched,
+            "records_stored": stored,
+            "errors": errors,
+        }
+        logger.info("Billing sync: %s projects, %s records fetched, %s stored in %.2fs",
+                    len(projects), fetched, stored, seconds)
+        return self.last_sync
+
+    # ==================== QUERIES ====================
+
+    async def spend(self, group_by: Sequence[str] = ("project",), since: Any = None, until: Any = None,
+                    project_id: Optional[str] = None, business_id: Optional[str] = None) -> Rows:
+        """Spend and credits per group, summed by the store."""
+        rows = await asyncio.to_thread(self.store.spend, tuple(group_by), parse_timestamp(since),
+                                       parse_timestamp(until), project_id, business_id)
+        for row in rows:
+            for name in ("first_at", "last_at"):
+                if isinstance(row.get(name), datetime):
+                    row[name] = row[name].isoformat()
+        return rows
+
+    # ==================== SCHEDULER ====================
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                pass    # logged by _sync
+            await asyncio.sleep(self.interval_seconds)
+
+    async def start(self) -> None:
+        """Sync now and then every interval_seconds (not at all when it is 0)."""
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._run(), name="billing-sync")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,214 @@
+"""
+Circuit breakers for upstream AiSensy calls, one per (service, endpoint group).
+
+A breaker watches the calls of the last `window_seconds`:
+
+- closed     calls pass; once `minimum_calls` were seen and the failed share
+             reaches `error_rate` (or the slow share reaches `slow_call_rate`)
+             the breaker opens
+- open       calls fail immediately with CircuitOpenError for `open_seconds`,
+             instead of each one waiting out the full request timeout
+- half-open  `half_open_calls` probe requests are let through; a successful
+             probe closes the breaker, a failed one opens it again
+
+Failures are 5xx responses, timeouts and connection errors. 4xx and 429
+responses are the caller's problem (or throttling), not an outage, and
+count as successes here.
+"""
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import aiohttp
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.concurrency import queue_wait
+from app.services.deadlines import request_timed_out
+from app.services.endpoints import current_endpoint
+from app.services.monitoring_service import record_circuit_rejection, set_circuit_state
+
+logger = get_logger("app.circuit_breaker")
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while its endpoint group's circuit is open."""
+
+    def __init__(self, service: str, group: str, retry_after: float):
+        self.service = service
+        self.group = group
+        self.retry_after = retry_after
+        super().__init__(
+            f"AiSensy {service} '{group}' endpoints are failing; "
+            f"requests are paused for {retry_after:.0f}s (circuit open)"
+        )
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    window_seconds: float = 60.0
+    minimum_calls: int = 10
+    error_rate: float = 0.5
+    slow_call_seconds: float = 10.0
+    slow_call_rate: float = 0.8
+    open_seconds: float = 30.0
+    half_open_calls: int = 1
+
+    @classmethod
+    def from_settings(cls) -> "BreakerConfig":
+        return cls(
+            error_rate=setting("CIRCUIT_ERROR_RATE", cls.error_rate),
+            slow_call_seconds=setting("CIRCUIT_SLOW_CALL_SECONDS", cls.slow_call_seconds),
+            slow_call_rate=setting("CIRCUIT_SLOW_CALL_RATE", cls.slow_call_rate),
+            open_seconds=setting("CIRCUIT_OPEN_SECONDS", cls.open_seconds),
+        )
+
+
+class CircuitBreaker:
+    """State machine of one endpoint group; not thread-safe (one event loop)."""
+
+    def __init__(self, service: str, group: str, config: BreakerConfig,
+                 clock: Callable[[], float] = time.monotonic):
+        self.service = service
+        self.group = group
+        self.config = config
+        self.clock = clock
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self._probes = 0
+        # (timestamp, failed, slow) of recent calls, with running totals
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()
+        self._failed = 0
+        self._slow = 0
+        set_circuit_state(service, group, CLOSED)
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        logger.warning("Circuit %s/%s: %s -> %s", self.service, self.group, self.state, state)
+        self.state = state
+        set_circuit_state(self.service, self.group, state)
+        if state == OPEN:
+            self.opened_at = self.clock()
+        if state in (OPEN, CLOSED):
+            self._probes = 0
+        if state == CLOSED:
+            self._calls.clear()
+            self._failed = self._slow = 0
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.config.window_seconds
+        while self._calls and self._calls[0][0] < horizon:
+            _, failed, slow = self._calls.popleft()
+            self._failed -= failed
+            self._slow -= slow
+
+    def before_call(self) -> None:
+        """Admit a call, or raise CircuitOpenError."""
+        if self.state == OPEN:
+            remaining = self.opened_at + self.config.open_seconds - self.clock()
+            if remaining > 0:
+                record_circuit_rejection(self.service, self.group)
+                raise CircuitOpenError(self.service, self.group, remaining)
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._probes >= self.config.half_open_calls:
+                record_circuit_rejection(self.service, self.group)
+                raise CircuitOpenError(self.service, self.group, self.config.open_seconds)
+            self._probes += 1
+
+    def release(self) -> None:
+        """The admitted call was abandoned (cancelled) without a verdict."""
+        if self.state == HALF_OPEN and self._probes:
+            self._probes -= 1
+
+    def record(self, failed: bool, elapsed: float) -> None:
+        """Record the outcome of an admitted call."""
+        slow = elapsed >= self.config.slow_call_seconds
+        if self.state == HALF_OPEN:
+            self._transition(OPEN if failed or slow else CLOSED)
+            return
+        if self.state == OPEN:
+            return
+
+        now = self.clock()
+        self._calls.append((now, failed, slow))
+        self._failed += failed
+        self._slow += slow
+        self._prune(now)
+
+        total = len(self._calls)
+        if total < self.config.minimum_calls:
+            return
+        if (self._failed / total >= self.config.error_rate
+                or self._slow / total >= self.config.slow_call_rate):
+            self._transition(OPEN)
+
+
+class CircuitBreakers:
+    """Breakers by (service, endpoint group), created on first use."""
+
+    def __init__(self, config: Optional[BreakerConfig] = None):
+        self._config = config
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+
+    @property
+    def config(self) -> BreakerConfig:
+        if self._config is None:
+            self._config = BreakerConfig.from_settings()
+        return self._config
+
+    def get(self, service: str, group: str) -> CircuitBreaker:
+        breaker = self._breakers.get((service, group))
+        if breaker is None:
+            breaker = self._breakers[(service, group)] = CircuitBreaker(service, group, self.config)
+        return breaker
+
+    def reset(self, config: Optional[BreakerConfig] = None) -> None:
+        """Forget every breaker (and optionally use a new config)."""
+        self._config = config
+        self._breakers.clear()
+
+
+circuit_breakers = CircuitBreakers()
+
+
+def circuit_breaker_middleware(service: str):
+    """aiohttp client middleware applying the breaker of each request's endpoint group."""
+
+    async def middleware(request: aiohttp.ClientRequest, handler) -> aiohttp.ClientResponse:
+        _, group = current_endpoint(service)
+        breaker = circuit_breakers.get(service, group)
+        breaker.before_call()
+        start = time.monotonic()
+        queue_wait.set(0.0)
+
+        def elapsed() -> float:
+            # Time spent waiting for a concurrency slot is not the endpoint's fault
+            return time.monotonic() - start - (queue_wait.get() or 0.0)
+
+        try:
+            response = await handler(request)
+        except asyncio.CancelledError:
+            # aiohttp enforces timeouts by cancelling: those are failures,
+            # unless the request timed out still waiting for a concurrency slot
+            if request_timed_out() and queue_wait.get() is not None:
+                breaker.record(failed=True, elapsed=elapsed())
+            else:
+                breaker.release()
+            raise
+        except Exception:
+            breaker.record(failed=True, elapsed=elapsed())
+            raise
+        breaker.record(failed=response.status >= 500, elapsed=elapsed())
+        return response
+
+    return middleware
+
+
+def circuit_breakers_enabled() -> bool:
+    return setting("CIRCUIT_BREAKER_ENABLED", True)
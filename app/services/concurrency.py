@@ -0,0 +1,252 @@
+"""
+Adaptive concurrency limits for upstream AiSensy calls, one per service.
+
+Each service ("partner", "direct_api") has an AIMD limiter in front of its
+shared connection pool that decides how many requests may be in flight:
+
+- while latency stays flat the limit grows: doubling per round trip at
+  first (slow start), then by one per round trip (additive increase)
+- 429s, 5xx responses, timeouts and connection errors cut the limit by
+  `backoff` (multiplicative decrease), at most once per round trip
+- latency inflation, i.e. the recent round-trip time rising above
+  `latency_tolerance` times the long-term one, cuts it by `latency_backoff`
+
+Requests over the limit wait in a weighted fair queue over their priority
+classes (see app.services.scheduling), with `interactive_reserve` of the
+slots kept for interactive requests. Bulk jobs settle at the highest
+throughput AiSensy sustains instead of a hand-tuned cap, without starving
+agents' tool calls. The current limit is exported as aisensy_concurrency_limit.
+"""
+import asyncio
+import contextvars
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.deadlines import request_timed_out
+from app.services.monitoring_service import (record_concurrency_decrease, record_queue_wait,
+                                             set_concurrency)
+from app.services.scheduling import INTERACTIVE, PRIORITIES, FairQueue, current_priority
+
+logger = get_logger("app.concurrency")
+
+# Seconds the current task's last request waited for a concurrency slot
+# (None while it is still waiting)
+queue_wait: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "queue_wait", default=0.0
+)
+
+
+@dataclass(frozen=True)
+class LimiterConfig:
+    initial_limit: int = 32
+    min_limit: int = 4
+    max_limit: int = 200
+    latency_tolerance: float = 2.0
+    backoff: float = 0.7
+    latency_backoff: float = 0.9
+    interactive_reserve: float = 0.2  # share of the limit only interactive requests may use
+    short_alpha: float = 0.2     # EWMA weight of the recent round-trip time
+    long_alpha: float = 0.01     # EWMA weight of the long-term round-trip time
+
+    @classmethod
+    def from_settings(cls) -> "LimiterConfig":
+        from app.services.http_pool import _pool_limit
+        return cls(
+            initial_limit=setting("CONCURRENCY_INITIAL_LIMIT", cls.initial_limit),
+            min_limit=setting("CONCURRENCY_MIN_LIMIT", cls.min_limit),
+            max_limit=setting("CONCURRENCY_MAX_LIMIT", 0) or _pool_limit(),
+            latency_tolerance=setting("CONCURRENCY_LATENCY_TOLERANCE", cls.latency_tolerance),
+            interactive_reserve=setting("INTERACTIVE_RESERVED_SHARE", cls.interactive_reserve),
+        )
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit of one service; used from one event loop at a time."""
+
+    def __init__(self, service: str, config: LimiterConfig,
+                 clock: Callable[[], float] = time.monotonic):
+        self.service = service
+        self.config = config
+        self.clock = clock
+        self.limit = float(min(max(config.initial_limit, config.min_limit), config.max_limit))
+        self.in_flight = 0
+        self.slow_start = True
+        self.short_rtt: Optional[float] = None
+        self.long_rtt: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._waiters = FairQueue(skip=lambda waiter: waiter.done())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._report()
+
+    def _bind_loop(self) -> None:
+        # Slots and waiters belong to one loop (tests and scripts may run several in turn)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self.in_flight = 0
+            self._waiters = FairQueue(skip=lambda waiter: waiter.done())
+
+    def _report(self) -> None:
+        set_concurrency(self.service, self.limit, self.in_flight, len(self._waiters))
+
+    def capacity(self, priority: str) -> int:
+        """Slots `priority` requests may occupy: all of them, minus the reserve for the others."""
+        limit = int(self.limit)
+        if priority == INTERACTIVE:
+            return limit
+        return max(1, limit - math.ceil(limit * self.config.interactive_reserve))
+
+    def _eligible(self) -> List[str]:
+        return [priority for priority in PRIORITIES if self.in_flight < self.capacity(priority)]
+
+    async def acquire(self, priority: Optional[str] = None) -> float:
+        """Wait for a slot; returns the seconds spent waiting."""
+        self._bind_loop()
+        priority = priority or current_priority()
+        if not len(self._waiters) and self.in_flight < self.capacity(priority):
+            self.in_flight += 1
+            self._report()
+            return 0.0
+
+        start = self.clock()
+        waiter = self._loop.create_future()
+        self._waiters.push(priority, waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release_slot()
+            raise
+        waited = self.clock() - start
+        record_queue_wait(self.service, priority, waited)
+        return waited
+
+    def release(self, rtt: Optional[float] = None, dropped: bool = False,
+                in_flight: Optional[int] = None) -> None:
+        """
+        Give back a slot. `dropped` marks an overloaded response (429/5xx/timeout);
+        `rtt` is the round-trip time of a successful one and `in_flight` the number
+        of requests in flight when it was sent. Cancelled calls pass neither.
+        """
+        if dropped:
+            self._decrease(self.config.backoff, "overload")
+        elif rtt is not None:
+            self._on_sample(rtt, self.in_flight if in_flight is None else in_flight)
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand free slots to the waiters, in fair-queue order."""
+        while True:
+            waiter = self._waiters.pop(self._eligible())
+            if waiter is None:
+                break
+            self.in_flight += 1
+            waiter.set_result(None)
+        self._report()
+
+    def _on_sample(self, rtt: float, in_flight: int) -> None:
+        config = self.config
+        if self.short_rtt is None:
+            self.short_rtt = self.long_rtt = rtt
+        else:
+            self.short_rtt += config.short_alpha * (rtt - self.short_rtt)
+            # The long-term RTT rises slowly but follows improvements at once
+            self.long_rtt = min(self.long_rtt + config.long_alpha * (rtt - self.long_rtt),
+                                self.short_rtt)
+
+        if self.short_rtt > self.long_rtt * config.latency_tolerance:
+            self._decrease(config.latency_backoff, "latency")
+            return
+        # Only grow a limit that is actually being used
+        if in_flight * 2 < self.limit:
+            return
+        increase = 1.0 if self.slow_start else 1.0 / self.limit
+        self.limit = min(float(config.max_limit), self.limit + increase)
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        now = self.clock()
+        # One decrease per round trip: the calls already in flight saw the old limit
+        if now - self._last_decrease < (self.short_rtt or 0.0):
+            return
+        self._last_decrease = now
+        self.slow_start = False
+        previous = self.limit
+        self.limit = max(float(self.config.min_limit), self.limit * factor)
+        record_concurrency_decrease(self.service, reason)
+        logger.info("Concurrency limit of %s: %.1f -> %.1f (%s)",
+                    self.service, previous, self.limit, reason)
+
+
+class ConcurrencyLimiters:
+    """Limiters by service, created on first use."""
+
+    def __init__(self, config: Optional[LimiterConfig] = None):
+        self._config = config
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+
+    @property
+    def config(self) -> LimiterConfig:
+        if self._config is None:
+            self._config = LimiterConfig.from_settings()
+        return self._config
+
+    def get(self, service: str) -> AdaptiveLimiter:
+        limiter = self._limiters.get(service)
+        if limiter is None:
+            limiter = self._limiters[service] = AdaptiveLimiter(service, self.config)
+        return limiter
+
+    def reset(self, config: Optional[LimiterConfig] = None) -> None:
+        """Forget every limiter (and optionally use a new config)."""
+        self._config = config
+        self._limiters.clear()
+
+
+concurrency_limiters = ConcurrencyLimiters()
+
+
+def _overloaded(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+def concurrency_limit_middleware(service: str):
+    """aiohttp client middleware holding a slot of the service's limiter per request."""
+
+    async def middleware(request: aiohttp.ClientRequest, handler) -> aiohttp.ClientResponse:
+        limiter = concurrency_limiters.get(service)
+        queue_wait.set(None)
+        queue_wait.set(await limiter.acquire())
+        in_flight = limiter.in_flight
+        start = time.monotonic()
+        try:
+            response = await handler(request)
+        except asyncio.CancelledError:
+            # aiohttp enforces timeouts by cancelling: a timeout is an overload signal
+            limiter.release(dropped=request_timed_out())
+            raise
+        except Exception:
+            limiter.release(dropped=True)
+            raise
+        if _overloaded(response.status):
+            limiter.release(dropped=True)
+        else:
+            limiter.release(rtt=time.monotonic() - start, in_flight=in_flight)
+        return response
+
+    return middleware
+
+
+def adaptive_concurrency_enabled() -> bool:
+    return setting("ADAPTIVE_CONCURRENCY_ENABLED", True)
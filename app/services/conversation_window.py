@@ -0,0 +1,338 @@
+"""
+24-hour customer service windows, by recipient.
+
+WhatsApp only accepts free-form messages to a user within 24 hours of that
+user's last message; outside the window only approved templates can be
+sent, and a free-form send is rejected with error 131047 after a full
+round-trip. `ConversationWindows` keeps, per recipient:
+
+- the time of their last inbound message (fed by the webhook receiver)
+- the time a free-form send to them was rejected as outside the window
+
+and answers "is the window open, and until when?" with one dict lookup, so
+send_message can refuse a doomed free-form send without calling AiSensy
+and bulk sends can be split into free-form and template recipients.
+
+The index is shared through a SQLite database (CONVERSATION_WINDOW_FILE),
+since the webhook receiver and the MCP servers run in different processes.
+Every change is written at once by a background task, in a worker thread,
+so the receiver's request handler never waits for the disk; concurrent
+changes are written together and rows only ever move forward (the later of
+the stored and the new time wins), so writers in different processes cannot
+undo each other. Each write transaction bumps a generation counter and tags
+its rows with it; `refresh()` (at most once per `reload_seconds`, also in a
+worker thread) loads only the rows of generations it has not seen.
+
+Both times are kept for CONVERSATION_WINDOW_RETENTION_DAYS, well past the
+window, so a recipient whose window closed is still refused as "expired".
+Lookups ignore times older than that whether or not they have been pruned
+yet, so answers never depend on when the last prune ran.
+
+A recipient without a recorded inbound message in the retention period has
+an unknown window. send_message only refuses it when
+CONVERSATION_WINDOW_ENFORCE is on (the webhook receiver sees every inbound
+message); `partition()` always counts it as template-required.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.monitoring_service import record_free_form_blocked
+from app.utils.phone_numbers import normalize_number as recipient_key
+
+logger = get_logger("app.conversation_window")
+
+WINDOW_SECONDS = 24 * 60 * 60
+RETENTION_SECONDS = 30 * WINDOW_SECONDS
+# Meta error of a free-form message sent outside the customer service window
+RE_ENGAGEMENT_ERROR = "131047"
+
+
+class ConversationWindows:
+    """Last inbound message and last rejected free-form send per recipient."""
+
+    def __init__(self, path: str = "", window_seconds: float = WINDOW_SECONDS,
+                 retention_seconds: float = RETENTION_SECONDS, reload_seconds: float = 1.0,
+                 prune_seconds: float = 3600.0, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.window_seconds = window_seconds
+        self.retention_seconds = max(retention_seconds, window_seconds)
+        self.reload_seconds = reload_seconds
+        self.prune_seconds = prune_seconds
+        self.clock = clock
+        self._inbound: Dict[str, float] = {}
+        self._rejected: Dict[str, float] = {}
+        self._lock = threading.Lock()       # the tables above and _pending
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._generation = 0
+        self._pending: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        self._writer: Optional[asyncio.Task] = None
+        self._loading: Optional[asyncio.Future] = None
+        self._checked_at = float("-inf")
+        self._pruned_at = time.monotonic()
+
+    @classmethod
+    def from_settings(cls) -> "ConversationWindows":
+        return cls(path=setting("CONVERSATION_WINDOW_FILE", "data/conversation_windows.sqlite3"),
+                   retention_seconds=setting("CONVERSATION_WINDOW_RETENTION_DAYS", 30.0) * WINDOW_SECONDS)
+
+    # ---------------- updates ----------------
+
+    def record_inbound(self, recipient: str, timestamp: float) -> None:
+        """The recipient wrote to us at `timestamp` (Unix seconds)."""
+        key = recipient_key(recipient)
+        with self._lock:
+            if not key or timestamp <= self._inbound.get(key, 0.0):
+                return
+            self._inbound[key] = float(timestamp)
+        self._changed(key)
+
+    def record_rejection(self, recipient: str, timestamp: Optional[float] = None) -> None:
+        """A free-form send to the recipient was rejected as outside the window."""
+        key = recipient_key(recipient)
+        if key:
+            with self._lock:
+                self._rejected[key] = float(timestamp if timestamp is not None else self.clock())
+            self._changed(key)
+
+    def record_send_result(self, recipient: str, response: Dict[str, Any]) -> None:
+        """Learn from the response of a free-form send."""
+        if not response.get("success") and RE_ENGAGEMENT_ERROR in str(response.get("details", "")):
+            self.record_rejection(recipient)
+
+    def _changed(self, key: str) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            self._pending[key] = (self._inbound.get(key), self._rejected.get(key))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_pending()       # no event loop to keep free
+            return
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._drain(), name="conversation-window-writer")
+
+    # ---------------- lookups ----------------
+
+    def _retained(self, table: Dict[str, float], key: str) -> Optional[float]:
+        at = table.get(key)
+        return at if at is not None and at >= self.clock() - self.retention_seconds else None
+
+    def expires_at(self, recipient: str) -> Optional[float]:
+        """End of the recipient's open window (Unix seconds), or None when it is not open."""
+        key = recipient_key(recipient)
+        inbound = self._inbound.get(key)
+        if inbound is None or inbound < self._rejected.get(key, float("-inf")):
+            return None
+        end = inbound + self.window_seconds
+        return end if end > self.clock() else None
+
+    def window(self, recipient: str) -> Dict[str, Any]:
+        """{"open", "expires_at", "last_inbound_at", "known"} of the recipient's window."""
+        key = recipient_key(recipient)
+        end = self.expires_at(key)
+        last = self._retained(self._inbound, key)
+        return {
+            "recipient": key,
+            "open": end is not None,
+            "expires_at": end,
+            "last_inbound_at": last,
+            "known": last is not None or self._retained(self._rejected, key) is not None,
+        }
+
+    def free_form_refusal(self, recipient: str) -> Optional[str]:
+        """Why a free-form send to `recipient` would be rejected, or None to send it."""
+        key = recipient_key(recipient)
+        if self.expires_at(key) is not None:
+            return None
+        if self._retained(self._rejected, key) is not None:
+            return "rejected"
+        if (self._retained(self._inbound, key) is not None
+                or setting("CONVERSATION_WINDOW_ENFORCE", False)):
+            return "expired"
+        return None
+
+    def partition(self, recipients: Iterable[str]) -> Dict[str, Any]:
+        """
+        Split `recipients` into those who can get a free-form message now
+        (with the end of their window) and those who need a template.
+        """
+        free_form: Dict[str, float] = {}
+        template_required: List[str] = []
+        for recipient in dict.fromkeys(recipient_key(r) for r in recipients):
+            if not recipient:
+                continue
+            end = self.expires_at(recipient)
+            if end is None:
+                template_required.append(recipient)
+            else:
+                free_form[recipient] = end
+        return {"free_form": free_form, "template_required": template_required}
+
+    def prune(self) -> None:
+        """Forget inbound messages and rejections older than the retention period."""
+        horizon = self.clock() - self.retention_seconds
+        with self._lock:
+            for table in (self._inbound, self._rejected):
+                for key in [key for key, at in table.items() if at < horizon]:
+                    del table[key]
+
+    # ---------------- persistence ----------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.executescript("""
+                PRAGMA journal_mode = WAL;
+                PRAGMA synchronous = NORMAL;
+                CREATE TABLE IF NOT EXISTS windows (
+                    recipient TEXT PRIMARY KEY,
+                    inbound   REAL,
+                    rejected  REAL,
+                    seq       INTEGER NOT NULL
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS ix_windows_seq ON windows (seq);
+                CREATE TABLE IF NOT EXISTS generation (
+                    id    INTEGER PRIMARY KEY CHECK (id = 1),
+                    value INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO generation VALUES (1, 0);
+            """)
+            self._db = db
+        return self._db
+
+    def _write(self, rows: Dict[str, Tuple[Optional[float], Optional[float]]]) -> None:
+        with self._db_lock:
+            db = self._connect()
+            # IMMEDIATE: writers in other processes wait for the lock instead of failing
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                generation = db.execute("SELECT value FROM generation").fetchone()[0] + 1
+                db.execute("UPDATE generation SET value = ?", (generation,))
+                db.executemany("""
+                    INSERT INTO windows (recipient, inbound, rejected, seq) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (recipient) DO UPDATE SET
+                        inbound = MAX(COALESCE(inbound, excluded.inbound), COALESCE(excluded.inbound, inbound)),
+                        rejected = MAX(COALESCE(rejected, excluded.rejected), COALESCE(excluded.rejected, rejected)),
+                        seq = excluded.seq
+                """, ((key, inbound, rejected, generation) for key, (inbound, rejected) in rows.items()))
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+
+    def _write_pending(self) -> bool:
+        """Write the changes not written yet (blocking); False when the write failed."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return True
+        try:
+            self._write(pending)
+        except Exception:
+            logger.exception("Saving %s conversation windows failed", len(pending))
+            with self._lock:
+                for key, row in pending.items():
+                    self._pending.setdefault(key, row)
+            return False
+        self._prune_if_due()
+        return True
+
+    async def _drain(self) -> None:
+        while self._pending:
+            if not await asyncio.to_thread(self._write_pending):
+                return      # retried with the next change or flush()
+
+    async def flush(self) -> None:
+        """Wait until every recorded change is written."""
+        if self._writer is not None and not self._writer.done():
+            await self._writer
+        if self._pending:
+            await asyncio.to_thread(self._write_pending)
+
+    def load(self) -> None:
+        """Merge the windows saved since the last load (blocking; see `refresh()`)."""
+        if not self.path:
+            return
+        with self._db_lock:
+            db = self._connect()
+            generation = db.execute("SELECT value FROM generation").fetchone()[0]
+            if generation == self._generation:
+                rows = []
+            else:
+                rows = db.execute("SELECT recipient, inbound, rejected FROM windows WHERE seq > ?",
+                                  (self._generation,)).fetchall()
+        with self._lock:
+            for key, inbound, rejected in rows:
+                for table, at in ((self._inbound, inbound), (self._rejected, rejected)):
+                    if at is not None and at > table.get(key, float("-inf")):
+                        table[key] = at
+            self._generation = generation
+        self._prune_if_due()
+
+    async def refresh(self) -> None:
+        """Pick up windows recorded by other processes, at most once per `reload_seconds`."""
+        if not self.path:
+            return
+        if self._loading is None or self._loading.done():
+            now = time.monotonic()
+            if now - self._checked_at < self.reload_seconds:
+                return
+            self._checked_at = now
+            self._loading = asyncio.ensure_future(asyncio.to_thread(self.load))
+        await asyncio.shield(self._loading)
+
+    def _prune_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._pruned_at < self.prune_seconds:
+            return
+        self._pruned_at = now
+        self.prune()
+        horizon = self.clock() - self.retention_seconds
+        with self._db_lock:
+            self._connect().execute(
+                "DELETE FROM windows WHERE COALESCE(inbound, 0) < ? AND COALESCE(rejected, 0) < ?",
+                (horizon, horizon))
+
+
+_windows: Optional[ConversationWindows] = None
+
+
+def get_conversation_windows() -> ConversationWindows:
+    """The process-wide index; call `refresh()` before lookups."""
+    global _windows
+    if _windows is None:
+        _windows = ConversationWindows.from_settings()
+    return _windows
+
+
+async def free_form_blocked(recipient: str) -> Optional[Dict[str, Any]]:
+    """
+    The error result of a free-form send that would be rejected as outside
+    the customer service window, or None when it may be sent.
+    """
+    windows = get_conversation_windows()
+    await windows.refresh()
+    reason = windows.free_form_refusal(recipient)
+    if reason is None:
+        return None
+    record_free_form_blocked(reason)
+    window = windows.window(recipient)
+    last = window["last_inbound_at"]
+    since = (f"their last message was {int((windows.clock() - last) // 3600)}h ago"
+             if last is not None else "no message from them was received")
+    return {
+        "success": False,
+        "error": (f"The 24-hour customer service window with {window['recipient']} is closed "
+                  f"({since}); only template messages can be sent to them now"),
+        "template_required": True,
+        "window": window,
+    }
@@ -0,0 +1,125 @@
+"""
+Timeouts of upstream AiSensy requests.
+
+Every request gets the connect/read/total timeouts of its endpoint's
+profile (TIMEOUT_PROFILES, named in the endpoint tables), so quick lookups
+such as `get_display_name_status` give up long before media uploads would.
+
+On top of that, a tool call can carry a deadline (see
+app.api.middleware.deadline). Requests made under a deadline only get the
+time that is left of it: a caller that gives up after 5 seconds does not
+leave requests behind that hold pool slots for 30 more. Requests are also
+cancelled with the tool call, which closes their connections.
+
+    with deadline(5.0):
+        await client.get_profile()  # at most 5s, or less if the profile says so
+"""
+import asyncio
+import contextlib
+import contextvars
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
+
+from app.services.endpoints import current_endpoint, endpoint_registry
+
+if TYPE_CHECKING:  # aiohttp is only imported once a client is used
+    import aiohttp
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """The deadline of the running tool call passed before the request could be sent."""
+
+
+@dataclass(frozen=True)
+class TimeoutProfile:
+    connect: float
+    read: float
+    total: float
+
+
+TIMEOUT_PROFILES: Dict[str, TimeoutProfile] = {
+    "lookup": TimeoutProfile(connect=3, read=8, total=10),
+    "default": TimeoutProfile(connect=5, read=20, total=30),
+    "analytics": TimeoutProfile(connect=5, read=45, total=60),
+    "transfer": TimeoutProfile(connect=5, read=120, total=180),
+}
+
+
+def timeout_profile_name(method: str, group: str) -> str:
+    """Profile of a client method: media transfers, analytics queries, lookups or the rest."""
+    if group == "media":
+        return "transfer"
+    if group == "analytics":
+        return "analytics"
+    if method.startswith("get_"):
+        return "lookup"
+    return "default"
+
+
+# Absolute time.monotonic() by which the running tool call must be done
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("deadline", default=None)
+# When the current task's last upstream request runs out of time
+_request_expiry: contextvars.ContextVar[float] = contextvars.ContextVar(
+    "request_expiry", default=float("inf")
+)
+
+
+@contextlib.contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Limit the upstream requests made inside the block to `seconds` from now in total."""
+    if seconds is None:
+        yield
+        return
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextlib.contextmanager
+def deadline_cleared() -> Iterator[None]:
+    """Run the block without the caller's deadline (e.g. to start background work)."""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left of the running tool call's deadline, or None without one."""
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def request_timeout(service: str) -> "aiohttp.ClientTimeout":
+    """
+    Timeouts of the next request of the current client call: its endpoint's
+    profile, cut to the deadline's remaining time. Raises DeadlineExceeded
+    when no time is left.
+    """
+    method, group = current_endpoint(service)
+    endpoint = endpoint_registry.get(service, method)
+    profile = TIMEOUT_PROFILES[endpoint.timeout if endpoint else timeout_profile_name(method, group)]
+    total, connect, read = profile.total, profile.connect, profile.read
+    remaining = remaining_time()
+    if remaining is not None:
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded before calling {method}")
+        total, connect, read = min(total, remaining), min(connect, remaining), min(read, remaining)
+    _request_expiry.set(time.monotonic() + total)
+    import aiohttp
+    return aiohttp.ClientTimeout(total=total, sock_connect=connect, sock_read=read)
+
+
+def request_timed_out() -> bool:
+    """
+    Whether the current task's request ran out of time. aiohttp enforces the
+    total timeout by cancelling the task, so middlewares see a CancelledError
+    and use this to tell a timeout from a cancelled tool call.
+    """
+    return time.monotonic() >= _request_expiry.get()
@@ -0,0 +1,130 @@
+"""
+Endpoints of the AiSensy APIs.
+
+Every client method is described by an `Endpoint` in its server's endpoint
+table (mcp_servers/*/clients/endpoints.py): verb, path, how the method's
+arguments map to query parameters and body, and the policies that apply
+to it (idempotency, cache, hedging, timeout profile, endpoint group). One
+generic executor, `app.services.upstream.call_endpoint`, sends the request
+of any endpoint; the client methods are thin wrappers around it.
+
+Client methods are grouped by the upstream feature they hit (flows,
+catalog, templates, ...), so that per-endpoint policies such as circuit
+breakers isolate a degraded feature without affecting the rest of the API.
+"""
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from app.services.monitoring_service import current_upstream_call
+
+if TYPE_CHECKING:
+    from app.services.response_cache import CachePolicy
+
+# (group, method-name keywords); the first group with a matching keyword wins
+ENDPOINT_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("flows", ("flow",)),
+    ("catalog", ("catalog", "product", "commerce")),
+    ("templates", ("template",)),
+    ("media", ("media", "upload")),
+    ("messages", ("message",)),
+    ("analytics", ("analytics", "health", "billing")),
+    ("qr_codes", ("qr_code",)),
+    ("payments", ("payment",)),
+    ("auth", ("token",)),
+    ("projects", ("project",)),
+    ("onboarding", ("embedded", "waba", "migration", "otp", "ads", "kyc", "verification")),
+)
+DEFAULT_GROUP = "account"
+
+IDEMPOTENT_VERBS = ("GET", "PUT", "DELETE")
+
+
+def endpoint_group(method: Optional[str]) -> str:
+    """Group of a client method, e.g. "get_flow_assets" -> "flows"."""
+    if method:
+        for group, keywords in ENDPOINT_GROUPS:
+            if any(keyword in method for keyword in keywords):
+                return group
+    return DEFAULT_GROUP
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    One AiSensy endpoint, called by the client method of the same name.
+
+    `path` is formatted with the call's arguments, falling back to the
+    client's attributes (partner_id, business_id); its fields are required.
+    `params`, `body` and `form` map request field names to argument names;
+    `body` may nest. Form fields listed in `files` are paths of files to
+    upload.
+    """
+
+    name: str
+    verb: str
+    path: str
+    params: Mapping[str, str] = field(default_factory=dict)
+    body: Mapping[str, Any] = field(default_factory=dict)
+    form: Mapping[str, str] = field(default_factory=dict)
+    files: Tuple[str, ...] = ()
+    # Arguments that must be set besides the path fields
+    required: Tuple[str, ...] = ()
+    # Top-level params/body fields left out when their argument is None
+    optional: Tuple[str, ...] = ()
+    # Top-level params/body fields left out when their argument is falsy ([], "", 0)
+    omit_falsy: Tuple[str, ...] = ()
+    # Refuse to send an empty body (updates of optional fields only)
+    require_body: bool = False
+    ok_statuses: Tuple[int, ...] = (200,)
+    # Safe to send twice; defaults to True for GET, PUT and DELETE
+    idempotent: Optional[bool] = None
+    # Circuit-breaker and rate-limit class; defaults to endpoint_group(name)
+    group: str = ""
+    # TIMEOUT_PROFILES name; defaults to app.services.deadlines.timeout_profile_name()
+    timeout: str = ""
+    cache: Optional["CachePolicy"] = None
+    # Cached endpoints whose entries a successful call makes outdated
+    invalidates: Tuple[str, ...] = ()
+    hedged: bool = False
+
+    def __post_init__(self):
+        if self.idempotent is None:
+            object.__setattr__(self, "idempotent", self.verb in IDEMPOTENT_VERBS)
+        if not self.group:
+            object.__setattr__(self, "group", endpoint_group(self.name))
+        if not self.timeout:
+            from app.services.deadlines import timeout_profile_name
+            object.__setattr__(self, "timeout", timeout_profile_name(self.name, self.group))
+        if (self.hedged or self.cache) and not self.idempotent:
+            raise ValueError(f"{self.name}: only idempotent endpoints can be hedged or cached")
+
+
+class EndpointRegistry:
+    """Endpoint tables by service ("partner", "direct_api")."""
+
+    def __init__(self):
+        self._tables: Dict[str, Dict[str, Endpoint]] = {}
+
+    def register(self, service: str, endpoints: Iterable[Endpoint]) -> None:
+        table = self._tables.setdefault(service, {})
+        for endpoint in endpoints:
+            if endpoint.name in table:
+                raise ValueError(f"Endpoint {service}.{endpoint.name} is already registered")
+            table[endpoint.name] = endpoint
+
+    def get(self, service: str, name: Optional[str]) -> Optional[Endpoint]:
+        return self._tables.get(service, {}).get(name)
+
+    def table(self, service: str) -> Dict[str, Endpoint]:
+        return dict(self._tables.get(service, {}))
+
+
+endpoint_registry = EndpointRegistry()
+
+
+def current_endpoint(service: str) -> Tuple[str, str]:
+    """(method, group) of the client call running in the current task."""
+    call = current_upstream_call.get()
+    method = call[1] if call and call[0] == service else "unknown"
+    endpoint = endpoint_registry.get(service, method)
+    return method, endpoint.group if endpoint else endpoint_group(method)
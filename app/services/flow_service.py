@@ -0,0 +1,227 @@
+"""
+WhatsApp Flows data exchange.
+
+When a Flow has an endpoint, WhatsApp POSTs every INIT, BACK and
+data_exchange action (and health-check pings) to it, encrypted for the
+business public key uploaded with set_business_public_key:
+
+    {"encrypted_aes_key": b64, "encrypted_flow_data": b64, "initial_vector": b64}
+
+The AES-128 key is decrypted with our RSA private key (OAEP, SHA-256), the
+flow data with AES-GCM (tag appended to the ciphertext). The response is
+encrypted with the same key and the bit-inverted IV and returned as a
+base64 text body.
+
+The private key (FLOW_PRIVATE_KEY_FILE) is loaded once per process. RSA
+decryption of the AES key is the costly step (about a millisecond); it and
+the AES work run on the event loop for ordinary payloads and in a worker
+thread for payloads above FLOW_CRYPTO_THREAD_BYTES.
+tests/performance/flow_benchmark.py measures requests/second per core.
+
+Screens are served by handlers registered on `flow_handlers`:
+
+    @flow_handlers.screen("APPOINTMENT")
+    async def appointment(request: FlowRequest) -> dict:
+        return {"screen": "CONFIRM", "data": {...}}
+
+`@flow_handlers.init()` handles INIT (optionally per flow, by the
+"flow_id" Meta puts in the request data); modules listed in
+FLOW_HANDLER_MODULES are imported at startup to register their handlers.
+"""
+import asyncio
+import base64
+import functools
+import importlib
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.monitoring_service import record_flow_request
+from app.utils import json_backend
+
+logger = get_logger("app.flows")
+
+# Status codes WhatsApp acts on
+DECRYPTION_FAILED = 421       # client re-fetches the public key and retries
+INVALID_FLOW_TOKEN = 427      # client shows "this flow is no longer available"
+INVALID_SIGNATURE = 432
+
+_OAEP = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+
+
+class FlowDecryptionError(Exception):
+    """The request could not be decrypted with our private key."""
+
+
+class FlowTokenError(Exception):
+    """Raised by handlers when the request's flow_token is unknown or expired."""
+
+
+@dataclass
+class FlowRequest:
+    action: str
+    screen: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    flow_token: Optional[str] = None
+    version: str = "3.0"
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "FlowRequest":
+        return cls(action=str(payload.get("action") or ""), screen=payload.get("screen"),
+                   data=payload.get("data") or {}, flow_token=payload.get("flow_token"),
+                   version=str(payload.get("version") or "3.0"))
+
+
+# ==================== CRYPTO ====================
+
+class FlowCrypto:
+    """Decrypts Flow requests and encrypts their responses with one private key."""
+
+    def __init__(self, private_key_pem: bytes, passphrase: Optional[bytes] = None,
+                 thread_bytes: Optional[int] = None):
+        self._private_key = serialization.load_pem_private_key(private_key_pem, password=passphrase)
+        # Requests with more encrypted data than this are handled in a worker thread
+        self.thread_bytes = setting("FLOW_CRYPTO_THREAD_BYTES", 65536) if thread_bytes is None else thread_bytes
+
+    @classmethod
+    def from_file(cls, path: str, passphrase: str = "") -> "FlowCrypto":
+        with open(path, "rb") as f:
+            return cls(f.read(), passphrase.encode() if passphrase else None)
+
+    def decrypt_request(self, body: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes, bytes]:
+        """(decrypted payload, AES key, IV) of a request body."""
+        try:
+            encrypted_key = base64.b64decode(body["encrypted_aes_key"])
+            flow_data = base64.b64decode(body["encrypted_flow_data"])
+            iv = base64.b64decode(body["initial_vector"])
+            aes_key = self._private_key.decrypt(encrypted_key, _OAEP)
+            plaintext = AESGCM(aes_key).decrypt(iv, flow_data, None)
+            return json_backend.loads(plaintext), aes_key, iv
+        except Exception as e:
+            raise FlowDecryptionError(f"{type(e).__name__}: {e}") from e
+
+    @staticmethod
+    def encrypt_response(payload: Dict[str, Any], aes_key: bytes, iv: bytes) -> str:
+        """Base64 response body: the payload encrypted with the request's key and flipped IV."""
+        flipped = bytes(byte ^ 0xFF for byte in iv)
+        ciphertext = AESGCM(aes_key).encrypt(flipped, json_backend.dumps_bytes(payload), None)
+        return base64.b64encode(ciphertext).decode("ascii")
+
+
+@functools.lru_cache(maxsize=1)
+def get_flow_crypto() -> FlowCrypto:
+    path = setting("FLOW_PRIVATE_KEY_FILE", "")
+    if not path:
+        raise RuntimeError("FLOW_PRIVATE_KEY_FILE is not set")
+    return FlowCrypto.from_file(path, setting("FLOW_PRIVATE_KEY_PASSPHRASE", ""))
+
+
+# ==================== HANDLERS ====================
+
+FlowResponse = Dict[str, Any]
+FlowHandler = Callable[[FlowRequest], Union[FlowResponse, Awaitable[FlowResponse]]]
+
+
+class FlowHandlers:
+    """Handlers of Flow actions: INIT per flow (or any flow), data_exchange/BACK per screen."""
+
+    def __init__(self):
+        self._init: Dict[Optional[str], FlowHandler] = {}
+        self._screens: Dict[str, FlowHandler] = {}
+
+    def init(self, flow_id: Optional[str] = None):
+        """Register the INIT handler of `flow_id` (or of flows without their own)."""
+        def register(handler: FlowHandler) -> FlowHandler:
+            self._init[flow_id] = handler
+            return handler
+        return register
+
+    def screen(self, name: str):
+        """Register the handler of data_exchange and BACK actions sent from screen `name`."""
+        def register(handler: FlowHandler) -> FlowHandler:
+            if name in self._screens:
+                raise ValueError(f"Flow screen {name} already has a handler")
+            self._screens[name] = handler
+            return handler
+        return register
+
+    def handler_for(self, request: FlowRequest) -> Optional[FlowHandler]:
+        if request.action.upper() == "INIT":
+            return self._init.get(request.data.get("flow_id")) or self._init.get(None)
+        return self._screens.get(request.screen or "")
+
+    def clear(self) -> None:
+        self._init.clear()
+        self._screens.clear()
+
+
+flow_handlers = FlowHandlers()
+
+
+def load_flow_handlers() -> None:
+    """Import the modules of FLOW_HANDLER_MODULES (comma-separated) so their handlers register."""
+    for module in filter(None, (name.strip() for name in setting("FLOW_HANDLER_MODULES", "").split(","))):
+        importlib.import_module(module)
+
+
+async def dispatch(request: FlowRequest, handlers: Optional[FlowHandlers] = None) -> Tuple[int, FlowResponse]:
+    """(HTTP status, response payload) of a decrypted request."""
+    action = request.action.lower()
+    if action == "ping":
+        return 200, {"data": {"status": "active"}}
+    if request.data.get("error"):
+        # WhatsApp reports a response it could not use; it only needs an acknowledgement
+        logger.warning("Flow client error on screen %s: %s", request.screen, request.data.get("error_message"))
+        return 200, {"data": {"acknowledged": True}}
+
+    handler = (handlers or flow_handlers).handler_for(request)
+    if handler is None:
+        logger.error("No flow handler for action %s on screen %s", request.action, request.screen)
+        return 200, {"screen": request.screen, "data": {"error_message": "This step is not available right now."}}
+    try:
+        response = handler(request)
+        if inspect.isawaitable(response):
+            response = await response
+        return 200, response
+    except FlowTokenError as e:
+        logger.warning("Invalid flow token %s: %s", request.flow_token, e)
+        return INVALID_FLOW_TOKEN, {}
+    except Exception:
+        logger.exception("Flow handler for screen %s failed", request.screen)
+        return 200, {"screen": request.screen, "data": {"error_message": "Something went wrong, please try again."}}
+
+
+async def handle_exchange(body: Dict[str, Any], crypto: Optional[FlowCrypto] = None,
+                          handlers: Optional[FlowHandlers] = None) -> Tuple[int, str]:
+    """(HTTP status, response body) of one encrypted data-exchange request."""
+    start = time.monotonic()
+    crypto = crypto or get_flow_crypto()
+    threaded = len(body.get("encrypted_flow_data") or "") > crypto.thread_bytes
+    try:
+        if threaded:
+            payload, aes_key, iv = await asyncio.to_thread(crypto.decrypt_request, body)
+        else:
+            payload, aes_key, iv = crypto.decrypt_request(body)
+    except FlowDecryptionError as e:
+        logger.warning("Flow request could not be decrypted: %s", e)
+        record_flow_request("decryption_failed", "unknown", time.monotonic() - start)
+        return DECRYPTION_FAILED, ""
+
+    request = FlowRequest.from_payload(payload)
+    status, response = await dispatch(request, handlers)
+    if status != 200:
+        record_flow_request(str(status), request.action, time.monotonic() - start)
+        return status, ""
+    if threaded:
+        text = await asyncio.to_thread(crypto.encrypt_response, response, aes_key, iv)
+    else:
+        text = crypto.encrypt_response(response, aes_key, iv)
+    record_flow_request("ok", request.action, time.monotonic() - start)
+    return status, text
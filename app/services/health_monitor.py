@@ -0,0 +1,279 @@
+"""
+Messaging health of every phone number, polled in the background.
+
+Checking a fleet with get_phone_numbers, get_messaging_health_status and
+get_display_name_status takes one tool call per number. `HealthMonitor`
+polls them instead, for all tenants and numbers concurrently (at most
+HEALTH_MONITOR_CONCURRENCY requests at a time, at bulk priority so agents'
+calls go first), and keeps:
+
+- the latest state of every number (quality rating, messaging limit tier,
+  throughput, display name status, can_send_message and health issues)
+- a time series of those fields per number (HEALTH_MONITOR_HISTORY polls)
+- the recent changes
+
+A change of a tracked field is logged, counted in
+aisensy_number_health_changes_total and, when HEALTH_MONITOR_WEBHOOK_URL is
+set, POSTed there as {"changes": [...]}. The current quality and sending
+state of every number are exported as gauges.
+
+Background polling every HEALTH_MONITOR_INTERVAL_SECONDS is opt-in (0, the
+default, leaves it off, so a server start makes no upstream calls); without
+it, get_fleet_health polls on its first call and whenever asked to refresh.
+
+The upstream calls are made by a source object (the MCP server provides one
+backed by its Direct API clients):
+
+    tenants() -> iterable of tenant ids
+    async phone_numbers(tenant) -> list of phone number records
+    async health(tenant, phone_number_id) -> health status record
+    async display_name(tenant) -> display name status record
+"""
+import asyncio
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.config.logging import get_logger
+from app.services.monitoring_service import record_health_change, set_number_health
+from app.services.scheduling import BULK, request_priority
+
+logger = get_logger("app.health_monitor")
+
+TRACKED_FIELDS = ("quality_rating", "messaging_limit_tier", "throughput", "name_status", "can_send_message")
+RECENT_CHANGES = 200
+
+
+def _timestamp(at: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(at, timezone.utc).isoformat() if at else None
+
+
+@dataclass
+class NumberHealth:
+    """Latest known state of one phone number."""
+
+    tenant: str
+    phone_number_id: str
+    display_phone_number: str = ""
+    verified_name: str = ""
+    quality_rating: str = "UNKNOWN"
+    messaging_limit_tier: str = ""
+    throughput: str = ""
+    name_status: str = ""
+    can_send_message: str = ""
+    issues: List[Dict[str, Any]] = field(default_factory=list)
+    checked_at: float = 0.0
+    error: Optional[str] = None
+
+    def tracked(self) -> Dict[str, str]:
+        return {name: getattr(self, name) for name in TRACKED_FIELDS}
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["checked_at"] = _timestamp(self.checked_at)
+        return data
+
+
+@dataclass(frozen=True)
+class HealthChange:
+    tenant: str
+    phone_number_id: str
+    field: str
+    previous: str
+    current: str
+    at: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "at": _timestamp(self.at)}
+
+
+def _number_state(tenant: str, record: Dict[str, Any]) -> NumberHealth:
+    throughput = record.get("throughput")
+    return NumberHealth(
+        tenant=tenant,
+        phone_number_id=str(record.get("id", "")),
+        display_phone_number=record.get("display_phone_number", ""),
+        verified_name=record.get("verified_name", ""),
+        quality_rating=record.get("quality_rating") or "UNKNOWN",
+        messaging_limit_tier=record.get("messaging_limit_tier", ""),
+        throughput=throughput.get("level", "") if isinstance(throughput, dict) else str(throughput or ""),
+        name_status=record.get("name_status", ""),
+    )
+
+
+def _apply_health(state: NumberHealth, record: Dict[str, Any]) -> None:
+    health = record.get("health_status", record)
+    state.can_send_message = health.get("can_send_message", "")
+    state.issues = [
+        {"entity_type": entity.get("entity_type"), "id": entity.get("id"),
+         "can_send_message": entity.get("can_send_message"), "errors": entity.get("errors", [])}
+        for entity in health.get("entities") or ()
+        if entity.get("can_send_message") not in (None, "AVAILABLE")
+    ]
+
+
+class HealthMonitor:
+    """Polls the health of all phone numbers and keeps their state and history in memory."""
+
+    def __init__(self, source, interval_seconds: float = 300.0, history_size: int = 288,
+                 concurrency: int = 8, webhook_url: str = "", clock=time.time):
+        self.source = source
+        self.interval_seconds = interval_seconds
+        self.history_size = history_size
+        self.concurrency = concurrency
+        self.webhook_url = webhook_url
+        self._clock = clock
+        self._numbers: Dict[Tuple[str, str], NumberHealth] = {}
+        self._history: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        self._changes: Deque[HealthChange] = deque(maxlen=RECENT_CHANGES)
+        self._tenant_errors: Dict[str, str] = {}
+        self.polled_at: Optional[float] = None
+        self.poll_seconds: float = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._poll_lock = asyncio.Lock()
+
+    # ==================== POLLING ====================
+
+    async def _poll_tenant(self, tenant: str, slots: asyncio.Semaphore) -> List[NumberHealth]:
+        async with slots:
+            records = await self.source.phone_numbers(tenant)
+        states = [_number_state(tenant, record) for record in records if record.get("id")]
+
+        async def health(state: NumberHealth) -> None:
+            try:
+                async with slots:
+                    _apply_health(state, await self.source.health(tenant, state.phone_number_id))
+            except Exception as e:
+                state.error = f"health: {e}"
+
+        async def display_name() -> None:
+            try:
+                async with slots:
+                    record = await self.source.display_name(tenant)
+            except Exception as e:
+                logger.warning("Display name status of tenant %s failed: %s", tenant, e)
+                return
+            for state in states:
+                if len(states) == 1 or str(record.get("id")) == state.phone_number_id:
+                    state.name_status = record.get("name_status", state.name_status)
+
+        await asyncio.gather(display_name(), *(health(state) for state in states))
+        return states
+
+    async def poll(self) -> List[HealthChange]:
+        """Poll every number once; returns the changes since the previous poll."""
+        async with self._poll_lock:
+            start = time.monotonic()
+            slots = asyncio.Semaphore(self.concurrency)
+            tenants = list(self.source.tenants())
+            with request_priority(BULK):
+                results = await asyncio.gather(*(self._poll_tenant(tenant, slots) for tenant in tenants),
+                                               return_exceptions=True)
+            now = self._clock()
+            changes: List[HealthChange] = []
+            for tenant, result in zip(tenants, results):
+                if isinstance(result, BaseException):
+                    self._tenant_errors[tenant] = f"{type(result).__name__}: {result}"
+                    logger.warning("Health poll of tenant %s failed: %s", tenant, result)
+                    continue
+                self._tenant_errors.pop(tenant, None)
+                for state in result:
+                    state.checked_at = now
+                    changes.extend(self._record(state))
+            self.polled_at = now
+            self.poll_seconds = round(time.monotonic() - start, 3)
+
+        for change in changes:
+            logger.warning("Phone number %s (%s): %s changed from %s to %s", change.phone_number_id,
+                           change.tenant, change.field, change.previous or "-", change.current or "-")
+            record_health_change(change.field)
+        if changes and self.webhook_url:
+            await self._notify(changes)
+        return changes
+
+    def _record(self, state: NumberHealth) -> List[HealthChange]:
+        key = (state.tenant, state.phone_number_id)
+        previous = self._numbers.get(key)
+        if state.error and previous is not None:
+            # Keep the last known values of a number whose health could not be read
+            state.can_send_message, state.issues = previous.can_send_message, previous.issues
+        self._numbers[key] = state
+        set_number_health(state.tenant, state.phone_number_id, state.quality_rating, state.can_send_message)
+        history = self._history.setdefault(key, deque(maxlen=self.history_size))
+        history.append({"at": state.checked_at, **state.tracked()})
+
+        if previous is None:
+            return []
+        changes = [HealthChange(state.tenant, state.phone_number_id, name, old, new, state.checked_at)
+                   for name, old, new in zip(TRACKED_FIELDS, previous.tracked().values(),
+                                             state.tracked().values())
+                   if old != new]
+        self._changes.extend(changes)
+        return changes
+
+    async def _notify(self, changes: List[HealthChange]) -> None:
+        import aiohttp
+
+        payload = {"changes": [change.to_dict() for change in changes]}
+        try:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+                async with session.post(self.webhook_url, json=payload) as response:
+                    if response.status >= 400:
+                        logger.warning("Health change webhook returned %s", response.status)
+        except Exception as e:
+            logger.warning("Health change webhook failed: %s", e)
+
+    # ==================== READING ====================
+
+    def snapshot(self, phone_number_id: Optional[str] = None, include_history: bool = False) -> Dict[str, Any]:
+        """The fleet's current state, from memory."""
+        numbers = [state for state in self._numbers.values()
+                   if phone_number_id is None or state.phone_number_id == phone_number_id]
+        entries = []
+        for state in sorted(numbers, key=lambda s: (s.tenant, s.phone_number_id)):
+            entry = state.to_dict()
+            if include_history:
+                entry["history"] = [{**point, "at": _timestamp(point["at"])}
+                                    for point in self._history.get((state.tenant, state.phone_number_id), ())]
+            entries.append(entry)
+        return {
+            "polled_at": _timestamp(self.polled_at),
+            "poll_seconds": self.poll_seconds,
+            "interval_seconds": self.interval_seconds,
+            "summary": {
+                "numbers": len(numbers),
+                "quality_rating": dict(Counter(state.quality_rating for state in numbers)),
+                "can_send_message": dict(Counter(state.can_send_message or "UNKNOWN" for state in numbers)),
+                "errors": sum(1 for state in numbers if state.error),
+            },
+            "numbers": entries,
+            "recent_changes": [change.to_dict() for change in self._changes
+                               if phone_number_id is None or change.phone_number_id == phone_number_id],
+            "tenant_errors": dict(self._tenant_errors),
+        }
+
+    # ==================== SCHEDULER ====================
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("Health poll failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def start(self) -> None:
+        """Poll now and then every interval_seconds (not at all when it is 0)."""
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,161 @@
+"""
+Hedged requests for latency-critical reads.
+
+When a call of a method whose endpoint is `hedged` (see the endpoint
+tables) has not answered within the p95 latency observed for that method,
+the same call is started a second time (on another pooled connection) and
+whichever answers first wins; the other is cancelled, which aborts its
+HTTP request. Calls that return quickly, the
+other 95%, are never duplicated.
+
+Hedges are paid from a token budget that earns `budget_ratio` of a token
+per call, so they add at most that share (5% by default) to the upstream
+load, even when AiSensy is slow across the board. Hedging is opt-in
+(HEDGING_ENABLED) and only applies to idempotent reads.
+"""
+import asyncio
+import functools
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from app.config.settings import setting
+from app.services.endpoints import endpoint_registry
+from app.services.monitoring_service import record_hedge, set_hedge_delay
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    quantile: float = 0.95
+    window: int = 200            # latest latencies the quantile is taken over
+    min_samples: int = 20        # no hedging before this many latencies were seen
+    min_delay: float = 0.02      # never hedge sooner than this
+    budget_ratio: float = 0.05   # hedges per call, at most
+    max_tokens: float = 10.0     # hedges that can be saved up for a burst
+
+    @classmethod
+    def from_settings(cls) -> "HedgePolicy":
+        return cls(budget_ratio=setting("HEDGE_BUDGET_RATIO", cls.budget_ratio))
+
+
+class Hedger:
+    """Latency window and hedge budget of one client method."""
+
+    def __init__(self, service: str, method: str, policy: HedgePolicy):
+        self.service = service
+        self.method = method
+        self.policy = policy
+        self.tokens = 0.0
+        self._latencies: Deque[float] = deque(maxlen=policy.window)
+        self._delay: Optional[float] = None
+
+    def observe(self, seconds: float) -> None:
+        self._latencies.append(seconds)
+        self._delay = None
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait for the first attempt before hedging, or None while warming up."""
+        if len(self._latencies) < self.policy.min_samples:
+            return None
+        if self._delay is None:
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, math.ceil(self.policy.quantile * len(ordered)) - 1)
+            self._delay = max(self.policy.min_delay, ordered[index])
+            set_hedge_delay(self.service, self.method, self._delay)
+        return self._delay
+
+    async def call(self, attempt: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        self.tokens = min(self.policy.max_tokens, self.tokens + self.policy.budget_ratio)
+        start = loop.time()
+        primary = asyncio.ensure_future(attempt())
+        tasks = [primary]
+        try:
+            delay = self.delay()
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+            if not primary.done() and delay is not None:
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    hedge_start = loop.time()
+                    tasks.append(asyncio.ensure_future(attempt()))
+                    record_hedge(self.service, self.method, "sent")
+                else:
+                    record_hedge(self.service, self.method, "over_budget")
+
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # The first success wins; an error only when nothing else is left
+                winner = next((task for task in tasks if task in done
+                               and task.result().get("success")), None)
+                if winner is None and not pending:
+                    winner = next(task for task in tasks if task in done)
+                if winner is not None:
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        self.observe(loop.time() - (start if winner is primary else hedge_start))
+        if len(tasks) > 1:
+            record_hedge(self.service, self.method, "won" if winner is not primary else "lost")
+        return winner.result()
+
+
+class Hedgers:
+    """Hedgers by (service, method), created on first use."""
+
+    def __init__(self):
+        self._hedgers: Dict[tuple, Hedger] = {}
+        self._settings: Optional[tuple] = None
+
+    def _options(self) -> tuple:
+        if self._settings is None:
+            self._settings = (setting("HEDGING_ENABLED", False), HedgePolicy.from_settings())
+        return self._settings
+
+    @property
+    def enabled(self) -> bool:
+        return self._options()[0]
+
+    def get(self, service: str, method: str) -> Hedger:
+        hedger = self._hedgers.get((service, method))
+        if hedger is None:
+            hedger = self._hedgers[(service, method)] = Hedger(service, method, self._options()[1])
+        return hedger
+
+    def reset(self, enabled: Optional[bool] = None, policy: Optional[HedgePolicy] = None) -> None:
+        """Forget every hedger; re-read the settings unless `enabled`/`policy` are given."""
+        self._hedgers.clear()
+        self._settings = None
+        if enabled is not None or policy is not None:
+            self._settings = (bool(enabled), policy or HedgePolicy.from_settings())
+
+
+hedgers = Hedgers()
+
+
+def _hedged_method(service: str, name: str, method):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if not hedgers.enabled:
+            return await method(self, *args, **kwargs)
+        return await hedgers.get(service, name).call(lambda: method(self, *args, **kwargs))
+
+    wrapper.__hedged__ = True
+    return wrapper
+
+
+def hedge_client_methods(cls, service: str) -> None:
+    """
+    Hedge the methods of `cls` whose endpoint is hedged. Called from the base
+    clients' `__init_subclass__` after instrumentation, so every attempt is
+    measured as its own upstream request.
+    """
+    for name, attr in list(vars(cls).items()):
+        endpoint = endpoint_registry.get(service, name)
+        if endpoint and endpoint.hedged and not getattr(attr, "__hedged__", False):
+            setattr(cls, name, _hedged_method(service, name, attr))
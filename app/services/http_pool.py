@@ -0,0 +1,67 @@
+"""
+One aiohttp connector per upstream service, shared by every client session.
+
+Each client manager keeps a session per tenant (the session carries that
+tenant's credentials as default headers). Opening a connection pool per
+session would multiply sockets by the number of tenants, so all sessions of a
+service are created with `connector=shared_connector(service)` and
+`connector_owner=False`: tenants differ only in headers and reuse the same
+keep-alive connections.
+"""
+import asyncio
+from typing import Dict
+
+import aiohttp
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.monitoring_service import connection_pools
+
+logger = get_logger("app.http_pool")
+
+
+def _pool_limit() -> int:
+    return setting("HTTP_POOL_LIMIT", 200)
+
+
+class SharedConnector:
+    """Lazily created TCPConnector for one service, recreated if its loop is gone."""
+
+    def __init__(self, service: str, limit: int = 0):
+        self.service = service
+        self.limit = limit
+        self.connector: aiohttp.TCPConnector = None
+
+    def get(self) -> aiohttp.TCPConnector:
+        loop = asyncio.get_running_loop()
+        connector = self.connector
+        if connector is None or connector.closed or connector._loop is not loop:
+            connector = self.connector = aiohttp.TCPConnector(
+                limit=self.limit or _pool_limit(),
+                keepalive_timeout=30,
+            )
+            connection_pools.register(self.service, "shared", self)
+            logger.debug("Shared connector created for %s (limit %s)", self.service, connector.limit)
+        return connector
+
+    async def close(self) -> None:
+        connector, self.connector = self.connector, None
+        if connector is not None and not connector.closed:
+            await connector.close()
+
+
+_connectors: Dict[str, SharedConnector] = {}
+
+
+def shared_connector(service: str) -> aiohttp.TCPConnector:
+    """The connector every `service` session should use (with connector_owner=False)."""
+    pool = _connectors.get(service)
+    if pool is None:
+        pool = _connectors[service] = SharedConnector(service)
+    return pool.get()
+
+
+async def close_shared_connectors() -> None:
+    """Close the shared connectors; call after the client managers are shut down."""
+    for pool in list(_connectors.values()):
+        await pool.close()
@@ -1,4 +1,453 @@
 """
-monitoring_service.py - Auto-generated
-Implement your logic here
+Prometheus metrics shared by both MCP servers.
+
+Series exported:
+- aisensy_upstream_request_duration_seconds  latency per client method
+- aisensy_upstream_responses_total          HTTP status (or exception) per client method
+- aisensy_upstream_retries_total            retries/replays per client method and reason
+- mcp_tool_call_duration_seconds            latency per MCP tool
+- mcp_tool_calls_total                      tool calls per outcome (success/error)
+- aisensy_connection_pool_connections       in-use/idle connections per client pool
+- aisensy_client_manager_active_references  BaseClientManager reference counts
+- aisensy_tenant_clients                    tenants with an open client per client manager
+- aisensy_tenant_evictions_total            tenant clients closed for capacity or idleness
+- aisensy_cache_lookups_total               cached lookups per cache: hit, stale, stale_if_error or miss
+- aisensy_circuit_state                     circuit breaker state per endpoint group (0 closed, 1 half-open, 2 open)
+- aisensy_circuit_rejections_total          calls failed fast by an open circuit
+- aisensy_concurrency_limit                 adaptive in-flight request limit per service
+- aisensy_concurrency_requests              requests in flight / waiting for a slot per service
+- aisensy_concurrency_decreases_total       limit back-offs per service and reason (overload, latency)
+- aisensy_request_queue_seconds             time requests waited for a concurrency slot, per priority
+- aisensy_hedged_requests_total             hedges sent / won / lost / skipped over budget per method
+- aisensy_hedge_delay_seconds               current hedge trigger (observed p95) per method
+- aisensy_token_refreshes_total             Direct API token refreshes per trigger and outcome
+- aisensy_webhook_requests_total            webhook deliveries per outcome (accepted, invalid_signature, ...)
+- aisensy_webhook_events_total              webhook events per kind (status/message) and outcome (buffered/stored/malformed)
+- aisensy_webhook_buffered_events           webhook events waiting to be written to Postgres
+- aisensy_webhook_flush_seconds             duration of webhook batch inserts
+- aisensy_free_form_sends_blocked_total     free-form sends refused locally because the 24h window is closed
+- aisensy_suppressed_sends_total            sends refused because the recipient opted out, per tool
+- aisensy_flow_requests_seconds             WhatsApp Flows data-exchange requests per outcome and action
+- aisensy_number_quality_rating             quality rating per phone number (0 green, 1 yellow, 2 red, -1 unknown)
+- aisensy_number_can_send                   sending state per phone number (1 available, 0.5 limited, 0 blocked)
+- aisensy_number_health_changes_total       quality/tier/throughput/name/sending changes seen by the health monitor
+- aisensy_billing_sync_seconds               billing record syncs per outcome (ok, partial, failed)
+- aisensy_billing_sync_records_total         billing records fetched from AiSensy / stored in Postgres by syncs
+- aisensy_wcc_rollup_projects_total          projects of WCC usage rollups by source (fetched, cached, failed)
 """
+import contextvars
+import functools
+import inspect
+import time
+import weakref
+from typing import Optional, Tuple
+
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram,
+                               generate_latest, start_http_server)
+from prometheus_client.core import GaugeMetricFamily
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+UPSTREAM_REQUEST_SECONDS = Histogram(
+    "aisensy_upstream_request_duration_seconds",
+    "Latency of AiSensy client methods, including retries.",
+    ["service", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_RESPONSES = Counter(
+    "aisensy_upstream_responses_total",
+    "Upstream HTTP responses by status code (or exception type).",
+    ["service", "method", "status"],
+)
+UPSTREAM_RETRIES = Counter(
+    "aisensy_upstream_retries_total",
+    "Upstream requests sent again after a failed or slow attempt.",
+    ["service", "method", "reason"],
+)
+TOOL_CALL_SECONDS = Histogram(
+    "mcp_tool_call_duration_seconds",
+    "Latency of MCP tool calls.",
+    ["server", "tool"],
+    buckets=LATENCY_BUCKETS,
+)
+TOOL_CALLS = Counter(
+    "mcp_tool_calls_total",
+    "MCP tool calls by outcome.",
+    ["server", "tool", "outcome"],
+)
+CLIENT_MANAGER_REFS = Gauge(
+    "aisensy_client_manager_active_references",
+    "Active references held on a shared client by its manager.",
+    ["service", "client"],
+)
+TENANT_CLIENTS = Gauge(
+    "aisensy_tenant_clients",
+    "Tenants with an open client in a client manager.",
+    ["service", "client"],
+)
+TENANT_EVICTIONS = Counter(
+    "aisensy_tenant_evictions_total",
+    "Tenant clients closed by a client manager, by reason (capacity, idle).",
+    ["service", "client", "reason"],
+)
+CIRCUIT_STATE = Gauge(
+    "aisensy_circuit_state",
+    "Circuit breaker state per endpoint group: 0 closed, 1 half-open, 2 open.",
+    ["service", "group"],
+)
+CIRCUIT_REJECTIONS = Counter(
+    "aisensy_circuit_rejections_total",
+    "Upstream calls failed fast because their endpoint group's circuit was open.",
+    ["service", "group"],
+)
+CONCURRENCY_LIMIT = Gauge(
+    "aisensy_concurrency_limit",
+    "Adaptive limit of in-flight upstream requests per service.",
+    ["service"],
+)
+CONCURRENCY_REQUESTS = Gauge(
+    "aisensy_concurrency_requests",
+    "Upstream requests in flight or waiting for a concurrency slot.",
+    ["service", "state"],
+)
+CONCURRENCY_DECREASES = Counter(
+    "aisensy_concurrency_decreases_total",
+    "Multiplicative decreases of the adaptive concurrency limit.",
+    ["service", "reason"],
+)
+REQUEST_QUEUE_SECONDS = Histogram(
+    "aisensy_request_queue_seconds",
+    "Time upstream requests waited for a concurrency slot, by priority class.",
+    ["service", "priority"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+HEDGED_REQUESTS = Counter(
+    "aisensy_hedged_requests_total",
+    "Hedged upstream reads by outcome: sent, won (the hedge answered first), lost, over_budget.",
+    ["service", "method", "outcome"],
+)
+HEDGE_DELAY = Gauge(
+    "aisensy_hedge_delay_seconds",
+    "Latency after which a read is hedged (its observed p95).",
+    ["service", "method"],
+)
+CACHE_LOOKUPS = Counter(
+    "aisensy_cache_lookups_total",
+    "Cache lookups by result (hit, miss, stale).",
+    ["cache", "result"],
+)
+TOKEN_REFRESHES = Counter(
+    "aisensy_token_refreshes_total",
+    "Direct API bearer token refreshes by trigger (expiry, unauthorized, manual) and outcome.",
+    ["trigger", "outcome"],
+)
+WEBHOOK_REQUESTS = Counter(
+    "aisensy_webhook_requests_total",
+    "Webhook deliveries by outcome (accepted, invalid_signature, invalid_payload, overloaded).",
+    ["outcome"],
+)
+WEBHOOK_EVENTS = Counter(
+    "aisensy_webhook_events_total",
+    "Webhook events by kind (status, message) and outcome (buffered, stored, malformed).",
+    ["kind", "outcome"],
+)
+WEBHOOK_BUFFERED = Gauge(
+    "aisensy_webhook_buffered_events",
+    "Webhook events accepted but not yet written to Postgres.",
+)
+WEBHOOK_FLUSH_SECONDS = Histogram(
+    "aisensy_webhook_flush_seconds",
+    "Duration of webhook event batch inserts, by outcome (ok, error).",
+    ["outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+FREE_FORM_BLOCKED = Counter(
+    "aisensy_free_form_sends_blocked_total",
+    "Free-form sends refused without calling AiSensy because the 24h customer service "
+    "window is closed, by reason (expired, rejected).",
+    ["reason"],
+)
+SUPPRESSED_SENDS = Counter(
+    "aisensy_suppressed_sends_total",
+    "Sends refused because the recipient is on the suppression list, by tool.",
+    ["tool"],
+)
+FLOW_REQUESTS_SECONDS = Histogram(
+    "aisensy_flow_requests_seconds",
+    "Duration of WhatsApp Flows data-exchange requests (decrypt, handler, encrypt), "
+    "by outcome (ok, decryption_failed, 427) and action.",
+    ["outcome", "action"],
+    buckets=LATENCY_BUCKETS,
+)
+NUMBER_QUALITY = Gauge(
+    "aisensy_number_quality_rating",
+    "Quality rating of a phone number (0 green, 1 yellow, 2 red, -1 unknown).",
+    ["tenant", "phone_number_id"],
+)
+NUMBER_CAN_SEND = Gauge(
+    "aisensy_number_can_send",
+    "Whether a phone number can send messages (1 available, 0.5 limited, 0 blocked, -1 unknown).",
+    ["tenant", "phone_number_id"],
+)
+NUMBER_HEALTH_CHANGES = Counter(
+    "aisensy_number_health_changes_total",
+    "Changes of phone number health seen by the health monitor, by field.",
+    ["field"],
+)
+BILLING_SYNC_SECONDS = Histogram(
+    "aisensy_billing_sync_seconds",
+    "Duration of billing record syncs into Postgres, by outcome (ok, partial, failed).",
+    ["outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+BILLING_SYNC_RECORDS = Counter(
+    "aisensy_billing_sync_records_total",
+    "Billing records handled by billing syncs, by stage (fetched, stored).",
+    ["stage"],
+)
+WCC_ROLLUP_PROJECTS = Counter(
+    "aisensy_wcc_rollup_projects_total",
+    "Projects of partner-wide WCC usage rollups, by source (fetched, cached, failed).",
+    ["source"],
+)
+
+# (service, method) of the client call running in the current task; lets the
+# aiohttp trace hooks label HTTP-level metrics with the client method name.
+current_upstream_call: contextvars.ContextVar[Optional[Tuple[str, str]]] = contextvars.ContextVar(
+    "current_upstream_call", default=None
+)
+
+
+# ==================== CLIENT INSTRUMENTATION ====================
+
+def _instrument_method(service: str, name: str, func):
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        token = current_upstream_call.set((service, name))
+        start = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            UPSTREAM_REQUEST_SECONDS.labels(service, name).observe(time.perf_counter() - start)
+            current_upstream_call.reset(token)
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def instrument_client_methods(cls, service: str) -> None:
+    """
+    Wrap every public coroutine method defined on `cls` with latency metrics.
+
+    Called from the base clients' `__init_subclass__`, so each endpoint
+    method is measured without repeating timing code in 70 method bodies.
+    """
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or name == "close":
+            continue
+        if inspect.iscoroutinefunction(attr) and not getattr(attr, "__instrumented__", False):
+            setattr(cls, name, _instrument_method(service, name, attr))
+
+
+def upstream_trace_config(service: str):
+    """aiohttp TraceConfig recording status codes and exceptions per client method."""
+    import aiohttp
+
+    def _labels():
+        call = current_upstream_call.get()
+        return call if call is not None else (service, "unknown")
+
+    async def on_request_end(session, trace_config_ctx, params):
+        svc, method = _labels()
+        UPSTREAM_RESPONSES.labels(svc, method, str(params.response.status)).inc()
+
+    async def on_request_exception(session, trace_config_ctx, params):
+        svc, method = _labels()
+        UPSTREAM_RESPONSES.labels(svc, method, type(params.exception).__name__).inc()
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+def record_retry(service: str, method: str, reason: str) -> None:
+    UPSTREAM_RETRIES.labels(service, method, reason).inc()
+
+
+def record_cache_lookup(cache: str, result: str) -> None:
+    """Count a cache lookup; `result` is "hit", "miss" or "stale"."""
+    CACHE_LOOKUPS.labels(cache, result).inc()
+
+
+def record_token_refresh(trigger: str, outcome: str) -> None:
+    TOKEN_REFRESHES.labels(trigger, outcome).inc()
+
+
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def set_circuit_state(service: str, group: str, state: str) -> None:
+    CIRCUIT_STATE.labels(service, group).set(_CIRCUIT_STATE_VALUES[state])
+
+
+def record_circuit_rejection(service: str, group: str) -> None:
+    CIRCUIT_REJECTIONS.labels(service, group).inc()
+
+
+def set_concurrency(service: str, limit: float, in_flight: int, queued: int) -> None:
+    CONCURRENCY_LIMIT.labels(service).set(limit)
+    CONCURRENCY_REQUESTS.labels(service, "in_flight").set(in_flight)
+    CONCURRENCY_REQUESTS.labels(service, "queued").set(queued)
+
+
+def record_concurrency_decrease(service: str, reason: str) -> None:
+    CONCURRENCY_DECREASES.labels(service, reason).inc()
+
+
+def record_hedge(service: str, method: str, outcome: str) -> None:
+    HEDGED_REQUESTS.labels(service, method, outcome).inc()
+
+
+def set_hedge_delay(service: str, method: str, seconds: float) -> None:
+    HEDGE_DELAY.labels(service, method).set(seconds)
+
+
+def record_queue_wait(service: str, priority: str, seconds: float) -> None:
+    REQUEST_QUEUE_SECONDS.labels(service, priority).observe(seconds)
+
+
+def set_client_references(service: str, client: str, count: int) -> None:
+    CLIENT_MANAGER_REFS.labels(service, client).set(count)
+
+
+def set_tenant_clients(service: str, client: str, count: int) -> None:
+    TENANT_CLIENTS.labels(service, client).set(count)
+
+
+def record_tenant_eviction(service: str, client: str, reason: str) -> None:
+    TENANT_EVICTIONS.labels(service, client, reason).inc()
+
+
+def record_webhook_request(outcome: str) -> None:
+    WEBHOOK_REQUESTS.labels(outcome).inc()
+
+
+def record_webhook_events(kind: str, outcome: str, count: int) -> None:
+    if count:
+        WEBHOOK_EVENTS.labels(kind, outcome).inc(count)
+
+
+def set_webhook_buffered(count: int) -> None:
+    WEBHOOK_BUFFERED.set(count)
+
+
+def record_webhook_flush(outcome: str, seconds: float) -> None:
+    WEBHOOK_FLUSH_SECONDS.labels(outcome).observe(seconds)
+
+
+def record_free_form_blocked(reason: str) -> None:
+    FREE_FORM_BLOCKED.labels(reason).inc()
+
+
+def record_suppressed_send(tool: str) -> None:
+    SUPPRESSED_SENDS.labels(tool).inc()
+
+
+def record_flow_request(outcome: str, action: str, seconds: float) -> None:
+    FLOW_REQUESTS_SECONDS.labels(outcome, action).observe(seconds)
+
+
+_QUALITY_VALUES = {"GREEN": 0, "YELLOW": 1, "RED": 2}
+_CAN_SEND_VALUES = {"AVAILABLE": 1, "LIMITED": 0.5, "BLOCKED": 0}
+
+
+def set_number_health(tenant: str, phone_number_id: str, quality_rating: str, can_send_message: str) -> None:
+    NUMBER_QUALITY.labels(tenant, phone_number_id).set(_QUALITY_VALUES.get(quality_rating, -1))
+    NUMBER_CAN_SEND.labels(tenant, phone_number_id).set(_CAN_SEND_VALUES.get(can_send_message, -1))
+
+
+def record_health_change(field: str) -> None:
+    NUMBER_HEALTH_CHANGES.labels(field).inc()
+
+
+def record_billing_sync(outcome: str, seconds: float, fetched: int, stored: int) -> None:
+    BILLING_SYNC_SECONDS.labels(outcome).observe(seconds)
+    BILLING_SYNC_RECORDS.labels("fetched").inc(fetched)
+    BILLING_SYNC_RECORDS.labels("stored").inc(stored)
+
+
+def record_wcc_rollup_projects(source: str, count: int) -> None:
+    WCC_ROLLUP_PROJECTS.labels(source).inc(count)
+
+
+# ==================== CONNECTION POOLS ====================
+
+class ConnectionPoolCollector:
+    """
+    Reports in-use and idle connections of every registered connection pool:
+    a client (its session's connector) or anything with a `connector`
+    attribute, such as the shared connectors of app.services.http_pool.
+
+    Values are read from the aiohttp connector at scrape time, so nothing is
+    tracked on the request path.
+    """
+
+    def __init__(self):
+        self._clients = weakref.WeakValueDictionary()
+
+    def register(self, service: str, client_name: str, client) -> None:
+        self._clients[(service, client_name)] = client
+
+    def collect(self):
+        family = GaugeMetricFamily(
+            "aisensy_connection_pool_connections",
+            "Connections held by the client connection pool.",
+            labels=["service", "client", "state"],
+        )
+        for (service, client_name), client in list(self._clients.items()):
+            connector = getattr(client, "connector", None)
+            if connector is None:
+                session = getattr(client, "_session", None)
+                if session is not None and not session.closed:
+                    connector = session.connector
+            if connector is None or connector.closed:
+                in_use = idle = 0
+            else:
+                in_use = len(getattr(connector, "_acquired", ()))
+                idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+            family.add_metric([service, client_name, "in_use"], in_use)
+            family.add_metric([service, client_name, "idle"], idle)
+        yield family
+
+
+connection_pools = ConnectionPoolCollector()
+REGISTRY.register(connection_pools)
+
+
+# ==================== EXPOSITION ====================
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Return the Prometheus exposition payload and its content type."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+_exporter_ports = set()
+
+
+def metrics_port(name: str) -> int:
+    """Exporter port of the setting `name` (0 = no exporter)."""
+    from app.config.settings import setting
+    return setting(name, 0)
+
+
+def start_metrics_exporter(port: int) -> None:
+    """
+    Serve /metrics on a background thread.
+
+    Used for the stdio transport, where the server has no HTTP listener of
+    its own. A port of 0 disables the exporter.
+    """
+    if port and port not in _exporter_ports:
+        start_http_server(port)
+        _exporter_ports.add(port)
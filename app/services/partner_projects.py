@@ -0,0 +1,39 @@
+"""
+Projects of every tenant of a partner, as listed by the background jobs
+that walk all of them (the billing sync and the WCC usage rollup).
+
+Their sources answer:
+
+    tenants() -> iterable of tenant ids
+    async projects(tenant, slots) -> list of {"id", "business_id", ...}
+        (each upstream request made while holding the `slots` semaphore)
+"""
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+from app.config.logging import get_logger
+
+logger = get_logger("app.partner_projects")
+
+
+async def list_projects(source, slots: asyncio.Semaphore,
+                        errors: Dict[str, str]) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    (tenant, project) of every project of every tenant, listed concurrently
+    within `slots`. A project listed by several tenants is kept once, with
+    the first of them; tenants whose listing failed are recorded in
+    `errors` as "tenant:<id>".
+    """
+    tenants = list(source.tenants())
+    results = await asyncio.gather(*(source.projects(tenant, slots) for tenant in tenants),
+                                   return_exceptions=True)
+    projects: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    for tenant, result in zip(tenants, results):
+        if isinstance(result, BaseException):
+            errors[f"tenant:{tenant}"] = f"{type(result).__name__}: {result}"
+            logger.warning("Listing projects of tenant %s failed: %s", tenant, result)
+            continue
+        for project in result:
+            if project.get("id"):
+                projects.setdefault(str(project["id"]), (tenant, project))
+    return list(projects.values())
@@ -0,0 +1,138 @@
+"""
+Local QR images of AiSensy short links.
+
+create_qr_code_and_short_link, get_qr_codes and update_qr_code return the
+deep_link_url each QR code stands for; the image is rendered here from that
+URL (app.utils.qr_code) instead of being fetched from AiSensy again.
+
+Images live in a content-addressed cache under QR_CACHE_DIR:
+
+    objects/ab/<key>.json   code, prefilled message and deep link of the image
+    objects/ab/<key>.png    rendered on first read
+    objects/ab/<key>.svg
+    codes/<code>            key of the code's current image
+
+The key is a hash of the code id, the prefilled message, the deep link and
+the rendering settings, so updating a code's message moves it to a new key
+instead of invalidating files, and the cache can be shared by several
+server processes. The MCP server serves the images as the resources
+qr://<code>.png and qr://<code>.svg; after the first read, retrieval is a
+local file read.
+"""
+import functools
+import hashlib
+import os
+import re
+from typing import Any, Optional
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.utils import json_backend
+from app.utils.helpers import write_atomic
+from app.utils.qr_code import encode, to_png, to_svg
+
+logger = get_logger("app.qr_images")
+
+FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+_CODE = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+
+def qr_image_uri(code: str, image_format: str) -> str:
+    return f"qr://{code}.{image_format}"
+
+
+class QrImageCache:
+    """Content-addressed on-disk cache of QR images, rendered on first read."""
+
+    def __init__(self, directory: str, scale: int = 8, level: str = "M"):
+        self.directory = directory
+        self.scale = scale
+        self.level = level
+
+    def key(self, code: str, prefilled_message: str, deep_link_url: str) -> str:
+        content = json_backend.dumps_strict([code, prefilled_message, deep_link_url, self.scale, self.level])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
+    def _object(self, key: str, extension: str) -> str:
+        return os.path.join(self.directory, "objects", key[:2], f"{key}.{extension}")
+
+    def _pointer(self, code: str) -> str:
+        if not _CODE.match(code):
+            raise ValueError(f"Invalid QR code id {code!r}")
+        return os.path.join(self.directory, "codes", code)
+
+    def remember(self, code: str, prefilled_message: str, deep_link_url: str) -> str:
+        """Record the current content of `code`; returns its key."""
+        key = self.key(code, prefilled_message, deep_link_url)
+        meta = self._object(key, "json")
+        if not os.path.exists(meta):
+            write_atomic(meta, json_backend.dumps_bytes({"code": code, "prefilled_message": prefilled_message,
+                                                         "deep_link_url": deep_link_url}))
+        if self.current_key(code) != key:
+            write_atomic(self._pointer(code), key.encode("ascii"))
+        return key
+
+    def current_key(self, code: str) -> Optional[str]:
+        try:
+            with open(self._pointer(code), encoding="ascii") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def image(self, code: str, image_format: str) -> Optional[bytes]:
+        """The code's current image, rendered and stored on first use; None for unknown codes."""
+        if image_format not in FORMATS:
+            raise ValueError(f"Unsupported QR image format {image_format!r} (expected png or svg)")
+        key = self.current_key(code)
+        if key is None:
+            return None
+        path = self._object(key, image_format)
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+        with open(self._object(key, "json"), "rb") as f:
+            meta = json_backend.loads(f.read())
+        matrix = encode(meta["deep_link_url"], self.level)
+        data = (to_png(matrix, self.scale) if image_format == "png"
+                else to_svg(matrix, self.scale).encode("utf-8"))
+        write_atomic(path, data)
+        logger.info("Rendered %s QR image of %s", image_format, code)
+        return data
+
+    def annotate(self, data: Any, **known: str) -> Any:
+        """
+        `data` (a QR code, a list of them or {"data": [...]}) with the
+        qr://<code>.png/.svg URIs added to every QR code, which is
+        remembered; `known` fields (code, prefilled_message) override the
+        response's.
+        """
+        if isinstance(data, list):
+            return [self.annotate(item, **known) for item in data]
+        if not isinstance(data, dict):
+            return data
+        if "code" not in data and "code" not in known:
+            if "data" in data:
+                return {**data, "data": self.annotate(data["data"], **known)}
+            return data
+        record = {**data, **known}
+        code = str(record["code"])
+        deep_link_url = record.get("deep_link_url") or f"https://wa.me/message/{code}"
+        try:
+            self.remember(code, str(record.get("prefilled_message") or ""), deep_link_url)
+        except (OSError, ValueError) as e:
+            logger.warning("QR code %s not cached: %s", code, e)
+            return data
+        return {**data, "qr_images": {image_format: qr_image_uri(code, image_format)
+                                      for image_format in FORMATS}}
+
+
+@functools.lru_cache(maxsize=1)
+def get_qr_image_cache() -> QrImageCache:
+    return QrImageCache(setting("QR_CACHE_DIR", "data/qr_codes"), setting("QR_IMAGE_SCALE", 8),
+                        setting("QR_ERROR_CORRECTION", "M"))
+
+
+def annotate_qr_codes(data: Any, **known: str) -> Any:
+    return get_qr_image_cache().annotate(data, **known)
@@ -0,0 +1,215 @@
+"""
+Recipient list cleaning for bulk sends.
+
+Campaign lists arrive as CSV exports with spaces, "+", trunk-prefix zeros,
+duplicates and junk rows. `clean_recipient_list()` streams such a file once
+and writes:
+
+- <name>.clean.csv    one normalised WhatsApp ID per row ("number"), each
+                      number once, opted-out numbers left out
+- <name>.invalid.csv  the rows that are not valid numbers (line, value, reason)
+
+Numbers are normalised with app.utils.phone_numbers.to_e164. Duplicates are
+dropped with a set while the list has at most `max_in_memory` distinct
+numbers; bigger lists spill sorted runs to temporary files and are merged
+(external sort), so memory stays bounded. The clean file keeps the order
+of first appearance, except for lists that spilled, which come out sorted.
+
+`iter_recipients()` reads a clean file back for sending.
+"""
+import csv
+import heapq
+import itertools
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.utils.phone_numbers import to_e164
+
+logger = get_logger("app.recipient_lists")
+
+# Header names recognised as the number column (lower case, without separators)
+NUMBER_COLUMNS = ("phone", "phonenumber", "mobile", "mobilenumber", "number", "msisdn", "to",
+                  "whatsapp", "whatsappnumber", "contact", "contactnumber", "wa_id", "waid")
+INVALID_SAMPLE_SIZE = 20
+_SUPPRESSION_CHUNK = 10_000
+
+
+@dataclass
+class RecipientListReport:
+    rows: int = 0
+    valid: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    suppressed: int = 0
+    recipients: int = 0
+    output_path: str = ""
+    invalid_path: str = ""
+    spilled: bool = False
+    seconds: float = 0.0
+    invalid_sample: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _column_key(name: str) -> str:
+    return name.strip().lower().replace(" ", "").replace("-", "")
+
+
+def _number_column(first_row: List[str], column: Union[str, int, None]) -> Tuple[int, bool]:
+    """(index of the number column, whether `first_row` is a header row)."""
+    keys = [_column_key(cell) for cell in first_row]
+    recognised = [index for index, key in enumerate(keys)
+                  if key in NUMBER_COLUMNS or key.replace("_", "") in NUMBER_COLUMNS]
+    if isinstance(column, str) and not column.isdigit():
+        if _column_key(column) not in keys:
+            raise ValueError(f"Column {column!r} not found in header {first_row}")
+        return keys.index(_column_key(column)), True
+    if column is not None:
+        return int(column), bool(recognised)
+    return (recognised[0], True) if recognised else (0, False)
+
+
+class _Deduplicator:
+    """Distinct numbers in first-seen order, spilling sorted runs to disk past `max_in_memory`."""
+
+    def __init__(self, max_in_memory: int, directory: str):
+        self.max_in_memory = max_in_memory
+        self.directory = directory
+        self.seen: Dict[str, None] = {}
+        self.runs: List[str] = []
+
+    def add(self, number: str) -> bool:
+        """False when the number was already seen (only known while nothing spilled)."""
+        if number in self.seen:
+            return False
+        self.seen[number] = None
+        if len(self.seen) >= self.max_in_memory:
+            self._spill()
+        return True
+
+    def _spill(self) -> None:
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix=".run")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(f"{number}\n" for number in sorted(self.seen))
+        self.runs.append(path)
+        self.seen.clear()
+
+    def numbers(self) -> Iterator[str]:
+        if not self.runs:
+            yield from self.seen
+            return
+        if self.seen:
+            self._spill()
+        files = [open(path, encoding="utf-8") for path in self.runs]
+        try:
+            previous = None
+            for line in heapq.merge(*files):
+                if line != previous:
+                    previous = line
+                    yield line[:-1]
+        finally:
+            for f in files:
+                f.close()
+
+    def close(self) -> None:
+        for path in self.runs:
+            os.unlink(path)
+        self.runs.clear()
+
+
+def _chunks(numbers: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(numbers)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def clean_recipient_list(
+    path: str,
+    column: Union[str, int, None] = None,
+    default_country: Optional[str] = None,
+    output_path: Optional[str] = None,
+    invalid_path: Optional[str] = None,
+    exclude_suppressed: bool = True,
+    max_in_memory: Optional[int] = None,
+) -> RecipientListReport:
+    """
+    Normalise, deduplicate and (optionally) drop opted-out numbers of the
+    recipient list at `path` (CSV or one number per line). The number
+    column is `column` (header name or index), the column with a
+    recognised header name, or the first column.
+    """
+    start = time.monotonic()
+    default_country = default_country or setting("DEFAULT_COUNTRY_CODE", "91")
+    max_in_memory = max_in_memory or setting("RECIPIENT_LIST_MAX_IN_MEMORY", 2_000_000)
+    stem = os.path.splitext(path)[0]
+    report = RecipientListReport(output_path=output_path or f"{stem}.clean.csv",
+                                 invalid_path=invalid_path or f"{stem}.invalid.csv")
+    suppression = None
+    if exclude_suppressed:
+        from app.services.suppression import get_suppression_list
+        suppression = get_suppression_list()
+
+    dedup = _Deduplicator(max_in_memory, os.path.dirname(os.path.abspath(report.output_path)))
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as source, \
+                open(report.invalid_path, "w", newline="", encoding="utf-8") as invalid_file:
+            reader = csv.reader(source)
+            invalid = csv.writer(invalid_file)
+            invalid.writerow(("line", "value", "reason"))
+
+            first = next(reader, None) or []
+            index, header = _number_column(first, column)
+            rows = reader if header else itertools.chain([first], reader)
+
+            for row in rows:
+                if not any(row):
+                    continue
+                report.rows += 1
+                value = row[index] if index < len(row) else ""
+                number, reason = to_e164(value, default_country)
+                if number is None:
+                    report.invalid += 1
+                    invalid.writerow((reader.line_num, value, reason))
+                    if len(report.invalid_sample) < INVALID_SAMPLE_SIZE:
+                        report.invalid_sample.append(
+                            {"line": reader.line_num, "value": value, "reason": reason})
+                    continue
+                report.valid += 1
+                dedup.add(number)
+
+        report.spilled = bool(dedup.runs)
+        with open(report.output_path, "w", newline="", encoding="utf-8") as output:
+            output.write("number\n")
+            unique = 0
+            for chunk in _chunks(dedup.numbers(), _SUPPRESSION_CHUNK):
+                unique += len(chunk)
+                if suppression is not None:
+                    chunk, suppressed = suppression.filter(chunk)
+                    report.suppressed += len(suppressed)
+                report.recipients += len(chunk)
+                output.writelines(f"{number}\n" for number in chunk)
+        report.duplicates = report.valid - unique
+    finally:
+        dedup.close()
+
+    report.seconds = round(time.monotonic() - start, 3)
+    logger.info("Cleaned %s: %s rows, %s recipients, %s duplicates, %s invalid, %s suppressed (%.1fs)",
+                path, report.rows, report.recipients, report.duplicates, report.invalid,
+                report.suppressed, report.seconds)
+    return report
+
+
+def iter_recipients(clean_path: str) -> Iterator[str]:
+    """Numbers of a clean file written by clean_recipient_list()."""
+    with open(clean_path, encoding="utf-8") as f:
+        next(f, None)
+        for line in f:
+            number = line.strip()
+            if number:
+                yield number
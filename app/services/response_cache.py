@@ -0,0 +1,232 @@
+"""
+Cached lookups of slowly changing AiSensy data, with stale serving.
+
+Client methods whose endpoint has a `cache` policy (see the endpoint
+tables) answer from an in-process cache whose entries have a soft and a
+hard TTL:
+
+- younger than soft_ttl          served as is
+- between soft_ttl and hard_ttl  served at once while one background
+                                 request refreshes the entry
+                                 (stale-while-revalidate)
+- older than hard_ttl            fetched again; if AiSensy is failing (5xx,
+                                 429, timeout, open circuit) the old entry
+                                 is served instead, flagged with
+                                 "stale": True, until stale_if_error_ttl
+                                 (stale-if-error)
+
+Entries are scoped to the client's credentials, so tenants never see each
+other's data, and successful writes drop the entries their endpoint
+`invalidates`. Concurrent misses of one key share a single
+upstream request.
+"""
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.deadlines import deadline_cleared
+from app.services.endpoints import endpoint_registry
+from app.services.monitoring_service import record_cache_lookup
+from app.services.scheduling import NORMAL, request_priority
+
+logger = get_logger("app.response_cache")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    soft_ttl: float
+    hard_ttl: float
+    stale_if_error_ttl: float
+
+
+def _servable_error(result: Any) -> bool:
+    """Upstream trouble worth hiding behind a stale entry (not e.g. a 401 or 404)."""
+    status = result.get("status_code")
+    return status is None or status == 429 or status >= 500
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Cache fetch failed", exc_info=task.exception())
+
+
+@dataclass
+class _Entry:
+    value: Dict[str, Any]
+    fetched_at: float
+
+
+class ResponseCache:
+    """LRU cache of one client method's successful results."""
+
+    def __init__(self, name: str, policy: CachePolicy, max_entries: int = 1024,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.policy = policy
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._fetches: Dict[Hashable, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_loop(self) -> None:
+        # Pending fetches belong to one loop (tests and scripts may run several in turn)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._fetches.clear()
+
+    def _store(self, key: Hashable, result: Dict[str, Any]) -> None:
+        self._entries[key] = _Entry(result, self.clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> asyncio.Task:
+        """
+        The upstream request for `key`: one at a time, shared by concurrent
+        callers. It runs as its own task, so a caller giving up does not
+        cancel it for the others, and its result still fills the cache.
+        """
+        task = self._fetches.get(key)
+        if task is None:
+            task = self._fetches[key] = self._loop.create_task(self._run_fetch(key, fetch))
+            task.add_done_callback(_retrieve_exception)
+        return task
+
+    async def _run_fetch(self, key: Hashable, fetch) -> Dict[str, Any]:
+        try:
+            result = await fetch()
+            if result.get("success"):
+                self._store(key, result)
+            return result
+        finally:
+            self._fetches.pop(key, None)
+
+    def _refresh_in_background(self, key: Hashable, fetch) -> None:
+        # Not bound by the triggering tool call's deadline or priority
+        with deadline_cleared(), request_priority(NORMAL):
+            self._fetch(key, fetch)
+
+    async def lookup(self, key: Hashable, fetch: Callable[[], Awaitable[Dict[str, Any]]]):
+        self._bind_loop()
+        entry = self._entries.get(key)
+        age = self.clock() - entry.fetched_at if entry is not None else None
+        policy = self.policy
+
+        if age is not None and age < policy.hard_ttl:
+            self._entries.move_to_end(key)
+            if age < policy.soft_ttl:
+                record_cache_lookup(self.name, "hit")
+            else:
+                record_cache_lookup(self.name, "stale")
+                self._refresh_in_background(key, fetch)
+            return dict(entry.value)
+
+        result = await asyncio.shield(self._fetch(key, fetch))
+        if (not result.get("success") and _servable_error(result)
+                and entry is not None and age < policy.stale_if_error_ttl):
+            record_cache_lookup(self.name, "stale_if_error")
+            logger.warning("Serving stale %s (%.0fs old): %s", self.name, age, result.get("error"))
+            return {**entry.value, "stale": True, "age_seconds": round(age, 1),
+                    "upstream_error": result.get("error")}
+        record_cache_lookup(self.name, "miss")
+        return result
+
+    def invalidate(self, scope: Hashable) -> None:
+        """Drop the entries of one client scope."""
+        for key in [key for key in self._entries if key[0] == scope]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class ResponseCaches:
+    """Caches by client method name, created on first use."""
+
+    def __init__(self):
+        self._caches: Dict[str, ResponseCache] = {}
+        # Cache policies by method name, from the endpoint tables
+        self._policies: Dict[str, CachePolicy] = {}
+        self._settings: Optional[Tuple[bool, int]] = None
+
+    def _options(self) -> Tuple[bool, int]:
+        if self._settings is None:
+            self._settings = (setting("RESPONSE_CACHE_ENABLED", True),
+                              setting("RESPONSE_CACHE_MAX_ENTRIES", 1024))
+        return self._settings
+
+    @property
+    def enabled(self) -> bool:
+        return self._options()[0]
+
+    def add_policy(self, name: str, policy: CachePolicy) -> None:
+        self._policies[name] = policy
+
+    def get(self, name: str) -> ResponseCache:
+        cache = self._caches.get(name)
+        if cache is None:
+            cache = self._caches[name] = ResponseCache(name, self._policies[name],
+                                                       max_entries=self._options()[1])
+        return cache
+
+    def invalidate(self, names, scope: Hashable) -> None:
+        for name in names:
+            if name in self._caches:
+                self._caches[name].invalidate(scope)
+
+    def reset(self) -> None:
+        """Forget every cache (and re-read the settings)."""
+        self._caches.clear()
+        self._settings = None
+
+
+response_caches = ResponseCaches()
+
+
+def _cached_method(name: str, method):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if not response_caches.enabled:
+            return await method(self, *args, **kwargs)
+        key = (self._cache_scope(), args, tuple(sorted(kwargs.items())))
+        return await response_caches.get(name).lookup(key, lambda: method(self, *args, **kwargs))
+
+    wrapper.__cached__ = True
+    return wrapper
+
+
+def _invalidating_method(names: Tuple[str, ...], method):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        result = await method(self, *args, **kwargs)
+        if isinstance(result, dict) and result.get("success"):
+            response_caches.invalidate(names, self._cache_scope())
+        return result
+
+    wrapper.__cached__ = True
+    return wrapper
+
+
+def cache_client_methods(cls, service: str) -> None:
+    """
+    Put the methods of `cls` whose endpoint has a cache policy behind their
+    cache, and make those whose endpoint invalidates others drop outdated
+    entries. Called from the base clients' `__init_subclass__` after
+    instrumentation, so cache hits are not counted as upstream requests.
+    """
+    for name, attr in list(vars(cls).items()):
+        endpoint = endpoint_registry.get(service, name)
+        if endpoint is None or getattr(attr, "__cached__", False):
+            continue
+        if endpoint.cache:
+            response_caches.add_policy(name, endpoint.cache)
+            setattr(cls, name, _cached_method(name, attr))
+        elif endpoint.invalidates:
+            setattr(cls, name, _invalidating_method(endpoint.invalidates, attr))
@@ -0,0 +1,97 @@
+"""
+Priority classes of upstream requests.
+
+Requests inherit the priority of the task that makes them:
+
+- interactive  MCP tool calls made by agents (set by the tool middleware)
+- normal       anything that did not choose a class
+- bulk         background jobs: campaign sends, imports, backfills
+
+    with request_priority(BULK):
+        await client.send_message(...)
+
+Requests waiting for a concurrency slot are served by weighted fair queuing
+over the classes (PRIORITY_WEIGHTS), and a share of every service's slots is
+only available to interactive requests, so a large bulk job cannot make an
+agent's `get_profile` queue behind it.
+"""
+import contextlib
+import contextvars
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+INTERACTIVE, NORMAL, BULK = "interactive", "normal", "bulk"
+PRIORITIES = (INTERACTIVE, NORMAL, BULK)
+
+# Share of the slots each class gets while all of them are waiting
+PRIORITY_WEIGHTS: Dict[str, float] = {INTERACTIVE: 8.0, NORMAL: 3.0, BULK: 1.0}
+
+_current_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "request_priority", default=NORMAL
+)
+
+
+def current_priority() -> str:
+    return _current_priority.get()
+
+
+@contextlib.contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """Run the upstream requests made inside the block with `priority`."""
+    if priority not in PRIORITY_WEIGHTS:
+        raise ValueError(f"Unknown request priority: {priority!r}")
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class FairQueue:
+    """
+    Start-time fair queue over the priority classes.
+
+    Every item is tagged with a virtual finish time of `start + 1 / weight`,
+    where start is the later of the queue's virtual time and the class's
+    previous tag; `pop` serves the smallest tag. Busy classes therefore share
+    the dequeues in proportion to their weights, and a class that was idle
+    cannot bank credit for later.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None,
+                 skip: Callable[[Any], bool] = lambda item: False):
+        self.weights = dict(weights or PRIORITY_WEIGHTS)
+        self._skip = skip
+        self._queues: Dict[str, Deque[Tuple[float, Any]]] = {p: deque() for p in self.weights}
+        self._last_tag = {p: 0.0 for p in self.weights}
+        self._virtual_time = 0.0
+
+    def push(self, priority: str, item: Any) -> None:
+        tag = max(self._virtual_time, self._last_tag[priority]) + 1.0 / self.weights[priority]
+        self._last_tag[priority] = tag
+        self._queues[priority].append((tag, item))
+
+    def _head(self, priority: str) -> Optional[Tuple[float, Any]]:
+        queue = self._queues[priority]
+        while queue and self._skip(queue[0][1]):
+            queue.popleft()
+        return queue[0] if queue else None
+
+    def pop(self, eligible: Iterable[str]) -> Optional[Any]:
+        """The next item of the `eligible` classes, or None."""
+        best = None
+        for priority in eligible:
+            head = self._head(priority)
+            if head is not None and (best is None or head[0] < best[1]):
+                best = (priority, head[0])
+        if best is None:
+            return None
+        priority, tag = best
+        self._virtual_time = tag
+        return self._queues[priority].popleft()[1]
+
+    def count(self, priority: str) -> int:
+        return len(self._queues[priority])
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
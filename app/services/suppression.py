@@ -0,0 +1,368 @@
+"""
+Opt-out / suppression list, checked before every send.
+
+Numbers that must not be messaged are kept in a SQLite database
+(SUPPRESSION_DB_FILE, one WITHOUT ROWID table keyed by the normalised
+number), which is the exact set. A Bloom filter over the same numbers sits
+in front of it: most recipients are not suppressed, and for those the
+filter answers "definitely not" from memory in a few microseconds. Only
+filter hits (the suppressed numbers plus SUPPRESSION_BLOOM_ERROR_RATE of
+the others) are confirmed with an indexed SQLite lookup, which is local and
+adds microseconds too.
+
+Bloom filters cannot forget: removed numbers stay set in the filter and are
+answered by the exact lookup. The filter is rebuilt from the table when it
+outgrows its capacity. Every write transaction that adds numbers bumps the
+table's generation and tags its rows with it, so a process whose filter is
+behind (another server added numbers) catches up with the rows of the newer
+generations; the generation is checked at most once per `refresh_seconds`.
+The filter is saved with its generation on close and after imports, and a
+restart only loads the rows added since.
+
+`filter()` checks a whole recipient list at once: one filter pass, then
+one `IN (...)` query per chunk of filter hits.
+
+Opening the list (which may rebuild the filter) and every SQLite query are
+blocking, so on the event loop the list is opened with
+`load_suppression_list()` and numbers are checked with `contains()`, which
+answers filter misses from memory and does the rest in a worker thread.
+"""
+import asyncio
+import contextlib
+import csv
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.monitoring_service import record_suppressed_send
+from app.utils.phone_numbers import normalize_number
+
+logger = get_logger("app.suppression")
+
+# Parameters per statement stay below SQLite's default limit (999)
+_CHUNK = 900
+_IMPORT_BATCH = 10_000
+
+
+class BloomFilter:
+    """Bloom filter over strings, sized for `capacity` items at `error_rate` false positives."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterator[int]:
+        # Double hashing (Kirsch-Mitzenmacher): k positions from one 128-bit digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % size
+
+    def add(self, key: str) -> None:
+        bits = self.bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def full(self) -> bool:
+        return self.count > self.capacity
+
+
+class SuppressionList:
+    """Suppressed numbers: a Bloom filter in front of an exact SQLite set."""
+
+    def __init__(self, path: str = ":memory:", capacity: int = 1_000_000, error_rate: float = 0.001,
+                 refresh_seconds: float = 1.0):
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_seconds = refresh_seconds
+        self._checked_at = time.monotonic()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        self._db.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS suppressed (
+                number   TEXT PRIMARY KEY,
+                reason   TEXT NOT NULL,
+                added_at REAL NOT NULL,
+                seq      INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS ix_suppressed_seq ON suppressed (seq);
+            CREATE TABLE IF NOT EXISTS generation (
+                id    INTEGER PRIMARY KEY CHECK (id = 1),
+                value INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO generation VALUES (1, 0);
+            CREATE TABLE IF NOT EXISTS bloom_snapshot (
+                id         INTEGER PRIMARY KEY CHECK (id = 1),
+                generation INTEGER NOT NULL,
+                capacity   INTEGER NOT NULL,
+                error_rate REAL NOT NULL,
+                count      INTEGER NOT NULL,
+                bits       BLOB NOT NULL
+            );
+        """)
+        self._bloom, self._bloom_generation = self._load_bloom() or self._rebuild_bloom()
+        self._catch_up()
+        self._grow()
+
+    @classmethod
+    def from_settings(cls) -> "SuppressionList":
+        return cls(path=setting("SUPPRESSION_DB_FILE", "data/suppression.sqlite3"),
+                   capacity=setting("SUPPRESSION_BLOOM_CAPACITY", 1_000_000),
+                   error_rate=setting("SUPPRESSION_BLOOM_ERROR_RATE", 0.001))
+
+    # ---------------- filter ----------------
+
+    def _generation(self) -> int:
+        return self._db.execute("SELECT value FROM generation").fetchone()[0]
+
+    def _load_bloom(self) -> Optional[Tuple[BloomFilter, int]]:
+        row = self._db.execute(
+            "SELECT generation, capacity, error_rate, count, bits FROM bloom_snapshot").fetchone()
+        if row is None:
+            return None
+        generation, capacity, error_rate, count, bits = row
+        bloom = BloomFilter(capacity, error_rate)
+        if error_rate != self.error_rate or len(bits) != len(bloom.bits):
+            return None
+        bloom.bits[:] = bits
+        bloom.count = count
+        return bloom, generation
+
+    def _rebuild_bloom(self) -> Tuple[BloomFilter, int]:
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                generation = self._generation()
+                total = len(self)
+                bloom = BloomFilter(max(self.capacity, 2 * total), self.error_rate)
+                for (number,) in self._db.execute("SELECT number FROM suppressed"):
+                    bloom.add(number)
+            finally:
+                self._db.execute("COMMIT")
+        logger.info("Suppression filter built for %s numbers (capacity %s)", total, bloom.capacity)
+        return bloom, generation
+
+    def _catch_up(self) -> None:
+        """Add the numbers of the generations this filter has not seen (added by other processes)."""
+        with self._lock:
+            generation = self._generation()
+            if generation == self._bloom_generation:
+                return
+            for (number,) in self._db.execute(
+                    "SELECT number FROM suppressed WHERE seq > ?", (self._bloom_generation,)):
+                self._bloom.add(number)
+            self._bloom_generation = generation
+
+    def _grow(self) -> None:
+        if self._bloom.full:
+            self._bloom, self._bloom_generation = self._rebuild_bloom()
+
+    def _refresh_due(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.refresh_seconds
+
+    def _refresh(self) -> None:
+        if self._refresh_due():
+            self._checked_at = time.monotonic()
+            self._catch_up()
+            self._grow()
+
+    def save_filter(self) -> None:
+        """Store the filter so the next start does not rebuild it."""
+        with self._lock:
+            bloom = self._bloom
+            self._db.execute(
+                "INSERT OR REPLACE INTO bloom_snapshot VALUES (1, ?, ?, ?, ?, ?)",
+                (self._bloom_generation, bloom.capacity, bloom.error_rate, bloom.count,
+                 bytes(bloom.bits)),
+            )
+
+    # ---------------- membership ----------------
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM suppressed").fetchone()[0]
+
+    def _stored(self, key: str) -> bool:
+        with self._lock:
+            return self._db.execute(
+                "SELECT 1 FROM suppressed WHERE number = ?", (key,)).fetchone() is not None
+
+    def __contains__(self, number: str) -> bool:
+        self._refresh()
+        key = normalize_number(number)
+        return bool(key) and key in self._bloom and self._stored(key)
+
+    async def contains(self, number: str) -> bool:
+        """`number in self` without blocking the event loop."""
+        if self._refresh_due():
+            await asyncio.to_thread(self._refresh)
+        key = normalize_number(number)
+        if not key or key not in self._bloom:
+            return False
+        return await asyncio.to_thread(self._stored, key)
+
+    def filter(self, numbers: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """(allowed, suppressed) normalised numbers, in input order, without duplicates."""
+        self._refresh()
+        keys = [key for key in dict.fromkeys(map(normalize_number, numbers)) if key]
+        bloom = self._bloom
+        candidates = [key for key in keys if key in bloom]
+        suppressed = set()
+        with self._lock:
+            for start in range(0, len(candidates), _CHUNK):
+                chunk = candidates[start:start + _CHUNK]
+                rows = self._db.execute(
+                    f"SELECT number FROM suppressed WHERE number IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                suppressed.update(number for (number,) in rows)
+        if not suppressed:
+            return keys, []
+        return ([key for key in keys if key not in suppressed],
+                [key for key in keys if key in suppressed])
+
+    def entry(self, number: str) -> Optional[Dict[str, Any]]:
+        key = normalize_number(number)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT number, reason, added_at FROM suppressed WHERE number = ?", (key,)).fetchone()
+        return dict(zip(("number", "reason", "added_at"), row)) if row else None
+
+    # ---------------- updates ----------------
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def add(self, numbers: Iterable[str], reason: str = "opt_out") -> int:
+        """Suppress `numbers`; returns how many were not suppressed yet."""
+        added = 0
+        now = time.time()
+        batch: List[str] = []
+
+        def insert() -> int:
+            before = self._db.total_changes
+            self._db.executemany(
+                "INSERT OR IGNORE INTO suppressed (number, reason, added_at, seq) VALUES (?, ?, ?, ?)",
+                ((key, reason, now, generation) for key in batch),
+            )
+            for key in batch:
+                self._bloom.add(key)
+            batch.clear()
+            return self._db.total_changes - before
+
+        with self._transaction():
+            self._catch_up()
+            generation = self._generation() + 1
+            self._db.execute("UPDATE generation SET value = ?", (generation,))
+            for number in numbers:
+                key = normalize_number(number)
+                if key:
+                    batch.append(key)
+                if len(batch) >= _IMPORT_BATCH:
+                    added += insert()
+            added += insert()
+        self._bloom_generation = generation
+        self._grow()
+        return added
+
+    def remove(self, numbers: Iterable[str]) -> int:
+        """Stop suppressing `numbers`; returns how many were suppressed."""
+        keys = [key for key in dict.fromkeys(map(normalize_number, numbers)) if key]
+        removed = 0
+        with self._transaction():
+            for start in range(0, len(keys), _CHUNK):
+                chunk = keys[start:start + _CHUNK]
+                removed += self._db.execute(
+                    f"DELETE FROM suppressed WHERE number IN ({','.join('?' * len(chunk))})", chunk
+                ).rowcount
+        return removed
+
+    def import_file(self, path: str, reason: str = "opt_out") -> int:
+        """
+        Suppress the numbers in the first column of a CSV or text file (a
+        header row is skipped since it has no digits); returns how many
+        were new.
+        """
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            added = self.add((row[0] for row in csv.reader(f) if row), reason)
+        self.save_filter()
+        return added
+
+    def export_file(self, path: str) -> int:
+        """Write every suppressed number as CSV (number, reason, added_at); returns the count."""
+        count = 0
+        with self._lock, open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(("number", "reason", "added_at"))
+            for row in self._db.execute(
+                    "SELECT number, reason, added_at FROM suppressed ORDER BY number"):
+                writer.writerow(row)
+                count += 1
+        return count
+
+    def close(self) -> None:
+        self.save_filter()
+        self._db.close()
+
+
+_suppression_list: Optional[SuppressionList] = None
+_suppression_lock = threading.Lock()
+
+
+def get_suppression_list() -> SuppressionList:
+    global _suppression_list
+    if _suppression_list is None:
+        with _suppression_lock:
+            if _suppression_list is None:
+                _suppression_list = SuppressionList.from_settings()
+    return _suppression_list
+
+
+async def load_suppression_list() -> SuppressionList:
+    """`get_suppression_list()`, opened in a worker thread the first time."""
+    if _suppression_list is not None:
+        return _suppression_list
+    return await asyncio.to_thread(get_suppression_list)
+
+
+async def suppressed_send(number: str, tool: str) -> Optional[Dict[str, Any]]:
+    """The error result of a send to a suppressed number, or None when it may be sent."""
+    if not await (await load_suppression_list()).contains(number):
+        return None
+    record_suppressed_send(tool)
+    return {
+        "success": False,
+        "error": f"{normalize_number(number)} has opted out of messages; nothing was sent",
+        "suppressed": True,
+    }
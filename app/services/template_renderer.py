@@ -0,0 +1,321 @@
+"""
+Template messages for personalised bulk sends.
+
+`compile_template()` turns a template as returned by get_template_by_id /
+get_templates into a `CompiledTemplate`: the ordered parameter columns the
+template needs ("header_1", "body_1", "body_2", "button_0", ...) and, per
+component, which columns fill its parameters. Rendering a recipient's row
+is then a validation pass over its values and the assembly of the send
+payload, without looking at the template text again.
+
+Rows are checked the way Meta checks them, so bad rows are rejected here
+instead of by the upstream call: every parameter must be set, text
+parameters cannot contain new lines, tabs or more than four consecutive
+spaces, and lengths are limited; media headers need a link or a media id.
+
+`render_template_file()` streams a CSV of recipients (a "to" column plus
+the parameter columns) into a JSON-lines file of ready-to-send payloads
+and a CSV of rejected rows, one row at a time, so memory stays flat for
+lists of any size. Recipients are normalised with to_e164 and opted-out
+numbers are rejected.
+"""
+import csv
+import functools
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.utils import json_backend
+from app.utils.phone_numbers import to_e164
+
+logger = get_logger("app.template_renderer")
+
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z0-9_]+)\s*\}\}")
+# What Meta refuses in text parameters
+_INVALID_TEXT = re.compile(r"[\n\t]| {5,}")
+MEDIA_FORMATS = {"IMAGE": "image", "VIDEO": "video", "DOCUMENT": "document"}
+MAX_LENGTHS = {"header": 60, "body": 1024, "button": 2000}
+REJECTED_SAMPLE_SIZE = 20
+
+
+class TemplateCompileError(ValueError):
+    """The template cannot be sent (not approved, unsupported component, bad placeholders)."""
+
+
+class TemplateRowError(ValueError):
+    """A recipient row does not fit the template."""
+
+    def __init__(self, column: str, reason: str):
+        self.column = column
+        self.reason = reason
+        super().__init__(f"{column}: {reason}")
+
+
+@dataclass(frozen=True)
+class Slot:
+    """One template parameter, filled from column `column` of a row."""
+
+    column: str
+    kind: str                      # text, image, video, document, coupon_code
+    max_length: int = 0
+    parameter_name: Optional[str] = None
+
+    def parameter(self, value: str) -> Dict[str, Any]:
+        if self.kind == "text":
+            parameter = {"type": "text", "text": value}
+            if self.parameter_name:
+                parameter["parameter_name"] = self.parameter_name
+            return parameter
+        if self.kind == "coupon_code":
+            return {"type": "coupon_code", "coupon_code": value}
+        media = {"id": value} if value.isdigit() else {"link": value}
+        return {"type": self.kind, self.kind: media}
+
+    def check(self, value: str) -> Optional[str]:
+        """Why `value` cannot fill this slot, or None."""
+        if not value:
+            return "missing value"
+        if self.kind in MEDIA_FORMATS.values():
+            if not (value.isdigit() or value.startswith(("https://", "http://"))):
+                return "must be a media link (http/https) or media id"
+            return None
+        if self.max_length and len(value) > self.max_length:
+            return f"longer than {self.max_length} characters"
+        if self.kind == "text" and _INVALID_TEXT.search(value):
+            return "contains new lines, tabs or more than 4 consecutive spaces"
+        return None
+
+
+@dataclass(frozen=True)
+class _Component:
+    type: str
+    slots: Tuple[int, ...]
+    sub_type: Optional[str] = None
+    index: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template's parameter-slot plan; renders rows into send payloads."""
+
+    name: str
+    language: str
+    slots: Tuple[Slot, ...]
+    components: Tuple[_Component, ...]
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(slot.column for slot in self.slots)
+
+    def values(self, row: Mapping[str, Any]) -> List[str]:
+        """The row's values in slot order (missing ones as "")."""
+        values = []
+        for slot in self.slots:
+            value = row.get(slot.column)
+            values.append("" if value is None else str(value).strip())
+        return values
+
+    def validate(self, values: Sequence[str]) -> None:
+        """Raise TemplateRowError for the first value that cannot fill its slot."""
+        for slot, value in zip(self.slots, values):
+            reason = slot.check(value)
+            if reason:
+                raise TemplateRowError(slot.column, reason)
+
+    def payload(self, to: str, values: Sequence[str]) -> Dict[str, Any]:
+        """Send payload (POST /messages) of validated `values` for recipient `to`."""
+        components = []
+        for component in self.components:
+            rendered = {"type": component.type,
+                        "parameters": [self.slots[i].parameter(values[i]) for i in component.slots]}
+            if component.sub_type:
+                rendered["sub_type"] = component.sub_type
+                rendered["index"] = str(component.index)
+            components.append(rendered)
+        template: Dict[str, Any] = {"name": self.name, "language": {"code": self.language}}
+        if components:
+            template["components"] = components
+        return {"messaging_product": "whatsapp", "recipient_type": "individual",
+                "to": to, "type": "template", "template": template}
+
+    def render(self, to: str, row: Mapping[str, Any]) -> Dict[str, Any]:
+        values = self.values(row)
+        self.validate(values)
+        return self.payload(to, values)
+
+
+def _placeholders(text: str, component: str) -> List[str]:
+    """Distinct placeholders of `text`, positional ones checked to be {{1}}..{{n}}."""
+    names = list(dict.fromkeys(PLACEHOLDER.findall(text or "")))
+    if names and all(name.isdigit() for name in names):
+        names.sort(key=int)
+        if names != [str(i) for i in range(1, len(names) + 1)]:
+            raise TemplateCompileError(f"{component} placeholders must be {{{{1}}}}..{{{{n}}}}, got {names}")
+    return names
+
+
+def compile_template(template: Mapping[str, Any]) -> CompiledTemplate:
+    """Compile a template (as returned by get_template_by_id) into its slot plan."""
+    name = template.get("name")
+    if not name:
+        raise TemplateCompileError("Template has no name")
+    status = template.get("status")
+    if status and str(status).upper() != "APPROVED":
+        raise TemplateCompileError(f"Template {name} is {status}; only approved templates can be sent")
+    language = template.get("language") or "en"
+    if isinstance(language, Mapping):
+        language = language.get("code") or "en"
+    named = str(template.get("parameter_format", "")).upper() == "NAMED"
+
+    slots: List[Slot] = []
+    components: List[_Component] = []
+
+    def add(component: str, new_slots: List[Slot], **extra) -> None:
+        if new_slots:
+            start = len(slots)
+            slots.extend(new_slots)
+            components.append(_Component(component, tuple(range(start, len(slots))), **extra))
+
+    for component in template.get("components") or ():
+        kind = str(component.get("type", "")).upper()
+        if kind == "HEADER":
+            header_format = str(component.get("format", "TEXT")).upper()
+            if header_format in MEDIA_FORMATS:
+                media = MEDIA_FORMATS[header_format]
+                add("header", [Slot(f"header_{media}", media)])
+            elif header_format == "TEXT":
+                add("header", [Slot(f"header_{key}", "text", MAX_LENGTHS["header"], key if named else None)
+                               for key in _placeholders(component.get("text"), "HEADER")])
+            else:
+                raise TemplateCompileError(f"{header_format} headers are not supported")
+        elif kind == "BODY":
+            add("body", [Slot(f"body_{key}", "text", MAX_LENGTHS["body"], key if named else None)
+                         for key in _placeholders(component.get("text"), "BODY")])
+        elif kind == "BUTTONS":
+            for index, button in enumerate(component.get("buttons") or ()):
+                button_type = str(button.get("type", "")).upper()
+                if button_type == "URL" and PLACEHOLDER.search(button.get("url") or ""):
+                    add("button", [Slot(f"button_{index}", "text", MAX_LENGTHS["button"])],
+                        sub_type="url", index=index)
+                elif button_type == "COPY_CODE":
+                    add("button", [Slot(f"button_{index}", "coupon_code", 15)],
+                        sub_type="copy_code", index=index)
+
+    return CompiledTemplate(str(name), str(language), tuple(slots), tuple(components))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_encoded(encoded: str) -> CompiledTemplate:
+    return compile_template(json_backend.loads(encoded))
+
+
+def compiled_template(template: Mapping[str, Any]) -> CompiledTemplate:
+    """compile_template(), compiled once per distinct template."""
+    return _compile_encoded(json_backend.dumps_strict(template))
+
+
+# ==================== FILES ====================
+
+@dataclass
+class TemplateRenderReport:
+    template: str = ""
+    columns: List[str] = field(default_factory=list)
+    rows: int = 0
+    rendered: int = 0
+    rejected: int = 0
+    output_path: str = ""
+    rejected_path: str = ""
+    seconds: float = 0.0
+    rejected_sample: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+Rendered = Tuple[Optional[Dict[str, Any]], Optional[TemplateRowError]]
+
+
+def render_row(compiled: CompiledTemplate, row: Mapping[str, Any], default_country: str,
+               suppression=None) -> Rendered:
+    """(payload, None), or (None, error) when the row cannot be sent; the row needs a "to" value."""
+    to, reason = to_e164(str(row.get("to") or ""), default_country)
+    if to is None:
+        return None, TemplateRowError("to", reason)
+    if suppression is not None and to in suppression:
+        return None, TemplateRowError("to", "opted out")
+    try:
+        return compiled.render(to, row), None
+    except TemplateRowError as e:
+        return None, e
+
+
+def render_rows(compiled: CompiledTemplate, rows: Iterable[Mapping[str, Any]],
+                default_country: Optional[str] = None, suppression=None) -> Iterator[Rendered]:
+    """render_row() of every row, lazily."""
+    default_country = default_country or setting("DEFAULT_COUNTRY_CODE", "91")
+    for row in rows:
+        yield render_row(compiled, row, default_country, suppression)
+
+
+def render_template_file(compiled: CompiledTemplate, path: str, output_path: Optional[str] = None,
+                         rejected_path: Optional[str] = None, default_country: Optional[str] = None,
+                         exclude_suppressed: bool = True) -> TemplateRenderReport:
+    """
+    Render the recipient CSV at `path` (header row with "to" and the
+    template's columns) into <name>.payloads.jsonl and <name>.rejected.csv.
+    """
+    start = time.monotonic()
+    default_country = default_country or setting("DEFAULT_COUNTRY_CODE", "91")
+    stem = os.path.splitext(path)[0]
+    report = TemplateRenderReport(template=compiled.name, columns=["to", *compiled.columns],
+                                  output_path=output_path or f"{stem}.payloads.jsonl",
+                                  rejected_path=rejected_path or f"{stem}.rejected.csv")
+    suppression = None
+    if exclude_suppressed:
+        from app.services.suppression import get_suppression_list
+        suppression = get_suppression_list()
+
+    with open(path, newline="", encoding="utf-8-sig") as source:
+        reader = csv.DictReader(source)
+        header = [column.strip() for column in reader.fieldnames or ()]
+        missing = [column for column in report.columns if column not in header]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)} (expected {', '.join(report.columns)})")
+        reader.fieldnames = header
+
+        with open(report.output_path, "w", encoding="utf-8") as output, \
+                open(report.rejected_path, "w", newline="", encoding="utf-8") as rejected_file:
+            rejected = csv.writer(rejected_file)
+            rejected.writerow(("line", "to", "column", "reason"))
+            for row in reader:
+                if not any(row.values()):
+                    continue
+                report.rows += 1
+                payload, error = render_row(compiled, row, default_country, suppression)
+                if payload is not None:
+                    report.rendered += 1
+                    output.write(json_backend.dumps(payload))
+                    output.write("\n")
+                    continue
+                report.rejected += 1
+                rejected.writerow((reader.line_num, row.get("to"), error.column, error.reason))
+                if len(report.rejected_sample) < REJECTED_SAMPLE_SIZE:
+                    report.rejected_sample.append({"line": reader.line_num, "to": row.get("to"),
+                                                   "column": error.column, "reason": error.reason})
+
+    report.seconds = round(time.monotonic() - start, 3)
+    logger.info("Rendered %s for %s: %s payloads, %s rejected (%.1fs)", compiled.name, path,
+                report.rendered, report.rejected, report.seconds)
+    return report
+
+
+def iter_payloads(output_path: str) -> Iterator[Dict[str, Any]]:
+    """Payloads of a file written by render_template_file()."""
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json_backend.loads(line)
@@ -0,0 +1,136 @@
+"""
+Tenants: the AiSensy credentials a tool call runs with.
+
+The default tenant comes from settings (PARTNER_ID, BUSINESS_ID,
+AiSensy_API_Key, AISENSY_BEARER_TOKEN, AISENSY_PROJECT_API_PWD). More
+tenants can be listed in the JSON file named by TENANTS_FILE:
+
+    {
+        "acme":   {"business_id": "...", "bearer_token": "..."},
+        "globex": {"partner_id": "...", "api_key": "...", "business_id": "..."}
+    }
+
+Fields left out are taken from the default tenant, so businesses under
+the same partner only need their own business id and Direct API token.
+
+The tenant of the running tool call is held in `current_tenant`; the client
+managers read it to pick (or create) that tenant's clients.
+"""
+import contextvars
+import functools
+import json
+from dataclasses import dataclass, field, fields
+from typing import Dict, Optional, Tuple
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+
+logger = get_logger("app.tenants")
+
+DEFAULT_TENANT_ID = "default"
+
+
+class UnknownTenantError(KeyError):
+    """Raised for a tenant id that is not configured."""
+
+
+@dataclass(frozen=True)
+class Tenant:
+    """Credentials of one partner/business/project."""
+
+    tenant_id: str
+    partner_id: str = ""
+    business_id: str = ""
+    api_key: str = field(default="", repr=False)
+    bearer_token: str = field(default="", repr=False)
+    project_password: str = field(default="", repr=False)
+
+
+class TenantRegistry:
+    """The default tenant plus the tenants loaded from TENANTS_FILE."""
+
+    def __init__(self, default: Tenant, tenants: Optional[Dict[str, Tenant]] = None):
+        self.default = default
+        self._tenants = {default.tenant_id: default, **(tenants or {})}
+
+    @property
+    def multi_tenant(self) -> bool:
+        return len(self._tenants) > 1
+
+    def ids(self):
+        return sorted(self._tenants)
+
+    def get(self, tenant_id: Optional[str] = None) -> Tenant:
+        if not tenant_id:
+            return self.default
+        try:
+            return self._tenants[tenant_id]
+        except KeyError:
+            raise UnknownTenantError(tenant_id) from None
+
+    @classmethod
+    def from_file(cls, default: Tenant, path: str) -> "TenantRegistry":
+        with open(path, encoding="utf-8") as handle:
+            raw = json.load(handle)
+        known = {f.name for f in fields(Tenant)} - {"tenant_id"}
+        tenants = {}
+        for tenant_id, values in raw.items():
+            unknown = set(values) - known
+            if unknown:
+                raise ValueError(f"Tenant {tenant_id!r}: unknown fields {sorted(unknown)}")
+            inherited = {name: getattr(default, name) for name in known}
+            tenants[tenant_id] = Tenant(tenant_id=tenant_id, **{**inherited, **values})
+        logger.info("Loaded %s tenants from %s", len(tenants), path)
+        return cls(default, tenants)
+
+
+def tenant_pool_options() -> Tuple[int, float]:
+    """(TENANT_POOL_SIZE, TENANT_IDLE_SECONDS)."""
+    return setting("TENANT_POOL_SIZE", 256), setting("TENANT_IDLE_SECONDS", 900.0)
+
+
+def _tenant_settings() -> Dict[str, str]:
+    """Read the tenant settings."""
+    names = ("PARTNER_ID", "BUSINESS_ID", "AiSensy_API_Key", "AISENSY_BEARER_TOKEN",
+             "AISENSY_PROJECT_API_PWD", "TENANTS_FILE")
+    return {name: setting(name, "") or "" for name in names}
+
+
+def tenants_file() -> str:
+    return _tenant_settings()["TENANTS_FILE"]
+
+
+@functools.lru_cache(maxsize=1)
+def get_tenant_registry() -> TenantRegistry:
+    values = _tenant_settings()
+    default = Tenant(
+        tenant_id=DEFAULT_TENANT_ID,
+        partner_id=values["PARTNER_ID"],
+        business_id=values["BUSINESS_ID"],
+        api_key=values["AiSensy_API_Key"],
+        bearer_token=values["AISENSY_BEARER_TOKEN"],
+        project_password=values["AISENSY_PROJECT_API_PWD"],
+    )
+    if values["TENANTS_FILE"]:
+        return TenantRegistry.from_file(default, values["TENANTS_FILE"])
+    return TenantRegistry(default)
+
+
+# Tenant of the tool call running in the current task (None = default tenant)
+_current_tenant: contextvars.ContextVar[Optional[Tenant]] = contextvars.ContextVar(
+    "current_tenant", default=None
+)
+
+
+def current_tenant() -> Tenant:
+    """The tenant selected for the running tool call, or the default tenant."""
+    return _current_tenant.get() or get_tenant_registry().default
+
+
+def use_tenant(tenant: Optional[Tenant]) -> contextvars.Token:
+    """Select `tenant` for the current task; undo with `reset_tenant(token)`."""
+    return _current_tenant.set(tenant)
+
+
+def reset_tenant(token: contextvars.Token) -> None:
+    _current_tenant.reset(token)
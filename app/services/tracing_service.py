@@ -0,0 +1,272 @@
+"""
+OpenTelemetry tracing shared by both MCP servers.
+
+Span hierarchy for a tool call:
+    tool <name>                        (FastMCP middleware)
+    ├── validate <RequestModel>        (pydantic request model construction)
+    ├── client_manager.acquire         (wait on the BaseClientManager lock)
+    └── <service>.<client method>      (client endpoint method)
+        └── HTTP <METHOD>              (aiohttp request; connector queue wait as events)
+
+Tracing is off unless TRACING_EXPORTER is set ("otlp", "console" or
+"memory"). When off, or when opentelemetry is not installed, every helper
+here is a pass-through, and opentelemetry is never imported.
+
+Sampling is head-based: `ParentBased(TraceIdRatioBased(TRACING_SAMPLE_RATIO))`
+keeps the overhead proportional to the sampled share of tool calls, and an
+incoming sampled parent is always honoured.
+"""
+import contextlib
+import functools
+import inspect
+from typing import Any, Dict, Optional
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+
+logger = get_logger("app.tracing")
+
+# Set by setup_tracing(); None means tracing is disabled
+_tracer = None
+_memory_exporter = None
+_NOOP = contextlib.nullcontext()
+
+
+def _tracing_options() -> Dict[str, Any]:
+    return {
+        "exporter": setting("TRACING_EXPORTER", ""),
+        "sample_ratio": setting("TRACING_SAMPLE_RATIO", 0.05),
+        "otlp_endpoint": setting("OTEL_EXPORTER_OTLP_ENDPOINT", ""),
+    }
+
+
+def setup_tracing(service_name: str, exporter: Optional[str] = None,
+                  sample_ratio: Optional[float] = None, otlp_endpoint: Optional[str] = None) -> bool:
+    """
+    Install a tracer provider for `service_name`.
+
+    Arguments override the TRACING_* settings. Returns True when tracing is
+    active. Only the first successful call configures the provider.
+    """
+    global _tracer, _memory_exporter
+
+    if _tracer is not None:
+        return True
+
+    options = _tracing_options()
+    exporter = (exporter if exporter is not None else options["exporter"]).strip().lower()
+    sample_ratio = sample_ratio if sample_ratio is not None else options["sample_ratio"]
+    otlp_endpoint = otlp_endpoint if otlp_endpoint is not None else options["otlp_endpoint"]
+
+    if not exporter:
+        return False
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (BatchSpanProcessor, ConsoleSpanExporter,
+                                                    SimpleSpanProcessor)
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError:
+        logger.warning("TRACING_EXPORTER=%s but opentelemetry-sdk is not installed", exporter)
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(float(sample_ratio))),
+    )
+
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        span_exporter = OTLPSpanExporter(endpoint=otlp_endpoint) if otlp_endpoint else OTLPSpanExporter()
+        provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    elif exporter == "console":
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    elif exporter == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        _memory_exporter = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(_memory_exporter))
+    else:
+        logger.warning("Unknown TRACING_EXPORTER %r, tracing disabled", exporter)
+        return False
+
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer("aisensy.mcp")
+    logger.info("Tracing enabled for %s (exporter=%s, sample_ratio=%s)",
+                service_name, exporter, sample_ratio)
+    return True
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def get_finished_spans() -> list:
+    """Spans collected by the in-memory exporter (TRACING_EXPORTER=memory)."""
+    return list(_memory_exporter.get_finished_spans()) if _memory_exporter is not None else []
+
+
+def span(name: str, **attributes):
+    """Context manager opening a child span, or a no-op when tracing is off."""
+    if _tracer is None:
+        return _NOOP
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def current_span():
+    """The active span (non-recording when tracing is off)."""
+    if _tracer is None:
+        return None
+    from opentelemetry import trace
+    return trace.get_current_span()
+
+
+# ==================== CLIENT METHODS ====================
+
+def _trace_method(service: str, name: str, func):
+    span_name = f"{service}.{name}"
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if _tracer is None:
+            return await func(self, *args, **kwargs)
+        with _tracer.start_as_current_span(span_name, attributes={"aisensy.service": service}) as s:
+            result = await func(self, *args, **kwargs)
+            if isinstance(result, dict) and result.get("success") is False:
+                s.set_attribute("aisensy.error", str(result.get("error")))
+                if "status_code" in result:
+                    s.set_attribute("http.response.status_code", result["status_code"])
+            return result
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_client_methods(cls, service: str) -> None:
+    """Open a span around every public coroutine method defined on `cls`."""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or name == "close":
+            continue
+        if inspect.iscoroutinefunction(attr) and not getattr(attr, "__traced__", False):
+            setattr(cls, name, _trace_method(service, name, attr))
+
+
+# ==================== REQUEST MODELS ====================
+
+def _trace_model_init(model):
+    original_init = model.__init__
+    span_name = f"validate {model.__name__}"
+
+    @functools.wraps(original_init)
+    def __init__(self, *args, **kwargs):
+        if _tracer is None:
+            return original_init(self, *args, **kwargs)
+        with _tracer.start_as_current_span(span_name):
+            return original_init(self, *args, **kwargs)
+
+    __init__.__traced__ = True
+    return __init__
+
+
+def trace_request_models(models) -> None:
+    """
+    Open a "validate <Model>" span whenever one of `models` is constructed.
+
+    Tools validate their arguments by building a request model, so timing
+    the constructor isolates pydantic validation from the upstream call.
+    """
+    for model in models:
+        if not isinstance(model, type) or getattr(model.__init__, "__traced__", False):
+            continue
+        model.__init__ = _trace_model_init(model)
+
+
+# ==================== HTTP ====================
+
+def tracing_trace_config(service: str):
+    """
+    aiohttp TraceConfig producing an HTTP client span per request.
+
+    The W3C trace headers are injected into the outgoing request, and time
+    spent waiting for a free connector slot or opening a connection is
+    recorded as span events.
+    """
+    import aiohttp
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+
+    async def on_request_start(session, ctx, params):
+        ctx.span = None
+        if _tracer is None:
+            return
+        ctx.span = _tracer.start_span(
+            f"HTTP {params.method}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "http.request.method": params.method,
+                "url.full": str(params.url.with_query(None)),
+                "server.address": params.url.host or "",
+                "aisensy.service": service,
+            },
+        )
+        propagate.inject(params.headers, context=trace.set_span_in_context(ctx.span))
+
+    async def on_connection_queued_start(session, ctx, params):
+        if getattr(ctx, "span", None) is not None:
+            ctx.span.add_event("connection_queued")
+
+    async def on_connection_queued_end(session, ctx, params):
+        if getattr(ctx, "span", None) is not None:
+            ctx.span.add_event("connection_dequeued")
+
+    async def on_connection_create_start(session, ctx, params):
+        if getattr(ctx, "span", None) is not None:
+            ctx.span.add_event("connection_create_start")
+
+    async def on_connection_create_end(session, ctx, params):
+        if getattr(ctx, "span", None) is not None:
+            ctx.span.add_event("connection_create_end")
+
+    async def on_connection_reuseconn(session, ctx, params):
+        if getattr(ctx, "span", None) is not None:
+            ctx.span.add_event("connection_reused")
+
+    async def on_request_end(session, ctx, params):
+        span_ = getattr(ctx, "span", None)
+        if span_ is None:
+            return
+        status = params.response.status
+        span_.set_attribute("http.response.status_code", status)
+        if status >= 400:
+            span_.set_status(Status(StatusCode.ERROR))
+        span_.end()
+
+    async def on_request_exception(session, ctx, params):
+        span_ = getattr(ctx, "span", None)
+        if span_ is None:
+            return
+        span_.record_exception(params.exception)
+        span_.set_status(Status(StatusCode.ERROR, type(params.exception).__name__))
+        span_.end()
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_queued_start.append(on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(on_connection_queued_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+def client_trace_configs(service: str) -> list:
+    """Trace configs for a client session: metrics always, tracing when enabled."""
+    from app.services.monitoring_service import upstream_trace_config
+
+    configs = [upstream_trace_config(service)]
+    if _tracer is not None:
+        configs.append(tracing_trace_config(service))
+    return configs
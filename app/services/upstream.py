@@ -0,0 +1,121 @@
+"""
+Request policies shared by the AiSensy clients, and the executor that
+sends the request of any endpoint.
+
+Every client session runs its requests through the aiohttp client
+middlewares returned by `client_middlewares(service)`, in order; the first
+middleware sees the request first and the response last.
+"""
+import asyncio
+import contextlib
+import logging
+import string
+from typing import Any, Dict, List, Mapping, Tuple
+
+import aiohttp
+
+from app.services.circuit_breaker import CircuitOpenError, circuit_breaker_middleware, circuit_breakers_enabled
+from app.services.concurrency import adaptive_concurrency_enabled, concurrency_limit_middleware
+from app.services.endpoints import Endpoint
+
+
+def client_middlewares(service: str) -> Tuple:
+    """aiohttp client middlewares for the sessions of `service` ("partner" or "direct_api")."""
+    middlewares = []
+    if circuit_breakers_enabled():
+        # Before the limiter: open circuits fail fast instead of queueing for a slot
+        middlewares.append(circuit_breaker_middleware(service))
+    if adaptive_concurrency_enabled():
+        middlewares.append(concurrency_limit_middleware(service))
+    return tuple(middlewares)
+
+
+def _path_fields(path: str) -> List[str]:
+    return [name for _, name, _, _ in string.Formatter().parse(path) if name]
+
+
+def _fill(template: Mapping[str, Any], values: Dict[str, Any], optional=(),
+          omit_falsy=()) -> Dict[str, Any]:
+    """Request fields from a (nested) field -> argument mapping."""
+    filled = {}
+    for key, source in template.items():
+        value = _fill(source, values) if isinstance(source, Mapping) else values.get(source)
+        if (value is None and key in optional) or (not value and key in omit_falsy):
+            continue
+        filled[key] = value
+    return filled
+
+
+def _missing(names: List[str]) -> Dict[str, Any]:
+    listed = names[0] if len(names) == 1 else f"{', '.join(names[:-1])} and {names[-1]}"
+    return {"success": False,
+            "error": f"Missing required field{'s' if len(names) > 1 else ''}: {listed}"}
+
+
+async def call_endpoint(client, endpoint: Endpoint, arguments: Dict[str, Any],
+                        logger: logging.Logger) -> Dict[str, Any]:
+    """
+    Send the request of `endpoint` for one client method call and answer
+    like every client method: {"success": True, "data": ...} on one of its
+    ok statuses, the client's `_handle_error()` for other statuses, and
+    {"success": False, "error": ...} for invalid arguments and failed
+    requests.
+    """
+    fields = _path_fields(endpoint.path)
+    values = {name: getattr(client, name, None) for name in fields}
+    values.update(arguments)
+    missing = [name for name in dict.fromkeys((*fields, *endpoint.required)) if not values.get(name)]
+    if missing:
+        logger.error("Missing %s for %s", ", ".join(missing), endpoint.name)
+        return _missing(missing)
+
+    params = _fill(endpoint.params, values, endpoint.optional, endpoint.omit_falsy)
+    body = _fill(endpoint.body, values, endpoint.optional, endpoint.omit_falsy)
+    if endpoint.require_body and not body:
+        logger.error("No fields provided to %s", endpoint.name)
+        return {"success": False, "error": "No fields provided to update"}
+
+    url = client.BASE_URL + endpoint.path.format(**{name: values[name] for name in fields})
+    logger.debug("%s %s (%s)", endpoint.verb, url, endpoint.name)
+    try:
+        with contextlib.ExitStack() as stack:
+            form = None
+            if endpoint.form:
+                form = aiohttp.FormData()
+                for key, source in endpoint.form.items():
+                    if key in endpoint.files:
+                        form.add_field(key, stack.enter_context(open(values[source], "rb")))
+                    else:
+                        form.add_field(key, str(values.get(source)))
+
+            session = await client._get_session()
+            async with session.request(
+                endpoint.verb, url,
+                params=params or None,
+                json=body if endpoint.body else None,
+                data=form,
+                timeout=client._request_timeout(),
+            ) as response:
+                if response.status in endpoint.ok_statuses:
+                    data = await client._read_json(response)
+                    logger.info("%s succeeded", endpoint.name)
+                    return {"success": True, "data": data}
+
+                error_text = await response.text()
+                return client._handle_error(response.status, error_text)
+
+    except FileNotFoundError as e:
+        logger.error("File not found: %s", e.filename)
+        return {"success": False, "error": f"File not found: {e.filename}"}
+    except aiohttp.ClientConnectorError:
+        logger.error("Network connection error")
+        return {"success": False, "error": "Network connection error"}
+    except asyncio.TimeoutError:
+        logger.error("Request timeout")
+        return {"success": False, "error": "Request timeout"}
+    except CircuitOpenError as e:
+        logger.warning("%s rejected: %s", endpoint.name, e)
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        logger.exception("Unexpected error")
+        return {"success": False, "error": str(e)}
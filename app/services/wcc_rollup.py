@@ -0,0 +1,396 @@
+"""
+Partner-wide WhatsApp Cloud Credits (WCC) usage, rolled up per month.
+
+get_wcc_usage_analytics returns the daily usage of one project per call.
+`WccRollup` fans those calls out over every project of every tenant (at
+most WCC_ROLLUP_CONCURRENCY requests at a time, at bulk priority so agents'
+calls go first, and under the clients' own concurrency limits), sums the
+days into months and rolls the months up by month, project or business.
+
+A month is closed WCC_ROLLUP_CLOSE_DAYS days after it ends; its usage no
+longer changes. The monthly usage of closed months is kept per project in
+WCC_ROLLUP_CACHE_DIR, together with the last closed month the project was
+fetched after ("covered_through", so months without usage are known too).
+A project is only fetched again when the report asks for an open month or
+a closed month after covered_through, so reports on past months after the
+first one are answered from disk.
+
+Aggregation is columnar and dependency-free: every metric is an
+array('d') column, rows are added into the columns by group index. The
+resulting `UsageTable` exports to Parquet or Arrow IPC when pyarrow is
+installed (the arrays are handed to Arrow without copying), and to CSV
+otherwise.
+
+The upstream calls are made by a source object (the onboarding server
+provides one backed by its Partner API clients):
+
+    tenants() -> iterable of tenant ids
+    async projects(tenant, slots) -> list of {"id", "business_id", ...}
+        (see app.services.partner_projects)
+    async wcc_usage(tenant, project_id) -> list of daily usage records
+"""
+import asyncio
+import csv
+import functools
+import hashlib
+import io
+import os
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.monitoring_service import record_wcc_rollup_projects
+from app.services.partner_projects import list_projects
+from app.services.scheduling import BULK, request_priority
+from app.utils import json_backend
+from app.utils.helpers import write_atomic
+
+logger = get_logger("app.wcc_rollup")
+
+# Output column -> path of the value in a daily wccAnalytics record
+METRICS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("total_chats", ("totalChatCount",)),
+    ("sent_chats", ("sentChatCount",)),
+    ("delivered_chats", ("deliveredChatCount",)),
+    ("read_chats", ("readChatCount",)),
+    ("failed_chats", ("failedChatCount",)),
+    ("enqueued_chats", ("enqueuedChatCount",)),
+    ("credit_used", ("centralBalanceUsedCount",)),
+    ("credit_messages", ("centralBalanceMessagesCount",)),
+    ("template_credit_used", ("templateCreditUsedCount",)),
+    ("template_messages", ("templateMessagesCount",)),
+    ("free_tier_messages", ("freeTierCount",)),
+    ("mc_messages", ("mcCentralBalanceMetrics", "count")),
+    ("mc_credit_used", ("mcCentralBalanceMetrics", "creditUsage")),
+    ("uc_messages", ("ucCentralBalanceMetrics", "count")),
+    ("uc_credit_used", ("ucCentralBalanceMetrics", "creditUsage")),
+)
+METRIC_NAMES = tuple(name for name, _ in METRICS)
+GROUP_KEYS = {"project": "project_id", "business": "business_id"}
+EXPORT_FORMATS = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+
+# days, value per metric
+MonthUsage = Tuple[int, array]
+
+
+def _zeros() -> array:
+    return array("d", [0.0]) * len(METRICS)
+
+
+def _value(day: Dict[str, Any], path: Tuple[str, ...]) -> float:
+    value: Any = day
+    for key in path:
+        if not isinstance(value, dict):
+            return 0.0
+        value = value.get(key)
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def monthly_usage(days: Iterable[Dict[str, Any]]) -> Dict[str, MonthUsage]:
+    """Daily usage records summed per month (YYYY-MM of dayDate)."""
+    months: Dict[str, MonthUsage] = {}
+    for day in days:
+        month = str(day.get("dayDate") or "")[:7]
+        if len(month) != 7:
+            continue
+        count, values = months.get(month) or (0, _zeros())
+        for i, (_, path) in enumerate(METRICS):
+            values[i] += _value(day, path)
+        months[month] = (count + 1, values)
+    return months
+
+
+def month_range(start: str, end: str) -> List[str]:
+    """YYYY-MM months from start to end, both included."""
+    year, month = (int(part) for part in start.split("-"))
+    end_year, end_month = (int(part) for part in end.split("-"))
+    if not (1 <= month <= 12 and 1 <= end_month <= 12):
+        raise ValueError(f"Invalid month in {start!r}..{end!r} (expected YYYY-MM)")
+    months = []
+    while (year, month) <= (end_year, end_month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    if not months:
+        raise ValueError(f"start_month {start} is after end_month {end}")
+    return months
+
+
+def _next_month_start(month: str) -> datetime:
+    year, number = (int(part) for part in month.split("-"))
+    year, number = (year + 1, 1) if number == 12 else (year, number + 1)
+    return datetime(year, number, 1, tzinfo=timezone.utc)
+
+
+class UsageTable:
+    """Rolled-up usage as columns: key columns, a days column and one array('d') per metric."""
+
+    def __init__(self, key_names: Sequence[str]):
+        self.keys: Dict[str, List[str]] = {name: [] for name in key_names}
+        self.days = array("q")
+        self.metrics: Dict[str, array] = {name: array("d") for name in METRIC_NAMES}
+        self._index: Dict[tuple, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def add(self, key: tuple, days: int, values: array) -> None:
+        row = self._index.get(key)
+        if row is None:
+            row = self._index[key] = len(self.days)
+            for column, value in zip(self.keys.values(), key):
+                column.append(value)
+            self.days.append(0)
+            for column in self.metrics.values():
+                column.append(0.0)
+        self.days[row] += days
+        for column, value in zip(self.metrics.values(), values):
+            column[row] += value
+
+    def sorted(self) -> "UsageTable":
+        order = sorted(range(len(self)), key=lambda row: tuple(column[row] or "" for column in self.keys.values()))
+        table = UsageTable(self.keys)
+        for name, column in self.keys.items():
+            table.keys[name] = [column[row] for row in order]
+        table.days = array("q", (self.days[row] for row in order))
+        table.metrics = {name: array("d", (column[row] for row in order)) for name, column in self.metrics.items()}
+        table._index = {tuple(column[i] for column in table.keys.values()): i for i in range(len(order))}
+        return table
+
+    def rows(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        count = len(self) if limit is None else min(limit, len(self))
+        return [{**{name: column[row] for name, column in self.keys.items()}, "days": self.days[row],
+                 **{name: round(column[row], 4) for name, column in self.metrics.items()}}
+                for row in range(count)]
+
+    def totals(self) -> Dict[str, float]:
+        return {name: round(sum(column), 4) for name, column in self.metrics.items()}
+
+
+def group_columns(group_by: Sequence[str]) -> List[str]:
+    """Key columns of a group_by ("project", "business"); ValueError for anything else."""
+    unknown = [name for name in group_by if name not in GROUP_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown group_by {', '.join(unknown)}; use {', '.join(GROUP_KEYS)}")
+    return [GROUP_KEYS[name] for name in dict.fromkeys(group_by)]
+
+
+def rollup(usage: Iterable[Tuple[Dict[str, Any], str, MonthUsage]], group_by: Sequence[str] = ()) -> UsageTable:
+    """Sum (labels, month, usage) entries into a table keyed by month and the group_by labels."""
+    names = group_columns(group_by)
+    table = UsageTable(["month", *names])
+    for labels, month, (days, values) in usage:
+        table.add((month, *(labels.get(name) for name in names)), days, values)
+    return table.sorted()
+
+
+# ==================== EXPORT ====================
+
+def _pyarrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        return None
+
+
+def _arrow_table(pa, table: UsageTable):
+    def column(values: array, arrow_type):
+        # array('q') / array('d') buffers are int64 / float64 in native order: no copy
+        return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+
+    return pa.table({
+        **{name: pa.array(values, pa.string()) for name, values in table.keys.items()},
+        "days": column(table.days, pa.int64()),
+        **{name: column(values, pa.float64()) for name, values in table.metrics.items()},
+    })
+
+
+def _csv_bytes(table: UsageTable) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([*table.keys, "days", *table.metrics])
+    columns = [*table.keys.values(), table.days, *table.metrics.values()]
+    writer.writerows(zip(*columns))
+    return buffer.getvalue().encode("utf-8")
+
+
+def export_table(table: UsageTable, path: str, export_format: str = "auto") -> Dict[str, Any]:
+    """
+    Write `table` to `path` plus the format's extension: parquet or arrow
+    (Arrow IPC file) with pyarrow, csv without; "auto" picks parquet when
+    pyarrow is installed and csv otherwise.
+    """
+    export_format = (export_format or "auto").strip().lower()
+    pa = _pyarrow()
+    if export_format == "auto":
+        export_format = "parquet" if pa is not None else "csv"
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format {export_format!r} (expected auto, parquet, arrow or csv)")
+
+    if export_format == "csv":
+        data = _csv_bytes(table)
+    elif pa is None:
+        raise ValueError(f"Exporting {export_format} needs pyarrow, which is not installed; use csv")
+    else:
+        arrow_table = _arrow_table(pa, table)
+        sink = pa.BufferOutputStream()
+        if export_format == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(arrow_table, sink)
+        else:
+            with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+                writer.write_table(arrow_table)
+        data = sink.getvalue().to_pybytes()
+
+    path += EXPORT_FORMATS[export_format]
+    write_atomic(path, data)
+    logger.info("Exported %s WCC usage rows to %s", len(table), path)
+    return {"path": os.path.abspath(path), "format": export_format, "rows": len(table), "bytes": len(data)}
+
+
+# ==================== CACHE ====================
+
+class WccUsageCache:
+    """Monthly usage of closed months per project, one JSON file per project."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, project_id: str) -> str:
+        name = hashlib.sha256(project_id.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, "projects", name[:2], f"{name}.json")
+
+    def load(self, project_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(project_id), "rb") as f:
+                entry = json_backend.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning("Ignoring unreadable WCC usage cache of project %s", project_id)
+            return None
+        if entry.get("project_id") != project_id or entry.get("metrics") != list(METRIC_NAMES):
+            return None
+        return entry
+
+    def store(self, project_id: str, covered_through: str, months: Dict[str, MonthUsage]) -> None:
+        entry = {
+            "project_id": project_id,
+            "covered_through": covered_through,
+            "metrics": list(METRIC_NAMES),
+            "months": {month: [days, *values] for month, (days, values) in sorted(months.items())},
+        }
+        write_atomic(self._path(project_id), json_backend.dumps_bytes(entry))
+
+    @staticmethod
+    def months(entry: Dict[str, Any]) -> Dict[str, MonthUsage]:
+        return {month: (int(row[0]), array("d", row[1:])) for month, row in entry.get("months", {}).items()}
+
+
+# ==================== ROLLUP ====================
+
+class WccRollup:
+    """Partner-wide monthly WCC usage from per-project analytics, with closed months cached."""
+
+    def __init__(self, source, cache: WccUsageCache, concurrency: int = 8, close_days: float = 2.0,
+                 clock=time.time):
+        self.source = source
+        self.cache = cache
+        self.concurrency = concurrency
+        self.close_days = close_days
+        self._clock = clock
+
+    def _now(self) -> datetime:
+        return datetime.fromtimestamp(self._clock(), timezone.utc)
+
+    def current_month(self) -> str:
+        return self._now().strftime("%Y-%m")
+
+    def closed(self, month: str) -> bool:
+        return self._now() >= _next_month_start(month) + timedelta(days=self.close_days)
+
+    def last_closed_month(self) -> str:
+        month = self.current_month()
+        while not self.closed(month):
+            year, number = (int(part) for part in month.split("-"))
+            month = f"{year - 1:04d}-12" if number == 1 else f"{year:04d}-{number - 1:02d}"
+        return month
+
+    async def _project_usage(self, tenant: str, project_id: str, months: List[str], through: str,
+                             refresh: bool, slots: asyncio.Semaphore) -> Tuple[Dict[str, MonthUsage], bool]:
+        """Usage of the requested months of one project, and whether it was fetched."""
+        entry = None if refresh else await asyncio.to_thread(self.cache.load, project_id)
+        if entry is not None and all(month <= entry["covered_through"] for month in months):
+            cached = self.cache.months(entry)
+            return {month: cached[month] for month in months if month in cached}, False
+
+        async with slots:
+            days = await self.source.wcc_usage(tenant, project_id)
+        usage = monthly_usage(days)
+        closed = {month: value for month, value in usage.items() if month <= through}
+        await asyncio.to_thread(self.cache.store, project_id, through, closed)
+        return {month: usage[month] for month in months if month in usage}, True
+
+    async def report(self, start_month: Optional[str] = None, end_month: Optional[str] = None,
+                     group_by: Sequence[str] = (), refresh: bool = False) -> Tuple[UsageTable, Dict[str, Any]]:
+        """
+        Usage of all projects from start_month to end_month (YYYY-MM, both
+        included; default: the current month), rolled up by month and
+        `group_by` ("project", "business"). Returns the table and a summary
+        of where the data came from.
+        """
+        start = time.monotonic()
+        end_month = end_month or self.current_month()
+        months = month_range(start_month or end_month, end_month)
+        group_columns(group_by)
+        through = self.last_closed_month()
+        errors: Dict[str, str] = {}
+        slots = asyncio.Semaphore(self.concurrency)
+
+        with request_priority(BULK):
+            projects = await list_projects(self.source, slots, errors)
+            results = await asyncio.gather(
+                *(self._project_usage(tenant, str(project["id"]), months, through, refresh, slots)
+                  for tenant, project in projects),
+                return_exceptions=True)
+
+        usage = []
+        fetched = cached = 0
+        for (_, project), result in zip(projects, results):
+            if isinstance(result, BaseException):
+                errors[str(project["id"])] = f"{type(result).__name__}: {result}"
+                logger.warning("WCC usage of project %s failed: %s", project["id"], result)
+                continue
+            project_months, was_fetched = result
+            fetched += was_fetched
+            cached += not was_fetched
+            labels = {"project_id": str(project["id"]), "business_id": project.get("business_id")}
+            usage.extend((labels, month, value) for month, value in project_months.items())
+
+        table = rollup(usage, group_by)
+        record_wcc_rollup_projects("fetched", fetched)
+        record_wcc_rollup_projects("cached", cached)
+        record_wcc_rollup_projects("failed", len(errors))
+        summary = {
+            "months": months,
+            "open_months": [month for month in months if month > through],
+            "projects": len(projects),
+            "projects_fetched": fetched,
+            "projects_from_cache": cached,
+            "errors": errors,
+            "seconds": round(time.monotonic() - start, 3),
+        }
+        logger.info("WCC usage rollup %s..%s: %s projects (%s fetched, %s cached) in %.2fs",
+                    months[0], months[-1], len(projects), fetched, cached, summary["seconds"])
+        return table, summary
+
+
+@functools.lru_cache(maxsize=1)
+def get_wcc_usage_cache() -> WccUsageCache:
+    return WccUsageCache(setting("WCC_ROLLUP_CACHE_DIR", "data/wcc_usage"))
@@ -0,0 +1,318 @@
+"""
+Ingestion of AiSensy webhooks: delivery statuses and inbound messages.
+
+AiSensy forwards the WhatsApp Cloud API webhooks to the receiver in
+app.api.v1.endpoints.webhooks. A delivery is checked against its
+X-Hub-Signature-256 (HMAC-SHA256 of the raw body with WEBHOOK_SECRET),
+parsed into table rows and handed to the `WebhookBuffer`, and acknowledged
+at once; nothing on the request path waits for the database.
+
+The buffer writes its events to Postgres (message_statuses,
+inbound_messages) in batches of up to WEBHOOK_BATCH_SIZE, at least every
+WEBHOOK_FLUSH_SECONDS, from a worker thread. Inserts ignore rows that are
+already stored, so redelivered webhooks and retried batches are harmless.
+When the database falls behind and WEBHOOK_MAX_BUFFERED events are
+waiting, deliveries are refused with 503 and AiSensy redelivers them later.
+
+`message_status()` and `recent_inbound_messages()` answer the MCP tools
+from the database plus the events still waiting in this process's buffer.
+"""
+import asyncio
+import functools
+import hashlib
+import hmac
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.config.logging import get_logger
+from app.config.settings import setting
+from app.services.monitoring_service import (record_webhook_events, record_webhook_flush,
+                                             set_webhook_buffered)
+
+logger = get_logger("app.webhooks")
+
+SIGNATURE_HEADER = "x-hub-signature-256"
+STATUS_ORDER = {"sent": 0, "delivered": 1, "read": 2, "failed": 3}
+
+Rows = List[Dict[str, Any]]
+
+
+def signature_valid(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """Whether `signature` ("sha256=<hex>") is the HMAC-SHA256 of `body` under `secret`."""
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len("sha256="):])
+
+
+def _message_text(message: Dict[str, Any]) -> Optional[str]:
+    kind = message.get("type")
+    content = message.get(kind) if isinstance(message.get(kind), dict) else {}
+    if kind == "text":
+        return content.get("body")
+    if kind == "button":
+        return content.get("text")
+    if kind == "interactive":
+        reply = content.get("button_reply") or content.get("list_reply") or {}
+        return reply.get("title")
+    return content.get("caption")
+
+
+def _dicts(items: Any) -> List[Dict[str, Any]]:
+    return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+
+def _status_row(status: Dict[str, Any], phone_number_id: Optional[str], now: datetime) -> Dict[str, Any]:
+    return {
+        "message_id": status["id"],
+        "status": status["status"],
+        "timestamp": int(status.get("timestamp") or 0),
+        "recipient_id": status.get("recipient_id"),
+        "phone_number_id": phone_number_id,
+        "conversation_id": (status.get("conversation") or {}).get("id"),
+        "pricing_category": (status.get("pricing") or {}).get("category"),
+        "errors": status.get("errors"),
+        "received_at": now,
+    }
+
+
+def _message_row(message: Dict[str, Any], phone_number_id: Optional[str],
+                 names: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    return {
+        "message_id": message["id"],
+        "from_number": message.get("from") or "",
+        "timestamp": int(message.get("timestamp") or 0),
+        "type": message.get("type") or "unknown",
+        "text": _message_text(message),
+        "contact_name": names.get(message.get("from")),
+        "phone_number_id": phone_number_id,
+        "payload": message,
+        "received_at": now,
+    }
+
+
+def parse_events(payload: Any) -> Tuple[Rows, Rows]:
+    """
+    (status rows, inbound message rows) of a WhatsApp Cloud API webhook
+    payload; events without an id are skipped, and malformed events (a
+    timestamp that is not epoch seconds, fields of the wrong type) are
+    counted and skipped without affecting the rest of the delivery.
+    """
+    statuses: Rows = []
+    messages: Rows = []
+    malformed = {"status": 0, "message": 0}
+    if not isinstance(payload, dict):
+        return statuses, messages
+    now = datetime.now(timezone.utc)
+    for entry in _dicts(payload.get("entry")):
+        for change in _dicts(entry.get("changes")):
+            value = change.get("value")
+            if not isinstance(value, dict):
+                continue
+            metadata = value.get("metadata")
+            phone_number_id = metadata.get("phone_number_id") if isinstance(metadata, dict) else None
+            names = {}
+            for contact in _dicts(value.get("contacts")):
+                profile = contact.get("profile")
+                names[contact.get("wa_id")] = profile.get("name") if isinstance(profile, dict) else None
+            for status in _dicts(value.get("statuses")):
+                if not status.get("id") or not status.get("status"):
+                    continue
+                try:
+                    statuses.append(_status_row(status, phone_number_id, now))
+                except (AttributeError, TypeError, ValueError):
+                    malformed["status"] += 1
+            for message in _dicts(value.get("messages")):
+                if not message.get("id"):
+                    continue
+                try:
+                    messages.append(_message_row(message, phone_number_id, names, now))
+                except (AttributeError, TypeError, ValueError):
+                    malformed["message"] += 1
+    for kind, count in malformed.items():
+        if count:
+            logger.warning("Skipped %s malformed webhook %s events", count, kind)
+            record_webhook_events(kind, "malformed", count)
+    return statuses, messages
+
+
+def write_to_postgres(statuses: Rows, messages: Rows) -> None:
+    """Insert one batch of events (blocking; run in a worker thread)."""
+    from sqlmodel import Session
+
+    from app.database.postgresql.postgresql_connection import get_engine
+    from app.database.postgresql.postgresql_repositories import WebhookEventRepository
+
+    with Session(get_engine()) as session:
+        WebhookEventRepository(session=session).insert_batch(statuses, messages)
+
+
+def _take(queue: Deque, count: int) -> list:
+    return [queue.popleft() for _ in range(min(count, len(queue)))]
+
+
+class WebhookBuffer:
+    """Webhook events accepted by the receiver, written to Postgres in batches."""
+
+    def __init__(self, writer: Callable[[Rows, Rows], None] = write_to_postgres,
+                 batch_size: int = 1000, flush_seconds: float = 0.5,
+                 max_buffered: int = 100_000, retry_seconds: float = 1.0):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.max_buffered = max_buffered
+        self.retry_seconds = retry_seconds
+        self._statuses: Deque[Dict[str, Any]] = deque()
+        self._messages: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @classmethod
+    def from_settings(cls) -> "WebhookBuffer":
+        return cls(batch_size=setting("WEBHOOK_BATCH_SIZE", 1000),
+                   flush_seconds=setting("WEBHOOK_FLUSH_SECONDS", 0.5),
+                   max_buffered=setting("WEBHOOK_MAX_BUFFERED", 100_000))
+
+    def __len__(self) -> int:
+        return len(self._statuses) + len(self._messages)
+
+    def add(self, statuses: Rows, messages: Rows) -> bool:
+        """Buffer the events of one delivery; False (nothing buffered) when the buffer is full."""
+        if len(self) + len(statuses) + len(messages) > self.max_buffered:
+            return False
+        self._statuses.extend(statuses)
+        self._messages.extend(messages)
+        record_webhook_events("status", "buffered", len(statuses))
+        record_webhook_events("message", "buffered", len(messages))
+        set_webhook_buffered(len(self))
+        if self._wakeup is not None and len(self) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    async def flush(self) -> bool:
+        """Write one batch; on failure the batch is put back and False returned."""
+        statuses = _take(self._statuses, self.batch_size)
+        messages = _take(self._messages, self.batch_size - len(statuses))
+        if not statuses and not messages:
+            return True
+        start = time.monotonic()
+        try:
+            await asyncio.to_thread(self.writer, statuses, messages)
+        except Exception:
+            logger.exception("Writing %s webhook events failed; retrying",
+                             len(statuses) + len(messages))
+            self._statuses.extendleft(reversed(statuses))
+            self._messages.extendleft(reversed(messages))
+            record_webhook_flush("error", time.monotonic() - start)
+            return False
+        record_webhook_flush("ok", time.monotonic() - start)
+        record_webhook_events("status", "stored", len(statuses))
+        record_webhook_events("message", "stored", len(messages))
+        set_webhook_buffered(len(self))
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while len(self):
+                if not await self.flush():
+                    if self._stopping:
+                        return
+                    await asyncio.sleep(self.retry_seconds)
+                    break
+            if self._stopping:
+                return
+
+    async def start(self) -> None:
+        """Start writing batches in the background (on the running event loop)."""
+        if self._task is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write what is buffered and stop."""
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        if len(self):
+            logger.error("%s webhook events could not be written before shutdown", len(self))
+
+    def pending_statuses(self, message_id: str) -> Rows:
+        return [row for row in self._statuses if row["message_id"] == message_id]
+
+    def pending_messages(self, from_number: Optional[str] = None, since: Optional[int] = None) -> Rows:
+        return [row for row in self._messages
+                if (not from_number or row["from_number"] == from_number)
+                and (since is None or row["timestamp"] >= since)]
+
+
+@functools.lru_cache(maxsize=1)
+def get_webhook_buffer() -> WebhookBuffer:
+    return WebhookBuffer.from_settings()
+
+
+# ==================== QUERIES ====================
+
+def _public(row: Dict[str, Any]) -> Dict[str, Any]:
+    row = dict(row)
+    received_at = row.get("received_at")
+    if isinstance(received_at, datetime):
+        row["received_at"] = received_at.isoformat()
+    return row
+
+
+def _read_status_history(message_id: str) -> Rows:
+    from sqlmodel import Session
+
+    from app.database.postgresql.postgresql_connection import get_engine
+    from app.database.postgresql.postgresql_repositories import WebhookEventRepository
+
+    with Session(get_engine()) as session:
+        rows = WebhookEventRepository(session=session).status_history(message_id)
+        return [row.model_dump(exclude={"id"}) for row in rows]
+
+
+def _read_recent_inbound(limit: int, from_number: Optional[str], since: Optional[int]) -> Rows:
+    from sqlmodel import Session
+
+    from app.database.postgresql.postgresql_connection import get_engine
+    from app.database.postgresql.postgresql_repositories import WebhookEventRepository
+
+    with Session(get_engine()) as session:
+        rows = WebhookEventRepository(session=session).recent_inbound(limit, from_number, since)
+        return [row.model_dump() for row in rows]
+
+
+async def message_status(message_id: str) -> Dict[str, Any]:
+    """Current status and status history of an outgoing message."""
+    history = {row["status"]: row for row in await asyncio.to_thread(_read_status_history, message_id)}
+    for row in get_webhook_buffer().pending_statuses(message_id):
+        history.setdefault(row["status"], row)
+    ordered = sorted(history.values(),
+                     key=lambda row: (row["timestamp"], STATUS_ORDER.get(row["status"], -1)))
+    return {
+        "message_id": message_id,
+        "status": ordered[-1]["status"] if ordered else None,
+        "history": [_public(row) for row in ordered],
+    }
+
+
+async def recent_inbound_messages(limit: int = 50, from_number: Optional[str] = None,
+                                  since: Optional[int] = None) -> Rows:
+    """Latest inbound messages, newest first."""
+    rows = {row["message_id"]: row
+            for row in await asyncio.to_thread(_read_recent_inbound, limit, from_number, since)}
+    for row in get_webhook_buffer().pending_messages(from_number, since):
+        rows.setdefault(row["message_id"], row)
+    newest = sorted(rows.values(), key=lambda row: row["timestamp"], reverse=True)[:limit]
+    return [_public(row) for row in newest]
@@ -0,0 +1,96 @@
+"""
+Pluggable JSON backend for upstream payloads and tool results.
+
+orjson is used when it is installed (JSON_BACKEND=auto), otherwise the
+stdlib `json` module; JSON_BACKEND=stdlib or =orjson forces one. The
+functions keep the stdlib signatures the call sites need:
+
+- dumps(obj) -> str       aiohttp `json_serialize=` for request bodies
+- loads(bytes | str)      response decoding, straight from the raw body
+- dumps_bytes(obj)        when bytes are wanted (files, sockets)
+- dumps_strict(obj)       like dumps, but raises TypeError on non-JSON values
+"""
+import json
+from typing import Any, Callable, Dict, Union
+
+from app.config.logging import get_logger
+
+logger = get_logger("app.json")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _stdlib_dumps_bytes(obj: Any) -> bytes:
+    return _stdlib_dumps(obj).encode("utf-8")
+
+
+def _stdlib_dumps_strict(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _stdlib_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _orjson_functions() -> Dict[str, Callable]:
+    import orjson
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps(obj: Any) -> str:
+        return dumps_bytes(obj).decode("utf-8")
+
+    def dumps_strict(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    return {"dumps": dumps, "dumps_bytes": dumps_bytes, "dumps_strict": dumps_strict,
+            "loads": orjson.loads}
+
+
+_STDLIB = {"dumps": _stdlib_dumps, "dumps_bytes": _stdlib_dumps_bytes,
+           "dumps_strict": _stdlib_dumps_strict, "loads": _stdlib_loads}
+
+# Active backend; rebound by set_backend()
+backend_name = "stdlib"
+dumps: Callable[[Any], str] = _stdlib_dumps
+dumps_bytes: Callable[[Any], bytes] = _stdlib_dumps_bytes
+dumps_strict: Callable[[Any], str] = _stdlib_dumps_strict
+loads: Callable[[Union[bytes, str]], Any] = _stdlib_loads
+
+
+def set_backend(name: str = "auto") -> str:
+    """
+    Select "orjson", "stdlib" or "auto" (orjson if importable).
+
+    Returns the name of the backend now in use.
+    """
+    global backend_name, dumps, dumps_bytes, dumps_strict, loads
+
+    name = (name or "auto").strip().lower()
+    functions, chosen = _STDLIB, "stdlib"
+    if name in ("auto", "orjson"):
+        try:
+            functions, chosen = _orjson_functions(), "orjson"
+        except ImportError:
+            if name == "orjson":
+                logger.warning("JSON_BACKEND=orjson but orjson is not installed, using stdlib json")
+    elif name != "stdlib":
+        logger.warning("Unknown JSON_BACKEND %r, using stdlib json", name)
+
+    dumps, dumps_bytes, loads = functions["dumps"], functions["dumps_bytes"], functions["loads"]
+    dumps_strict = functions["dumps_strict"]
+    backend_name = chosen
+    return chosen
+
+
+def _configured_backend() -> str:
+    from app.config.settings import setting
+    return setting("JSON_BACKEND", "auto")
+
+
+set_backend(_configured_backend())
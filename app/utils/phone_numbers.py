@@ -0,0 +1,89 @@
+"""
+Phone number normalisation shared by the per-recipient indexes
+(conversation windows, suppression list) and recipient list cleaning.
+
+WhatsApp IDs are the digits of the international (E.164) number without
+"+" ("+91 98000-00001" -> "919800000001"); every index keys recipients
+that way.
+
+`to_e164()` turns what people type into that form: punctuation is dropped,
+"+" and "00" mark international numbers, and other numbers are national
+numbers of the default country when they have its length (after removing
+trunk-prefix zeros) and international numbers otherwise. Lengths are
+checked against the mobile number lengths of COUNTRY_NUMBER_LENGTHS;
+numbers of other countries only against E.164's 8 to 15 digits.
+
+Guessing national numbers suits lists people typed. Where numbers are
+normally given as WhatsApp IDs already (the `to` of a send), pass
+`bare_digits_international=True`: bare digits without a leading 0 are then
+taken as a WhatsApp ID as is, checked only against E.164's length (the
+country table lists mobile lengths only), and only numbers with a trunk 0
+or separators are read as national ("6591234567" stays a Singapore number).
+"""
+import functools
+import re
+from typing import Dict, Optional, Tuple
+
+_NON_DIGITS = re.compile(r"\D")
+# Separators people put in numbers; removed with one str.translate
+_SEPARATORS = str.maketrans("", "", " -.()/\t\u00a0")
+
+# Country calling code -> lengths of mobile numbers without it
+COUNTRY_NUMBER_LENGTHS: Dict[str, Tuple[int, ...]] = {
+    "1": (10,), "7": (10,), "20": (10,), "27": (9,), "33": (9,), "34": (9,),
+    "39": (9, 10), "44": (10,), "49": (10, 11), "52": (10,), "55": (11,), "60": (9, 10),
+    "61": (9,), "62": (9, 10, 11, 12), "63": (10,), "65": (8,), "66": (9,), "81": (10,),
+    "86": (11,), "91": (10,), "92": (10,), "94": (9,), "234": (10,), "254": (9,),
+    "880": (10,), "965": (8,), "966": (9,), "968": (8,), "971": (9,), "973": (8,),
+    "974": (8,), "977": (10,),
+}
+E164_MIN_DIGITS, E164_MAX_DIGITS = 8, 15
+
+
+def normalize_number(number: str) -> str:
+    """Digits of a WhatsApp ID / phone number; "" when there are none."""
+    return _NON_DIGITS.sub("", number or "")
+
+
+@functools.lru_cache(maxsize=1024)
+def _country(prefix: str) -> Optional[Tuple[str, Tuple[int, ...]]]:
+    """(calling code, number lengths) of the country a number starting with `prefix` belongs to."""
+    for size in (1, 2, 3):
+        lengths = COUNTRY_NUMBER_LENGTHS.get(prefix[:size])
+        if lengths:
+            return prefix[:size], lengths
+    return None
+
+
+def to_e164(number: str, default_country: str = "91",
+            bare_digits_international: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """
+    (WhatsApp ID, None) of a phone number as typed, or (None, reason) when
+    it is not a valid number.
+    """
+    value = (number or "").strip()
+    if not value:
+        return None, "empty"
+    whatsapp_id = bare_digits_international and value.isascii() and value.isdigit() and value[0] != "0"
+    international = whatsapp_id or value[0] == "+"
+    value = value.translate(_SEPARATORS).lstrip("+")
+    if not (value.isascii() and value.isdigit()):
+        return None, "invalid characters"
+    if not international and value[:2] == "00":
+        value, international = value[2:], True
+    if not international:
+        national = value.lstrip("0")
+        if len(national) in COUNTRY_NUMBER_LENGTHS.get(default_country, ()):
+            value = default_country + national
+        elif len(national) != len(value):
+            return None, "invalid length"
+    if value[:1] == "0":
+        return None, "invalid country code"
+    country = None if whatsapp_id else _country(value[:3])
+    if country is not None:
+        code, lengths = country
+        if len(value) - len(code) not in lengths:
+            return None, "invalid length"
+    elif not E164_MIN_DIGITS <= len(value) <= E164_MAX_DIGITS:
+        return None, "invalid length"
+    return value, None
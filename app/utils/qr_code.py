@@ -0,0 +1,336 @@
+"""
+QR code encoding and rendering (ISO/IEC 18004), standard library only.
+
+Short-link QR codes only ever hold a URL, so the encoder supports byte
+mode (UTF-8) at any version (1-40) and error correction level; the
+smallest version that fits is used and the mask with the lowest penalty
+is chosen, as QR readers expect.
+
+    matrix = encode("https://wa.me/message/ANED2T5QRU7HG1")
+    to_png(matrix, scale=8)   # bytes of a grayscale PNG
+    to_svg(matrix, scale=8)   # SVG document
+"""
+import re
+import struct
+import zlib
+from typing import List, Sequence, Union
+
+Matrix = List[List[bool]]
+
+# Error correction level -> format bits
+ERROR_CORRECTION = {"L": 1, "M": 0, "Q": 3, "H": 2}
+_LEVELS = "LMQH"
+
+# Error correction codewords per block and number of blocks, per level (L, M, Q, H) and version (1-40)
+_ECC_CODEWORDS_PER_BLOCK = (
+    (7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28,
+     28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26,
+     26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28),
+    (13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30,
+     28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28,
+     30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+)
+_ECC_BLOCKS = (
+    (1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8,
+     8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25),
+    (1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16,
+     17, 17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47, 49),
+    (1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20,
+     23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68),
+    (1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25,
+     25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81),
+)
+
+# GF(256) with the QR polynomial x^8 + x^4 + x^3 + x^2 + 1
+_EXP = [0] * 512
+_LOG = [0] * 256
+_value = 1
+for _power in range(255):
+    _EXP[_power] = _value
+    _LOG[_value] = _power
+    _value <<= 1
+    if _value & 0x100:
+        _value ^= 0x11D
+for _power in range(255, 512):
+    _EXP[_power] = _EXP[_power - 255]
+
+_MASKS = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+_LONG_RUN = re.compile(r"0{5,}|1{5,}")
+_FINDER_LIKE = re.compile(r"(?=(10111010000|00001011101))")
+
+
+class QrCodeError(ValueError):
+    """The data does not fit in a QR code at the requested error correction level."""
+
+
+def _multiply(x: int, y: int) -> int:
+    return _EXP[_LOG[x] + _LOG[y]] if x and y else 0
+
+
+def _generator(degree: int) -> List[int]:
+    """Coefficients of the Reed-Solomon generator polynomial (leading 1 omitted)."""
+    result = [0] * (degree - 1) + [1]
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            result[j] = _multiply(result[j], root)
+            if j + 1 < degree:
+                result[j] ^= result[j + 1]
+        root = _multiply(root, 2)
+    return result
+
+
+def _remainder(data: Sequence[int], generator: Sequence[int]) -> List[int]:
+    result = [0] * len(generator)
+    for byte in data:
+        factor = byte ^ result.pop(0)
+        result.append(0)
+        if factor:
+            for i, coefficient in enumerate(generator):
+                result[i] ^= _multiply(coefficient, factor)
+    return result
+
+
+def _raw_modules(version: int) -> int:
+    """Modules available for data and error correction (after function patterns)."""
+    result = (16 * version + 128) * version + 64
+    if version >= 2:
+        alignments = version // 7 + 2
+        result -= (25 * alignments - 10) * alignments - 55
+        if version >= 7:
+            result -= 36
+    return result
+
+
+def data_codewords(version: int, level: str) -> int:
+    """Data capacity in bytes of `version` at error correction `level`."""
+    index = _LEVELS.index(level)
+    return (_raw_modules(version) // 8
+            - _ECC_CODEWORDS_PER_BLOCK[index][version - 1] * _ECC_BLOCKS[index][version - 1])
+
+
+def _alignment_positions(version: int) -> List[int]:
+    if version == 1:
+        return []
+    count = version // 7 + 2
+    step = (version * 8 + count * 3 + 5) // (count * 4 - 4) * 2
+    size = version * 4 + 17
+    return [6] + sorted(size - 7 - i * step for i in range(count - 1))
+
+
+def _codewords(data: bytes, version: int, level: str) -> List[int]:
+    """Data codewords (mode, length, data, padding) with error correction, interleaved."""
+    count_bits = 8 if version < 10 else 16
+    capacity = data_codewords(version, level) * 8
+    bits = (0b0100 << count_bits | len(data)) << 8 * len(data) | int.from_bytes(data, "big")
+    length = 4 + count_bits + 8 * len(data)
+    terminator = min(4, capacity - length)
+    bits, length = bits << terminator, length + terminator
+    bits, length = bits << (-length % 8), length + (-length % 8)
+    codewords = list(bits.to_bytes(length // 8, "big"))
+    codewords += [0xEC, 0x11] * ((capacity // 8 - len(codewords)) // 2 + 1)
+    codewords = codewords[:capacity // 8]
+
+    index = _LEVELS.index(level)
+    blocks_count = _ECC_BLOCKS[index][version - 1]
+    ecc_length = _ECC_CODEWORDS_PER_BLOCK[index][version - 1]
+    raw = _raw_modules(version) // 8
+    short_blocks = blocks_count - raw % blocks_count
+    short_length = raw // blocks_count
+    generator = _generator(ecc_length)
+    blocks, offset = [], 0
+    for i in range(blocks_count):
+        size = short_length - ecc_length + (0 if i < short_blocks else 1)
+        block = codewords[offset:offset + size]
+        offset += size
+        ecc = _remainder(block, generator)
+        if i < short_blocks:
+            block.append(0)      # placeholder, skipped when interleaving
+        blocks.append(block + ecc)
+
+    result = []
+    for i in range(len(blocks[0])):
+        for j, block in enumerate(blocks):
+            if i != short_length - ecc_length or j >= short_blocks:
+                result.append(block[i])
+    return result
+
+
+class _Grid:
+    def __init__(self, version: int):
+        self.version = version
+        self.size = version * 4 + 17
+        self.modules = [[False] * self.size for _ in range(self.size)]
+        self.function = [[False] * self.size for _ in range(self.size)]
+
+    def set(self, x: int, y: int, dark: bool) -> None:
+        self.modules[y][x] = dark
+        self.function[y][x] = True
+
+    def draw_function_patterns(self) -> None:
+        size = self.size
+        for i in range(size):
+            self.set(6, i, i % 2 == 0)
+            self.set(i, 6, i % 2 == 0)
+        for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+            for dy in range(-4, 5):
+                for dx in range(-4, 5):
+                    x, y = cx + dx, cy + dy
+                    if 0 <= x < size and 0 <= y < size:
+                        self.set(x, y, max(abs(dx), abs(dy)) not in (2, 4))
+        positions = _alignment_positions(self.version)
+        last = len(positions) - 1
+        for i, cx in enumerate(positions):
+            for j, cy in enumerate(positions):
+                if (i, j) in ((0, 0), (0, last), (last, 0)):
+                    continue
+                for dy in range(-2, 3):
+                    for dx in range(-2, 3):
+                        self.set(cx + dx, cy + dy, max(abs(dx), abs(dy)) != 1)
+        self.draw_format_bits("M", 0)   # reserve the area; redrawn once the mask is chosen
+        self.draw_version()
+
+    def draw_format_bits(self, level: str, mask: int) -> None:
+        data = ERROR_CORRECTION[level] << 3 | mask
+        remainder = data
+        for _ in range(10):
+            remainder = (remainder << 1) ^ ((remainder >> 9) * 0x537)
+        bits = (data << 10 | remainder) ^ 0x5412
+        bit = lambda i: ((bits >> i) & 1) == 1
+        size = self.size
+        for i in range(6):
+            self.set(8, i, bit(i))
+        self.set(8, 7, bit(6))
+        self.set(8, 8, bit(7))
+        self.set(7, 8, bit(8))
+        for i in range(9, 15):
+            self.set(14 - i, 8, bit(i))
+        for i in range(8):
+            self.set(size - 1 - i, 8, bit(i))
+        for i in range(8, 15):
+            self.set(8, size - 15 + i, bit(i))
+        self.set(8, size - 8, True)
+
+    def draw_version(self) -> None:
+        if self.version < 7:
+            return
+        remainder = self.version
+        for _ in range(12):
+            remainder = (remainder << 1) ^ ((remainder >> 11) * 0x1F25)
+        bits = self.version << 12 | remainder
+        for i in range(18):
+            dark = ((bits >> i) & 1) == 1
+            a, b = self.size - 11 + i % 3, i // 3
+            self.set(a, b, dark)
+            self.set(b, a, dark)
+
+    def draw_codewords(self, codewords: Sequence[int]) -> None:
+        total, i = len(codewords) * 8, 0
+        right = self.size - 1
+        while right >= 1:
+            if right == 6:
+                right = 5
+            upward = ((right + 1) & 2) == 0
+            for vertical in range(self.size):
+                y = self.size - 1 - vertical if upward else vertical
+                for x in (right, right - 1):
+                    if not self.function[y][x] and i < total:
+                        self.modules[y][x] = ((codewords[i >> 3] >> (7 - (i & 7))) & 1) == 1
+                        i += 1
+            right -= 2
+
+    def masked(self, mask: int) -> Matrix:
+        condition = _MASKS[mask]
+        return [[dark != (not function and condition(x, y))
+                 for x, (dark, function) in enumerate(zip(row, function_row))]
+                for y, (row, function_row) in enumerate(zip(self.modules, self.function))]
+
+
+def _penalty(matrix: Matrix) -> int:
+    size = len(matrix)
+    lines = ["".join("1" if dark else "0" for dark in row) for row in matrix]
+    lines += ["".join(column) for column in zip(*lines[:size])]
+    score = 0
+    for line in lines:
+        score += sum(len(run) - 2 for run in _LONG_RUN.findall(line))
+        # finder-like patterns, including those reaching into the light border
+        score += 40 * len(_FINDER_LIKE.findall(f"0000{line}0000"))
+    for y in range(size - 1):
+        top, bottom = matrix[y], matrix[y + 1]
+        for x in range(size - 1):
+            if top[x] == top[x + 1] == bottom[x] == bottom[x + 1]:
+                score += 3
+    dark = sum(line.count("1") for line in lines[:size])
+    total = size * size
+    score += ((abs(dark * 20 - total * 10) + total - 1) // total - 1) * 10
+    return score
+
+
+def encode(data: Union[str, bytes], level: str = "M", mask: int = -1) -> Matrix:
+    """Module matrix (rows of dark/light, without the quiet zone) of `data`."""
+    if level not in ERROR_CORRECTION:
+        raise QrCodeError(f"Unknown error correction level {level!r} (expected L, M, Q or H)")
+    payload = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+    for version in range(1, 41):
+        count_bits = 8 if version < 10 else 16
+        if len(payload) < 1 << count_bits and \
+                4 + count_bits + 8 * len(payload) <= data_codewords(version, level) * 8:
+            break
+    else:
+        raise QrCodeError(f"{len(payload)} bytes do not fit in a QR code at level {level}")
+
+    grid = _Grid(version)
+    grid.draw_function_patterns()
+    grid.draw_codewords(_codewords(payload, version, level))
+    candidates = range(8) if mask < 0 else (mask,)
+    best = None
+    for candidate in candidates:
+        grid.draw_format_bits(level, candidate)
+        matrix = grid.masked(candidate)
+        score = _penalty(matrix) if len(candidates) > 1 else 0
+        if best is None or score < best[0]:
+            best = (score, matrix)
+    return best[1]
+
+
+def to_svg(matrix: Matrix, scale: int = 8, border: int = 4) -> str:
+    """SVG document of `matrix`: one path of dark modules on a white background."""
+    size = len(matrix) + 2 * border
+    path = "".join(f"M{x + border},{y + border}h1v1h-1z"
+                   for y, row in enumerate(matrix) for x, dark in enumerate(row) if dark)
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" version="1.1" viewBox="0 0 {size} {size}" '
+            f'width="{size * scale}" height="{size * scale}" shape-rendering="crispEdges">'
+            f'<rect width="100%" height="100%" fill="#FFFFFF"/>'
+            f'<path d="{path}" fill="#000000"/></svg>\n')
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def to_png(matrix: Matrix, scale: int = 8, border: int = 4) -> bytes:
+    """Grayscale PNG of `matrix`, `scale` pixels per module."""
+    width = (len(matrix) + 2 * border) * scale
+    light_row = b"\x00" + b"\xff" * width
+    dark, light = b"\x00" * scale, b"\xff" * scale
+    margin = b"\xff" * (border * scale)
+    rows = [light_row] * (border * scale)
+    for row in matrix:
+        line = b"\x00" + margin + b"".join(dark if module else light for module in row) + margin
+        rows.extend([line] * scale)
+    rows.extend([light_row] * (border * scale))
+    header = struct.pack(">IIBBBBB", width, width, 8, 0, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(b"".join(rows), 9)) + _png_chunk(b"IEND", b""))
@@ -1 +1,6 @@
+"""
+MCP servers package.
 
+Nothing is imported here: `boarding_mcp` and `direct_api_mcp` each build
+their FastMCP server on first access of their `mcp` attribute.
+"""
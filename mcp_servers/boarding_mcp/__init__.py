@@ -1 +1,15 @@
-from .tools import mcp
\ No newline at end of file
+"""
+Onboarding MCP server.
+
+`mcp` is resolved lazily so importing the clients or models of this package
+does not build the FastMCP server and register every tool.
+"""
+
+__all__ = ["mcp"]
+
+
+def __getattr__(name):
+    if name == "mcp":
+        from .tools import load_tools
+        return load_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,71 @@
+"""
+Partner API source of the billing records sync.
+
+`get_billing_sync()` is the server's BillingSync (app.services.billing_sync),
+syncing the projects of every business of every configured tenant with that
+tenant's Partner API clients. It runs while the server is up when
+BILLING_SYNC_INTERVAL_SECONDS is set (see the lifespan in .tools) and is
+read by the billing spend tools.
+"""
+import asyncio
+import functools
+from typing import Any, Dict, List
+
+from app.config.settings import setting
+from app.services.billing_sync import BillingSync
+from app.services.tenant_service import get_tenant_registry, reset_tenant, use_tenant
+from .clients import get_aisensy_get_client
+
+
+def _items(data: Any) -> List[Dict[str, Any]]:
+    items = data.get("data", []) if isinstance(data, dict) else data
+    return [item for item in items or () if isinstance(item, dict)]
+
+
+class PartnerBillingSource:
+    """Projects and billing records of each tenant's partner account."""
+
+    def tenants(self) -> List[str]:
+        return get_tenant_registry().ids()
+
+    @staticmethod
+    async def _call(tenant_id: str, method: str, **kwargs) -> Any:
+        token = use_tenant(get_tenant_registry().get(tenant_id))
+        try:
+            async with get_aisensy_get_client() as client:
+                response = await getattr(client, method)(**kwargs)
+        finally:
+            reset_tenant(token)
+        if not response.get("success"):
+            raise RuntimeError(response.get("error") or f"{method} failed")
+        return response.get("data") or {}
+
+    async def projects(self, tenant_id: str, slots: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """Projects of every business; each request holds one of the caller's `slots`."""
+        async with slots:
+            businesses = _items(await self._call(tenant_id, "get_all_business_profiles"))
+
+        async def business_projects(business: Dict[str, Any]) -> List[Dict[str, Any]]:
+            business_id = business.get("business_id") or business.get("id")
+            async with slots:
+                projects = _items(await self._call(tenant_id, "get_all_business_projects",
+                                                   business_id=business_id))
+            return [{"id": project.get("id"),
+                     "business_id": project.get("business_id") or business_id,
+                     "currency": project.get("billing_currency") or business.get("currency") or ""}
+                    for project in projects]
+
+        listed = await asyncio.gather(*(business_projects(business) for business in businesses))
+        return [project for projects in listed for project in projects]
+
+    async def billing_records(self, tenant_id: str, project_id: str) -> List[Dict[str, Any]]:
+        return _items(await self._call(tenant_id, "get_billing_records", project_id=project_id))
+
+
+@functools.lru_cache(maxsize=1)
+def get_billing_sync() -> BillingSync:
+    return BillingSync(
+        PartnerBillingSource(),
+        interval_seconds=setting("BILLING_SYNC_INTERVAL_SECONDS", 0.0),
+        concurrency=setting("BILLING_SYNC_CONCURRENCY", 8),
+    )
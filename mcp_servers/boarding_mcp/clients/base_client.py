@@ -5,7 +5,22 @@ import aiohttp
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
-from app import settings, logger
+from app import settings
+from app.config.logging import get_logger
+from app.services.deadlines import request_timeout
+from app.services.endpoints import endpoint_registry
+from app.services.hedging import hedge_client_methods
+from app.services.http_pool import shared_connector
+from app.services.monitoring_service import instrument_client_methods
+from app.services.response_cache import cache_client_methods
+from app.services.tenant_service import Tenant
+from app.services.tracing_service import client_trace_configs, trace_client_methods
+from app.services.upstream import call_endpoint, client_middlewares
+from app.utils import json_backend
+
+from . import endpoints  # noqa: F401  (registers PARTNER_ENDPOINTS)
+
+logger = get_logger("boarding_mcp.clients")
 
 
 @dataclass
@@ -13,22 +28,63 @@ class AiSensyBaseClient:
     """Base client with shared functionality."""
     timeout: int = 30
     BASE_URL: str = field(default_factory=lambda: settings.BASE_URL)
+    partner_id: str = field(default_factory=lambda: settings.PARTNER_ID)
+    business_id: str = field(default_factory=lambda: settings.BUSINESS_ID)
+    api_key: str = field(default_factory=lambda: settings.AiSensy_API_Key, repr=False)
     _session: Optional[aiohttp.ClientSession] = field(default=None, init=False, repr=False)
     
+    @classmethod
+    def for_tenant(cls, tenant: Tenant, **kwargs):
+        """Client acting with `tenant`'s partner, business and API key."""
+        return cls(partner_id=tenant.partner_id, business_id=tenant.business_id,
+                   api_key=tenant.api_key, **kwargs)
+    
+    def __init_subclass__(cls, **kwargs):
+        """Instrument every endpoint method of the concrete clients; hedge and cache some reads."""
+        super().__init_subclass__(**kwargs)
+        instrument_client_methods(cls, service="partner")
+        trace_client_methods(cls, service="partner")
+        hedge_client_methods(cls, service="partner")
+        cache_client_methods(cls, service="partner")
+    
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
+                connector=shared_connector("partner"),
+                connector_owner=False,
                 timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=client_trace_configs("partner"),
+                json_serialize=json_backend.dumps,
+                middlewares=client_middlewares("partner"),
                 headers={
                     "Accept": "application/json",
                     "Content-Type": "application/json",
-                    "X-AiSensy-Partner-API-Key": settings.AiSensy_API_Key,
+                    "X-AiSensy-Partner-API-Key": self.api_key,
                 }
             )
             logger.debug("New HTTP session created")
         return self._session
     
+    async def _call(self, endpoint: str, /, **arguments) -> Dict[str, Any]:
+        """Call `endpoint` of PARTNER_ENDPOINTS with a client method's arguments."""
+        return await call_endpoint(self, endpoint_registry.get("partner", endpoint), arguments, logger)
+    
+    def _cache_scope(self) -> tuple:
+        """Whose data this client reads: the key prefix of its cached lookups."""
+        return (self.BASE_URL, self.partner_id, self.business_id)
+    
+    def _request_timeout(self) -> aiohttp.ClientTimeout:
+        """Timeouts of the running call's request: its endpoint's profile, cut to the tool call's deadline."""
+        return request_timeout("partner")
+    
+    async def _read_json(self, response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body with the configured JSON backend."""
+        body = await response.read()
+        if not body.strip():
+            return None
+        return json_backend.loads(body)
+    
     async def close(self) -> None:
         """Close HTTP session."""
         if self._session and not self._session.closed:
@@ -46,7 +102,7 @@ class AiSensyBaseClient:
     
     def _handle_error(self, status: int, error_text: str) -> Dict[str, Any]:
         """Handle error response."""
-        logger.warning(f"API error: {status} - {error_text}")
+        logger.warning("API error: %s - %s", status, error_text)
         error_map = {
             400: "Bad request",
             401: "Invalid API key",
@@ -2,38 +2,77 @@
 Client Manager for AiSensy Clients (GET, POST, and PATCH)
 
 Provides safe client reuse across concurrent requests using a singleton pattern
-with reference counting. Clients are kept alive as long as there are active
-users and properly cleaned up when the application shuts down.
+with reference counting. Each manager keeps one client per tenant; clients
+are kept alive as long as there are active users, closed when their tenant
+goes idle, and properly cleaned up when the application shuts down.
 """
 import asyncio
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Optional, TypeVar, Generic, Type
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any, List, Optional, TypeVar, Generic, Type, TYPE_CHECKING
 
-from .get_clients import AiSensyGetClient
-from .post_clients import AiSensyPostClient
-from .patch_clients import AiSensyPatchClient
-from app import logger
+from app.config.logging import get_logger
+from app.services.monitoring_service import (record_tenant_eviction, set_client_references,
+                                             set_tenant_clients)
+from app.services.tenant_service import Tenant, current_tenant, tenant_pool_options
+from app.services.tracing_service import span
 
-T = TypeVar("T", AiSensyGetClient, AiSensyPostClient, AiSensyPatchClient)
+if TYPE_CHECKING:
+    from .get_clients import AiSensyGetClient
+    from .post_clients import AiSensyPostClient
+    from .patch_clients import AiSensyPatchClient
+
+logger = get_logger("boarding_mcp.clients")
+
+T = TypeVar("T", "AiSensyGetClient", "AiSensyPostClient", "AiSensyPatchClient")
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    references: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+async def _close_clients(clients) -> None:
+    for client in clients:
+        try:
+            await client.close()
+        except Exception:
+            logger.exception("Failed to close evicted client")
 
 
 class BaseClientManager(Generic[T]):
     """
     Base class for managing shared client instances with reference counting.
     
+    One client is kept per tenant (see app.services.tenant_service) in a
+    bounded LRU. All of them share the service's connection pool, so a
+    tenant's client only adds a session with its own credentials.
+    
     This ensures:
     1. Client is reused across concurrent requests (connection pooling)
     2. Client is not closed while other requests are using it
-    3. Proper cleanup on application shutdown
+    3. Unused tenant clients are closed beyond TENANT_POOL_SIZE or after TENANT_IDLE_SECONDS
+    4. Proper cleanup on application shutdown
     """
     
     _instance: Optional["BaseClientManager"] = None
     _client_class: Type[T] = None
+    # "module:Class" imported on first use, keeping aiohttp off the startup path
+    _client_class_path: str = ""
     _client_name: str = "Base"
+    _service_name: str = "partner"
     
-    def __init__(self):
-        self._client: Optional[T] = None
-        self._ref_count: int = 0
+    def __init__(self, max_tenants: Optional[int] = None, idle_seconds: Optional[float] = None):
+        default_size, default_idle = tenant_pool_options()
+        self.max_tenants: int = max_tenants or default_size
+        self.idle_seconds: float = default_idle if idle_seconds is None else idle_seconds
+        # tenant id -> pooled client, least recently used first
+        self._clients: "OrderedDict[str, _PooledClient]" = OrderedDict()
         self._client_lock: asyncio.Lock = asyncio.Lock()
     
     @classmethod
@@ -43,93 +82,165 @@ class BaseClientManager(Generic[T]):
             cls._instance = cls()
         return cls._instance
     
-    async def _ensure_client(self) -> T:
-        """Ensure client exists and increment reference count."""
+    @classmethod
+    def _resolve_client_class(cls) -> Type[T]:
+        """Import the client class the first time a client is needed."""
+        if cls._client_class is None:
+            module_name, _, class_name = cls._client_class_path.partition(":")
+            module = import_module(module_name, __package__)
+            cls._client_class = getattr(module, class_name)
+        return cls._client_class
+    
+    async def _ensure_client(self, tenant: Tenant) -> T:
+        """Ensure the tenant's client exists and increment its reference count."""
         async with self._client_lock:
-            if self._client is None:
-                logger.debug(f"Creating new AiSensy {self._client_name} client instance")
-                self._client = self._client_class()
+            pooled = self._clients.get(tenant.tenant_id)
+            if pooled is None:
+                logger.debug(
+                    "Creating new AiSensy %s client instance for tenant %s",
+                    self._client_name,
+                    tenant.tenant_id
+                )
+                pooled = _PooledClient(self._resolve_client_class().for_tenant(tenant))
+                self._clients[tenant.tenant_id] = pooled
+            self._clients.move_to_end(tenant.tenant_id)
             
-            self._ref_count += 1
+            pooled.references += 1
             logger.debug(
-                f"{self._client_name} client acquired. Active references: {self._ref_count}"
+                "%s client acquired for tenant %s. Active references: %s",
+                self._client_name,
+                tenant.tenant_id,
+                pooled.references
             )
-            return self._client
+            evicted = self._evict_unused()
+            self._report()
+        await _close_clients(evicted)
+        return pooled.client
     
-    async def _release_client(self) -> None:
+    async def _release_client(self, tenant: Tenant) -> None:
         """Decrement reference count. Client stays open for reuse."""
         async with self._client_lock:
-            self._ref_count -= 1
-            logger.debug(
-                f"{self._client_name} client released. Active references: {self._ref_count}"
-            )
+            pooled = self._clients.get(tenant.tenant_id)
+            if pooled is not None:
+                pooled.references -= 1
+                pooled.last_used = time.monotonic()
+                logger.debug(
+                    "%s client released for tenant %s. Active references: %s",
+                    self._client_name,
+                    tenant.tenant_id,
+                    pooled.references
+                )
+            evicted = self._evict_unused()
+            self._report()
+        await _close_clients(evicted)
+    
+    def _evict_unused(self) -> List[T]:
+        """
+        Remove unreferenced clients while the pool is over `max_tenants`
+        (least recently used first) or that were idle for `idle_seconds`.
+        Called with the lock held; the caller closes what is returned.
+        """
+        now = time.monotonic()
+        excess = len(self._clients) - self.max_tenants
+        evicted = []
+        for tenant_id, pooled in list(self._clients.items()):
+            if pooled.references > 0:
+                continue
+            if excess > 0:
+                reason = "capacity"
+            elif now - pooled.last_used > self.idle_seconds:
+                reason = "idle"
+            else:
+                continue
+            del self._clients[tenant_id]
+            excess -= 1
+            evicted.append(pooled.client)
+            record_tenant_eviction(self._service_name, self._client_name, reason)
+            logger.debug("Evicted %s client of tenant %s (%s)",
+                         self._client_name, tenant_id, reason)
+        return evicted
+    
+    def _report(self) -> None:
+        references = sum(pooled.references for pooled in self._clients.values())
+        set_client_references(self._service_name, self._client_name, references)
+        set_tenant_clients(self._service_name, self._client_name, len(self._clients))
     
     async def close(self) -> None:
         """
-        Force close the client. 
+        Force close every tenant's client.
         Should only be called during application shutdown.
         """
         async with self._client_lock:
-            if self._client is not None:
-                if self._ref_count > 0:
-                    logger.warning(
-                        f"Closing {self._client_name} client with "
-                        f"{self._ref_count} active references"
-                    )
-                logger.info(f"Closing AiSensy {self._client_name} client")
-                await self._client.close()
-                self._client = None
-                self._ref_count = 0
+            references = sum(pooled.references for pooled in self._clients.values())
+            if references > 0:
+                logger.warning(
+                    "Closing %s clients with %s active references",
+                    self._client_name,
+                    references
+                )
+            if self._clients:
+                logger.info("Closing AiSensy %s clients (%s tenants)",
+                            self._client_name, len(self._clients))
+            clients = [pooled.client for pooled in self._clients.values()]
+            self._clients.clear()
+            self._report()
+        await _close_clients(clients)
     
     @classmethod
     @asynccontextmanager
-    async def get_client(cls):
+    async def get_client(cls, tenant: Optional[Tenant] = None):
         """
         Context manager for safely acquiring and releasing the client.
         
+        Args:
+            tenant: Defaults to the tenant selected for the running tool call.
+        
         Yields:
-            The shared client instance
+            The shared client instance of the tenant
         """
+        tenant = tenant or current_tenant()
         manager = cls.get_instance()
-        client = await manager._ensure_client()
+        # Time spent waiting on the manager lock shows up as its own span
+        with span("client_manager.acquire", **{"aisensy.service": cls._service_name,
+                                               "aisensy.client": cls._client_name}):
+            client = await manager._ensure_client(tenant)
         try:
             yield client
         finally:
-            await manager._release_client()
+            await manager._release_client(tenant)
     
     @classmethod
     async def shutdown(cls) -> None:
         """
-        Shutdown the client manager and close the client.
+        Shutdown the client manager and close its clients.
         Call this during application shutdown.
         """
         if cls._instance is not None:
             await cls._instance.close()
             cls._instance = None
-            logger.info(f"AiSensy {cls._client_name} client manager shutdown complete")
-
+            logger.info("AiSensy %s client manager shutdown complete", cls._client_name)
 
-class AiSensyGetClientManager(BaseClientManager[AiSensyGetClient]):
+class AiSensyGetClientManager(BaseClientManager["AiSensyGetClient"]):
     """Manager for AiSensy GET client."""
     
     _instance: Optional["AiSensyGetClientManager"] = None
-    _client_class = AiSensyGetClient
+    _client_class_path = ".get_clients:AiSensyGetClient"
     _client_name = "GET"
 
 
-class AiSensyPostClientManager(BaseClientManager[AiSensyPostClient]):
+class AiSensyPostClientManager(BaseClientManager["AiSensyPostClient"]):
     """Manager for AiSensy POST client."""
     
     _instance: Optional["AiSensyPostClientManager"] = None
-    _client_class = AiSensyPostClient
+    _client_class_path = ".post_clients:AiSensyPostClient"
     _client_name = "POST"
 
 
-class AiSensyPatchClientManager(BaseClientManager[AiSensyPatchClient]):
+class AiSensyPatchClientManager(BaseClientManager["AiSensyPatchClient"]):
     """Manager for AiSensy PATCH client."""
     
     _instance: Optional["AiSensyPatchClientManager"] = None
-    _client_class = AiSensyPatchClient
+    _client_class_path = ".patch_clients:AiSensyPatchClient"
     _client_name = "PATCH"
 
 
@@ -190,4 +301,7 @@ async def shutdown_all_clients() -> None:
     await AiSensyGetClientManager.shutdown()
     await AiSensyPostClientManager.shutdown()
     await AiSensyPatchClientManager.shutdown()
+    # Imported here: the connector module pulls in aiohttp
+    from app.services.http_pool import close_shared_connectors
+    await close_shared_connectors()
     logger.info("All AiSensy client managers shutdown complete")
\ No newline at end of file
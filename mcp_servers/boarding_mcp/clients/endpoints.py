@@ -0,0 +1,106 @@
+"""
+Endpoint table of the AiSensy Partner API.
+
+Each client method of AiSensyGetClient, AiSensyPostClient and
+AiSensyPatchClient is a thin wrapper that calls the endpoint of the same
+name; see app.services.endpoints.Endpoint for the fields.
+"""
+from typing import Tuple
+
+from app.services.endpoints import Endpoint, endpoint_registry
+from app.services.response_cache import CachePolicy
+
+PARTNER_ENDPOINTS: Tuple[Endpoint, ...] = (
+    Endpoint("get_business_profile_by_id", "GET", "/partner/{partner_id}/business/{business_id}",
+             cache=CachePolicy(soft_ttl=60, hard_ttl=300, stale_if_error_ttl=3600)),
+    Endpoint("get_all_business_profiles", "GET", "/partner/{partner_id}/business"),
+    Endpoint("get_kyc_submission_status", "GET", "/partner/{partner_id}/kyc/get-kyc-submission-status",
+             params={"projectId": "project_id"}, required=("project_id",)),
+    Endpoint("get_business_verification_status", "GET", "/partner/{partner_id}/kyc/get-business-verification-status",
+             params={"projectId": "project_id"}, required=("project_id",)),
+    Endpoint("get_partner_details", "GET", "/partner/{partner_id}",
+             cache=CachePolicy(soft_ttl=300, hard_ttl=900, stale_if_error_ttl=86400)),
+    Endpoint("get_wcc_usage_analytics", "GET", "/partner/{partner_id}/wcc-analytics",
+             params={"projectId": "project_id"}, required=("project_id",)),
+    Endpoint("get_billing_records", "GET", "/partner/{partner_id}/billings",
+             params={"projectId": "project_id"}, required=("project_id",)),
+    Endpoint("get_all_business_projects", "GET", "/partner/{partner_id}/business/{business_id}/project",
+             params={"fields": "fields", "additionalFields": "additional_fields"},
+             omit_falsy=("fields", "additionalFields")),
+    Endpoint("get_project_by_id", "GET", "/partner/{partner_id}/project/{project_id}", hedged=True),
+    Endpoint("update_business_details", "PATCH", "/partner/{partner_id}/business/{business_id}",
+             body={"display_name": "display_name", "company": "company", "contact": "contact"},
+             optional=("display_name", "company", "contact"), require_body=True,
+             ok_statuses=(200, 201), invalidates=("get_business_profile_by_id",)),
+    Endpoint("create_business_profile", "POST", "/partner/{partner_id}/business",
+             body={
+                 "display_name": "display_name",
+                 "email": "email",
+                 "company": "company",
+                 "contact": "contact",
+                 "timezone": "timezone",
+                 "currency": "currency",
+                 "companySize": "company_size",
+                 "password": "password",
+             },
+             ok_statuses=(200, 201)),
+    Endpoint("create_project", "POST", "/partner/{partner_id}/business/{business_id}/project",
+             body={"name": "name"}, required=("name",), ok_statuses=(200, 201)),
+    Endpoint("generate_embedded_signup_url", "POST", "/partner/{partner_id}/generate-waba-link",
+             body={
+                 "businessId": "business_id",
+                 "assistantId": "assistant_id",
+                 "setup": {
+                     "business": {
+                         "name": "business_name",
+                         "email": "business_email",
+                         "phone": {"code": "phone_code", "number": "phone_number"},
+                         "website": "website",
+                         "address": {
+                             "streetAddress1": "street_address",
+                             "city": "city",
+                             "state": "state",
+                             "zipPostal": "zip_postal",
+                             "country": "country",
+                         },
+                         "timezone": "timezone",
+                     },
+                     "phone": {
+                         "displayName": "display_name",
+                         "category": "category",
+                         "description": "description",
+                     },
+                 },
+             },
+             ok_statuses=(200, 201)),
+    Endpoint("submit_waba_app_id", "POST", "/partner/{partner_id}/submit-facebook-access-token",
+             body={"assistantId": "assistant_id", "wabaAppId": "waba_app_id"},
+             required=("assistant_id", "waba_app_id"), ok_statuses=(200, 201)),
+    Endpoint("start_migration", "POST", "/partner/{partner_id}/submit-facebook-access-token-for-migration-to-partner",
+             body={
+                 "assistantId": "assistant_id",
+                 "targetId": "target_id",
+                 "countryCode": "country_code",
+                 "phoneNumber": "phone_number",
+             },
+             required=("assistant_id", "target_id", "country_code", "phone_number"),
+             ok_statuses=(200, 201)),
+    Endpoint("request_otp_for_verification", "POST", "/partner/{partner_id}/request-otp-for-migration-to-partner",
+             body={"assistantId": "assistant_id", "mode": "mode"}, required=("assistant_id",),
+             ok_statuses=(200, 201)),
+    Endpoint("verify_otp", "POST", "/partner/{partner_id}/validate-otp-for-migration-to-partner",
+             body={"assistantId": "assistant_id", "otp": "otp"}, required=("assistant_id", "otp"),
+             ok_statuses=(200, 201)),
+    Endpoint("generate_embedded_fb_catalog_url", "POST", "/partner/{partner_id}/generate-catalog-connect-link",
+             body={"businessId": "business_id", "assistantId": "assistant_id"},
+             required=("business_id", "assistant_id"), ok_statuses=(200, 201)),
+    Endpoint("generate_ctwa_ads_manager_dashboard_url", "POST", "/partner/{partner_id}/ads/generate-dashboard-link",
+             body={
+                 "businessId": "business_id",
+                 "assistantId": "assistant_id",
+                 "expiresIn": "expires_in",
+             },
+             required=("business_id", "assistant_id"), ok_statuses=(200, 201)),
+)
+
+endpoint_registry.register("partner", PARTNER_ENDPOINTS)
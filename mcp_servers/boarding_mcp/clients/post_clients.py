@@ -1,11 +1,8 @@
 """This is POST Aisensy Client"""
 
 from typing import Dict, Any, Optional
-import aiohttp
-import asyncio
 
 from .base_client import AiSensyBaseClient
-from app import settings, logger
 
 
 class AiSensyPostClient(AiSensyBaseClient):
@@ -25,89 +22,23 @@ class AiSensyPostClient(AiSensyBaseClient):
         """
         Create a new business profile in the AiSensy API.
         """
-        if not settings.PARTNER_ID:
-            logger.error("Missing PARTNER_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required field: partner_id"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/business"
-        payload = {
-            "display_name": display_name,
-            "email": email,
-            "company": company,
-            "contact": contact,
-            "timezone": timezone,
-            "currency": currency,
-            "companySize": company_size,
-            "password": password
-        }
-        logger.debug(f"Creating business profile at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully created business profile")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED: was aiohttp.ClientTimeout
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "create_business_profile",
+            display_name=display_name,
+            email=email,
+            company=company,
+            contact=contact,
+            timezone=timezone,
+            currency=currency,
+            company_size=company_size,
+            password=password,
+        )
 
     async def create_project(self, name: str) -> Dict[str, Any]:
         """
         Create a new project in the AiSensy API.
         """
-        if not settings.PARTNER_ID or not settings.BUSINESS_ID:
-            logger.error("Missing PARTNER_ID or BUSINESS_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required fields: partner_id and business_id"
-            }
-
-        if not name:
-            logger.error("Missing name parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: name"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/business/{settings.BUSINESS_ID}/project"
-        payload = {"name": name}
-        logger.debug(f"Creating project at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully created project")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("create_project", name=name)
 
     async def generate_embedded_signup_url(
         self,
@@ -131,64 +62,25 @@ class AiSensyPostClient(AiSensyBaseClient):
         """
         Generate an embedded signup URL for WhatsApp Business API (WABA).
         """
-        if not settings.PARTNER_ID:
-            logger.error("Missing PARTNER_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required field: partner_id"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/generate-waba-link"
-        payload = {
-            "businessId": business_id,
-            "assistantId": assistant_id,
-            "setup": {
-                "business": {
-                    "name": business_name,
-                    "email": business_email,
-                    "phone": {
-                        "code": phone_code,
-                        "number": phone_number
-                    },
-                    "website": website,
-                    "address": {
-                        "streetAddress1": street_address,
-                        "city": city,
-                        "state": state,
-                        "zipPostal": zip_postal,
-                        "country": country
-                    },
-                    "timezone": timezone
-                },
-                "phone": {
-                    "displayName": display_name,
-                    "category": category,
-                    "description": description
-                }
-            }
-        }
-        logger.debug(f"Generating embedded signup URL at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully generated embedded signup URL")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "generate_embedded_signup_url",
+            business_id=business_id,
+            assistant_id=assistant_id,
+            business_name=business_name,
+            business_email=business_email,
+            phone_code=phone_code,
+            phone_number=phone_number,
+            website=website,
+            street_address=street_address,
+            city=city,
+            state=state,
+            zip_postal=zip_postal,
+            country=country,
+            timezone=timezone,
+            display_name=display_name,
+            category=category,
+            description=description,
+        )
 
     async def submit_waba_app_id(
         self,
@@ -198,47 +90,9 @@ class AiSensyPostClient(AiSensyBaseClient):
         """
         Submit WABA App ID (Facebook Access Token) to the AiSensy API.
         """
-        if not settings.PARTNER_ID:
-            logger.error("Missing PARTNER_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required field: partner_id"
-            }
-
-        if not assistant_id or not waba_app_id:
-            logger.error("Missing assistant_id or waba_app_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required fields: assistant_id and waba_app_id"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/submit-facebook-access-token"
-        payload = {
-            "assistantId": assistant_id,
-            "wabaAppId": waba_app_id
-        }
-        logger.debug(f"Submitting WABA App ID at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully submitted WABA App ID")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "submit_waba_app_id", assistant_id=assistant_id, waba_app_id=waba_app_id
+        )
 
     async def start_migration(
         self,
@@ -250,49 +104,13 @@ class AiSensyPostClient(AiSensyBaseClient):
         """
         Start migration by submitting Facebook access token for migration to partner.
         """
-        if not settings.PARTNER_ID:
-            logger.error("Missing PARTNER_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required field: partner_id"
-            }
-
-        if not assistant_id or not target_id or not country_code or not phone_number:
-            logger.error("Missing required parameters for migration")
-            return {
-                "success": False,
-                "error": "Missing required fields: assistant_id, target_id, country_code, phone_number"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/submit-facebook-access-token-for-migration-to-partner"
-        payload = {
-            "assistantId": assistant_id,
-            "targetId": target_id,
-            "countryCode": country_code,
-            "phoneNumber": phone_number
-        }
-        logger.debug(f"Starting migration at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully started migration")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "start_migration",
+            assistant_id=assistant_id,
+            target_id=target_id,
+            country_code=country_code,
+            phone_number=phone_number,
+        )
 
     async def request_otp_for_verification(
         self,
@@ -302,47 +120,9 @@ class AiSensyPostClient(AiSensyBaseClient):
         """
         Request OTP for verification during migration.
         """
-        if not settings.PARTNER_ID:
-            logger.error("Missing PARTNER_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required field: partner_id"
-            }
-
-        if not assistant_id:
-            logger.error("Missing assistant_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: assistant_id"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/request-otp-for-migration-to-partner"
-        payload = {
-            "assistantId": assistant_id,
-            "mode": mode
-        }
-        logger.debug(f"Requesting OTP for verification at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully requested OTP for verification")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "request_otp_for_verification", assistant_id=assistant_id, mode=mode
+        )
 
     async def verify_otp(
         self,
@@ -352,47 +132,7 @@ class AiSensyPostClient(AiSensyBaseClient):
         """
         Verify OTP for migration to partner.
         """
-        if not settings.PARTNER_ID:
-            logger.error("Missing PARTNER_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required field: partner_id"
-            }
-
-        if not assistant_id or not otp:
-            logger.error("Missing assistant_id or otp parameter")
-            return {
-                "success": False,
-                "error": "Missing required fields: assistant_id and otp"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/validate-otp-for-migration-to-partner"
-        payload = {
-            "assistantId": assistant_id,
-            "otp": otp
-        }
-        logger.debug(f"Verifying OTP at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully verified OTP")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("verify_otp", assistant_id=assistant_id, otp=otp)
 
     async def generate_embedded_fb_catalog_url(
         self,
@@ -402,47 +142,9 @@ class AiSensyPostClient(AiSensyBaseClient):
         """
         Generate an embedded Facebook Catalog connect URL.
         """
-        if not settings.PARTNER_ID:
-            logger.error("Missing PARTNER_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required field: partner_id"
-            }
-
-        if not business_id or not assistant_id:
-            logger.error("Missing business_id or assistant_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required fields: business_id and assistant_id"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/generate-catalog-connect-link"
-        payload = {
-            "businessId": business_id,
-            "assistantId": assistant_id
-        }
-        logger.debug(f"Generating embedded FB catalog URL at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully generated embedded FB catalog URL")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "generate_embedded_fb_catalog_url", business_id=business_id, assistant_id=assistant_id
+        )
 
     async def generate_ctwa_ads_manager_dashboard_url(
         self,
@@ -453,45 +155,9 @@ class AiSensyPostClient(AiSensyBaseClient):
         """
         Generate CTWA (Click-to-WhatsApp) Ads Manager Dashboard URL.
         """
-        if not settings.PARTNER_ID:
-            logger.error("Missing PARTNER_ID in settings")
-            return {
-                "success": False,
-                "error": "Missing required field: partner_id"
-            }
-
-        if not business_id or not assistant_id:
-            logger.error("Missing business_id or assistant_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required fields: business_id and assistant_id"
-            }
-
-        url = f"{self.BASE_URL}/partner/{settings.PARTNER_ID}/ads/generate-dashboard-link"
-        payload = {
-            "businessId": business_id,
-            "assistantId": assistant_id,
-            "expiresIn": expires_in
-        }
-        logger.debug(f"Generating CTWA Ads Manager Dashboard URL at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    logger.info("Successfully generated CTWA Ads Manager Dashboard URL")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except asyncio.TimeoutError:  # FIXED
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+        return await self._call(
+            "generate_ctwa_ads_manager_dashboard_url",
+            business_id=business_id,
+            assistant_id=assistant_id,
+            expires_in=expires_in,
+        )
@@ -1,3 +1,4 @@
+from app.services.tracing_service import trace_request_models
 from .get_request import ProjectIdRequest, BusinessProjectsRequest
 from .post_request import (
     CreateBusinessProfileRequest,
@@ -23,4 +24,7 @@ __all__=["ProjectIdRequest", "BusinessProjectsRequest",
          "VerifyOtpRequest",
          "BusinessAssistantRequest",
          "CtwaAdsDashboardRequest",
-         "UpdateBusinessDetailsRequest"]
\ No newline at end of file
+         "UpdateBusinessDetailsRequest"]
+
+# Request validation appears as its own span in tool traces
+trace_request_models(globals()[name] for name in __all__)
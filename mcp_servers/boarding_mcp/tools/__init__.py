@@ -1,12 +1,91 @@
+from contextlib import asynccontextmanager
+from importlib import import_module
+
 from fastmcp import FastMCP
 
+from app.api.middleware.deadline import register_deadlines
+from app.api.middleware.monitoring import register_metrics, register_tracing
+from app.api.middleware.priority import register_request_priority
+from app.api.middleware.serialization import register_fast_tool_results
+from app.api.middleware.tenant import register_tenancy
+
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Run the billing records sync while the server is up."""
+    from ..billing_sync import get_billing_sync
+    sync = get_billing_sync()
+    await sync.start()
+    try:
+        yield {}
+    finally:
+        await sync.stop()
+
+
 mcp = FastMCP(
     name="OnboardingAssistant",
     instructions="""...""",
-    version="0.0.1"
+    version="0.0.1",
+    lifespan=lifespan
 )
+register_metrics(mcp, "onboarding")
+register_tracing(mcp, "onboarding")
+register_fast_tool_results(mcp)
+register_tenancy(mcp)
+register_request_priority(mcp)
+register_deadlines(mcp)
+
+
+# Tool function name -> module (relative to this package) that registers it.
+# Modules are imported by `load_tools()` when the server is first requested,
+# or one at a time when a single tool function is looked up on this package.
+_TOOL_MODULES = {
+    # get_tools
+    "get_business_profile_by_id": ".get_tools.tool_get_business_profile_by_id",
+    "get_all_business_profiles": ".get_tools.tool_get_all_business_profiles",
+    "get_kyc_submission_status": ".get_tools.tool_get_kyc_submission_status",
+    "get_business_verification_status": ".get_tools.tool_get_business_verification_status",
+    "get_partner_details": ".get_tools.tool_get_partner_details",
+    "get_wcc_usage_analytics": ".get_tools.tool_get_wcc_usage_analytics",
+    "get_billing_records": ".get_tools.tool_get_billing_records",
+    "get_all_business_projects": ".get_tools.tool_get_all_business_projects",
+    "get_project_by_id": ".get_tools.tool_get_project_by_id",
+    "get_billing_spend": ".get_tools.tool_get_billing_spend",
+    "sync_billing_records": ".get_tools.tool_sync_billing_records",
+    "get_partner_wcc_usage": ".get_tools.tool_get_partner_wcc_usage",
+    # post_tools
+    "create_business_profile": ".post_tools.tool_create_business_profile",
+    "create_project": ".post_tools.tool_create_project",
+    "generate_embedded_signup_url": ".post_tools.tool_generate_embedded_signup_url",
+    "submit_waba_app_id": ".post_tools.tool_submit_waba_app_id",
+    "start_migration": ".post_tools.tool_start_migration",
+    "request_otp_for_verification": ".post_tools.tool_request_otp_for_verification",
+    "verify_otp": ".post_tools.tool_verify_otp",
+    "generate_embedded_fb_catalog_url": ".post_tools.tool_generate_embedded_fb_catalog_url",
+    "generate_ctwa_ads_dashboard_url": ".post_tools.tool_generate_ctwa_ads_dashboard_url",
+    # patch_tools
+    "update_business_details": ".patch_tools.tool_update_business_details",
+}
+
+_tools_loaded = False
+
+
+def load_tools() -> FastMCP:
+    """Import every tool module so all tools are registered on `mcp`."""
+    global _tools_loaded
+    if not _tools_loaded:
+        for module_path in dict.fromkeys(_TOOL_MODULES.values()):
+            import_module(module_path, __name__)
+        _tools_loaded = True
+    return mcp
+
+
+def __getattr__(name):
+    module_path = _TOOL_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_path, __name__), name)
 
 
-from .get_tools import get_business_profile_by_id,get_all_business_profiles,get_kyc_submission_status,get_business_verification_status,get_partner_details,get_wcc_usage_analytics,get_billing_records,get_all_business_projects,get_project_by_id
-from .post_tools import create_business_profile,create_project,generate_embedded_signup_url,submit_waba_app_id,start_migration,request_otp_for_verification,verify_otp,generate_embedded_fb_catalog_url,generate_ctwa_ads_dashboard_url
-from .patch_tools import update_business_details
\ No newline at end of file
+__all__ = ["mcp", "load_tools", *_TOOL_MODULES]
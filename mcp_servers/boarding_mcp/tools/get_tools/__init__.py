@@ -7,5 +7,8 @@ from .tool_get_wcc_usage_analytics import get_wcc_usage_analytics
 from .tool_get_billing_records import get_billing_records
 from .tool_get_all_business_projects import get_all_business_projects
 from .tool_get_project_by_id import get_project_by_id
+from .tool_get_billing_spend import get_billing_spend
+from .tool_sync_billing_records import sync_billing_records
+from .tool_get_partner_wcc_usage import get_partner_wcc_usage
 
-__all__=[ "get_business_profile_by_id","get_all_business_profiles","get_kyc_submission_status","get_business_verification_status","get_partner_details","get_wcc_usage_analytics","get_billing_records","get_all_business_projects","get_project_by_id",]
\ No newline at end of file
+__all__=[ "get_business_profile_by_id","get_all_business_profiles","get_kyc_submission_status","get_business_verification_status","get_partner_details","get_wcc_usage_analytics","get_billing_records","get_all_business_projects","get_project_by_id","get_billing_spend","sync_billing_records","get_partner_wcc_usage",]
\ No newline at end of file
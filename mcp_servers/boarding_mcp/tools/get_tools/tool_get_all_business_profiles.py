@@ -49,11 +49,11 @@ async def get_all_business_profiles() -> AllBusinessProfilesResponse:
             if response.get("success"):
                 data = response.get("data", [])
                 count = len(data) if isinstance(data, list) else "unknown"
-                logger.info(f"Successfully retrieved {count} business profiles")
+                logger.info("Successfully retrieved %s business profiles", count)
                 return AllBusinessProfilesResponse(profiles=response["data"])
             else:
                 logger.warning(
-                    f"Failed to retrieve business profiles: {response.get('error')}"
+                    "Failed to retrieve business profiles: %s", response.get('error')
                 )
                 error_msg = f"Failed to retrieve business profiles: {response.get('error')}"
                 logger.warning(error_msg)
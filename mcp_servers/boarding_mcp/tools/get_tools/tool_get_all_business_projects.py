@@ -69,11 +69,11 @@ async def get_all_business_projects(
             if response.get("success"):
                 data = response.get("data", [])
                 count = len(data) if isinstance(data, list) else "unknown"
-                logger.info(f"Successfully retrieved {count} business projects")
+                logger.info("Successfully retrieved %s business projects", count)
                 return ProjectResponse(projects=response["data"])
             else:
                 logger.warning(
-                    f"Failed to retrieve business projects: {response.get('error')}"
+                    "Failed to retrieve business projects: %s", response.get('error')
                 )
                 error_msg = f"Failed to retrieve business projects: {response.get('error')}"
                 logger.warning(error_msg)
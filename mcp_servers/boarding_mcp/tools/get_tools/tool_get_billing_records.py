@@ -60,13 +60,13 @@ async def get_billing_records(project_id: str) -> BillingRecordsResponse:
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully retrieved billing records for project: {validated_project_id}"
+                    "Successfully retrieved billing records for project: %s", validated_project_id
                 )
                 return BillingRecordsResponse(**response)
             else:
                 logger.warning(
-                    f"Failed to retrieve billing records for project {validated_project_id}: "
-                    f"{response.get('error')}"
+                    "Failed to retrieve billing records for project %s: %s",
+                    validated_project_id, response.get('error')
                 )
                 error_msg = (
                     f"Failed to retrieve billing records for project "
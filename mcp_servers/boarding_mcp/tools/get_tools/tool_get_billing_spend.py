@@ -0,0 +1,92 @@
+"""
+MCP Tool: Get Billing Spend
+
+Spend and credits across all projects, summed by the database from the
+synced billing records (see app.services.billing_sync).
+"""
+from typing import Dict, Any, List, Optional
+
+from ..import mcp
+from ...billing_sync import get_billing_sync
+from app import logger
+
+
+@mcp.tool(
+    name="get_billing_spend",
+    description=(
+        "Returns spend (SUBTRACT entries), credits (ADD entries) and record counts from the billing "
+        "records of all projects, grouped by any of project, business, month, currency and reason. "
+        "Amounts are always split by currency. Answers from the locally synced billing records in "
+        "milliseconds; filter with since/until (ISO dates, until exclusive), project_id or business_id, "
+        "and set refresh=true to sync new records from AiSensy first."
+    ),
+    tags={
+        "billing",
+        "spend",
+        "finance",
+        "analytics",
+        "project",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Analytics & Billing"
+    }
+)
+async def get_billing_spend(
+    group_by: Optional[List[str]] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    project_id: Optional[str] = None,
+    business_id: Optional[str] = None,
+    refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Get spend and credits per group across all projects.
+
+    Args:
+        group_by: Grouping keys among project, business, month, currency and reason (default: project)
+        since: Only records created at or after this ISO date/time
+        until: Only records created before this ISO date/time
+        project_id: Only this project
+        business_id: Only projects of this business
+        refresh: Sync new billing records from AiSensy before answering
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): rows (group keys, currency, spend, credits, records, first_at, last_at)
+          and last_sync
+        - error (str): Error message if unsuccessful
+    """
+    try:
+        sync = get_billing_sync()
+        if refresh:
+            await sync.sync()
+        rows = await sync.spend(group_by=group_by or ["project"], since=since, until=until,
+                                project_id=project_id, business_id=business_id)
+        logger.info("Billing spend by %s: %s rows", ', '.join(group_by or ['project']), len(rows))
+        return {
+            "success": True,
+            "data": {
+                "rows": rows,
+                "last_sync": sync.last_sync
+            }
+        }
+
+    except ValueError as e:
+        error_msg = f"Validation error: {str(e)}"
+        logger.error(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
+
+    except Exception as e:
+        error_msg = f"Unexpected error computing billing spend: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
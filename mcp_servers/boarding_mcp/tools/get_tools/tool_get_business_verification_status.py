@@ -60,15 +60,15 @@ async def get_business_verification_status(project_id: str) -> BusinessVerificat
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully retrieved business verification status "
-                    f"for project: {validated_project_id}"
+                    "Successfully retrieved business verification status for project: %s",
+                    validated_project_id
                 )
                 return BusinessVerificationStatusResponse(**response)
 
             else:
                 logger.warning(
-                    f"Failed to retrieve business verification status "
-                    f"for project {validated_project_id}: {response.get('error')}")
+                    "Failed to retrieve business verification status for project %s: %s",
+                    validated_project_id, response.get('error'))
                 error_msg = (
                     f"Failed to retrieve business verification status: "
                     f"{response.get('error')}"
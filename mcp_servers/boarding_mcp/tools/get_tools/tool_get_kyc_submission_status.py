@@ -57,14 +57,14 @@ async def get_kyc_submission_status(project_id: str) -> KycSubmissionStatusRespo
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully retrieved KYC status for project: {validated_project_id}"
+                    "Successfully retrieved KYC status for project: %s", validated_project_id
                 )
                 return KycSubmissionStatusResponse(**response)
 
             else:
                 logger.warning(
-                    f"Failed to retrieve KYC status for project {validated_project_id}: "
-                    f"{response.get('error')}"
+                    "Failed to retrieve KYC status for project %s: %s",
+                    validated_project_id, response.get('error')
                 )
                 error_msg = (
                     f"Failed to retrieve KYC status for project "
@@ -52,7 +52,7 @@ async def get_partner_details() -> PartnerDetails:
                 return PartnerDetails(**response["data"])
             else:
                 logger.warning(
-                    f"Failed to retrieve partner details: {response.get('error')}"
+                    "Failed to retrieve partner details: %s", response.get('error')
                 )
                 error_msg = f"Failed to retrieve partner details: {response.get('error')}"
                 logger.warning(error_msg)
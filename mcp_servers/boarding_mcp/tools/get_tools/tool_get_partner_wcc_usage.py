@@ -0,0 +1,108 @@
+"""
+MCP Tool: Get Partner WCC Usage
+
+WhatsApp Cloud Credits (WCC) usage of all projects of the partner, rolled
+up per month (see app.services.wcc_rollup), optionally exported as a
+Parquet, Arrow or CSV file.
+"""
+import os
+import time
+from typing import Dict, Any, List, Optional
+
+from ..import mcp
+from ...wcc_rollup import get_wcc_rollup
+from app.config.settings import setting
+from app.services.wcc_rollup import export_table
+from app import logger
+
+
+@mcp.tool(
+    name="get_partner_wcc_usage",
+    description=(
+        "Returns WhatsApp Cloud Credits (WCC) usage of all projects of the partner per month: "
+        "chat counts (total, sent, delivered, read, failed), credits used, template and free tier "
+        "messages, optionally grouped by project and/or business. Covers start_month to end_month "
+        "(YYYY-MM, default the current month). Closed months are served from a local cache; set "
+        "export_format (auto, parquet, arrow or csv) to also write the full table to a file."
+    ),
+    tags={
+        "wcc",
+        "whatsapp",
+        "credits",
+        "analytics",
+        "usage",
+        "billing",
+        "partner",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Analytics & Billing"
+    }
+)
+async def get_partner_wcc_usage(
+    start_month: Optional[str] = None,
+    end_month: Optional[str] = None,
+    group_by: Optional[List[str]] = None,
+    export_format: Optional[str] = None,
+    max_rows: int = 100,
+    refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Get monthly WCC usage across all projects.
+
+    Args:
+        start_month: First month, YYYY-MM (default: end_month)
+        end_month: Last month, YYYY-MM (default: the current month)
+        group_by: Also group by "project" and/or "business" (default: month only)
+        export_format: Write the full table as auto, parquet, arrow or csv (default: no file)
+        max_rows: Most rows returned inline; the export always has all rows
+        refresh: Fetch closed months again instead of using the cache
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): rows, totals, row_count, truncated, summary (months, projects
+          fetched / from cache, errors) and export (path, format, rows, bytes)
+        - error (str): Error message if unsuccessful
+    """
+    try:
+        group_by = group_by or []
+        table, summary = await get_wcc_rollup().report(start_month, end_month, group_by, refresh)
+
+        export = None
+        if export_format:
+            months = summary["months"]
+            name = "_".join(["wcc_usage", months[0], months[-1], *group_by, time.strftime("%Y%m%dT%H%M%S")])
+            export = export_table(table, os.path.join(setting("WCC_EXPORT_DIR", "data/exports"), name),
+                                  export_format)
+
+        logger.info("Partner WCC usage %s..%s: %s rows", summary['months'][0], summary['months'][-1], len(table))
+        return {
+            "success": True,
+            "data": {
+                "rows": table.rows(limit=max_rows),
+                "totals": table.totals(),
+                "row_count": len(table),
+                "truncated": len(table) > max_rows,
+                "summary": summary,
+                "export": export
+            }
+        }
+
+    except ValueError as e:
+        error_msg = f"Validation error: {str(e)}"
+        logger.error(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
+
+    except Exception as e:
+        error_msg = f"Unexpected error rolling up WCC usage: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
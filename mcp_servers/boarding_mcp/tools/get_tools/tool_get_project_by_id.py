@@ -57,13 +57,13 @@ async def get_project_by_id(project_id: str) -> ProjectIDResponse:
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully retrieved project details for: {validated_project_id}"
+                    "Successfully retrieved project details for: %s", validated_project_id
                 )
                 return ProjectIDResponse(**response)
             else:
                 logger.warning(
-                    f"Failed to retrieve project {validated_project_id}: "
-                    f"{response.get('error')}"
+                    "Failed to retrieve project %s: %s",
+                    validated_project_id, response.get('error')
                 )
                 error_msg = (
                     f"Failed to retrieve project {validated_project_id}: "
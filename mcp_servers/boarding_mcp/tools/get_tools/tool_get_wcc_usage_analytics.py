@@ -61,13 +61,13 @@ async def get_wcc_usage_analytics(project_id: str) -> Dict[str, Any]:
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully retrieved WCC analytics for project: {validated_project_id}"
+                    "Successfully retrieved WCC analytics for project: %s", validated_project_id
                 )
                 return response
             else:
                 logger.warning(
-                    f"Failed to retrieve WCC analytics for project {validated_project_id}: "
-                    f"{response.get('error')}"
+                    "Failed to retrieve WCC analytics for project %s: %s",
+                    validated_project_id, response.get('error')
                 )
                 error_msg = (
                     f"Failed to retrieve WCC analytics for project "
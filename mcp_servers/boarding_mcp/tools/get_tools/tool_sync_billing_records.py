@@ -0,0 +1,59 @@
+"""
+MCP Tool: Sync Billing Records
+
+Pulls new billing records of all projects into the local billing records
+table (see app.services.billing_sync).
+"""
+from typing import Dict, Any
+
+from ..import mcp
+from ...billing_sync import get_billing_sync
+from app import logger
+
+
+@mcp.tool(
+    name="sync_billing_records",
+    description=(
+        "Syncs the billing records of all projects from AiSensy into the local database now, "
+        "fetching projects concurrently and storing only records newer than those already synced. "
+        "Runs on demand, and also in the background when BILLING_SYNC_INTERVAL_SECONDS is set; "
+        "use get_billing_spend to query the results."
+    ),
+    tags={
+        "billing",
+        "sync",
+        "records",
+        "finance",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Analytics & Billing"
+    }
+)
+async def sync_billing_records() -> Dict[str, Any]:
+    """
+    Sync billing records of all projects.
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): synced_at, seconds, outcome, projects, records_fetched,
+          records_stored and per-project errors
+        - error (str): Error message if unsuccessful
+    """
+    try:
+        summary = await get_billing_sync().sync()
+        logger.info("Synced billing records: %s stored", summary['records_stored'])
+        return {
+            "success": True,
+            "data": summary
+        }
+    except Exception as e:
+        error_msg = f"Unexpected error syncing billing records: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
@@ -84,12 +84,12 @@ async def update_business_details(
                     if getattr(request, f) is not None
                 ]
                 logger.info(
-                    f"Successfully updated business details. "
-                    f"Updated fields: {', '.join(updated_fields)}"
+                    "Successfully updated business details. Updated fields: %s",
+                    ', '.join(updated_fields)
                 )
             else:
                 logger.warning(
-                    f"Failed to update business details: {response.get('error')}"
+                    "Failed to update business details: %s", response.get('error')
                 )
             
             return response
@@ -81,7 +81,7 @@ async def create_business_profile(
                 details = response.get("details", {})
                 
                 full_error = f"{error_msg} | Status: {status_code} | Details: {details}"
-                logger.warning(f"Failed to create business profile: {full_error}")
+                logger.warning("Failed to create business profile: %s", full_error)
                 
                 return BusinessCreationResponse(
                     success=False,
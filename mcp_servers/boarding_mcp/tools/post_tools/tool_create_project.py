@@ -51,10 +51,10 @@ async def create_project(name: str) -> Dict[str, Any]:
             response = await client.create_project(name=request.name)
             
             if response.get("success"):
-                logger.info(f"Successfully created project: {request.name}")
+                logger.info("Successfully created project: %s", request.name)
             else:
                 logger.warning(
-                    f"Failed to create project: {response.get('error')}"
+                    "Failed to create project: %s", response.get('error')
                 )
             
             return response
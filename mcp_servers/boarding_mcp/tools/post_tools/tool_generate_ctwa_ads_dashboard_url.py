@@ -70,12 +70,12 @@ async def generate_ctwa_ads_dashboard_url(
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully generated CTWA Ads Dashboard URL for "
-                    f"business: {request.business_id}"
+                    "Successfully generated CTWA Ads Dashboard URL for business: %s",
+                    request.business_id
                 )
             else:
                 logger.warning(
-                    f"Failed to generate CTWA Ads Dashboard URL: {response.get('error')}"
+                    "Failed to generate CTWA Ads Dashboard URL: %s", response.get('error')
                 )
             
             return response
@@ -65,12 +65,12 @@ async def generate_embedded_fb_catalog_url(
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully generated FB catalog URL for "
-                    f"business: {request.business_id}"
+                    "Successfully generated FB catalog URL for business: %s",
+                    request.business_id
                 )
             else:
                 logger.warning(
-                    f"Failed to generate FB catalog URL: {response.get('error')}"
+                    "Failed to generate FB catalog URL: %s", response.get('error')
                 )
             
             return response
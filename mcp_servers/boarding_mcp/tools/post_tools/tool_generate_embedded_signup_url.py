@@ -124,7 +124,7 @@ async def generate_embedded_signup_url(
                 logger.info("Successfully generated embedded signup URL")
             else:
                 logger.warning(
-                    f"Failed to generate embedded signup URL: {response.get('error')}"
+                    "Failed to generate embedded signup URL: %s", response.get('error')
                 )
             
             return response
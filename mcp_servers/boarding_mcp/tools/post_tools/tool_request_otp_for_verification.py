@@ -64,12 +64,12 @@ async def request_otp_for_verification(
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully requested OTP via {request.mode} "
-                    f"for assistant: {request.assistant_id}"
+                    "Successfully requested OTP via %s for assistant: %s",
+                    request.mode, request.assistant_id
                 )
             else:
                 logger.warning(
-                    f"Failed to request OTP: {response.get('error')}"
+                    "Failed to request OTP: %s", response.get('error')
                 )
             
             return response
@@ -72,12 +72,12 @@ async def start_migration(
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully started migration for phone: "
-                    f"+{request.country_code}{request.phone_number}"
+                    "Successfully started migration for phone: +%s%s",
+                    request.country_code, request.phone_number
                 )
             else:
                 logger.warning(
-                    f"Failed to start migration: {response.get('error')}"
+                    "Failed to start migration: %s", response.get('error')
                 )
             
             return response
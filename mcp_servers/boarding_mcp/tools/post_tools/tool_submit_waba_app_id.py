@@ -64,11 +64,11 @@ async def submit_waba_app_id(
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully submitted WABA App ID for assistant: {request.assistant_id}"
+                    "Successfully submitted WABA App ID for assistant: %s", request.assistant_id
                 )
             else:
                 logger.warning(
-                    f"Failed to submit WABA App ID: {response.get('error')}"
+                    "Failed to submit WABA App ID: %s", response.get('error')
                 )
             
             return response
@@ -64,11 +64,11 @@ async def verify_otp(
             
             if response.get("success"):
                 logger.info(
-                    f"Successfully verified OTP for assistant: {request.assistant_id}"
+                    "Successfully verified OTP for assistant: %s", request.assistant_id
                 )
             else:
                 logger.warning(
-                    f"Failed to verify OTP: {response.get('error')}"
+                    "Failed to verify OTP: %s", response.get('error')
                 )
             
             return response
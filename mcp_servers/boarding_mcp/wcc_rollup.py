@@ -0,0 +1,33 @@
+"""
+Partner API source of the WCC usage rollup.
+
+`get_wcc_rollup()` is the server's WccRollup (app.services.wcc_rollup),
+reading the WCC analytics of every project of every configured tenant with
+that tenant's Partner API clients; projects are found like the billing
+sync finds them. It is used by the get_partner_wcc_usage tool.
+"""
+import functools
+from typing import Any, Dict, List
+
+from app.config.settings import setting
+from app.services.wcc_rollup import WccRollup, get_wcc_usage_cache
+from .billing_sync import PartnerBillingSource
+
+
+class PartnerUsageSource(PartnerBillingSource):
+    """Projects and daily WCC usage of each tenant's partner account."""
+
+    async def wcc_usage(self, tenant_id: str, project_id: str) -> List[Dict[str, Any]]:
+        data = await self._call(tenant_id, "get_wcc_usage_analytics", project_id=project_id)
+        days = data.get("wccAnalytics", data.get("data", [])) if isinstance(data, dict) else data
+        return [day for day in days or () if isinstance(day, dict)]
+
+
+@functools.lru_cache(maxsize=1)
+def get_wcc_rollup() -> WccRollup:
+    return WccRollup(
+        PartnerUsageSource(),
+        get_wcc_usage_cache(),
+        concurrency=setting("WCC_ROLLUP_CONCURRENCY", 8),
+        close_days=setting("WCC_ROLLUP_CLOSE_DAYS", 2.0),
+    )
@@ -5,7 +5,25 @@ import aiohttp
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
-from app import settings, logger
+from app.config.settings import get_settings
+from app.config.logging import get_logger
+from app.services.deadlines import request_timeout
+from app.services.endpoints import endpoint_registry
+from app.services.hedging import hedge_client_methods
+from app.services.http_pool import shared_connector
+from app.services.monitoring_service import (current_upstream_call, instrument_client_methods,
+                                             record_retry)
+from app.services.response_cache import cache_client_methods
+from app.services.tenant_service import Tenant
+from app.services.tracing_service import client_trace_configs, trace_client_methods
+from app.services.upstream import call_endpoint, client_middlewares
+from app.utils import json_backend
+
+from . import endpoints  # noqa: F401  (registers DIRECT_API_ENDPOINTS)
+from .direct_api_token import (DirectApiToken, direct_api_token_for, shared_direct_api_token,
+                               token_from_response)
+
+logger = get_logger("direct_api_mcp.clients")
 
 
 @dataclass
@@ -13,24 +31,128 @@ class AiSensyDirectApiClient:
     """Base client for AiSensy Direct APIs with shared functionality."""
     
     timeout: int = 30
-    BASE_URL: str = settings.Direct_BASE_URL
+    BASE_URL: str = field(default_factory=lambda: get_settings().Direct_BASE_URL)
     _session: Optional[aiohttp.ClientSession] = field(default=None, init=False, repr=False)
-    _token: str = field(default_factory=lambda: settings.AISENSY_BEARER_TOKEN)
+    # Explicit token for this client alone; by default all clients share the process token
+    _token: Optional[str] = field(default=None, repr=False)
+    _auth: DirectApiToken = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self._auth = shared_direct_api_token() if self._token is None else DirectApiToken(self._token)
+    
+    @classmethod
+    def for_tenant(cls, tenant: Tenant, **kwargs):
+        """Client sharing `tenant`'s token with that tenant's other Direct API clients."""
+        client = cls(_token="", **kwargs)
+        client._auth = direct_api_token_for(tenant)
+        return client
+    
+    def __init_subclass__(cls, **kwargs):
+        """Instrument every endpoint method of the concrete clients; hedge and cache some reads."""
+        super().__init_subclass__(**kwargs)
+        instrument_client_methods(cls, service="direct_api")
+        trace_client_methods(cls, service="direct_api")
+        hedge_client_methods(cls, service="direct_api")
+        cache_client_methods(cls, service="direct_api")
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
+                connector=shared_connector("direct_api"),
+                connector_owner=False,
                 timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=client_trace_configs("direct_api"),
+                json_serialize=json_backend.dumps,
+                middlewares=(*client_middlewares("direct_api"), self._auth_middleware),
                 headers={
                     "Accept": "application/json",
                     "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self._token}",
+                    "Authorization": f"Bearer {self._auth.token}",
                 }
             )
             logger.debug("New HTTP session created for Direct API")
         return self._session
     
+    async def _call(self, endpoint: str, /, **arguments) -> Dict[str, Any]:
+        """Call `endpoint` of DIRECT_API_ENDPOINTS with a client method's arguments."""
+        return await call_endpoint(self, endpoint_registry.get("direct_api", endpoint), arguments, logger)
+    
+    def _cache_scope(self) -> tuple:
+        """Whose data this client reads: the key prefix of its cached lookups."""
+        return (self.BASE_URL, self._auth.scope)
+    
+    def _request_timeout(self) -> aiohttp.ClientTimeout:
+        """Timeouts of the running call's request: its endpoint's profile, cut to the tool call's deadline."""
+        return request_timeout("direct_api")
+    
+    async def _read_json(self, response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body with the configured JSON backend."""
+        body = await response.read()
+        if not body.strip():
+            return None
+        return json_backend.loads(body)
+    
+    async def _auth_middleware(
+        self, request: aiohttp.ClientRequest, handler: aiohttp.ClientHandlerType
+    ) -> aiohttp.ClientResponse:
+        """
+        Send every request with the current token: refresh it shortly before
+        it expires, and on a 401 refresh it (once for all concurrent callers)
+        and replay the request.
+        """
+        if self._auth.expiring():
+            await self._try_refresh(self._auth.token, "expiry")
+
+        token = self._auth.token
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = await handler(request)
+        if response.status != 401:
+            return response
+
+        await self._try_refresh(token, "unauthorized")
+        if self._auth.token == token:
+            return response
+
+        response.release()
+        call = current_upstream_call.get()
+        record_retry("direct_api", call[1] if call else "unknown", "token_refresh")
+        logger.info("Replaying %s %s with the refreshed token", request.method, request.url.path)
+        request.headers["Authorization"] = f"Bearer {self._auth.token}"
+        return await handler(request)
+    
+    async def _try_refresh(self, stale_token: str, trigger: str) -> None:
+        """Refresh the token if it is still `stale_token`; failures are logged, not raised."""
+        try:
+            await self._auth.refresh(self._regenerate_token, stale_token=stale_token, trigger=trigger)
+        except Exception:
+            logger.exception("Direct API token refresh failed")
+    
+    async def _regenerate_token(self, direct_api: bool = True) -> Dict[str, Any]:
+        """
+        POST /users/regenrate-token and store the new token in the shared
+        DirectApiToken, which every session's middleware reads; open
+        connections are kept. Call through `self._auth.refresh()`.
+        """
+        url = f"{self.BASE_URL}/users/regenrate-token"
+        headers = {"Authorization": f"Bearer {self._auth.token}"}
+        if self._auth.project_password:
+            headers["X-AiSensy-Project-API-Pwd"] = self._auth.project_password
+
+        session = await self._get_session()
+        # Bypass _auth_middleware: this request must not trigger another refresh
+        async with session.post(url, json={"direct_api": direct_api}, headers=headers,
+                                middlewares=()) as response:
+            if response.status != 200:
+                return self._handle_error(response.status, await response.text())
+            data = await self._read_json(response)
+
+        token = token_from_response(data)
+        if not token:
+            return {"success": False, "error": "No token in regenerate-token response", "details": data}
+        self._auth.set(token)
+        return {"success": True, "data": data}
+    
     async def close(self) -> None:
         """Close HTTP session."""
         if self._session and not self._session.closed:
@@ -48,7 +170,7 @@ class AiSensyDirectApiClient:
     
     def _handle_error(self, status: int, error_text: str) -> Dict[str, Any]:
         """Handle error response."""
-        logger.warning(f"Direct API error: {status} - {error_text}")
+        logger.warning("Direct API error: %s - %s", status, error_text)
         error_map = {
             400: "Bad request",
             401: "Invalid or expired token",
@@ -2,10 +2,8 @@
 DELETE client for AiSensy Direct APIs
 """
 from typing import Dict, Any
-import aiohttp
 
 from .direct_api_base_client import AiSensyDirectApiClient
-from app import logger
 
 
 class AiSensyDirectApiDeleteClient(AiSensyDirectApiClient):
@@ -26,37 +24,7 @@ class AiSensyDirectApiDeleteClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not template_id:
-            logger.error("Missing template_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: template_id"
-            }
-
-        url = f"{self.BASE_URL}/wa_template"
-        params = {"templateId": template_id}
-        logger.debug(f"Deleting WA template by ID: {template_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.delete(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully deleted WA template by ID: {template_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("delete_wa_template_by_id", template_id=template_id)
 
     # ==================== 2. DELETE WA TEMPLATE BY NAME ====================
 
@@ -73,36 +41,7 @@ class AiSensyDirectApiDeleteClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not template_name:
-            logger.error("Missing template_name parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: template_name"
-            }
-
-        url = f"{self.BASE_URL}/wa_template/{template_name}"
-        logger.debug(f"Deleting WA template by name: {template_name}")
-
-        try:
-            session = await self._get_session()
-            async with session.delete(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully deleted WA template by name: {template_name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("delete_wa_template_by_name", template_name=template_name)
 
     # ==================== 3. DELETE MEDIA BY ID ====================
 
@@ -119,37 +58,7 @@ class AiSensyDirectApiDeleteClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not media_id:
-            logger.error("Missing media_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: media_id"
-            }
-
-        url = f"{self.BASE_URL}/media"
-        params = {"mediaId": media_id}
-        logger.debug(f"Deleting media by ID: {media_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.delete(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully deleted media by ID: {media_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("delete_media_by_id", media_id=media_id)
 
     # ==================== 4. DISCONNECT CATALOG ====================
 
@@ -163,29 +72,7 @@ class AiSensyDirectApiDeleteClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/disconnect-catalog"
-        logger.debug(f"Disconnecting catalog at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.delete(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully disconnected catalog")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("disconnect_catalog")
 
     # ==================== 5. DELETE A FLOW ====================
 
@@ -202,33 +89,4 @@ class AiSensyDirectApiDeleteClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not flow_id:
-            logger.error("Missing flow_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: flow_id"
-            }
-
-        url = f"{self.BASE_URL}/flows/{flow_id}"
-        logger.debug(f"Deleting flow: {flow_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.delete(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully deleted flow: {flow_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+        return await self._call("delete_flow", flow_id=flow_id)
@@ -1,11 +1,9 @@
 """
 GET client for AiSensy Direct APIs
 """
-from typing import Dict, Any, Optional
-import aiohttp
+from typing import Dict, Any
 
 from .direct_api_base_client import AiSensyDirectApiClient
-from app import logger
 
 
 class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
@@ -23,29 +21,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the business info
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/get-business-info"
-        logger.debug(f"Fetching business info from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched business info")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_business_info")
 
 
     async def get_fb_verification_status(self) -> Dict[str, Any]:
@@ -58,29 +34,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the business info
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/fb-verification-status"
-        logger.debug(f"Fetching business info from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fb-verification-status info")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_fb_verification_status")
 
             
 
@@ -103,29 +57,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing all templates
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/get-templates"
-        logger.debug(f"Fetching templates from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched templates")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_templates")
 
     async def get_template_by_id(self, template_id: str) -> Dict[str, Any]:
         """
@@ -140,36 +72,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the template details
             as returned by the AiSensy API.
         """
-        if not template_id:
-            logger.error("Missing template_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: template_id"
-            }
-
-        url = f"{self.BASE_URL}/get-template/{template_id}"
-        logger.debug(f"Fetching template from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully fetched template: {template_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_template_by_id", template_id=template_id)
 
     # ==================== MEDIA ====================
 
@@ -186,36 +89,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the upload session details
             as returned by the AiSensy API.
         """
-        if not upload_session_id:
-            logger.error("Missing upload_session_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: upload_session_id"
-            }
-
-        url = f"{self.BASE_URL}/media/session/{upload_session_id}"
-        logger.debug(f"Fetching media upload session from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully fetched media upload session: {upload_session_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_media_upload_session", upload_session_id=upload_session_id)
 
     # ==================== PROFILE ====================
 
@@ -229,29 +103,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the user profile
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/get-profile"
-        logger.debug(f"Fetching profile from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched profile")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_profile")
 
     # ==================== PHONE NUMBERS ====================
 
@@ -265,29 +117,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing all phone numbers
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/get-phone-numbers"
-        logger.debug(f"Fetching phone numbers from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched phone numbers")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_phone_numbers")
 
     async def get_phone_number(self) -> Dict[str, Any]:
         """
@@ -299,29 +129,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the phone number details
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/get-phone-number"
-        logger.debug(f"Fetching phone number from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched phone number")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_phone_number")
 
     # ==================== DISPLAY NAME / VERIFICATION ====================
 
@@ -335,29 +143,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the display name status
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/get-display-name-status"
-        logger.debug(f"Fetching display name status from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched display name status")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_display_name_status")
 
     # ==================== CATALOG ====================
 
@@ -371,29 +157,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the catalog details
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/catalog"
-        logger.debug(f"Fetching catalog from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched catalog")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_catalog")
 
     # ==================== PRODUCTS ====================
 
@@ -407,29 +171,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing all products
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/product"
-        logger.debug(f"Fetching products from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched products")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_products")
 
     # ==================== WHATSAPP COMMERCE ====================
 
@@ -443,29 +185,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the WhatsApp commerce settings
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/whatsapp-commerce-settings"
-        logger.debug(f"Fetching WhatsApp commerce settings from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched WhatsApp commerce settings")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_whatsapp_commerce_settings")
 
     # ==================== QR CODES ====================
 
@@ -479,29 +199,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing all QR codes
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/qr-codes"
-        logger.debug(f"Fetching QR codes from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched QR codes")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_qr_codes")
 
     # ==================== ENCRYPTION ====================
 
@@ -515,29 +213,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the WhatsApp business encryption settings
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/whatsapp-business-encryption"
-        logger.debug(f"Fetching WhatsApp business encryption from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched WhatsApp business encryption")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_whatsapp_business_encryption")
 
     # ==================== FLOWS ====================
 
@@ -551,29 +227,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing all flows
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/flows"
-        logger.debug(f"Fetching flows from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched flows")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_flows")
 
     async def get_flow_by_id(self, flow_id: str) -> Dict[str, Any]:
         """
@@ -588,36 +242,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the flow details
             as returned by the AiSensy API.
         """
-        if not flow_id:
-            logger.error("Missing flow_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: flow_id"
-            }
-
-        url = f"{self.BASE_URL}/flows/{flow_id}"
-        logger.debug(f"Fetching flow from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully fetched flow: {flow_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_flow_by_id", flow_id=flow_id)
 
     async def get_flow_assets(self, flow_id: str) -> Dict[str, Any]:
         """
@@ -632,36 +257,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the flow assets
             as returned by the AiSensy API.
         """
-        if not flow_id:
-            logger.error("Missing flow_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: flow_id"
-            }
-
-        url = f"{self.BASE_URL}/flows/{flow_id}/assets"
-        logger.debug(f"Fetching flow assets from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully fetched flow assets: {flow_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_flow_assets", flow_id=flow_id)
 
     async def get_flow_web_preview(self, flow_id: str) -> Dict[str, Any]:
         """
@@ -676,36 +272,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the flow web preview
             as returned by the AiSensy API.
         """
-        if not flow_id:
-            logger.error("Missing flow_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: flow_id"
-            }
-
-        url = f"{self.BASE_URL}/flows/{flow_id}/web-preview"
-        logger.debug(f"Fetching flow web preview from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully fetched flow web preview: {flow_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_flow_web_preview", flow_id=flow_id)
 
     # ==================== PAYMENT CONFIGURATIONS ====================
 
@@ -719,29 +286,7 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing all payment configurations
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/payment_configurations"
-        logger.debug(f"Fetching payment configurations from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched payment configurations")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_payment_configurations")
 
     async def get_payment_configuration_by_name(self, configuration_name: str) -> Dict[str, Any]:
         """
@@ -756,33 +301,6 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the payment configuration details
             as returned by the AiSensy API.
         """
-        if not configuration_name:
-            logger.error("Missing configuration_name parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: configuration_name"
-            }
-
-        url = f"{self.BASE_URL}/payment_configuration/{configuration_name}"
-        logger.debug(f"Fetching payment configuration from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully fetched payment configuration: {configuration_name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+        return await self._call(
+            "get_payment_configuration_by_name", configuration_name=configuration_name
+        )
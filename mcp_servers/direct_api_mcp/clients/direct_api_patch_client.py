@@ -2,10 +2,8 @@
 PATCH client for AiSensy Direct APIs
 """
 from typing import Dict, Any, Optional, List
-import aiohttp
 
 from .direct_api_base_client import AiSensyDirectApiClient
-from app import logger
 
 
 class AiSensyDirectApiPatchClient(AiSensyDirectApiClient):
@@ -26,37 +24,9 @@ class AiSensyDirectApiPatchClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not whatsapp_display_image:
-            logger.error("Missing whatsapp_display_image parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: whatsapp_display_image"
-            }
-
-        url = f"{self.BASE_URL}/update-profile-picture"
-        payload = {"whatsAppDisplayImage": whatsapp_display_image}
-        logger.debug(f"Updating business profile picture at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.patch(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully updated business profile picture")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "update_business_profile_picture", whatsapp_display_image=whatsapp_display_image
+        )
 
     # ==================== 2. UPDATE BUSINESS PROFILE DETAILS ====================
 
@@ -88,53 +58,16 @@ class AiSensyDirectApiPatchClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/update-profile"
-        payload = {}
-
-        if whatsapp_about is not None:
-            payload["whatsAppAbout"] = whatsapp_about
-        if address is not None:
-            payload["address"] = address
-        if description is not None:
-            payload["description"] = description
-        if vertical is not None:
-            payload["vertical"] = vertical
-        if email is not None:
-            payload["email"] = email
-        if websites is not None:
-            payload["websites"] = websites
-        if whatsapp_display_image is not None:
-            payload["whatsAppDisplayImage"] = whatsapp_display_image
-
-        if not payload:
-            logger.error("No fields provided to update")
-            return {
-                "success": False,
-                "error": "At least one field is required to update"
-            }
-
-        logger.debug(f"Updating business profile details at: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.patch(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully updated business profile details")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "update_business_profile_details",
+            whatsapp_about=whatsapp_about,
+            address=address,
+            description=description,
+            vertical=vertical,
+            email=email,
+            websites=websites,
+            whatsapp_display_image=whatsapp_display_image,
+        )
 
     # ==================== 3. UPDATE QR CODE ====================
 
@@ -156,40 +89,9 @@ class AiSensyDirectApiPatchClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not qr_code_id or not prefilled_message:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: qr_code_id and prefilled_message"
-            }
-
-        url = f"{self.BASE_URL}/qr-codes"
-        payload = {
-            "qrCodeId": qr_code_id,
-            "prefilledMessage": prefilled_message
-        }
-        logger.debug(f"Updating QR code: {qr_code_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.patch(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully updated QR code: {qr_code_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "update_qr_code", qr_code_id=qr_code_id, prefilled_message=prefilled_message
+        )
 
     # ==================== 4. UPDATING FLOW'S METADATA ====================
 
@@ -213,47 +115,6 @@ class AiSensyDirectApiPatchClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not flow_id:
-            logger.error("Missing flow_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: flow_id"
-            }
-
-        url = f"{self.BASE_URL}/flows/{flow_id}"
-        payload = {}
-
-        if name is not None:
-            payload["name"] = name
-        if categories is not None:
-            payload["categories"] = categories
-
-        if not payload:
-            logger.error("No fields provided to update")
-            return {
-                "success": False,
-                "error": "At least one field (name or categories) is required to update"
-            }
-
-        logger.debug(f"Updating flow metadata: {flow_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.patch(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully updated flow metadata: {flow_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+        return await self._call(
+            "update_flow_metadata", flow_id=flow_id, name=name, categories=categories
+        )
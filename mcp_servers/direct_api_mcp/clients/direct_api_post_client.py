@@ -2,10 +2,13 @@
 POST client for AiSensy Direct APIs
 """
 from typing import Dict, Any, Optional, List
+import asyncio
 import aiohttp
 
 from .direct_api_base_client import AiSensyDirectApiClient
-from app import logger
+from app.config.logging import get_logger
+
+logger = get_logger("direct_api_mcp.clients")
 
 
 class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
@@ -26,25 +29,18 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the new token details
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/users/regenrate-token"
-        payload = {"direct_api": direct_api}
-        logger.debug(f"Regenerating JWT bearer token at: {url}")
+        logger.debug("Regenerating JWT bearer token")
 
         try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully regenerated JWT bearer token")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
+            # The new token is rotated into every Direct API client
+            return await self._auth.refresh(
+                lambda: self._regenerate_token(direct_api), trigger="manual"
+            )
 
         except aiohttp.ClientConnectorError:
             logger.error("Network connection error")
             return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
+        except asyncio.TimeoutError:
             logger.error("Request timeout")
             return {"success": False, "error": "Request timeout"}
         except Exception as e:
@@ -77,38 +73,14 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the WABA analytics
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/waba-analytics"
-        payload = {
-            "fields": fields,
-            "start": start,
-            "end": end,
-            "granularity": granularity
-        }
-        if country_codes:
-            payload["country_codes"] = country_codes
-
-        logger.debug(f"Fetching WABA analytics from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched WABA analytics")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "get_waba_analytics",
+            fields=fields,
+            start=start,
+            end=end,
+            granularity=granularity,
+            country_codes=country_codes,
+        )
 
     # ==================== 3. HEALTH STATUS ====================
 
@@ -125,37 +97,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the health status
             as returned by the AiSensy API.
         """
-        if not node_id:
-            logger.error("Missing node_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: node_id"
-            }
-
-        url = f"{self.BASE_URL}/health-status"
-        payload = {"nodeId": node_id}
-        logger.debug(f"Fetching messaging health status from: {url}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully fetched messaging health status")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("get_messaging_health_status", node_id=node_id)
 
     # ==================== 4. SEND MESSAGE ====================
 
@@ -181,44 +123,13 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the message response
             as returned by the AiSensy API.
         """
-        if not to or not text_body:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: to and text_body"
-            }
-
-        url = f"{self.BASE_URL}/messages"
-        payload = {
-            "to": to,
-            "type": message_type,
-            "recipient_type": recipient_type,
-            "text": {
-                "body": text_body
-            }
-        }
-        logger.debug(f"Sending message to: {to}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully sent message to: {to}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "send_message",
+            to=to,
+            message_type=message_type,
+            text_body=text_body,
+            recipient_type=recipient_type,
+        )
 
     # ==================== 5. SEND MARKETING LITE MESSAGE ====================
 
@@ -244,44 +155,13 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the message response
             as returned by the AiSensy API.
         """
-        if not to or not text_body:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: to and text_body"
-            }
-
-        url = f"{self.BASE_URL}/marketing_messages"
-        payload = {
-            "to": to,
-            "type": message_type,
-            "recipient_type": recipient_type,
-            "text": {
-                "body": text_body
-            }
-        }
-        logger.debug(f"Sending marketing lite message to: {to}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully sent marketing lite message to: {to}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "send_marketing_lite_message",
+            to=to,
+            message_type=message_type,
+            text_body=text_body,
+            recipient_type=recipient_type,
+        )
 
     # ==================== 6. MARK MESSAGE AS READ ====================
 
@@ -298,37 +178,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not message_id:
-            logger.error("Missing message_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: message_id"
-            }
-
-        url = f"{self.BASE_URL}/mark-read"
-        payload = {"messageId": message_id}
-        logger.debug(f"Marking message as read: {message_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully marked message as read: {message_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("mark_message_as_read", message_id=message_id)
 
     # ==================== 7. SUBMIT WHATSAPP TEMPLATE MESSAGE ====================
 
@@ -354,42 +204,13 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the created template
             as returned by the AiSensy API.
         """
-        if not name or not category or not language or not components:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: name, category, language, and components"
-            }
-
-        url = f"{self.BASE_URL}/wa_template"
-        payload = {
-            "name": name,
-            "category": category,
-            "language": language,
-            "components": components
-        }
-        logger.debug(f"Submitting WhatsApp template: {name}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully submitted WhatsApp template: {name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "submit_whatsapp_template_message",
+            name=name,
+            category=category,
+            language=language,
+            components=components,
+        )
 
     # ==================== 8. EDIT TEMPLATE ====================
 
@@ -413,40 +234,9 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the updated template
             as returned by the AiSensy API.
         """
-        if not template_id or not category or not components:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: template_id, category, and components"
-            }
-
-        url = f"{self.BASE_URL}/edit-template/{template_id}"
-        payload = {
-            "category": category,
-            "components": components
-        }
-        logger.debug(f"Editing template: {template_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully edited template: {template_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "edit_template", template_id=template_id, category=category, components=components
+        )
 
     # ==================== 9. COMPARE TEMPLATE ====================
 
@@ -472,41 +262,13 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the comparison results
             as returned by the AiSensy API.
         """
-        if not template_id or not template_ids:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: template_id and template_ids"
-            }
-
-        url = f"{self.BASE_URL}/compare-template/{template_id}"
-        payload = {
-            "templateIds": template_ids,
-            "start": start,
-            "end": end
-        }
-        logger.debug(f"Comparing template: {template_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully compared template: {template_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "compare_template",
+            template_id=template_id,
+            template_ids=template_ids,
+            start=start,
+            end=end,
+        )
 
     # ==================== 10. UPLOAD MEDIA ====================
 
@@ -523,42 +285,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the upload response
             as returned by the AiSensy API.
         """
-        if not file_path:
-            logger.error("Missing file_path parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: file_path"
-            }
-
-        url = f"{self.BASE_URL}/media"
-        logger.debug(f"Uploading media from: {file_path}")
-
-        try:
-            session = await self._get_session()
-            data = aiohttp.FormData()
-            data.add_field('file', open(file_path, 'rb'))
-
-            async with session.post(url, data=data) as response:
-                if response.status == 200:
-                    resp_data = await response.json()
-                    logger.info("Successfully uploaded media")
-                    return {"success": True, "data": resp_data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except FileNotFoundError:
-            logger.error(f"File not found: {file_path}")
-            return {"success": False, "error": f"File not found: {file_path}"}
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("upload_media", file_path=file_path)
 
     # ==================== 11. RETRIEVE MEDIA BY ID ====================
 
@@ -575,37 +302,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the media details
             as returned by the AiSensy API.
         """
-        if not media_id:
-            logger.error("Missing media_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: media_id"
-            }
-
-        url = f"{self.BASE_URL}/get-media"
-        payload = {"id": media_id}
-        logger.debug(f"Retrieving media: {media_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully retrieved media: {media_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("retrieve_media_by_id", media_id=media_id)
 
     # ==================== 12. CREATE UPLOAD SESSION ====================
 
@@ -629,41 +326,12 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the session details
             as returned by the AiSensy API.
         """
-        if not file_name or not file_length or not file_type:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: file_name, file_length, and file_type"
-            }
-
-        url = f"{self.BASE_URL}/media/session"
-        payload = {
-            "fileName": file_name,
-            "fileLength": file_length,
-            "fileType": file_type
-        }
-        logger.debug(f"Creating upload session for: {file_name}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully created upload session for: {file_name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "create_upload_session",
+            file_name=file_name,
+            file_length=file_length,
+            file_type=file_type,
+        )
 
     # ==================== 13. UPLOAD MEDIA TO SESSION ====================
 
@@ -687,43 +355,12 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the upload response
             as returned by the AiSensy API.
         """
-        if not upload_session_id or not file_path:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: upload_session_id and file_path"
-            }
-
-        url = f"{self.BASE_URL}/media/session/{upload_session_id}"
-        logger.debug(f"Uploading media to session: {upload_session_id}")
-
-        try:
-            session = await self._get_session()
-            data = aiohttp.FormData()
-            data.add_field('file', open(file_path, 'rb'))
-            data.add_field('fileOffset', str(file_offset))
-
-            async with session.post(url, data=data) as response:
-                if response.status == 200:
-                    resp_data = await response.json()
-                    logger.info(f"Successfully uploaded media to session: {upload_session_id}")
-                    return {"success": True, "data": resp_data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except FileNotFoundError:
-            logger.error(f"File not found: {file_path}")
-            return {"success": False, "error": f"File not found: {file_path}"}
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "upload_media_to_session",
+            upload_session_id=upload_session_id,
+            file_path=file_path,
+            file_offset=file_offset,
+        )
 
     # ==================== 14. CREATE CATALOG ====================
 
@@ -757,50 +394,17 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the created catalog
             as returned by the AiSensy API.
         """
-        if not name:
-            logger.error("Missing name parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: name"
-            }
-
-        url = f"{self.BASE_URL}/catalog"
-        payload = {
-            "vertical": vertical,
-            "name": name,
-            "product_count": product_count,
-            "feed_count": feed_count,
-            "is_catalog_segment": is_catalog_segment
-        }
-        if default_image_url:
-            payload["default_image_url"] = default_image_url
-        if fallback_image_url:
-            payload["fallback_image_url"] = fallback_image_url
-        if da_display_settings:
-            payload["da_display_settings"] = da_display_settings
-
-        logger.debug(f"Creating catalog: {name}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully created catalog: {name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "create_catalog",
+            name=name,
+            vertical=vertical,
+            product_count=product_count,
+            feed_count=feed_count,
+            default_image_url=default_image_url,
+            fallback_image_url=fallback_image_url,
+            is_catalog_segment=is_catalog_segment,
+            da_display_settings=da_display_settings,
+        )
 
     # ==================== 15. CONNECT CATALOG ====================
 
@@ -817,37 +421,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not catalog_id:
-            logger.error("Missing catalog_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: catalog_id"
-            }
-
-        url = f"{self.BASE_URL}/connect-catalog"
-        payload = {"catalogId": catalog_id}
-        logger.debug(f"Connecting catalog: {catalog_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully connected catalog: {catalog_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("connect_catalog", catalog_id=catalog_id)
 
     # ==================== 16. CREATE PRODUCT ====================
 
@@ -891,58 +465,22 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the created product
             as returned by the AiSensy API.
         """
-        if not catalog_id or not name or not category or not currency or not image_url or not price or not retailer_id:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: catalog_id, name, category, currency, image_url, price, retailer_id"
-            }
-
-        url_endpoint = f"{self.BASE_URL}/product"
-        payload = {
-            "catalogId": catalog_id,
-            "name": name,
-            "category": category,
-            "currency": currency,
-            "image_url": image_url,
-            "price": price,
-            "retailer_id": retailer_id
-        }
-        if description:
-            payload["description"] = description
-        if url:
-            payload["url"] = url
-        if brand:
-            payload["brand"] = brand
-        if sale_price:
-            payload["sale_price"] = sale_price
-        if sale_price_start_date:
-            payload["sale_price_start_date"] = sale_price_start_date
-        if sale_price_end_date:
-            payload["sale_price_end_date"] = sale_price_end_date
-
-        logger.debug(f"Creating product: {name}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url_endpoint, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully created product: {name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "create_product",
+            catalog_id=catalog_id,
+            name=name,
+            category=category,
+            currency=currency,
+            image_url=image_url,
+            price=price,
+            retailer_id=retailer_id,
+            description=description,
+            url=url,
+            brand=brand,
+            sale_price=sale_price,
+            sale_price_start_date=sale_price_start_date,
+            sale_price_end_date=sale_price_end_date,
+        )
 
     # ==================== 17. SHOW / HIDE CATALOG ====================
 
@@ -964,33 +502,9 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the updated settings
             as returned by the AiSensy API.
         """
-        url = f"{self.BASE_URL}/whatsapp-commerce-settings"
-        payload = {
-            "enableCatalog": enable_catalog,
-            "enableCart": enable_cart
-        }
-        logger.debug("Updating WhatsApp commerce settings (show/hide catalog)")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully updated WhatsApp commerce settings")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "show_hide_catalog", enable_catalog=enable_catalog, enable_cart=enable_cart
+        )
 
     # ==================== 18. CREATE QR CODE & SHORT LINK ====================
 
@@ -1012,40 +526,11 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the created QR code
             as returned by the AiSensy API.
         """
-        if not prefilled_message:
-            logger.error("Missing prefilled_message parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: prefilled_message"
-            }
-
-        url = f"{self.BASE_URL}/qr-codes"
-        payload = {
-            "prefilledMessage": prefilled_message,
-            "generateQrImage": generate_qr_image
-        }
-        logger.debug("Creating QR code and short link")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully created QR code and short link")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "create_qr_code_and_short_link",
+            prefilled_message=prefilled_message,
+            generate_qr_image=generate_qr_image,
+        )
 
     # ==================== 19. SET BUSINESS PUBLIC KEY ====================
 
@@ -1062,37 +547,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not business_public_key:
-            logger.error("Missing business_public_key parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: business_public_key"
-            }
-
-        url = f"{self.BASE_URL}/whatsapp-business-encryption"
-        payload = {"businessPublicKey": business_public_key}
-        logger.debug("Setting business public key")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info("Successfully set business public key")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("set_business_public_key", business_public_key=business_public_key)
 
     # ==================== 20. CREATING A FLOW ====================
 
@@ -1114,40 +569,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the created flow
             as returned by the AiSensy API.
         """
-        if not name or not categories:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: name and categories"
-            }
-
-        url = f"{self.BASE_URL}/flows"
-        payload = {
-            "name": name,
-            "categories": categories
-        }
-        logger.debug(f"Creating flow: {name}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully created flow: {name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("create_flow", name=name, categories=categories)
 
     # ==================== 21. UPDATING A FLOW'S FLOW JSON ====================
 
@@ -1165,42 +587,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the upload response
             as returned by the AiSensy API.
         """
-        if not flow_id or not file_path:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: flow_id and file_path"
-            }
-
-        url = f"{self.BASE_URL}/flows/{flow_id}/assets"
-        logger.debug(f"Updating flow JSON for: {flow_id}")
-
-        try:
-            session = await self._get_session()
-            data = aiohttp.FormData()
-            data.add_field('file', open(file_path, 'rb'))
-
-            async with session.post(url, data=data) as response:
-                if response.status == 200:
-                    resp_data = await response.json()
-                    logger.info(f"Successfully updated flow JSON for: {flow_id}")
-                    return {"success": True, "data": resp_data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except FileNotFoundError:
-            logger.error(f"File not found: {file_path}")
-            return {"success": False, "error": f"File not found: {file_path}"}
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("update_flow_json", flow_id=flow_id, file_path=file_path)
 
     # ==================== 22. PUBLISH FLOW ====================
 
@@ -1217,36 +604,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not flow_id:
-            logger.error("Missing flow_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: flow_id"
-            }
-
-        url = f"{self.BASE_URL}/flows/{flow_id}/publish"
-        logger.debug(f"Publishing flow: {flow_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully published flow: {flow_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("publish_flow", flow_id=flow_id)
 
     # ==================== 23. DEPRECATE FLOW ====================
 
@@ -1263,36 +621,7 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the response
             as returned by the AiSensy API.
         """
-        if not flow_id:
-            logger.error("Missing flow_id parameter")
-            return {
-                "success": False,
-                "error": "Missing required field: flow_id"
-            }
-
-        url = f"{self.BASE_URL}/flows/{flow_id}/deprecate"
-        logger.debug(f"Deprecating flow: {flow_id}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully deprecated flow: {flow_id}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call("deprecate_flow", flow_id=flow_id)
 
     # ==================== 24. CREATE PAYMENT CONFIGURATION ====================
 
@@ -1320,43 +649,14 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the created configuration
             as returned by the AiSensy API.
         """
-        if not configuration_name or not purpose_code or not merchant_category_code or not provider_name or not redirect_url:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: configuration_name, purpose_code, merchant_category_code, provider_name, redirect_url"
-            }
-
-        url = f"{self.BASE_URL}/payment_configuration"
-        payload = {
-            "configuration_name": configuration_name,
-            "purpose_code": purpose_code,
-            "merchant_category_code": merchant_category_code,
-            "provider_name": provider_name,
-            "redirect_url": redirect_url
-        }
-        logger.debug(f"Creating payment configuration: {configuration_name}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully created payment configuration: {configuration_name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
+        return await self._call(
+            "create_payment_configuration",
+            configuration_name=configuration_name,
+            purpose_code=purpose_code,
+            merchant_category_code=merchant_category_code,
+            provider_name=provider_name,
+            redirect_url=redirect_url,
+        )
 
     # ==================== 25. GENERATE PAYMENT CONFIGURATION OAUTH LINK ====================
 
@@ -1378,37 +678,8 @@ class AiSensyDirectApiPostClient(AiSensyDirectApiClient):
             Dict[str, Any]: A dictionary containing the OAuth link
             as returned by the AiSensy API.
         """
-        if not configuration_name or not redirect_url:
-            logger.error("Missing required parameters")
-            return {
-                "success": False,
-                "error": "Missing required fields: configuration_name and redirect_url"
-            }
-
-        url = f"{self.BASE_URL}/generate_payment_configuration_oauth_link"
-        payload = {
-            "configuration_name": configuration_name,
-            "redirect_url": redirect_url
-        }
-        logger.debug(f"Generating OAuth link for: {configuration_name}")
-
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully generated OAuth link for: {configuration_name}")
-                    return {"success": True, "data": data}
-
-                error_text = await response.text()
-                return self._handle_error(response.status, error_text)
-
-        except aiohttp.ClientConnectorError:
-            logger.error("Network connection error")
-            return {"success": False, "error": "Network connection error"}
-        except aiohttp.ClientTimeout:
-            logger.error("Request timeout")
-            return {"success": False, "error": "Request timeout"}
-        except Exception as e:
-            logger.exception("Unexpected error")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+        return await self._call(
+            "generate_payment_configuration_oauth_link",
+            configuration_name=configuration_name,
+            redirect_url=redirect_url,
+        )
@@ -0,0 +1,149 @@
+"""
+Bearer token lifecycle for the AiSensy Direct API clients.
+
+The GET/POST/DELETE/PATCH clients each own a session but share one
+`DirectApiToken` per tenant, so a token regenerated through any of them is
+used by all of them. Refreshes are single-flight: concurrent callers that hit an
+expired token wait for the one refresh in progress instead of starting
+their own.
+"""
+import asyncio
+import base64
+import functools
+import itertools
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config.logging import get_logger
+from app.config.settings import get_settings
+from app.services.monitoring_service import record_token_refresh
+from app.services.tenant_service import DEFAULT_TENANT_ID, Tenant
+
+logger = get_logger("direct_api_mcp.clients")
+
+# Refresh this many seconds before the JWT `exp`
+REFRESH_MARGIN_SECONDS = 120.0
+# After a failed refresh, don't try again for this long
+REFRESH_COOLDOWN_SECONDS = 5.0
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """Return the `exp` claim of a JWT (unverified), or None if there is none."""
+    try:
+        claims = token.split(".")[1]
+        claims += "=" * (-len(claims) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(claims)).get("exp")
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def token_from_response(data: Any) -> Optional[str]:
+    """Find the new token in a /users/regenrate-token response body."""
+    if isinstance(data, dict):
+        for key in ("token", "access_token", "jwt"):
+            if isinstance(data.get(key), str) and data[key]:
+                return data[key]
+        data = list(data.values())
+    if isinstance(data, list):
+        for value in data:
+            if isinstance(value, (dict, list)):
+                token = token_from_response(value)
+                if token:
+                    return token
+    return None
+
+
+_scopes = itertools.count(1)
+
+
+class DirectApiToken:
+    """
+    The current Direct API bearer token, its expiry and the refresh lock.
+
+    `project_password` is sent as X-AiSensy-Project-API-Pwd when
+    regenerating, so a token can be replaced even after it has expired.
+    """
+
+    def __init__(self, token: str = "", project_password: str = "",
+                 refresh_margin: float = REFRESH_MARGIN_SECONDS):
+        self.project_password = project_password
+        self.refresh_margin = refresh_margin
+        # Identifies the business the token acts for, e.g. in cache keys
+        self.scope = f"token-{next(_scopes)}"
+        self.token = ""
+        self.expires_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._retry_at = 0.0
+        self.set(token)
+
+    def set(self, token: str) -> None:
+        self.token = token or ""
+        self.expires_at = jwt_expiry(self.token) if self.token else None
+
+    def expiring(self, now: Optional[float] = None) -> bool:
+        """True when the token's `exp` is within the refresh margin."""
+        if self.expires_at is None:
+            return False
+        return (now or time.time()) >= self.expires_at - self.refresh_margin
+
+    async def refresh(
+        self,
+        regenerate: Callable[[], Awaitable[Any]],
+        stale_token: Optional[str] = None,
+        trigger: str = "manual",
+    ) -> Any:
+        """
+        Run `regenerate` (which must call `set()` on success) under the lock.
+
+        With `stale_token`, nothing is done if the token has already moved
+        on from it (another caller refreshed while this one waited), or if
+        the last refresh failed less than REFRESH_COOLDOWN_SECONDS ago;
+        None is returned in both cases. Otherwise returns what `regenerate`
+        returned.
+        """
+        async with self._lock:
+            if stale_token is not None:
+                if self.token != stale_token:
+                    return None
+                if time.monotonic() < self._retry_at:
+                    return None
+
+            try:
+                result = await regenerate()
+            except Exception:
+                self._retry_at = time.monotonic() + REFRESH_COOLDOWN_SECONDS
+                record_token_refresh(trigger, "error")
+                raise
+
+            succeeded = isinstance(result, dict) and result.get("success")
+            if succeeded:
+                self._retry_at = 0.0
+                logger.info("Direct API token refreshed (%s), expires at %s", trigger, self.expires_at)
+            else:
+                self._retry_at = time.monotonic() + REFRESH_COOLDOWN_SECONDS
+                logger.warning("Direct API token refresh (%s) failed: %s", trigger, result)
+            record_token_refresh(trigger, "success" if succeeded else "failure")
+            return result
+
+
+@functools.lru_cache(maxsize=1)
+def shared_direct_api_token() -> DirectApiToken:
+    """The token shared by every Direct API client in this process."""
+    settings = get_settings()
+    return DirectApiToken(settings.AISENSY_BEARER_TOKEN, settings.AISENSY_PROJECT_API_PWD)
+
+
+_tenant_tokens: Dict[str, DirectApiToken] = {}
+
+
+def direct_api_token_for(tenant: Tenant) -> DirectApiToken:
+    """The token shared by `tenant`'s Direct API clients; kept when its clients are evicted."""
+    if tenant.tenant_id == DEFAULT_TENANT_ID:
+        return shared_direct_api_token()
+    token = _tenant_tokens.get(tenant.tenant_id)
+    if token is None:
+        token = _tenant_tokens[tenant.tenant_id] = DirectApiToken(tenant.bearer_token,
+                                                                   tenant.project_password)
+    return token
@@ -0,0 +1,193 @@
+"""
+Endpoint table of the AiSensy Direct API.
+
+Each method of the Direct API clients is a thin wrapper that calls the
+endpoint of the same name; see app.services.endpoints.Endpoint for the
+fields. regenerate_jwt_bearer_token is not listed: it goes through the
+token refresh of the base client instead.
+"""
+from typing import Tuple
+
+from app.services.endpoints import Endpoint, endpoint_registry
+from app.services.response_cache import CachePolicy
+
+DIRECT_API_ENDPOINTS: Tuple[Endpoint, ...] = (
+    # ==================== DELETE ====================
+    Endpoint("delete_wa_template_by_id", "DELETE", "/wa_template",
+             params={"templateId": "template_id"}, required=("template_id",)),
+    Endpoint("delete_wa_template_by_name", "DELETE", "/wa_template/{template_name}"),
+    Endpoint("delete_media_by_id", "DELETE", "/media", params={"mediaId": "media_id"},
+             required=("media_id",)),
+    Endpoint("disconnect_catalog", "DELETE", "/disconnect-catalog"),
+    Endpoint("delete_flow", "DELETE", "/flows/{flow_id}"),
+    # ==================== GET ====================
+    Endpoint("get_business_info", "GET", "/get-business-info",
+             cache=CachePolicy(soft_ttl=60, hard_ttl=300, stale_if_error_ttl=3600)),
+    Endpoint("get_fb_verification_status", "GET", "/fb-verification-status"),
+    Endpoint("get_templates", "GET", "/get-templates"),
+    Endpoint("get_template_by_id", "GET", "/get-template/{template_id}", hedged=True),
+    Endpoint("get_media_upload_session", "GET", "/media/session/{upload_session_id}"),
+    Endpoint("get_profile", "GET", "/get-profile",
+             cache=CachePolicy(soft_ttl=60, hard_ttl=300, stale_if_error_ttl=3600)),
+    Endpoint("get_phone_numbers", "GET", "/get-phone-numbers"),
+    Endpoint("get_phone_number", "GET", "/get-phone-number", hedged=True),
+    Endpoint("get_display_name_status", "GET", "/get-display-name-status"),
+    Endpoint("get_catalog", "GET", "/catalog"),
+    Endpoint("get_products", "GET", "/product"),
+    Endpoint("get_whatsapp_commerce_settings", "GET", "/whatsapp-commerce-settings"),
+    Endpoint("get_qr_codes", "GET", "/qr-codes"),
+    Endpoint("get_whatsapp_business_encryption", "GET", "/whatsapp-business-encryption"),
+    Endpoint("get_flows", "GET", "/flows"),
+    Endpoint("get_flow_by_id", "GET", "/flows/{flow_id}"),
+    Endpoint("get_flow_assets", "GET", "/flows/{flow_id}/assets"),
+    Endpoint("get_flow_web_preview", "GET", "/flows/{flow_id}/web-preview"),
+    Endpoint("get_payment_configurations", "GET", "/payment_configurations"),
+    Endpoint("get_payment_configuration_by_name", "GET", "/payment_configuration/{configuration_name}"),
+    # ==================== PATCH ====================
+    Endpoint("update_business_profile_picture", "PATCH", "/update-profile-picture",
+             body={"whatsAppDisplayImage": "whatsapp_display_image"},
+             required=("whatsapp_display_image",), invalidates=("get_profile",)),
+    Endpoint("update_business_profile_details", "PATCH", "/update-profile",
+             body={
+                 "whatsAppAbout": "whatsapp_about",
+                 "address": "address",
+                 "description": "description",
+                 "vertical": "vertical",
+                 "email": "email",
+                 "websites": "websites",
+                 "whatsAppDisplayImage": "whatsapp_display_image",
+             },
+             optional=("whatsAppAbout", "address", "description", "vertical", "email",
+                       "websites", "whatsAppDisplayImage"),
+             require_body=True, invalidates=("get_profile",)),
+    Endpoint("update_qr_code", "PATCH", "/qr-codes",
+             body={"qrCodeId": "qr_code_id", "prefilledMessage": "prefilled_message"},
+             required=("qr_code_id", "prefilled_message")),
+    Endpoint("update_flow_metadata", "PATCH", "/flows/{flow_id}",
+             body={"name": "name", "categories": "categories"}, optional=("name", "categories"),
+             require_body=True),
+    # ==================== POST ====================
+    Endpoint("get_waba_analytics", "POST", "/waba-analytics",
+             body={
+                 "fields": "fields",
+                 "start": "start",
+                 "end": "end",
+                 "granularity": "granularity",
+                 "country_codes": "country_codes",
+             },
+             omit_falsy=("country_codes",), idempotent=True),
+    Endpoint("get_messaging_health_status", "POST", "/health-status", body={"nodeId": "node_id"},
+             required=("node_id",), idempotent=True),
+    Endpoint("send_message", "POST", "/messages",
+             body={
+                 "to": "to",
+                 "type": "message_type",
+                 "recipient_type": "recipient_type",
+                 "text": {"body": "text_body"},
+             },
+             required=("to", "text_body")),
+    Endpoint("send_marketing_lite_message", "POST", "/marketing_messages",
+             body={
+                 "to": "to",
+                 "type": "message_type",
+                 "recipient_type": "recipient_type",
+                 "text": {"body": "text_body"},
+             },
+             required=("to", "text_body")),
+    Endpoint("mark_message_as_read", "POST", "/mark-read", body={"messageId": "message_id"},
+             required=("message_id",)),
+    Endpoint("submit_whatsapp_template_message", "POST", "/wa_template",
+             body={
+                 "name": "name",
+                 "category": "category",
+                 "language": "language",
+                 "components": "components",
+             },
+             required=("name", "category", "language", "components")),
+    Endpoint("edit_template", "POST", "/edit-template/{template_id}",
+             body={"category": "category", "components": "components"},
+             required=("category", "components")),
+    Endpoint("compare_template", "POST", "/compare-template/{template_id}",
+             body={"templateIds": "template_ids", "start": "start", "end": "end"},
+             required=("template_ids",), idempotent=True),
+    Endpoint("upload_media", "POST", "/media", form={"file": "file_path"}, files=("file",),
+             required=("file_path",)),
+    Endpoint("retrieve_media_by_id", "POST", "/get-media", body={"id": "media_id"},
+             required=("media_id",), idempotent=True),
+    Endpoint("create_upload_session", "POST", "/media/session",
+             body={
+                 "fileName": "file_name",
+                 "fileLength": "file_length",
+                 "fileType": "file_type",
+             },
+             required=("file_name", "file_length", "file_type")),
+    Endpoint("upload_media_to_session", "POST", "/media/session/{upload_session_id}",
+             form={"file": "file_path", "fileOffset": "file_offset"}, files=("file",),
+             required=("file_path",)),
+    Endpoint("create_catalog", "POST", "/catalog",
+             body={
+                 "vertical": "vertical",
+                 "name": "name",
+                 "product_count": "product_count",
+                 "feed_count": "feed_count",
+                 "is_catalog_segment": "is_catalog_segment",
+                 "default_image_url": "default_image_url",
+                 "fallback_image_url": "fallback_image_url",
+                 "da_display_settings": "da_display_settings",
+             },
+             required=("name",),
+             omit_falsy=("default_image_url", "fallback_image_url", "da_display_settings")),
+    Endpoint("connect_catalog", "POST", "/connect-catalog", body={"catalogId": "catalog_id"},
+             required=("catalog_id",)),
+    Endpoint("create_product", "POST", "/product",
+             body={
+                 "catalogId": "catalog_id",
+                 "name": "name",
+                 "category": "category",
+                 "currency": "currency",
+                 "image_url": "image_url",
+                 "price": "price",
+                 "retailer_id": "retailer_id",
+                 "description": "description",
+                 "url": "url",
+                 "brand": "brand",
+                 "sale_price": "sale_price",
+                 "sale_price_start_date": "sale_price_start_date",
+                 "sale_price_end_date": "sale_price_end_date",
+             },
+             required=("catalog_id", "name", "category", "currency", "image_url", "price",
+                       "retailer_id"),
+             omit_falsy=("description", "url", "brand", "sale_price", "sale_price_start_date",
+                         "sale_price_end_date")),
+    Endpoint("show_hide_catalog", "POST", "/whatsapp-commerce-settings",
+             body={"enableCatalog": "enable_catalog", "enableCart": "enable_cart"}),
+    Endpoint("create_qr_code_and_short_link", "POST", "/qr-codes",
+             body={
+                 "prefilledMessage": "prefilled_message",
+                 "generateQrImage": "generate_qr_image",
+             },
+             required=("prefilled_message",)),
+    Endpoint("set_business_public_key", "POST", "/whatsapp-business-encryption",
+             body={"businessPublicKey": "business_public_key"}, required=("business_public_key",)),
+    Endpoint("create_flow", "POST", "/flows", body={"name": "name", "categories": "categories"},
+             required=("name", "categories")),
+    Endpoint("update_flow_json", "POST", "/flows/{flow_id}/assets", form={"file": "file_path"},
+             files=("file",), required=("file_path",)),
+    Endpoint("publish_flow", "POST", "/flows/{flow_id}/publish"),
+    Endpoint("deprecate_flow", "POST", "/flows/{flow_id}/deprecate"),
+    Endpoint("create_payment_configuration", "POST", "/payment_configuration",
+             body={
+                 "configuration_name": "configuration_name",
+                 "purpose_code": "purpose_code",
+                 "merchant_category_code": "merchant_category_code",
+                 "provider_name": "provider_name",
+                 "redirect_url": "redirect_url",
+             },
+             required=("configuration_name", "purpose_code", "merchant_category_code",
+                       "provider_name", "redirect_url")),
+    Endpoint("generate_payment_configuration_oauth_link", "POST", "/generate_payment_configuration_oauth_link",
+             body={"configuration_name": "configuration_name", "redirect_url": "redirect_url"},
+             required=("configuration_name", "redirect_url")),
+)
+
+endpoint_registry.register("direct_api", DIRECT_API_ENDPOINTS)
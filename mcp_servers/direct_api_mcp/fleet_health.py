@@ -0,0 +1,58 @@
+"""
+Direct API source of the phone number health monitor.
+
+`get_fleet_health_monitor()` is the server's HealthMonitor
+(app.services.health_monitor), polling every configured tenant with that
+tenant's Direct API clients. The get_fleet_health tool polls it on demand;
+when HEALTH_MONITOR_INTERVAL_SECONDS is set it also polls in the background
+while the server is up (see the lifespan in .tools).
+"""
+import functools
+from typing import Any, Dict, List
+
+from app.config.settings import setting
+from app.services.health_monitor import HealthMonitor
+from app.services.tenant_service import get_tenant_registry, reset_tenant, use_tenant
+from .clients import get_direct_api_get_client, get_direct_api_post_client
+
+
+class DirectApiHealthSource:
+    """Phone numbers, health status and display name status of each tenant."""
+
+    def tenants(self) -> List[str]:
+        return get_tenant_registry().ids()
+
+    @staticmethod
+    async def _call(tenant_id: str, get_client, method: str, **kwargs) -> Any:
+        token = use_tenant(get_tenant_registry().get(tenant_id))
+        try:
+            async with get_client() as client:
+                response = await getattr(client, method)(**kwargs)
+        finally:
+            reset_tenant(token)
+        if not response.get("success"):
+            raise RuntimeError(response.get("error") or f"{method} failed")
+        return response.get("data") or {}
+
+    async def phone_numbers(self, tenant_id: str) -> List[Dict[str, Any]]:
+        data = await self._call(tenant_id, get_direct_api_get_client, "get_phone_numbers")
+        numbers = data.get("data", []) if isinstance(data, dict) else data
+        return [number for number in numbers if isinstance(number, dict)]
+
+    async def health(self, tenant_id: str, phone_number_id: str) -> Dict[str, Any]:
+        return await self._call(tenant_id, get_direct_api_post_client, "get_messaging_health_status",
+                                node_id=phone_number_id)
+
+    async def display_name(self, tenant_id: str) -> Dict[str, Any]:
+        return await self._call(tenant_id, get_direct_api_get_client, "get_display_name_status")
+
+
+@functools.lru_cache(maxsize=1)
+def get_fleet_health_monitor() -> HealthMonitor:
+    return HealthMonitor(
+        DirectApiHealthSource(),
+        interval_seconds=setting("HEALTH_MONITOR_INTERVAL_SECONDS", 0.0),
+        history_size=setting("HEALTH_MONITOR_HISTORY", 288),
+        concurrency=setting("HEALTH_MONITOR_CONCURRENCY", 8),
+        webhook_url=setting("HEALTH_MONITOR_WEBHOOK_URL", ""),
+    )
@@ -1,6 +1,7 @@
 """
 Pydantic models for MCP tool request validation for Direct API.
 """
+from app.services.tracing_service import trace_request_models
 
 # GET Request Models
 from .direct_api_get_request import (
@@ -95,4 +96,7 @@ __all__ = [
     "UpdateBusinessProfileDetailsRequest",
     "UpdateQrCodeRequest",
     "UpdateFlowMetadataRequest",
-]
\ No newline at end of file
+]
+
+# Request validation appears as its own span in tool traces
+trace_request_models(globals()[name] for name in __all__)
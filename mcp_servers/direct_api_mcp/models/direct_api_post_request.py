@@ -4,6 +4,9 @@ Pydantic models for MCP tool request validation for Direct API POST requests.
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, field_validator
 
+from app.config.settings import setting
+from app.utils.phone_numbers import to_e164
+
 
 class RegenerateJwtBearerTokenRequest(BaseModel):
     """Model for regenerate JWT bearer token request."""
@@ -103,11 +106,15 @@ class SendMessageRequest(BaseModel):
     @field_validator("to")
     @classmethod
     def validate_to(cls, v: str) -> str:
-        """Validate and sanitize phone number."""
+        """Validate phone number and normalise it to its WhatsApp ID (E.164 digits)."""
         v = v.strip()
         if not v:
             raise ValueError("to cannot be empty or whitespace")
-        return v
+        # Bare digits are a WhatsApp ID already; only "0..." or formatted numbers are national
+        number, reason = to_e164(v, setting("DEFAULT_COUNTRY_CODE", "91"), bare_digits_international=True)
+        if number is None:
+            raise ValueError(f"to is not a valid phone number ({reason})")
+        return number
     
     @field_validator("text_body")
     @classmethod
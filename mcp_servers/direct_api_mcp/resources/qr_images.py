@@ -0,0 +1,56 @@
+"""
+MCP Resources: QR code images
+
+qr://<code>.png and qr://<code>.svg serve the image of a QR code from the
+local cache (app.services.qr_images). Codes the cache has not seen yet are
+looked up with get_qr_codes once.
+"""
+import asyncio
+
+from fastmcp.exceptions import ResourceError
+
+from ..tools import mcp
+from ..clients import get_direct_api_get_client
+from app.services.qr_images import FORMATS, annotate_qr_codes, get_qr_image_cache
+from app import logger
+
+
+async def _image(code: str, image_format: str) -> bytes:
+    cache = get_qr_image_cache()
+    try:
+        image = await asyncio.to_thread(cache.image, code, image_format)
+        if image is None:
+            logger.info("QR code %s not cached; fetching QR codes", code)
+            async with get_direct_api_get_client() as client:
+                response = await client.get_qr_codes()
+            if not response.get("success"):
+                raise ResourceError(f"Could not fetch QR codes: {response.get('error')}")
+            await asyncio.to_thread(annotate_qr_codes, response.get("data"))
+            image = await asyncio.to_thread(cache.image, code, image_format)
+    except ValueError as e:
+        raise ResourceError(str(e)) from e
+    if image is None:
+        raise ResourceError(f"Unknown QR code: {code}")
+    return image
+
+
+@mcp.resource(
+    "qr://{code}.png",
+    name="qr_code_png",
+    description="PNG image of a QR code (by code id), rendered locally from its deep link.",
+    mime_type=FORMATS["png"],
+    tags={"qr", "image", "png"},
+)
+async def qr_code_png(code: str) -> bytes:
+    return await _image(code, "png")
+
+
+@mcp.resource(
+    "qr://{code}.svg",
+    name="qr_code_svg",
+    description="SVG image of a QR code (by code id), rendered locally from its deep link.",
+    mime_type=FORMATS["svg"],
+    tags={"qr", "image", "svg"},
+)
+async def qr_code_svg(code: str) -> bytes:
+    return await _image(code, "svg")
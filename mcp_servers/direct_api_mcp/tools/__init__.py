@@ -1,88 +1,150 @@
+from contextlib import asynccontextmanager
+from importlib import import_module
+
 from fastmcp import FastMCP
 
+from app.api.middleware.deadline import register_deadlines
+from app.api.middleware.monitoring import register_metrics, register_tracing
+from app.api.middleware.priority import register_request_priority
+from app.api.middleware.serialization import register_fast_tool_results
+from app.api.middleware.tenant import register_tenancy
+
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Run the phone number health monitor while the server is up."""
+    from ..fleet_health import get_fleet_health_monitor
+    from app.services.conversation_window import get_conversation_windows
+    monitor = get_fleet_health_monitor()
+    await monitor.start()
+    try:
+        yield {}
+    finally:
+        await monitor.stop()
+        await get_conversation_windows().flush()
+
+
 mcp = FastMCP(
     name="Direct_api_Server",
     instructions="""This is for conversation""",
-    version="0.0.1"
+    version="0.0.1",
+    lifespan=lifespan
 )
+register_metrics(mcp, "direct_api")
+register_tracing(mcp, "direct_api")
+register_fast_tool_results(mcp)
+register_tenancy(mcp)
+register_request_priority(mcp)
+register_deadlines(mcp)
 
-from .direct_api import get_fb_verification_status, get_business_info, regenerate_jwt_bearer_token, get_waba_analytics, get_messaging_health_status
-from .messages import send_message, send_marketing_lite_message, mark_message_as_read
-from .templates import compare_template, edit_template, submit_whatsapp_template_message, get_templates, get_template_by_id, delete_wa_template_by_id
-from .media import get_media_upload_session, upload_media, retrieve_media_by_id, create_upload_session, upload_media_to_session, delete_media_by_id
-from .profile import get_profile, update_business_profile_picture, update_business_profile_details
-from .phone_number import get_all_phone_numbers, get_display_name_status, get_single_phone_number
-from .catalog import get_catalog, get_products, connect_catalog, create_catalog, create_product, disconnect_catalog
-from .commerce import get_commerce_settings, show_hide_catalog
-from .qr_codes_and_short_links import get_qr_codes, create_qr_code_and_short_link, update_qr_code
-from .whatsp_business_encryption import get_whatsapp_business_encryption, set_business_public_key
-from .flows import get_flows, get_flow_by_id, get_flow_assets, create_flow, update_flow_json, publish_flow, deprecate_flow, delete_flow, update_flow_metadata
-from .whatsp_payments import get_payment_configurations, get_payment_configuration_by_name, create_payment_configuration, generate_payment_configuration_oauth_link
-
-__all__ = [
-    "mcp",
+
+# Tool function name -> module (relative to this package) that registers it.
+# Modules are imported by `load_tools()` when the server is first requested,
+# or one at a time when a single tool function is looked up on this package.
+_TOOL_MODULES = {
     # direct_api
-    "get_fb_verification_status",
-    "get_business_info",
-    "regenerate_jwt_bearer_token",
-    "get_waba_analytics",
-    "get_messaging_health_status",
+    "get_fb_verification_status": ".direct_api.direct_get_tools.get_fb_verification_status",
+    "get_business_info": ".direct_api.direct_get_tools.get_waba_information",
+    "regenerate_jwt_bearer_token": ".direct_api.direct_post_tools.regenerate_jwt_bearer_token",
+    "get_waba_analytics": ".direct_api.direct_post_tools.get_waba_analytics",
+    "get_messaging_health_status": ".direct_api.direct_post_tools.get_messaging_health_status",
+    "get_fleet_health": ".direct_api.get_fleet_health",
     # messages
-    "send_message",
-    "send_marketing_lite_message",
-    "mark_message_as_read",
+    "send_message": ".messages.send_message",
+    "send_marketing_lite_message": ".messages.send_lite_message",
+    "mark_message_as_read": ".messages.mark_message_as_read",
+    "check_conversation_windows": ".messages.check_conversation_windows",
+    "clean_recipient_list": ".messages.clean_recipient_list",
+    # suppression
+    "suppress_numbers": ".suppression.suppression_tools",
+    "unsuppress_numbers": ".suppression.suppression_tools",
+    "import_suppression_list": ".suppression.suppression_tools",
+    "export_suppression_list": ".suppression.suppression_tools",
+    # webhooks
+    "get_message_status": ".webhooks.get_message_status",
+    "get_inbound_messages": ".webhooks.get_inbound_messages",
     # templates
-    "compare_template",
-    "edit_template",
-    "submit_whatsapp_template_message",
-    "get_templates",
-    "get_template_by_id",
-    "delete_wa_template_by_id",
+    "compare_template": ".templates.post_template_tools.compare_template",
+    "edit_template": ".templates.post_template_tools.edit_template",
+    "submit_whatsapp_template_message": ".templates.post_template_tools.submit_whatsapp_template",
+    "get_templates": ".templates.get_template_tools.get_all_templates",
+    "get_template_by_id": ".templates.get_template_tools.get_template_by_id",
+    "delete_wa_template_by_id": ".templates.delete_template_tools.delete_wa_by_id",
+    "delete_wa_template_by_name": ".templates.delete_template_tools.delete_wa_template_by_name",
+    "render_template_messages": ".templates.render_template_tools.render_template_messages",
     # media
-    "get_media_upload_session",
-    "upload_media",
-    "retrieve_media_by_id",
-    "create_upload_session",
-    "upload_media_to_session",
-    "delete_media_by_id",
+    "get_media_upload_session": ".media.get_media_tools.get_media_upload_session",
+    "upload_media": ".media.post_media_tools.post_upload_media",
+    "retrieve_media_by_id": ".media.post_media_tools.retrieve_media_by_id",
+    "create_upload_session": ".media.post_media_tools.create_upload_session",
+    "upload_media_to_session": ".media.post_media_tools.upload_media_to_session",
+    "delete_media_by_id": ".media.delete_media_tools.delete_media_by_id",
     # profile
-    "get_profile",
-    "update_business_profile_picture",
-    "update_business_profile_details",
+    "get_profile": ".profile.get_profile_tools.get_profile",
+    "update_business_profile_picture": ".profile.patch_profile_tools.update_business_profile_picture",
+    "update_business_profile_details": ".profile.patch_profile_tools.update_business_profile_details",
     # phone_number
-    "get_all_phone_numbers",
-    "get_display_name_status",
-    "get_single_phone_number",
+    "get_all_phone_numbers": ".phone_number.get_all_phone_numbers",
+    "get_display_name_status": ".phone_number.get_display_status",
+    "get_single_phone_number": ".phone_number.get_single_phone_details",
     # catalog
-    "get_catalog",
-    "get_products",
-    "connect_catalog",
-    "create_catalog",
-    "create_product",
-    "disconnect_catalog",
+    "get_catalog": ".catalog.get_catalog_tools.get_catalog",
+    "get_products": ".catalog.get_catalog_tools.get_products",
+    "connect_catalog": ".catalog.post_catalogs_tools.post_connect_catalog",
+    "create_catalog": ".catalog.post_catalogs_tools.post_create_catalog",
+    "create_product": ".catalog.post_catalogs_tools.post_create_product",
+    "disconnect_catalog": ".catalog.delete_catalog_tools.delete_disconnect_catalog",
     # commerce
-    "get_commerce_settings",
-    "show_hide_catalog",
+    "get_commerce_settings": ".commerce.get_commerce_tools.get_whatsapp_commerce_settings",
+    "show_hide_catalog": ".commerce.post_commerce_tools.post_show_hide_catalog",
     # qr_codes_and_short_links
-    "get_qr_codes",
-    "create_qr_code_and_short_link",
-    "update_qr_code",
+    "get_qr_codes": ".qr_codes_and_short_links.get_qr_code_tools.get_all_qr_codes",
+    "create_qr_code_and_short_link": ".qr_codes_and_short_links.post_qr_code_tools.post_create_qr_code_and_short_link",
+    "update_qr_code": ".qr_codes_and_short_links.patch_qr_code_tools.patch_update_qr_code",
     # whatsp_business_encryption
-    "get_whatsapp_business_encryption",
-    "set_business_public_key",
+    "get_whatsapp_business_encryption": ".whatsp_business_encryption.get_business_tools.get_business_public_key",
+    "set_business_public_key": ".whatsp_business_encryption.post_business_tools.post_set_business_key",
     # flows
-    "get_flows",
-    "get_flow_by_id",
-    "get_flow_assets",
-    "create_flow",
-    "update_flow_json",
-    "publish_flow",
-    "deprecate_flow",
-    "delete_flow",
-    "update_flow_metadata",
+    "get_flows": ".flows.get_flow_tools.get_flows",
+    "get_flow_by_id": ".flows.get_flow_tools.get_flow_by_id",
+    "get_flow_assets": ".flows.get_flow_tools.get_flow_list_assets",
+    "create_flow": ".flows.post_flow_tools.post_create_flow",
+    "update_flow_json": ".flows.post_flow_tools.post_update_flow_json",
+    "publish_flow": ".flows.post_flow_tools.post_publish_flow",
+    "deprecate_flow": ".flows.post_flow_tools.post_deprecated_flow",
+    "delete_flow": ".flows.delete_flow_tools.delete_the_flow",
+    "update_flow_metadata": ".flows.patch_flow_tools.patch_update_flow",
     # whatsp_payments
-    "get_payment_configurations",
-    "get_payment_configuration_by_name",
-    "create_payment_configuration",
-    "generate_payment_configuration_oauth_link",
-]
\ No newline at end of file
+    "get_payment_configurations": ".whatsp_payments.get_whatsp_payments_tools.whatsp_get_payment_configurations",
+    "get_payment_configuration_by_name": ".whatsp_payments.get_whatsp_payments_tools.get_payment_by_name",
+    "create_payment_configuration": ".whatsp_payments.post_whatsp_payments_tools.post_create_payment_configuration",
+    "generate_payment_configuration_oauth_link": ".whatsp_payments.post_whatsp_payments_tools.post_generate_payment_configuration_oauth_link",
+}
+
+# Resource modules, imported by `load_tools()` with the tools.
+_RESOURCE_MODULES = (
+    "..resources.qr_images",
+)
+
+_tools_loaded = False
+
+
+def load_tools() -> FastMCP:
+    """Import every tool (and resource) module so all are registered on `mcp`."""
+    global _tools_loaded
+    if not _tools_loaded:
+        for module_path in (*dict.fromkeys(_TOOL_MODULES.values()), *_RESOURCE_MODULES):
+            import_module(module_path, __name__)
+        _tools_loaded = True
+    return mcp
+
+
+def __getattr__(name):
+    module_path = _TOOL_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_path, __name__), name)
+
+
+__all__ = ["mcp", "load_tools", *_TOOL_MODULES]
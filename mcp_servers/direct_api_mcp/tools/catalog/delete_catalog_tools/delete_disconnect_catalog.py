@@ -48,7 +48,7 @@ async def disconnect_catalog() -> Dict[str, Any]:
                 logger.info("Successfully disconnected catalog")
             else:
                 logger.warning(
-                    f"Failed to disconnect catalog: {response.get('error')}"
+                    "Failed to disconnect catalog: %s", response.get('error')
                 )
             
             return response
@@ -48,7 +48,7 @@ async def get_catalog() -> Dict[str, Any]:
                 logger.info("Successfully retrieved catalog")
             else:
                 logger.warning(
-                    f"Failed to retrieve catalog: {response.get('error')}"
+                    "Failed to retrieve catalog: %s", response.get('error')
                 )
             
             return response
@@ -49,10 +49,10 @@ async def get_products() -> Dict[str, Any]:
             if response.get("success"):
                 data = response.get("data", [])
                 count = len(data) if isinstance(data, list) else "unknown"
-                logger.info(f"Successfully retrieved {count} products")
+                logger.info("Successfully retrieved %s products", count)
             else:
                 logger.warning(
-                    f"Failed to retrieve products: {response.get('error')}"
+                    "Failed to retrieve products: %s", response.get('error')
                 )
             
             return response
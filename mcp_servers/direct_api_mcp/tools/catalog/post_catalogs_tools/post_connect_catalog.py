@@ -53,10 +53,10 @@ async def connect_catalog(catalog_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully connected catalog: {request.catalog_id}")
+                logger.info("Successfully connected catalog: %s", request.catalog_id)
             else:
                 logger.warning(
-                    f"Failed to connect catalog {request.catalog_id}: {response.get('error')}"
+                    "Failed to connect catalog %s: %s", request.catalog_id, response.get('error')
                 )
             
             return response
@@ -85,10 +85,10 @@ async def create_catalog(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully created catalog: {request.name}")
+                logger.info("Successfully created catalog: %s", request.name)
             else:
                 logger.warning(
-                    f"Failed to create catalog {request.name}: {response.get('error')}"
+                    "Failed to create catalog %s: %s", request.name, response.get('error')
                 )
             
             return response
@@ -106,10 +106,10 @@ async def create_product(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully created product: {request.name}")
+                logger.info("Successfully created product: %s", request.name)
             else:
                 logger.warning(
-                    f"Failed to create product {request.name}: {response.get('error')}"
+                    "Failed to create product %s: %s", request.name, response.get('error')
                 )
             
             return response
@@ -49,7 +49,7 @@ async def get_commerce_settings() -> Dict[str, Any]:
                 logger.info("Successfully retrieved WhatsApp commerce settings")
             else:
                 logger.warning(
-                    f"Failed to retrieve WhatsApp commerce settings: {response.get('error')}"
+                    "Failed to retrieve WhatsApp commerce settings: %s", response.get('error')
                 )
             
             return response
@@ -64,7 +64,7 @@ async def show_hide_catalog(
                 logger.info("Successfully updated catalog visibility settings")
             else:
                 logger.warning(
-                    f"Failed to update catalog visibility settings: {response.get('error')}"
+                    "Failed to update catalog visibility settings: %s", response.get('error')
                 )
             
             return response
@@ -1,5 +1,6 @@
 from .direct_get_tools import get_fb_verification_status,get_business_info
 from .direct_post_tools import regenerate_jwt_bearer_token,get_waba_analytics,get_messaging_health_status
+from .get_fleet_health import get_fleet_health
 
 
-__all__=["get_fb_verification_status","get_business_info","regenerate_jwt_bearer_token","get_waba_analytics","get_messaging_health_status"]
\ No newline at end of file
+__all__=["get_fb_verification_status","get_business_info","regenerate_jwt_bearer_token","get_waba_analytics","get_messaging_health_status","get_fleet_health"]
\ No newline at end of file
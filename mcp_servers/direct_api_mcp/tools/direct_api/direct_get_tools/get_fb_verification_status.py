@@ -47,7 +47,7 @@ async def get_fb_verification_status() -> Dict[str, Any]:
                 logger.info("Successfully get_fb_verification_status info")
             else:
                 logger.warning(
-                    f"Failed to retrieve business info: {response.get('error')}"
+                    "Failed to retrieve business info: %s", response.get('error')
                 )
             
             return response
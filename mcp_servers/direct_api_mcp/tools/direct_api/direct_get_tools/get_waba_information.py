@@ -49,7 +49,7 @@ async def get_business_info() -> Dict[str, Any]:
                 logger.info("Successfully retrieved business info")
             else:
                 logger.warning(
-                    f"Failed to retrieve business info: {response.get('error')}"
+                    "Failed to retrieve business info: %s", response.get('error')
                 )
             
             return response
@@ -53,10 +53,10 @@ async def get_messaging_health_status(node_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully retrieved messaging health status for node: {request.node_id}")
+                logger.info("Successfully retrieved messaging health status for node: %s", request.node_id)
             else:
                 logger.warning(
-                    f"Failed to retrieve messaging health status: {response.get('error')}"
+                    "Failed to retrieve messaging health status: %s", response.get('error')
                 )
             
             return response
@@ -77,7 +77,7 @@ async def get_waba_analytics(
                 logger.info("Successfully retrieved WABA analytics")
             else:
                 logger.warning(
-                    f"Failed to retrieve WABA analytics: {response.get('error')}"
+                    "Failed to retrieve WABA analytics: %s", response.get('error')
                 )
             
             return response
@@ -15,7 +15,9 @@ from app import logger
     name="regenerate_jwt_bearer_token",
     description=(
         "Regenerates JWT Bearer Token to Access Direct-APIs. "
-        "Returns a new authentication token for API access."
+        "Returns a new authentication token for API access. "
+        "The new token is used by every Direct API call right away; tokens are "
+        "also refreshed automatically before they expire or on a 401."
     ),
     tags={
         "auth",
@@ -57,7 +59,7 @@ async def regenerate_jwt_bearer_token(direct_api: bool = True) -> Dict[str, Any]
                 logger.info("Successfully regenerated JWT bearer token")
             else:
                 logger.warning(
-                    f"Failed to regenerate JWT bearer token: {response.get('error')}"
+                    "Failed to regenerate JWT bearer token: %s", response.get('error')
                 )
             
             return response
@@ -0,0 +1,75 @@
+"""
+MCP Tool: Get Fleet Health
+
+Messaging health of every phone number of every tenant, from the health
+monitor's last poll (see app.services.health_monitor); upstream calls are
+made only on the first call or when a refresh is asked for.
+"""
+from typing import Dict, Any, Optional
+
+from .. import mcp
+from ...fleet_health import get_fleet_health_monitor
+from app import logger
+
+
+@mcp.tool(
+    name="get_fleet_health",
+    description=(
+        "Returns the messaging health of all WhatsApp phone numbers at once: quality rating, "
+        "messaging limit tier, throughput, display name status, whether each number can send "
+        "messages and why not, plus recent changes. Polls AiSensy on the first call and returns "
+        "the last poll after that (kept current in the background when "
+        "HEALTH_MONITOR_INTERVAL_SECONDS is set); set refresh=true to poll now, "
+        "include_history=true for the time series."
+    ),
+    tags={
+        "messaging",
+        "health",
+        "quality",
+        "phone",
+        "fleet",
+        "direct-api",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Health Monitoring"
+    }
+)
+async def get_fleet_health(
+    phone_number_id: Optional[str] = None,
+    include_history: bool = False,
+    refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Get the health of all phone numbers.
+
+    Args:
+        phone_number_id: Only this phone number (default: all numbers)
+        include_history: Add each number's time series of tracked fields
+        refresh: Poll all numbers now instead of returning the last poll
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): polled_at, summary, numbers, recent_changes, tenant_errors
+        - error (str): Error message if unsuccessful
+    """
+    try:
+        monitor = get_fleet_health_monitor()
+        if refresh or monitor.polled_at is None:
+            changes = await monitor.poll()
+            logger.info("Polled fleet health: %s changes", len(changes))
+        data = monitor.snapshot(phone_number_id=phone_number_id, include_history=include_history)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        error_msg = f"Unexpected error reading fleet health: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
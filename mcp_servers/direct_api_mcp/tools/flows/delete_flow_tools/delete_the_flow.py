@@ -52,10 +52,10 @@ async def delete_flow(flow_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully deleted flow: {request.flow_id}")
+                logger.info("Successfully deleted flow: %s", request.flow_id)
             else:
                 logger.warning(
-                    f"Failed to delete flow {request.flow_id}: {response.get('error')}"
+                    "Failed to delete flow %s: %s", request.flow_id, response.get('error')
                 )
             
             return response
@@ -53,10 +53,10 @@ async def get_flow_by_id(flow_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully retrieved flow: {request.flow_id}")
+                logger.info("Successfully retrieved flow: %s", request.flow_id)
             else:
                 logger.warning(
-                    f"Failed to retrieve flow {request.flow_id}: {response.get('error')}"
+                    "Failed to retrieve flow %s: %s", request.flow_id, response.get('error')
                 )
             
             return response
@@ -54,10 +54,10 @@ async def get_flow_web_preview(flow_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully retrieved flow web preview: {request.flow_id}")
+                logger.info("Successfully retrieved flow web preview: %s", request.flow_id)
             else:
                 logger.warning(
-                    f"Failed to retrieve flow web preview {request.flow_id}: {response.get('error')}"
+                    "Failed to retrieve flow web preview %s: %s", request.flow_id, response.get('error')
                 )
             
             return response
@@ -47,10 +47,10 @@ async def get_flows() -> Dict[str, Any]:
             if response.get("success"):
                 data = response.get("data", [])
                 count = len(data) if isinstance(data, list) else "unknown"
-                logger.info(f"Successfully retrieved {count} flows")
+                logger.info("Successfully retrieved %s flows", count)
             else:
                 logger.warning(
-                    f"Failed to retrieve flows: {response.get('error')}"
+                    "Failed to retrieve flows: %s", response.get('error')
                 )
             
             return response
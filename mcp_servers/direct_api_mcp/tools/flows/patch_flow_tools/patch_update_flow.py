@@ -65,10 +65,10 @@ async def update_flow_metadata(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully updated flow metadata: {request.flow_id}")
+                logger.info("Successfully updated flow metadata: %s", request.flow_id)
             else:
                 logger.warning(
-                    f"Failed to update flow metadata {request.flow_id}: {response.get('error')}"
+                    "Failed to update flow metadata %s: %s", request.flow_id, response.get('error')
                 )
             
             return response
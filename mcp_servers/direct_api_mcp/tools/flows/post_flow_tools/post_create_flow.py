@@ -60,10 +60,10 @@ async def create_flow(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully created flow: {request.name}")
+                logger.info("Successfully created flow: %s", request.name)
             else:
                 logger.warning(
-                    f"Failed to create flow {request.name}: {response.get('error')}"
+                    "Failed to create flow %s: %s", request.name, response.get('error')
                 )
             
             return response
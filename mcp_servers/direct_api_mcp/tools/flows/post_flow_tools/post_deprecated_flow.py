@@ -52,10 +52,10 @@ async def deprecate_flow(flow_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully deprecated flow: {request.flow_id}")
+                logger.info("Successfully deprecated flow: %s", request.flow_id)
             else:
                 logger.warning(
-                    f"Failed to deprecate flow {request.flow_id}: {response.get('error')}"
+                    "Failed to deprecate flow %s: %s", request.flow_id, response.get('error')
                 )
             
             return response
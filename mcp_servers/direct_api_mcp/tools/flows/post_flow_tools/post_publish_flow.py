@@ -52,10 +52,10 @@ async def publish_flow(flow_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully published flow: {request.flow_id}")
+                logger.info("Successfully published flow: %s", request.flow_id)
             else:
                 logger.warning(
-                    f"Failed to publish flow {request.flow_id}: {response.get('error')}"
+                    "Failed to publish flow %s: %s", request.flow_id, response.get('error')
                 )
             
             return response
@@ -62,10 +62,10 @@ async def update_flow_json(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully updated flow JSON: {request.flow_id}")
+                logger.info("Successfully updated flow JSON: %s", request.flow_id)
             else:
                 logger.warning(
-                    f"Failed to update flow JSON {request.flow_id}: {response.get('error')}"
+                    "Failed to update flow JSON %s: %s", request.flow_id, response.get('error')
                 )
             
             return response
@@ -52,10 +52,10 @@ async def delete_media_by_id(media_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully deleted media by ID: {request.media_id}")
+                logger.info("Successfully deleted media by ID: %s", request.media_id)
             else:
                 logger.warning(
-                    f"Failed to delete media by ID {request.media_id}: {response.get('error')}"
+                    "Failed to delete media by ID %s: %s", request.media_id, response.get('error')
                 )
             
             return response
@@ -54,10 +54,10 @@ async def get_media_upload_session(upload_session_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully retrieved upload session: {request.upload_session_id}")
+                logger.info("Successfully retrieved upload session: %s", request.upload_session_id)
             else:
                 logger.warning(
-                    f"Failed to retrieve upload session {request.upload_session_id}: {response.get('error')}"
+                    "Failed to retrieve upload session %s: %s", request.upload_session_id, response.get('error')
                 )
             
             return response
@@ -66,10 +66,10 @@ async def create_upload_session(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully created upload session for: {request.file_name}")
+                logger.info("Successfully created upload session for: %s", request.file_name)
             else:
                 logger.warning(
-                    f"Failed to create upload session for {request.file_name}: {response.get('error')}"
+                    "Failed to create upload session for %s: %s", request.file_name, response.get('error')
                 )
             
             return response
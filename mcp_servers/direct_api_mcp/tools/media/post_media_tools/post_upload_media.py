@@ -52,10 +52,10 @@ async def upload_media(file_path: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully uploaded media: {request.file_path}")
+                logger.info("Successfully uploaded media: %s", request.file_path)
             else:
                 logger.warning(
-                    f"Failed to upload media {request.file_path}: {response.get('error')}"
+                    "Failed to upload media %s: %s", request.file_path, response.get('error')
                 )
             
             return response
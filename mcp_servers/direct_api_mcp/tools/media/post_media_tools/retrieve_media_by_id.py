@@ -53,10 +53,10 @@ async def retrieve_media_by_id(media_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully retrieved media: {request.media_id}")
+                logger.info("Successfully retrieved media: %s", request.media_id)
             else:
                 logger.warning(
-                    f"Failed to retrieve media {request.media_id}: {response.get('error')}"
+                    "Failed to retrieve media %s: %s", request.media_id, response.get('error')
                 )
             
             return response
@@ -65,10 +65,10 @@ async def upload_media_to_session(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully uploaded media to session: {request.upload_session_id}")
+                logger.info("Successfully uploaded media to session: %s", request.upload_session_id)
             else:
                 logger.warning(
-                    f"Failed to upload media to session {request.upload_session_id}: {response.get('error')}"
+                    "Failed to upload media to session %s: %s", request.upload_session_id, response.get('error')
                 )
             
             return response
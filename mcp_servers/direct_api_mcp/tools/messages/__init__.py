@@ -1,6 +1,8 @@
 from .send_message import send_message
 from .send_lite_message import send_marketing_lite_message
 from .mark_message_as_read import mark_message_as_read
+from .check_conversation_windows import check_conversation_windows
+from .clean_recipient_list import clean_recipient_list
 
 
-__all__=["send_message","send_marketing_lite_message","mark_message_as_read"]
\ No newline at end of file
+__all__=["send_message","send_marketing_lite_message","mark_message_as_read","check_conversation_windows","clean_recipient_list"]
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+MCP Tool: Check Conversation Windows
+
+Splits recipients into those who can receive free-form messages now (24h
+customer service window open), those who need a template message, and
+those on the suppression list.
+"""
+import asyncio
+from typing import Dict, Any, List
+
+from .. import mcp
+from app import logger
+from app.services.conversation_window import get_conversation_windows
+from app.services.suppression import load_suppression_list
+
+
+@mcp.tool(
+    name="check_conversation_windows",
+    description=(
+        "Checks the 24-hour customer service window of one or more recipients. "
+        "Returns the recipients who can receive free-form messages now (with the time their "
+        "window closes), those who can only receive template messages, and those who opted out "
+        "and must not be messaged. "
+        "Use it to plan bulk sends before calling send_message."
+    ),
+    tags={
+        "message",
+        "window",
+        "template",
+        "bulk",
+        "direct-api",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Messaging"
+    }
+)
+async def check_conversation_windows(recipients: List[str]) -> Dict[str, Any]:
+    """
+    Partition recipients by conversation window.
+
+    Args:
+        recipients: Recipient phone numbers (e.g., ["917089379345", "919800000001"])
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): free_form (recipient -> Unix time the window closes),
+          template_required (recipients with no open window on record) and
+          suppressed (opted-out recipients, who must not be messaged at all)
+        - error (str): Error message if unsuccessful
+    """
+    if not recipients:
+        return {
+            "success": False,
+            "error": "At least one recipient is required"
+        }
+    try:
+        suppression = await load_suppression_list()
+        allowed, suppressed = await asyncio.to_thread(suppression.filter, recipients)
+        windows = get_conversation_windows()
+        await windows.refresh()
+        data = windows.partition(allowed)
+        data["suppressed"] = suppressed
+        logger.info(
+            "Conversation windows: %s free-form, %s template-required, %s suppressed",
+            len(data['free_form']), len(data['template_required']), len(suppressed)
+        )
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        error_msg = f"Unexpected error checking conversation windows: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
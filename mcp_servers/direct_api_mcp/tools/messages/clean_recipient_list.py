@@ -0,0 +1,88 @@
+"""
+MCP Tool: Clean Recipient List
+
+Normalises, deduplicates and filters a campaign recipient list (CSV) for a
+bulk send, and reports the invalid rows.
+"""
+import asyncio
+from typing import Dict, Any, Optional
+
+from .. import mcp
+from app import logger
+from app.services.recipient_lists import clean_recipient_list as clean_list
+
+
+@mcp.tool(
+    name="clean_recipient_list",
+    description=(
+        "Prepares a recipient list file (CSV or one number per line) for a bulk send: normalises "
+        "every phone number to its WhatsApp ID, removes duplicates and opted-out numbers, and "
+        "writes the clean list and a report of invalid rows next to the file."
+    ),
+    tags={
+        "message",
+        "bulk",
+        "recipients",
+        "csv",
+        "direct-api",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Messaging"
+    }
+)
+async def clean_recipient_list(
+    file_path: str,
+    column: Optional[str] = None,
+    default_country_code: Optional[str] = None,
+    exclude_suppressed: bool = True
+) -> Dict[str, Any]:
+    """
+    Clean a recipient list.
+
+    Args:
+        file_path: Path of the recipient list on the server
+        column: Header name or index of the phone number column (default: detected)
+        default_country_code: Country code of numbers written without one (default: DEFAULT_COUNTRY_CODE)
+        exclude_suppressed: Leave out numbers on the suppression list (default: True)
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): row counts (rows, valid, duplicates, invalid, suppressed, recipients),
+          output_path (clean list), invalid_path (invalid rows) and the first invalid rows
+        - error (str): Error message if unsuccessful
+    """
+    try:
+        report = await asyncio.to_thread(
+            clean_list,
+            file_path,
+            column=column,
+            default_country=(default_country_code or "").lstrip("+") or None,
+            exclude_suppressed=exclude_suppressed,
+        )
+        return {
+            "success": True,
+            "data": report.to_dict()
+        }
+    except FileNotFoundError:
+        return {
+            "success": False,
+            "error": f"File not found: {file_path}"
+        }
+    except ValueError as e:
+        error_msg = f"Validation error: {str(e)}"
+        logger.warning(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
+    except Exception as e:
+        error_msg = f"Unexpected error cleaning recipient list: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
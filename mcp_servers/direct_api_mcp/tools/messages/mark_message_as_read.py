@@ -53,10 +53,10 @@ async def mark_message_as_read(message_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully marked message as read: {request.message_id}")
+                logger.info("Successfully marked message as read: %s", request.message_id)
             else:
                 logger.warning(
-                    f"Failed to mark message as read {request.message_id}: {response.get('error')}"
+                    "Failed to mark message as read %s: %s", request.message_id, response.get('error')
                 )
             
             return response
@@ -9,6 +9,7 @@ from .. import mcp
 from ...clients import get_direct_api_post_client
 from ...models import SendMarketingLiteMessageRequest
 from app import logger
+from app.services.suppression import suppressed_send
 
 
 @mcp.tool(
@@ -62,6 +63,11 @@ async def send_marketing_lite_message(
             recipient_type=recipient_type
         )
         
+        suppressed = await suppressed_send(request.to, "send_marketing_lite_message")
+        if suppressed:
+            logger.warning("Not sending marketing lite message to %s: recipient opted out", request.to)
+            return suppressed
+
         async with get_direct_api_post_client() as client:
             response = await client.send_marketing_lite_message(
                 to=request.to,
@@ -71,10 +77,10 @@ async def send_marketing_lite_message(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully sent marketing lite message to: {request.to}")
+                logger.info("Successfully sent marketing lite message to: %s", request.to)
             else:
                 logger.warning(
-                    f"Failed to send marketing lite message to {request.to}: {response.get('error')}"
+                    "Failed to send marketing lite message to %s: %s", request.to, response.get('error')
                 )
             
             return response
@@ -9,13 +9,17 @@ from .. import mcp
 from ...clients import get_direct_api_post_client
 from ...models import SendMessageRequest
 from app import logger
+from app.services.conversation_window import free_form_blocked, get_conversation_windows
+from app.services.suppression import suppressed_send
 
 
 @mcp.tool(
     name="send_message",
     description=(
         "Sends a WhatsApp message via the AiSensy Direct API. "
-        "Supports sending text messages to individual recipients."
+        "Supports sending text messages to individual recipients. "
+        "Free-form text can only be sent within 24 hours of the recipient's last message; "
+        "outside that window the send is refused with template_required set."
     ),
     tags={
         "message",
@@ -60,6 +64,17 @@ async def send_message(
             recipient_type=recipient_type
         )
         
+        suppressed = await suppressed_send(request.to, "send_message")
+        if suppressed:
+            logger.warning("Not sending message to %s: recipient opted out", request.to)
+            return suppressed
+
+        # Free-form text outside the 24h window is rejected upstream anyway
+        blocked = await free_form_blocked(request.to)
+        if blocked:
+            logger.warning("Not sending free-form message to %s: window closed", request.to)
+            return blocked
+
         async with get_direct_api_post_client() as client:
             response = await client.send_message(
                 to=request.to,
@@ -67,12 +82,13 @@ async def send_message(
                 text_body=request.text_body,
                 recipient_type=request.recipient_type
             )
+            get_conversation_windows().record_send_result(request.to, response)
             
             if response.get("success"):
-                logger.info(f"Successfully sent message to: {request.to}")
+                logger.info("Successfully sent message to: %s", request.to)
             else:
                 logger.warning(
-                    f"Failed to send message to {request.to}: {response.get('error')}"
+                    "Failed to send message to %s: %s", request.to, response.get('error')
                 )
             
             return response
@@ -48,10 +48,10 @@ async def get_all_phone_numbers() -> Dict[str, Any]:
             if response.get("success"):
                 data = response.get("data", [])
                 count = len(data) if isinstance(data, list) else "unknown"
-                logger.info(f"Successfully retrieved {count} phone numbers")
+                logger.info("Successfully retrieved %s phone numbers", count)
             else:
                 logger.warning(
-                    f"Failed to retrieve phone numbers: {response.get('error')}"
+                    "Failed to retrieve phone numbers: %s", response.get('error')
                 )
             
             return response
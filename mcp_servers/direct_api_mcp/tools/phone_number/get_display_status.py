@@ -50,7 +50,7 @@ async def get_display_name_status() -> Dict[str, Any]:
                 logger.info("Successfully retrieved display name status")
             else:
                 logger.warning(
-                    f"Failed to retrieve display name status: {response.get('error')}"
+                    "Failed to retrieve display name status: %s", response.get('error')
                 )
             
             return response
@@ -49,7 +49,7 @@ async def get_single_phone_number() -> Dict[str, Any]:
                 logger.info("Successfully retrieved phone number")
             else:
                 logger.warning(
-                    f"Failed to retrieve phone number: {response.get('error')}"
+                    "Failed to retrieve phone number: %s", response.get('error')
                 )
             
             return response
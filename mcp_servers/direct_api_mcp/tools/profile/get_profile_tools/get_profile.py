@@ -48,7 +48,7 @@ async def get_profile() -> Dict[str, Any]:
                 logger.info("Successfully retrieved profile")
             else:
                 logger.warning(
-                    f"Failed to retrieve profile: {response.get('error')}"
+                    "Failed to retrieve profile: %s", response.get('error')
                 )
             
             return response
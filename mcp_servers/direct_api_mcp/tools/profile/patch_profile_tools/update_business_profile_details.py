@@ -85,7 +85,7 @@ async def update_business_profile_details(
                 logger.info("Successfully updated business profile details")
             else:
                 logger.warning(
-                    f"Failed to update business profile details: {response.get('error')}"
+                    "Failed to update business profile details: %s", response.get('error')
                 )
             
             return response
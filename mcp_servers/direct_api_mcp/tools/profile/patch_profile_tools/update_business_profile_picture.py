@@ -58,7 +58,7 @@ async def update_business_profile_picture(whatsapp_display_image: str) -> Dict[s
                 logger.info("Successfully updated business profile picture")
             else:
                 logger.warning(
-                    f"Failed to update business profile picture: {response.get('error')}"
+                    "Failed to update business profile picture: %s", response.get('error')
                 )
             
             return response
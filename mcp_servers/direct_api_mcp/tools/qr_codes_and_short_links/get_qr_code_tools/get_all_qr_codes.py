@@ -3,10 +3,12 @@ MCP Tool: Get QR Codes
 
 Fetches all QR codes from the AiSensy Direct API.
 """
+import asyncio
 from typing import Dict, Any
 
 from ... import mcp
 from ....clients import get_direct_api_get_client
+from app.services.qr_images import annotate_qr_codes
 from app import logger
 
 
@@ -15,7 +17,8 @@ from app import logger
     description=(
         "Fetches all QR codes from the AiSensy Direct API. "
         "Returns a list of all QR codes including their prefilled messages, "
-        "short links, and image data."
+        "short links, and image data. Each code has qr_images: the URIs of its "
+        "PNG/SVG image, rendered locally (read them as resources, no AiSensy call)."
     ),
     tags={
         "qr",
@@ -46,12 +49,13 @@ async def get_qr_codes() -> Dict[str, Any]:
             response = await client.get_qr_codes()
             
             if response.get("success"):
+                response = {**response, "data": await asyncio.to_thread(annotate_qr_codes, response.get("data", []))}
                 data = response.get("data", [])
                 count = len(data) if isinstance(data, list) else "unknown"
-                logger.info(f"Successfully retrieved {count} QR codes")
+                logger.info("Successfully retrieved %s QR codes", count)
             else:
                 logger.warning(
-                    f"Failed to retrieve QR codes: {response.get('error')}"
+                    "Failed to retrieve QR codes: %s", response.get('error')
                 )
             
             return response
@@ -3,11 +3,13 @@ MCP Tool: Update QR Code
 
 Updates a QR code via the AiSensy Direct API.
 """
+import asyncio
 from typing import Dict, Any
 
 from ... import mcp
 from ....clients import get_direct_api_patch_client
 from ....models import UpdateQrCodeRequest
+from app.services.qr_images import annotate_qr_codes
 from app import logger
 
 
@@ -15,7 +17,8 @@ from app import logger
     name="update_qr_code",
     description=(
         "Updates a QR code via the AiSensy Direct API. "
-        "Changes the prefilled message for the specified QR code."
+        "Changes the prefilled message for the specified QR code. "
+        "Returns qr_images: URIs of the updated PNG/SVG image (MCP resources)."
     ),
     tags={
         "qr",
@@ -61,10 +64,13 @@ async def update_qr_code(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully updated QR code: {request.qr_code_id}")
+                response = {**response, "data": await asyncio.to_thread(
+                    annotate_qr_codes, response.get("data"), code=request.qr_code_id,
+                    prefilled_message=request.prefilled_message)}
+                logger.info("Successfully updated QR code: %s", request.qr_code_id)
             else:
                 logger.warning(
-                    f"Failed to update QR code {request.qr_code_id}: {response.get('error')}"
+                    "Failed to update QR code %s: %s", request.qr_code_id, response.get('error')
                 )
             
             return response
@@ -3,11 +3,13 @@ MCP Tool: Create QR Code and Short Link
 
 Creates a QR code and short link via the AiSensy Direct API.
 """
+import asyncio
 from typing import Dict, Any
 
 from ... import mcp
 from ....clients import get_direct_api_post_client
 from ....models import CreateQrCodeAndShortLinkRequest
+from app.services.qr_images import annotate_qr_codes
 from app import logger
 
 
@@ -15,7 +17,8 @@ from app import logger
     name="create_qr_code_and_short_link",
     description=(
         "Creates a QR code and short link via the AiSensy Direct API. "
-        "Returns a QR code image and short link with the specified prefilled message."
+        "Returns a QR code image and short link with the specified prefilled message, "
+        "and qr_images: URIs of the locally rendered PNG/SVG image (MCP resources)."
     ),
     tags={
         "qr",
@@ -63,10 +66,11 @@ async def create_qr_code_and_short_link(
             )
             
             if response.get("success"):
+                response = {**response, "data": await asyncio.to_thread(annotate_qr_codes, response.get("data"))}
                 logger.info("Successfully created QR code and short link")
             else:
                 logger.warning(
-                    f"Failed to create QR code and short link: {response.get('error')}"
+                    "Failed to create QR code and short link: %s", response.get('error')
                 )
             
             return response
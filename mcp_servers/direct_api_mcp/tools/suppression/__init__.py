@@ -0,0 +1,5 @@
+from .suppression_tools import (suppress_numbers, unsuppress_numbers, import_suppression_list,
+                                export_suppression_list)
+
+
+__all__=["suppress_numbers","unsuppress_numbers","import_suppression_list","export_suppression_list"]
@@ -0,0 +1,155 @@
+"""
+MCP Tools: Suppression List
+
+Manage the opt-out / suppression list that send_message and
+send_marketing_lite_message check before every send.
+"""
+import asyncio
+from typing import Dict, Any, List
+
+from .. import mcp
+from app import logger
+from app.services.suppression import load_suppression_list
+
+_META = {
+    "version": "1.0.0",
+    "author": "AiSensy Team",
+    "category": "Compliance"
+}
+
+
+@mcp.tool(
+    name="suppress_numbers",
+    description=(
+        "Adds phone numbers to the opt-out / suppression list. "
+        "No message is sent to a suppressed number until it is removed again."
+    ),
+    tags={"suppression", "opt-out", "compliance", "post", "aisensy"},
+    meta=_META
+)
+async def suppress_numbers(numbers: List[str], reason: str = "opt_out") -> Dict[str, Any]:
+    """
+    Suppress phone numbers.
+
+    Args:
+        numbers: Phone numbers to suppress (e.g., ["917089379345"])
+        reason: Why they are suppressed (default: "opt_out")
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): added (numbers newly suppressed) and total
+        - error (str): Error message if unsuccessful
+    """
+    if not numbers:
+        return {"success": False, "error": "At least one number is required"}
+    try:
+        suppression = await load_suppression_list()
+        added = await asyncio.to_thread(suppression.add, numbers, reason)
+        logger.info("Suppressed %s new numbers (%s)", added, reason)
+        total = await asyncio.to_thread(len, suppression)
+        return {"success": True, "data": {"added": added, "total": total}}
+    except Exception as e:
+        error_msg = f"Unexpected error suppressing numbers: {str(e)}"
+        logger.exception(error_msg)
+        return {"success": False, "error": error_msg}
+
+
+@mcp.tool(
+    name="unsuppress_numbers",
+    description="Removes phone numbers from the opt-out / suppression list (e.g. after they opted back in).",
+    tags={"suppression", "opt-in", "compliance", "delete", "aisensy"},
+    meta=_META
+)
+async def unsuppress_numbers(numbers: List[str]) -> Dict[str, Any]:
+    """
+    Stop suppressing phone numbers.
+
+    Args:
+        numbers: Phone numbers to remove from the suppression list
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): removed (numbers that were suppressed) and total
+        - error (str): Error message if unsuccessful
+    """
+    if not numbers:
+        return {"success": False, "error": "At least one number is required"}
+    try:
+        suppression = await load_suppression_list()
+        removed = await asyncio.to_thread(suppression.remove, numbers)
+        logger.info("Removed %s numbers from the suppression list", removed)
+        total = await asyncio.to_thread(len, suppression)
+        return {"success": True, "data": {"removed": removed, "total": total}}
+    except Exception as e:
+        error_msg = f"Unexpected error removing suppressed numbers: {str(e)}"
+        logger.exception(error_msg)
+        return {"success": False, "error": error_msg}
+
+
+@mcp.tool(
+    name="import_suppression_list",
+    description=(
+        "Bulk-imports opted-out phone numbers from a CSV or text file on the server "
+        "(numbers in the first column, an optional header row is skipped)."
+    ),
+    tags={"suppression", "opt-out", "import", "bulk", "compliance", "aisensy"},
+    meta=_META
+)
+async def import_suppression_list(file_path: str, reason: str = "opt_out") -> Dict[str, Any]:
+    """
+    Import a suppression list file.
+
+    Args:
+        file_path: Path of the CSV/text file to import
+        reason: Why the numbers are suppressed (default: "opt_out")
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): added (numbers newly suppressed) and total
+        - error (str): Error message if unsuccessful
+    """
+    try:
+        suppression = await load_suppression_list()
+        added = await asyncio.to_thread(suppression.import_file, file_path, reason)
+        logger.info("Imported %s new suppressed numbers from %s", added, file_path)
+        total = await asyncio.to_thread(len, suppression)
+        return {"success": True, "data": {"added": added, "total": total}}
+    except FileNotFoundError:
+        return {"success": False, "error": f"File not found: {file_path}"}
+    except Exception as e:
+        error_msg = f"Unexpected error importing suppression list: {str(e)}"
+        logger.exception(error_msg)
+        return {"success": False, "error": error_msg}
+
+
+@mcp.tool(
+    name="export_suppression_list",
+    description="Exports the whole opt-out / suppression list to a CSV file on the server (number, reason, added_at).",
+    tags={"suppression", "opt-out", "export", "bulk", "compliance", "aisensy"},
+    meta=_META
+)
+async def export_suppression_list(file_path: str) -> Dict[str, Any]:
+    """
+    Export the suppression list.
+
+    Args:
+        file_path: Path of the CSV file to write
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): file_path and exported (number of rows)
+        - error (str): Error message if unsuccessful
+    """
+    try:
+        suppression = await load_suppression_list()
+        exported = await asyncio.to_thread(suppression.export_file, file_path)
+        logger.info("Exported %s suppressed numbers to %s", exported, file_path)
+        return {"success": True, "data": {"file_path": file_path, "exported": exported}}
+    except Exception as e:
+        error_msg = f"Unexpected error exporting suppression list: {str(e)}"
+        logger.exception(error_msg)
+        return {"success": False, "error": error_msg}
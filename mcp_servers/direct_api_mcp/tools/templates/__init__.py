@@ -1,9 +1,10 @@
 from .post_template_tools import compare_template,edit_template,submit_whatsapp_template_message
 from .get_template_tools import get_templates,get_template_by_id
 from .delete_template_tools import delete_wa_template_by_id,delete_wa_template_by_id
+from .render_template_tools import render_template_messages
 
 
 
 
-__all__=["compare_template","edit_template","submit_whatsapp_template_message","get_templates","get_template_by_id","delete_wa_template_by_id","delete_wa_template_by_id"]
+__all__=["compare_template","edit_template","submit_whatsapp_template_message","get_templates","get_template_by_id","delete_wa_template_by_id","delete_wa_template_by_id","render_template_messages"]
 
@@ -53,10 +53,10 @@ async def delete_wa_template_by_id(template_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully deleted template by ID: {request.template_id}")
+                logger.info("Successfully deleted template by ID: %s", request.template_id)
             else:
                 logger.warning(
-                    f"Failed to delete template by ID {request.template_id}: {response.get('error')}"
+                    "Failed to delete template by ID %s: %s", request.template_id, response.get('error')
                 )
             
             return response
@@ -53,10 +53,10 @@ async def delete_wa_template_by_name(template_name: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully deleted template by name: {request.template_name}")
+                logger.info("Successfully deleted template by name: %s", request.template_name)
             else:
                 logger.warning(
-                    f"Failed to delete template by name {request.template_name}: {response.get('error')}"
+                    "Failed to delete template by name %s: %s", request.template_name, response.get('error')
                 )
             
             return response
@@ -48,10 +48,10 @@ async def get_templates() -> Dict[str, Any]:
             if response.get("success"):
                 data = response.get("data", [])
                 count = len(data) if isinstance(data, list) else "unknown"
-                logger.info(f"Successfully retrieved {count} templates")
+                logger.info("Successfully retrieved %s templates", count)
             else:
                 logger.warning(
-                    f"Failed to retrieve templates: {response.get('error')}"
+                    "Failed to retrieve templates: %s", response.get('error')
                 )
             
             return response
@@ -54,10 +54,10 @@ async def get_template_by_id(template_id: str) -> Dict[str, Any]:
             )
             
             if response.get("success"):
-                logger.info(f"Successfully retrieved template: {request.template_id}")
+                logger.info("Successfully retrieved template: %s", request.template_id)
             else:
                 logger.warning(
-                    f"Failed to retrieve template {request.template_id}: {response.get('error')}"
+                    "Failed to retrieve template %s: %s", request.template_id, response.get('error')
                 )
             
             return response
@@ -70,10 +70,10 @@ async def compare_template(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully compared template: {request.template_id}")
+                logger.info("Successfully compared template: %s", request.template_id)
             else:
                 logger.warning(
-                    f"Failed to compare template {request.template_id}: {response.get('error')}"
+                    "Failed to compare template %s: %s", request.template_id, response.get('error')
                 )
             
             return response
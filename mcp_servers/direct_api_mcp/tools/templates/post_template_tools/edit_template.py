@@ -66,10 +66,10 @@ async def edit_template(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully edited template: {request.template_id}")
+                logger.info("Successfully edited template: %s", request.template_id)
             else:
                 logger.warning(
-                    f"Failed to edit template {request.template_id}: {response.get('error')}"
+                    "Failed to edit template %s: %s", request.template_id, response.get('error')
                 )
             
             return response
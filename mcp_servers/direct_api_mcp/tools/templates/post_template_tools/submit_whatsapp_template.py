@@ -70,10 +70,10 @@ async def submit_whatsapp_template_message(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully submitted WhatsApp template: {request.name}")
+                logger.info("Successfully submitted WhatsApp template: %s", request.name)
             else:
                 logger.warning(
-                    f"Failed to submit WhatsApp template {request.name}: {response.get('error')}"
+                    "Failed to submit WhatsApp template %s: %s", request.name, response.get('error')
                 )
             
             return response
@@ -0,0 +1,4 @@
+from .render_template_messages import render_template_messages
+
+
+__all__ =["render_template_messages"]
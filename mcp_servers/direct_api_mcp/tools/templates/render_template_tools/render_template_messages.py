@@ -0,0 +1,101 @@
+"""
+MCP Tool: Render Template Messages
+
+Renders personalised template messages for a recipient list: the template
+is fetched and compiled once, every row is validated against it, and the
+ready-to-send payloads are written to a file.
+"""
+import asyncio
+from typing import Dict, Any
+
+from ... import mcp
+from ....clients import get_direct_api_get_client
+from ....models import TemplateIdRequest
+from app import logger
+from app.services.template_renderer import (TemplateCompileError, compiled_template,
+                                            render_template_file)
+
+
+@mcp.tool(
+    name="render_template_messages",
+    description=(
+        "Renders a personalised WhatsApp template message for every row of a recipient CSV on "
+        "the server. The CSV needs a 'to' column and one column per template parameter "
+        "(header_1, body_1, body_2, ..., button_0; the expected columns are returned when any "
+        "are missing). Rows that do not fit the template are rejected before anything is sent; "
+        "valid rows are written as ready-to-send payloads (JSON lines)."
+    ),
+    tags={
+        "template",
+        "bulk",
+        "render",
+        "whatsapp",
+        "direct-api",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Template Management"
+    }
+)
+async def render_template_messages(
+    template_id: str,
+    file_path: str,
+    exclude_suppressed: bool = True
+) -> Dict[str, Any]:
+    """
+    Render template messages for a recipient list.
+
+    Args:
+        template_id: The unique template identifier
+        file_path: Path of the recipient CSV on the server
+        exclude_suppressed: Reject rows of opted-out recipients (default: True)
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): template, columns, row counts (rows, rendered, rejected),
+          output_path (payloads), rejected_path and the first rejected rows
+        - error (str): Error message if unsuccessful
+    """
+    try:
+        request = TemplateIdRequest(template_id=template_id)
+
+        async with get_direct_api_get_client() as client:
+            response = await client.get_template_by_id(template_id=request.template_id)
+        if not response.get("success"):
+            return response
+
+        template = response.get("data") or {}
+        if "components" not in template and isinstance(template.get("data"), dict):
+            template = template["data"]
+        compiled = compiled_template(template)
+
+        report = await asyncio.to_thread(
+            render_template_file, compiled, file_path, exclude_suppressed=exclude_suppressed
+        )
+        return {
+            "success": True,
+            "data": report.to_dict()
+        }
+
+    except FileNotFoundError:
+        return {
+            "success": False,
+            "error": f"File not found: {file_path}"
+        }
+    except (TemplateCompileError, ValueError) as e:
+        error_msg = f"Validation error: {str(e)}"
+        logger.warning(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
+    except Exception as e:
+        error_msg = f"Unexpected error rendering template messages: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
@@ -0,0 +1,5 @@
+from .get_message_status import get_message_status
+from .get_inbound_messages import get_inbound_messages
+
+
+__all__=["get_message_status","get_inbound_messages"]
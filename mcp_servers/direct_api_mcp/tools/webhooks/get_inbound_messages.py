@@ -0,0 +1,71 @@
+"""
+MCP Tool: Get Inbound Messages
+
+Recent messages received from customers, from the webhooks received by
+the webhook receiver.
+"""
+from typing import Dict, Any, Optional
+
+from .. import mcp
+from app import logger
+from app.services.webhook_service import recent_inbound_messages
+
+
+@mcp.tool(
+    name="get_inbound_messages",
+    description=(
+        "Returns the most recent inbound WhatsApp messages received from customers, newest first. "
+        "Optionally filtered by sender phone number and by a minimum Unix timestamp."
+    ),
+    tags={
+        "message",
+        "inbound",
+        "webhook",
+        "get",
+        "direct-api",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Messaging"
+    }
+)
+async def get_inbound_messages(
+    limit: int = 50,
+    from_number: Optional[str] = None,
+    since: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get recent inbound messages.
+
+    Args:
+        limit: Maximum number of messages to return (1-500, default 50)
+        from_number: Only messages from this sender (WhatsApp ID, e.g. "919876543210")
+        since: Only messages sent at or after this Unix timestamp
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (list): Inbound messages, newest first
+        - error (str): Error message if unsuccessful
+    """
+    if not 1 <= limit <= 500:
+        return {
+            "success": False,
+            "error": "limit must be between 1 and 500"
+        }
+    try:
+        data = await recent_inbound_messages(limit=limit, from_number=from_number or None, since=since)
+        logger.info("Fetched %s inbound messages", len(data))
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        error_msg = f"Unexpected error reading inbound messages: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
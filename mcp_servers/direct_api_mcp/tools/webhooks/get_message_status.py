@@ -0,0 +1,66 @@
+"""
+MCP Tool: Get Message Status
+
+Delivery status of a sent message, from the webhooks received by the
+webhook receiver (sent / delivered / read / failed).
+"""
+from typing import Dict, Any
+
+from .. import mcp
+from app import logger
+from app.services.webhook_service import message_status
+
+
+@mcp.tool(
+    name="get_message_status",
+    description=(
+        "Returns the delivery status of a sent WhatsApp message (sent, delivered, read or failed) "
+        "and its status history, as reported by the AiSensy webhooks."
+    ),
+    tags={
+        "message",
+        "status",
+        "webhook",
+        "get",
+        "direct-api",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Messaging"
+    }
+)
+async def get_message_status(message_id: str) -> Dict[str, Any]:
+    """
+    Get the delivery status of a message.
+
+    Args:
+        message_id: The WhatsApp message ID (wamid) returned when the message was sent
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the operation was successful
+        - data (dict): message_id, current status (None when no webhook arrived yet)
+          and the status history, oldest first
+        - error (str): Error message if unsuccessful
+    """
+    if not message_id or not message_id.strip():
+        return {
+            "success": False,
+            "error": "message_id is required"
+        }
+    try:
+        data = await message_status(message_id.strip())
+        logger.info("Status of message %s: %s", message_id, data['status'])
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        error_msg = f"Unexpected error reading message status: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
@@ -67,7 +67,7 @@ async def get_whatsapp_business_encryption() -> Dict[str, Any]:
                 logger.info("Successfully retrieved WhatsApp Business encryption settings")
             else:
                 logger.warning(
-                    f"Failed to retrieve WhatsApp Business encryption settings: {response.get('error')}"
+                    "Failed to retrieve WhatsApp Business encryption settings: %s", response.get('error')
                 )
             
             return response
@@ -78,7 +78,7 @@ async def set_business_public_key(business_public_key: str) -> Dict[str, Any]:
                 logger.info("Successfully set business public key for encryption")
             else:
                 logger.warning(
-                    f"Failed to set business public key: {response.get('error')}"
+                    "Failed to set business public key: %s", response.get('error')
                 )
             
             return response
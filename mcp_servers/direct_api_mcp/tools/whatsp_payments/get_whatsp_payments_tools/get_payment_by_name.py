@@ -54,10 +54,10 @@ async def get_payment_configuration_by_name(configuration_name: str) -> Dict[str
             )
             
             if response.get("success"):
-                logger.info(f"Successfully retrieved payment configuration: {request.configuration_name}")
+                logger.info("Successfully retrieved payment configuration: %s", request.configuration_name)
             else:
                 logger.warning(
-                    f"Failed to retrieve payment configuration {request.configuration_name}: {response.get('error')}"
+                    "Failed to retrieve payment configuration %s: %s", request.configuration_name, response.get('error')
                 )
             
             return response
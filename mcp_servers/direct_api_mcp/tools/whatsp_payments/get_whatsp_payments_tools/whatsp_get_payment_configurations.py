@@ -48,10 +48,10 @@ async def get_payment_configurations() -> Dict[str, Any]:
             if response.get("success"):
                 data = response.get("data", [])
                 count = len(data) if isinstance(data, list) else "unknown"
-                logger.info(f"Successfully retrieved {count} payment configurations")
+                logger.info("Successfully retrieved %s payment configurations", count)
             else:
                 logger.warning(
-                    f"Failed to retrieve payment configurations: {response.get('error')}"
+                    "Failed to retrieve payment configurations: %s", response.get('error')
                 )
             
             return response
@@ -73,10 +73,10 @@ async def create_payment_configuration(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully created payment configuration: {request.configuration_name}")
+                logger.info("Successfully created payment configuration: %s", request.configuration_name)
             else:
                 logger.warning(
-                    f"Failed to create payment configuration {request.configuration_name}: {response.get('error')}"
+                    "Failed to create payment configuration %s: %s", request.configuration_name, response.get('error')
                 )
             
             return response
@@ -62,10 +62,10 @@ async def generate_payment_configuration_oauth_link(
             )
             
             if response.get("success"):
-                logger.info(f"Successfully generated OAuth link for: {request.configuration_name}")
+                logger.info("Successfully generated OAuth link for: %s", request.configuration_name)
             else:
                 logger.warning(
-                    f"Failed to generate OAuth link for {request.configuration_name}: {response.get('error')}"
+                    "Failed to generate OAuth link for %s: %s", request.configuration_name, response.get('error')
                 )
             
             return response
@@ -1,4 +1,6 @@
 from direct_api_mcp import mcp
+from app.services.monitoring_service import metrics_port, start_metrics_exporter
 
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    start_metrics_exporter(metrics_port("DIRECT_API_METRICS_PORT"))
+    mcp.run()
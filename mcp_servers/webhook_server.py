@@ -0,0 +1,11 @@
+import uvicorn
+
+from app.config.settings import setting
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "app.api.webhook_app:create_webhook_app",
+        factory=True,
+        host=setting("WEBHOOK_HOST", "0.0.0.0"),
+        port=setting("WEBHOOK_PORT", 8090),
+    )
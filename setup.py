@@ -22,6 +22,8 @@ setup(
         "httpx",
         "mcp",
         "google-generativeai",
+        "prometheus-client",
+        "orjson",
     ],
     extras_require={
         "dev": [
@@ -38,6 +40,11 @@ setup(
             "pytest-asyncio",
             "httpx",
         ],
+        "tracing": [
+            "opentelemetry-api",
+            "opentelemetry-sdk",
+            "opentelemetry-exporter-otlp-proto-http",
+        ],
     },
     entry_points={
         "console_scripts": [
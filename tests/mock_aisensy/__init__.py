@@ -0,0 +1,15 @@
+"""
+Local mock of the AiSensy Partner and Direct APIs for offline tests and load tests.
+"""
+from .server import (DIRECT_PREFIX, PARTNER_PREFIX, ROUTES, Latency, MockAiSensy,
+                     MockAiSensyServer, MockProfile)
+
+__all__ = [
+    "DIRECT_PREFIX",
+    "PARTNER_PREFIX",
+    "ROUTES",
+    "Latency",
+    "MockAiSensy",
+    "MockAiSensyServer",
+    "MockProfile",
+]
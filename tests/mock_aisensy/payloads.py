@@ -0,0 +1,400 @@
+"""
+Canned response payloads for the mock AiSensy APIs.
+
+Partner API payloads follow the response models in
+`boarding_mcp.models.response_models`; Direct API payloads follow the
+WhatsApp Cloud API objects the AiSensy Direct API passes through.
+Every builder takes the path parameters and the decoded request body.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import time
+import uuid
+from typing import Any, Dict
+
+PARTNER_ID = "mock-partner"
+BUSINESS_ID = "mock-business"
+PROJECT_ID = "mock-project"
+WABA_ID = "102290129340398"
+PHONE_NUMBER_ID = "106540352242922"
+CATALOG_ID = "1234567890123456"
+TOKEN_SECRET = b"mock-aisensy-secret"
+
+_NOW_MS = 1_717_000_000_000
+
+
+def _id() -> str:
+    return uuid.uuid4().hex[:24]
+
+
+def make_token(ttl_seconds: float = 3600.0, subject: str = PROJECT_ID) -> str:
+    """HS256 JWT carrying `exp`, like the tokens issued by /users/regenrate-token."""
+    def b64(raw: bytes) -> str:
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    header = b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    claims = b64(json.dumps({"sub": subject, "iat": int(time.time()),
+                             "exp": int(time.time() + ttl_seconds)}).encode())
+    signature = hmac.new(TOKEN_SECRET, f"{header}.{claims}".encode(), hashlib.sha256).digest()
+    return f"{header}.{claims}.{b64(signature)}"
+
+
+def token_is_valid(token: str, now: float = None) -> bool:
+    """True for a token from `make_token()` that has not expired yet."""
+    try:
+        header, claims, signature = token.split(".")
+        expected = hmac.new(TOKEN_SECRET, f"{header}.{claims}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(base64.urlsafe_b64decode(signature + "=" * (-len(signature) % 4)),
+                                   expected):
+            return False
+        exp = json.loads(base64.urlsafe_b64decode(claims + "=" * (-len(claims) % 4)))["exp"]
+    except (ValueError, KeyError, TypeError):
+        return False
+    return (now or time.time()) < exp
+
+
+# ==================== PARTNER API ====================
+
+def business_profile(**_) -> Dict[str, Any]:
+    return {
+        "id": BUSINESS_ID,
+        "active": True,
+        "display_name": "Mock Business",
+        "project_ids": [PROJECT_ID],
+        "user_name": "mock-user",
+        "business_id": BUSINESS_ID,
+        "email": "owner@mock-business.test",
+        "created_at": _NOW_MS,
+        "updated_at": _NOW_MS,
+        "company": "Mock Business Pvt Ltd",
+        "contact": "919999999999",
+        "currency": "INR",
+        "timezone": "Asia/Calcutta GMT+05:30",
+        "partner_id": PARTNER_ID,
+        "type": "owner",
+        "companySize": 10,
+        "password": True,
+    }
+
+
+def all_business_profiles(**_) -> list:
+    profiles = []
+    for i in range(5):
+        profile = business_profile()
+        profile.update(id=f"{BUSINESS_ID}-{i}", business_id=f"{BUSINESS_ID}-{i}",
+                       createdOn="2024-05-29")
+        profiles.append(profile)
+    return profiles
+
+
+def kyc_submission_status(**_) -> Dict[str, Any]:
+    return {"data": [{"status": "SUBMITTED", "project_id": PROJECT_ID}]}
+
+
+def business_verification_status(**_) -> Dict[str, Any]:
+    return {"verification_status": "verified", "id": WABA_ID}
+
+
+def partner_details(**_) -> Dict[str, Any]:
+    return {
+        "id": PARTNER_ID,
+        "name": "mock-partner",
+        "display_name": "Mock Partner",
+        "centralBalance": 125000.5,
+        "currency": "INR",
+        "webhook_url": "https://partner.mock.test/webhook",
+        "created_at": _NOW_MS,
+        "updated_at": _NOW_MS,
+    }
+
+
+def _country_wise(amount: float, count: int) -> Dict[str, Any]:
+    return {"IN": {"amount": amount, "count": count}}
+
+
+def wcc_usage_analytics(**_) -> Dict[str, Any]:
+    days = []
+    for day in range(1, 31):
+        days.append({
+            "_id": _id(),
+            "assistantId": PROJECT_ID,
+            "clientId": BUSINESS_ID,
+            "partnerId": PARTNER_ID,
+            "dayDate": f"2024-05-{day:02d}",
+            "timezone": "Asia/Calcutta",
+            "totalChatCount": 120 + day,
+            "sentChatCount": 118 + day,
+            "deliveredChatCount": 115 + day,
+            "readChatCount": 90 + day,
+            "failedChatCount": 3,
+            "enqueuedChatCount": 0,
+            "centralBalanceUsedCount": 42.5,
+            "centralBalanceUsedCountryWise": _country_wise(42.5, 50),
+            "centralBalanceMessagesCount": 50,
+            "templateCreditUsedCount": 0,
+            "templateMessagesCount": 50,
+            "freeTierCount": 10,
+            "mcCentralBalanceMetrics": {"count": 30, "creditUsage": 30.0,
+                                        "creditUsageCountryWise": _country_wise(30.0, 30)},
+            "ucCentralBalanceMetrics": {"count": 20, "creditUsage": 12.5,
+                                        "creditUsageCountryWise": _country_wise(12.5, 20)},
+        })
+    return {"wccAnalytics": days}
+
+
+def billing_records(**_) -> Dict[str, Any]:
+    records = []
+    for i in range(20):
+        records.append({
+            "_id": _id(),
+            "partnerId": PARTNER_ID,
+            "action": "SUBTRACT" if i % 4 else "ADD",
+            "amount": 1000 + i,
+            "prevCentralBalance": 125000 - i * 1000,
+            "reasonCode": "PLAN_RENEWED" if i % 4 else "RECHARGE",
+            "message": "Mock billing entry",
+            "assistantId": PROJECT_ID,
+            "clientId": BUSINESS_ID,
+            "createdAt": f"2024-05-{i + 1:02d}T10:00:00.000Z",
+            "updatedAt": f"2024-05-{i + 1:02d}T10:00:00.000Z",
+        })
+    return {"data": records}
+
+
+def project(project_id: str = PROJECT_ID, **_) -> Dict[str, Any]:
+    return {
+        "type": "project",
+        "id": project_id,
+        "name": "Mock Project",
+        "business_id": BUSINESS_ID,
+        "partner_id": PARTNER_ID,
+        "plan_activated_on": _NOW_MS,
+        "status": "active",
+        "sandbox": False,
+        "active_plan": "BASIC_MONTHLY",
+        "created_at": _NOW_MS,
+        "updated_at": _NOW_MS,
+        "plan_renewal_on": _NOW_MS + 30 * 86_400_000,
+        "mau_quota": 1000,
+        "mau_usage": 125,
+        "credit": 500,
+        "wa_number": "919999999999",
+        "wa_messaging_tier": "TIER_1K",
+        "wa_display_name_status": "APPROVED",
+        "fb_business_manager_status": "verified",
+        "wa_display_name": "Mock Business",
+        "wa_quality_rating": "GREEN",
+        "wa_about": "Mock business on WhatsApp",
+        "wa_business_profile": {"address": "1 Mock Street, Bengaluru", "email": "support@mock-business.test",
+                                "websites": ["https://mock-business.test"], "vertical": "RETAIL"},
+        "billing_currency": "INR",
+        "timezone": "Asia/Calcutta GMT+05:30",
+        "subscription_started_on": _NOW_MS,
+        "is_whatsapp_verified": True,
+        "subscription_status": "active",
+        "daily_template_limit": 1000,
+        "waba_app_status": "LIVE",
+    }
+
+
+def projects(**_) -> list:
+    return [project(f"{PROJECT_ID}-{i}") for i in range(3)]
+
+
+def created(body: Dict[str, Any] = None, **_) -> Dict[str, Any]:
+    """Creation acknowledgement echoing the request body."""
+    return {"id": _id(), "created_at": _NOW_MS, **(body or {})}
+
+
+def link(**_) -> Dict[str, Any]:
+    return {"url": f"https://mock.aisensy.test/link/{_id()}", "expires_at": _NOW_MS + 86_400_000}
+
+
+# ==================== DIRECT API ====================
+
+def token(**_) -> Dict[str, Any]:
+    return {"token": make_token(), "direct_api": True}
+
+
+def business_info(**_) -> Dict[str, Any]:
+    return {"id": WABA_ID, "name": "Mock Business", "timezone_id": "71",
+            "message_template_namespace": "mock_namespace", "currency": "INR"}
+
+
+def fb_verification_status(**_) -> Dict[str, Any]:
+    return {"business_verification_status": "verified", "id": WABA_ID}
+
+
+def template(template_id: str = "1234567890", **_) -> Dict[str, Any]:
+    return {
+        "id": template_id,
+        "name": f"order_update_{template_id[-4:]}",
+        "language": "en",
+        "status": "APPROVED",
+        "category": "UTILITY",
+        "components": [
+            {"type": "HEADER", "format": "TEXT", "text": "Order {{1}}"},
+            {"type": "BODY", "text": "Hi {{1}}, your order {{2}} ships on {{3}}."},
+            {"type": "FOOTER", "text": "Mock Business"},
+        ],
+    }
+
+
+def templates(**_) -> Dict[str, Any]:
+    return {"data": [template(str(1000000000 + i)) for i in range(25)],
+            "paging": {"cursors": {"before": "MAZDZD", "after": "MjQZD"}}}
+
+
+def upload_session(upload_session_id: str = "upload:mock", **_) -> Dict[str, Any]:
+    return {"id": upload_session_id, "file_offset": 0}
+
+
+def profile(**_) -> Dict[str, Any]:
+    return {"data": [{
+        "about": "Mock business on WhatsApp",
+        "address": "1 Mock Street, Bengaluru",
+        "description": "A business that only exists in tests",
+        "email": "support@mock-business.test",
+        "profile_picture_url": "https://mock.aisensy.test/profile.jpg",
+        "websites": ["https://mock-business.test"],
+        "vertical": "RETAIL",
+        "messaging_product": "whatsapp",
+    }]}
+
+
+def phone_number(**_) -> Dict[str, Any]:
+    return {"verified_name": "Mock Business", "display_phone_number": "+91 99999 99999",
+            "id": PHONE_NUMBER_ID, "quality_rating": "GREEN", "code_verification_status": "VERIFIED",
+            "platform_type": "CLOUD_API", "throughput": {"level": "STANDARD"},
+            "messaging_limit_tier": "TIER_1K"}
+
+
+def phone_numbers(**_) -> Dict[str, Any]:
+    return {"data": [phone_number()]}
+
+
+def display_name_status(**_) -> Dict[str, Any]:
+    return {"id": PHONE_NUMBER_ID, "name_status": "APPROVED"}
+
+
+def catalogs(**_) -> Dict[str, Any]:
+    return {"data": [{"id": CATALOG_ID, "name": "Mock Catalog", "vertical": "commerce"}]}
+
+
+def products(**_) -> Dict[str, Any]:
+    return {"data": [{"id": str(9000 + i), "retailer_id": f"sku-{i}", "name": f"Product {i}",
+                      "price": "₹499.00", "currency": "INR", "availability": "in stock"}
+                     for i in range(20)]}
+
+
+def commerce_settings(**_) -> Dict[str, Any]:
+    return {"data": [{"is_cart_enabled": True, "is_catalog_visible": True, "id": _id()}]}
+
+
+def qr_codes(**_) -> Dict[str, Any]:
+    return {"data": [{"code": f"ANED2T5QRU7HG1{i}", "prefilled_message": "Hi, I'd like to order",
+                      "deep_link_url": f"https://wa.me/message/ANED2T5QRU7HG1{i}",
+                      "qr_image_url": f"https://scontent.mock.test/qr/{i}.png"} for i in range(3)]}
+
+
+def qr_code(body: Dict[str, Any] = None, **_) -> Dict[str, Any]:
+    body = body or {}
+    code = body.get("code") or "ANED2T5QRU7HG1"
+    return {"code": code, "prefilled_message": body.get("prefilledMessage", ""),
+            "deep_link_url": f"https://wa.me/message/{code}",
+            "qr_image_url": f"https://scontent.mock.test/qr/{code}.png"}
+
+
+def encryption(**_) -> Dict[str, Any]:
+    return {"data": [{"business_public_key": "-----BEGIN PUBLIC KEY-----\nMOCK\n-----END PUBLIC KEY-----",
+                      "business_public_key_signature_status": "VALID"}]}
+
+
+def flow(flow_id: str = "flow-1", **_) -> Dict[str, Any]:
+    return {"id": flow_id, "name": f"Mock flow {flow_id}", "status": "DRAFT",
+            "categories": ["LEAD_GENERATION"], "validation_errors": [], "json_version": "3.1"}
+
+
+def flows(**_) -> Dict[str, Any]:
+    return {"data": [flow(f"{7000 + i}") for i in range(5)]}
+
+
+def flow_assets(flow_id: str = "flow-1", **_) -> Dict[str, Any]:
+    return {"data": [{"name": "flow.json", "asset_type": "FLOW_JSON",
+                      "download_url": f"https://mock.aisensy.test/flows/{flow_id}/flow.json"}]}
+
+
+def flow_preview(flow_id: str = "flow-1", **_) -> Dict[str, Any]:
+    return {"id": flow_id, "preview": {"preview_url": f"https://business.facebook.com/wa/manage/flows/{flow_id}/preview",
+                                       "expires_at": "2099-01-01T00:00:00+0000"}}
+
+
+def payment_configuration(configuration_name: str = "mock-config", **_) -> Dict[str, Any]:
+    return {"configuration_name": configuration_name, "provider_name": "razorpay",
+            "provider_mid": "mock-mid", "status": "Active", "created_timestamp": 1717000000}
+
+
+def payment_configurations(**_) -> Dict[str, Any]:
+    return {"data": [{"payment_configurations": [payment_configuration(f"config-{i}") for i in range(3)]}]}
+
+
+def analytics(**_) -> Dict[str, Any]:
+    return {"analytics": {"phone_numbers": ["919999999999"], "granularity": "DAY",
+                          "data_points": [{"start": 1717000000 + i * 86400, "end": 1717086400 + i * 86400,
+                                           "sent": 100 + i, "delivered": 95 + i} for i in range(7)]},
+            "id": WABA_ID}
+
+
+def health_status(**_) -> Dict[str, Any]:
+    return {"health_status": {"can_send_message": "AVAILABLE",
+                              "entities": [{"entity_type": "PHONE_NUMBER", "id": PHONE_NUMBER_ID,
+                                            "can_send_message": "AVAILABLE"},
+                                           {"entity_type": "WABA", "id": WABA_ID,
+                                            "can_send_message": "AVAILABLE"}]},
+            "id": PHONE_NUMBER_ID}
+
+
+def message_sent(body: Dict[str, Any] = None, **_) -> Dict[str, Any]:
+    body = body or {}
+    return {"messaging_product": "whatsapp",
+            "contacts": [{"input": body.get("to", ""), "wa_id": body.get("to", "")}],
+            "messages": [{"id": f"wamid.{_id()}", "message_status": "accepted"}]}
+
+
+def success(**_) -> Dict[str, Any]:
+    return {"success": True}
+
+
+def template_created(**_) -> Dict[str, Any]:
+    return {"id": str(uuid.uuid4().int)[:16], "status": "PENDING", "category": "MARKETING"}
+
+
+def template_comparison(template_id: str = "1234567890", **_) -> Dict[str, Any]:
+    return {"data": [{"metric": "BLOCK_RATE", "type": "RELATIVE", "order_by_relative_metric": [template_id]}]}
+
+
+def media_id(**_) -> Dict[str, Any]:
+    return {"id": str(uuid.uuid4().int)[:16]}
+
+
+def media(**_) -> Dict[str, Any]:
+    return {"messaging_product": "whatsapp", "url": "https://lookaside.mock.test/media",
+            "mime_type": "image/jpeg", "sha256": "0" * 64, "file_size": 2048, "id": media_id()["id"]}
+
+
+def upload_session_created(**_) -> Dict[str, Any]:
+    return {"id": f"upload:{_id()}"}
+
+
+def file_handle(**_) -> Dict[str, Any]:
+    return {"h": f"4::{_id()}"}
+
+
+def flow_created(**_) -> Dict[str, Any]:
+    return {"id": str(uuid.uuid4().int)[:16], "success": True, "validation_errors": []}
+
+
+def oauth_link(**_) -> Dict[str, Any]:
+    return {"oauth_url": f"https://mock.aisensy.test/oauth/{_id()}", "expiration": 1717086400}
@@ -0,0 +1,416 @@
+"""
+aiohttp mock of the AiSensy Partner and Direct APIs.
+
+Every endpoint used by `boarding_mcp.clients` and `direct_api_mcp.clients`
+is routed under the same prefixes as the real services:
+
+    {base}/partner-apis/v1/partner/{partner_id}/...   (Partner API, BASE_URL)
+    {base}/direct-apis/t1/...                         (Direct API, Direct_BASE_URL)
+
+Each request goes through a `MockProfile`: sampled latency, token-bucket rate
+limiting and random 429 / 5xx / stall injection. Profiles can be overridden
+per endpoint name (the client method name). With `verify_tokens`, Direct API
+calls need an unexpired token issued by /users/regenrate-token (or
+`payloads.make_token()`), as the real service does.
+
+Run standalone:
+    python -m tests.mock_aisensy --port 8089 --latency lognormal:80:40 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from aiohttp import web
+
+from . import payloads
+
+PARTNER_PREFIX = "/partner-apis/v1"
+DIRECT_PREFIX = "/direct-apis/t1"
+PARTNER_KEY_HEADER = "X-AiSensy-Partner-API-Key"
+
+
+# ==================== PROFILES ====================
+
+@dataclass
+class Latency:
+    """
+    Response latency distribution in milliseconds.
+
+    kind is one of "constant", "uniform" (mean ± spread), "normal" and
+    "lognormal" (mean and standard deviation of the resulting latency).
+    """
+
+    kind: str = "constant"
+    mean_ms: float = 0.0
+    spread_ms: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """Parse "kind:mean[:spread]", e.g. "lognormal:80:40" or "constant:5"."""
+        parts = spec.split(":")
+        kind = parts[0] or "constant"
+        mean = float(parts[1]) if len(parts) > 1 else 0.0
+        spread = float(parts[2]) if len(parts) > 2 else 0.0
+        if kind not in ("constant", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        return cls(kind, mean, spread)
+
+    def sample(self, rng: random.Random) -> float:
+        """One latency sample in seconds."""
+        if self.mean_ms <= 0:
+            return 0.0
+        if self.kind == "uniform":
+            ms = rng.uniform(self.mean_ms - self.spread_ms, self.mean_ms + self.spread_ms)
+        elif self.kind == "normal":
+            ms = rng.gauss(self.mean_ms, self.spread_ms)
+        elif self.kind == "lognormal":
+            sigma2 = math.log1p((self.spread_ms / self.mean_ms) ** 2)
+            ms = rng.lognormvariate(math.log(self.mean_ms) - sigma2 / 2, math.sqrt(sigma2))
+        else:
+            ms = self.mean_ms
+        return max(ms, 0.0) / 1000.0
+
+
+@dataclass
+class MockProfile:
+    """Failure and performance behaviour applied to every mocked request."""
+
+    latency: Latency = field(default_factory=Latency)
+    error_rate: float = 0.0        # share of requests answered with a random 5xx
+    throttle_rate: float = 0.0     # share of requests answered with 429
+    stall_rate: float = 0.0        # share of requests that hang for stall_seconds
+    stall_seconds: float = 30.0
+    rate_limit: float = 0.0        # sustained requests/second per service (0 = unlimited)
+    burst: int = 0                 # token bucket size (defaults to one second of rate_limit)
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst or max(1, int(math.ceil(rate)))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def take(self) -> Optional[float]:
+        """Consume a token; return None if allowed, else seconds until the next token."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return None
+        return (1 - self.tokens) / self.rate
+
+
+# ==================== ROUTES ====================
+
+class Route(NamedTuple):
+    service: str     # "partner" or "direct_api"
+    method: str
+    path: str        # relative to the service prefix
+    name: str        # client method name, used for per-endpoint profiles and stats
+    payload: Callable
+
+
+_P = "/partner/{partner_id}"
+
+ROUTES: List[Route] = [
+    # Partner API - GET
+    Route("partner", "GET", _P + "/business/{business_id}", "get_business_profile_by_id", payloads.business_profile),
+    Route("partner", "GET", _P + "/business", "get_all_business_profiles", payloads.all_business_profiles),
+    Route("partner", "GET", _P + "/kyc/get-kyc-submission-status", "get_kyc_submission_status",
+          payloads.kyc_submission_status),
+    Route("partner", "GET", _P + "/kyc/get-business-verification-status", "get_business_verification_status",
+          payloads.business_verification_status),
+    Route("partner", "GET", _P, "get_partner_details", payloads.partner_details),
+    Route("partner", "GET", _P + "/wcc-analytics", "get_wcc_usage_analytics", payloads.wcc_usage_analytics),
+    Route("partner", "GET", _P + "/billings", "get_billing_records", payloads.billing_records),
+    Route("partner", "GET", _P + "/business/{business_id}/project", "get_all_business_projects", payloads.projects),
+    Route("partner", "GET", _P + "/project/{project_id}", "get_project_by_id", payloads.project),
+    # Partner API - POST / PATCH
+    Route("partner", "POST", _P + "/business", "create_business_profile", payloads.created),
+    Route("partner", "POST", _P + "/business/{business_id}/project", "create_project", payloads.created),
+    Route("partner", "POST", _P + "/generate-waba-link", "generate_embedded_signup_url", payloads.link),
+    Route("partner", "POST", _P + "/submit-facebook-access-token", "submit_waba_app_id", payloads.created),
+    Route("partner", "POST", _P + "/submit-facebook-access-token-for-migration-to-partner", "start_migration",
+          payloads.created),
+    Route("partner", "POST", _P + "/request-otp-for-migration-to-partner", "request_otp_for_verification",
+          payloads.created),
+    Route("partner", "POST", _P + "/validate-otp-for-migration-to-partner", "verify_otp", payloads.created),
+    Route("partner", "POST", _P + "/generate-catalog-connect-link", "generate_embedded_fb_catalog_url", payloads.link),
+    Route("partner", "POST", _P + "/ads/generate-dashboard-link", "generate_ctwa_ads_manager_dashboard_url",
+          payloads.link),
+    Route("partner", "PATCH", _P + "/business/{business_id}", "update_business_details", payloads.created),
+
+    # Direct API - GET
+    Route("direct_api", "GET", "/get-business-info", "get_business_info", payloads.business_info),
+    Route("direct_api", "GET", "/fb-verification-status", "get_fb_verification_status",
+          payloads.fb_verification_status),
+    Route("direct_api", "GET", "/get-templates", "get_templates", payloads.templates),
+    Route("direct_api", "GET", "/get-template/{template_id}", "get_template_by_id", payloads.template),
+    Route("direct_api", "GET", "/media/session/{upload_session_id}", "get_media_upload_session",
+          payloads.upload_session),
+    Route("direct_api", "GET", "/get-profile", "get_profile", payloads.profile),
+    Route("direct_api", "GET", "/get-phone-numbers", "get_phone_numbers", payloads.phone_numbers),
+    Route("direct_api", "GET", "/get-phone-number", "get_phone_number", payloads.phone_number),
+    Route("direct_api", "GET", "/get-display-name-status", "get_display_name_status", payloads.display_name_status),
+    Route("direct_api", "GET", "/catalog", "get_catalog", payloads.catalogs),
+    Route("direct_api", "GET", "/product", "get_products", payloads.products),
+    Route("direct_api", "GET", "/whatsapp-commerce-settings", "get_whatsapp_commerce_settings",
+          payloads.commerce_settings),
+    Route("direct_api", "GET", "/qr-codes", "get_qr_codes", payloads.qr_codes),
+    Route("direct_api", "GET", "/whatsapp-business-encryption", "get_whatsapp_business_encryption",
+          payloads.encryption),
+    Route("direct_api", "GET", "/flows", "get_flows", payloads.flows),
+    Route("direct_api", "GET", "/flows/{flow_id}", "get_flow_by_id", payloads.flow),
+    Route("direct_api", "GET", "/flows/{flow_id}/assets", "get_flow_assets", payloads.flow_assets),
+    Route("direct_api", "GET", "/flows/{flow_id}/web-preview", "get_flow_web_preview", payloads.flow_preview),
+    Route("direct_api", "GET", "/payment_configurations", "get_payment_configurations",
+          payloads.payment_configurations),
+    Route("direct_api", "GET", "/payment_configuration/{configuration_name}", "get_payment_configuration_by_name",
+          payloads.payment_configuration),
+    # Direct API - POST
+    Route("direct_api", "POST", "/users/regenrate-token", "regenerate_jwt_bearer_token", payloads.token),
+    Route("direct_api", "POST", "/waba-analytics", "get_waba_analytics", payloads.analytics),
+    Route("direct_api", "POST", "/health-status", "get_messaging_health_status", payloads.health_status),
+    Route("direct_api", "POST", "/messages", "send_message", payloads.message_sent),
+    Route("direct_api", "POST", "/marketing_messages", "send_marketing_lite_message", payloads.message_sent),
+    Route("direct_api", "POST", "/mark-read", "mark_message_as_read", payloads.success),
+    Route("direct_api", "POST", "/wa_template", "submit_whatsapp_template_message", payloads.template_created),
+    Route("direct_api", "POST", "/edit-template/{template_id}", "edit_template", payloads.success),
+    Route("direct_api", "POST", "/compare-template/{template_id}", "compare_template", payloads.template_comparison),
+    Route("direct_api", "POST", "/media", "upload_media", payloads.media_id),
+    Route("direct_api", "POST", "/get-media", "retrieve_media_by_id", payloads.media),
+    Route("direct_api", "POST", "/media/session", "create_upload_session", payloads.upload_session_created),
+    Route("direct_api", "POST", "/media/session/{upload_session_id}", "upload_media_to_session",
+          payloads.file_handle),
+    Route("direct_api", "POST", "/catalog", "create_catalog", payloads.created),
+    Route("direct_api", "POST", "/connect-catalog", "connect_catalog", payloads.success),
+    Route("direct_api", "POST", "/product", "create_product", payloads.created),
+    Route("direct_api", "POST", "/whatsapp-commerce-settings", "show_hide_catalog", payloads.success),
+    Route("direct_api", "POST", "/qr-codes", "create_qr_code_and_short_link", payloads.qr_code),
+    Route("direct_api", "POST", "/whatsapp-business-encryption", "set_business_public_key", payloads.success),
+    Route("direct_api", "POST", "/flows", "create_flow", payloads.flow_created),
+    Route("direct_api", "POST", "/flows/{flow_id}/assets", "update_flow_json", payloads.success),
+    Route("direct_api", "POST", "/flows/{flow_id}/publish", "publish_flow", payloads.success),
+    Route("direct_api", "POST", "/flows/{flow_id}/deprecate", "deprecate_flow", payloads.success),
+    Route("direct_api", "POST", "/payment_configuration", "create_payment_configuration",
+          payloads.payment_configuration),
+    Route("direct_api", "POST", "/generate_payment_configuration_oauth_link",
+          "generate_payment_configuration_oauth_link", payloads.oauth_link),
+    # Direct API - DELETE / PATCH
+    Route("direct_api", "DELETE", "/wa_template", "delete_wa_template_by_id", payloads.success),
+    Route("direct_api", "DELETE", "/wa_template/{template_name}", "delete_wa_template_by_name", payloads.success),
+    Route("direct_api", "DELETE", "/media", "delete_media_by_id", payloads.success),
+    Route("direct_api", "DELETE", "/disconnect-catalog", "disconnect_catalog", payloads.success),
+    Route("direct_api", "DELETE", "/flows/{flow_id}", "delete_flow", payloads.success),
+    Route("direct_api", "PATCH", "/update-profile-picture", "update_business_profile_picture", payloads.success),
+    Route("direct_api", "PATCH", "/update-profile", "update_business_profile_details", payloads.success),
+    Route("direct_api", "PATCH", "/qr-codes", "update_qr_code", payloads.qr_code),
+    Route("direct_api", "PATCH", "/flows/{flow_id}", "update_flow_metadata", payloads.success),
+]
+
+
+# ==================== SERVER ====================
+
+class MockAiSensy:
+    """
+    The mock service: routes, profiles and request statistics.
+
+    Use `create_app()` to mount it in an aiohttp application, or
+    `MockAiSensyServer` to run it on a local port.
+    """
+
+    def __init__(self, profile: Optional[MockProfile] = None,
+                 endpoint_profiles: Optional[Dict[str, MockProfile]] = None,
+                 seed: Optional[int] = None, verify_tokens: bool = False):
+        self.profile = profile or MockProfile()
+        self.verify_tokens = verify_tokens
+        self.endpoint_profiles: Dict[str, MockProfile] = dict(endpoint_profiles or {})
+        self.rng = random.Random(seed)
+        self.requests: Counter = Counter()   # endpoint name -> requests received
+        self.responses: Counter = Counter()  # (endpoint name, status) -> responses sent
+        self._buckets: Dict[str, _TokenBucket] = {}
+
+    def profile_for(self, name: str) -> MockProfile:
+        return self.endpoint_profiles.get(name, self.profile)
+
+    def reset_stats(self) -> None:
+        self.requests.clear()
+        self.responses.clear()
+
+    def create_app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        for route in ROUTES:
+            prefix = PARTNER_PREFIX if route.service == "partner" else DIRECT_PREFIX
+            app.router.add_route(route.method, prefix + route.path, self._handler(route))
+        return app
+
+    def _bucket(self, service: str, profile: MockProfile) -> Optional[_TokenBucket]:
+        if profile.rate_limit <= 0:
+            return None
+        bucket = self._buckets.get(service)
+        if bucket is None or bucket.rate != profile.rate_limit:
+            bucket = self._buckets[service] = _TokenBucket(profile.rate_limit, profile.burst)
+        return bucket
+
+    def _handler(self, route: Route):
+        async def handle(request: web.Request) -> web.StreamResponse:
+            self.requests[route.name] += 1
+            response = await self._respond(route, request)
+            self.responses[(route.name, response.status)] += 1
+            return response
+
+        return handle
+
+    async def _respond(self, route: Route, request: web.Request) -> web.StreamResponse:
+        if route.service == "partner":
+            if not request.headers.get(PARTNER_KEY_HEADER):
+                return web.json_response({"message": "Missing partner API key"}, status=401)
+        else:
+            authorization = request.headers.get("Authorization", "")
+            if not authorization.startswith("Bearer "):
+                return web.json_response({"message": "Unauthorized"}, status=401)
+            if (self.verify_tokens and route.name != "regenerate_jwt_bearer_token"
+                    and not payloads.token_is_valid(authorization[len("Bearer "):])):
+                return web.json_response({"message": "Token expired"}, status=401)
+
+        profile = self.profile_for(route.name)
+        bucket = self._bucket(route.service, profile)
+        if bucket is not None:
+            retry_after = bucket.take()
+            if retry_after is not None:
+                return web.json_response({"message": "Too many requests"}, status=429,
+                                         headers={"Retry-After": f"{retry_after:.3f}"})
+
+        delay = profile.latency.sample(self.rng)
+        if profile.stall_rate and self.rng.random() < profile.stall_rate:
+            delay += profile.stall_seconds
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = self.rng.random()
+        if roll < profile.throttle_rate:
+            return web.json_response({"message": "Too many requests"}, status=429,
+                                     headers={"Retry-After": "1"})
+        if roll < profile.throttle_rate + profile.error_rate:
+            status = self.rng.choice((500, 502, 503))
+            return web.json_response({"message": "Injected upstream failure"}, status=status)
+
+        body = {}
+        if request.can_read_body and request.content_type == "application/json":
+            body = await request.json()
+        elif request.can_read_body:
+            await request.read()
+        return web.json_response(route.payload(body=body, **request.match_info))
+
+
+class MockAiSensyServer:
+    """
+    Run `MockAiSensy` on a local port.
+
+        async with MockAiSensyServer(MockProfile(latency=Latency("constant", 20))) as mock:
+            env = mock.settings_env()
+    """
+
+    def __init__(self, profile: Optional[MockProfile] = None,
+                 endpoint_profiles: Optional[Dict[str, MockProfile]] = None,
+                 host: str = "127.0.0.1", port: int = 0, seed: Optional[int] = None,
+                 verify_tokens: bool = False):
+        self.mock = MockAiSensy(profile, endpoint_profiles, seed, verify_tokens)
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def partner_base_url(self) -> str:
+        return self.base_url + PARTNER_PREFIX
+
+    @property
+    def direct_base_url(self) -> str:
+        return self.base_url + DIRECT_PREFIX
+
+    def settings_env(self) -> Dict[str, str]:
+        """Environment variables pointing both servers' clients at this mock."""
+        return {
+            "BASE_URL": self.partner_base_url,
+            "STG_BASE_URL": self.partner_base_url,
+            "Direct_BASE_URL": self.direct_base_url,
+            "PARTNER_ID": payloads.PARTNER_ID,
+            "BUSINESS_ID": payloads.BUSINESS_ID,
+            "AiSensy_API_Key": "mock-partner-key",
+            "AISENSY_BEARER_TOKEN": payloads.make_token(),
+        }
+
+    async def start(self) -> "MockAiSensyServer":
+        self._runner = web.AppRunner(self.mock.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+        return self
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockAiSensyServer":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+
+def profile_from_args(args: argparse.Namespace) -> MockProfile:
+    return MockProfile(
+        latency=Latency.parse(args.latency),
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        stall_rate=args.stall_rate,
+        stall_seconds=args.stall_seconds,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+    )
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", default="constant:0",
+                        help='latency distribution "kind:mean_ms[:spread_ms]"')
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of injected 429s")
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--stall-seconds", type=float, default=30.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="requests/second per service")
+    parser.add_argument("--burst", type=int, default=0)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Mock AiSensy Partner and Direct APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--seed", type=int, default=None)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        async with MockAiSensyServer(profile_from_args(args), host=args.host, port=args.port,
+                                     seed=args.seed) as server:
+            for key, value in server.settings_env().items():
+                print(f"{key}={value}")
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,114 @@
+"""
+WhatsApp Flows data-exchange micro-benchmark.
+
+With a 2048-bit key (the size Meta requires) it times, per request:
+- decrypting the request (RSA-OAEP of the AES key + AES-GCM of the data)
+- encrypting the response (AES-GCM with the flipped IV)
+- the whole exchange: decrypt, dispatch to a screen handler, encrypt
+
+for a typical screen payload and for large ones, and reports the
+requests/second one core sustains (the event loop runs one exchange at a
+time, so that is also the ceiling of one webhook worker).
+
+Run directly for a report:
+    python -m tests.performance.flow_benchmark [--repeat N]
+"""
+import argparse
+import asyncio
+import base64
+import os
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from app.services import flow_service
+from app.services.flow_service import FlowCrypto, FlowHandlers, FlowRequest
+from app.utils import json_backend
+
+
+def private_key_pem(key_size: int = 2048) -> bytes:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    return key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                             serialization.NoEncryption())
+
+
+def encrypted_request(private_pem: bytes, payload: Dict[str, Any]) -> Tuple[Dict[str, str], bytes, bytes]:
+    """(request body, AES key, IV) of `payload` as WhatsApp would send it."""
+    public_key = serialization.load_pem_private_key(private_pem, password=None).public_key()
+    aes_key, iv = AESGCM.generate_key(bit_length=128), os.urandom(16)
+    body = {
+        "encrypted_aes_key": base64.b64encode(public_key.encrypt(aes_key, flow_service._OAEP)).decode(),
+        "encrypted_flow_data": base64.b64encode(
+            AESGCM(aes_key).encrypt(iv, json_backend.dumps_bytes(payload), None)).decode(),
+        "initial_vector": base64.b64encode(iv).decode(),
+    }
+    return body, aes_key, iv
+
+
+def decrypted_response(text: str, aes_key: bytes, iv: bytes) -> Dict[str, Any]:
+    """The payload of a response body, decrypted as WhatsApp would."""
+    flipped = bytes(byte ^ 0xFF for byte in iv)
+    return json_backend.loads(AESGCM(aes_key).decrypt(flipped, base64.b64decode(text), None))
+
+
+def realistic_requests() -> Dict[str, Dict[str, Any]]:
+    appointment = {"department": "cardiology", "location": "1", "date": "2026-01-01", "time": "10:30",
+                   "name": "Asha", "email": "asha@example.com", "phone": "919800000001"}
+    return {
+        "data_exchange (200 B)": appointment,
+        "data_exchange (16 KB)": {**appointment, "notes": "x" * 16_000},
+        "data_exchange (256 KB)": {**appointment, "photo": "x" * 256_000},
+    }
+
+
+def _per_call_us(fn: Callable[[], Any], repeat: int) -> float:
+    number = max(1, repeat)
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def run_benchmark(repeat: int = 200) -> List[Dict[str, Any]]:
+    """Time every step for every payload; returns one row per payload (times in µs)."""
+    pem = private_key_pem()
+    crypto = FlowCrypto(pem)
+    handlers = FlowHandlers()
+    handlers.screen("BENCH")(lambda request: {"screen": "DONE", "data": {"ok": True}})
+    loop = asyncio.new_event_loop()
+    rows = []
+    try:
+        for name, data in realistic_requests().items():
+            payload = FlowRequest("data_exchange", "BENCH", data, "token").__dict__
+            body, aes_key, iv = encrypted_request(pem, payload)
+            response = {"screen": "DONE", "data": {"ok": True}}
+            row = {"payload": name, "bytes": len(body["encrypted_flow_data"])}
+            row["decrypt"] = _per_call_us(lambda: crypto.decrypt_request(body), repeat)
+            row["encrypt"] = _per_call_us(lambda: crypto.encrypt_response(response, aes_key, iv), repeat)
+            row["exchange"] = _per_call_us(
+                lambda: loop.run_until_complete(flow_service.handle_exchange(body, crypto, handlers)), repeat)
+            rows.append(row)
+    finally:
+        loop.close()
+    return rows
+
+
+def format_report(rows: List[Dict[str, Any]]) -> str:
+    columns = ["decrypt", "encrypt", "exchange"]
+    lines = [f"{'payload':<26}{'bytes':>9}" + "".join(f"{c:>12}" for c in columns) + f"{'req/s/core':>14}"]
+    for row in rows:
+        cells = "".join(f"{row[c]:>12.1f}" for c in columns)
+        lines.append(f"{row['payload']:<26}{row['bytes']:>9}{cells}{1e6 / row['exchange']:>14.0f}")
+    lines.append("(times in µs per request)")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200, help="requests per timing run")
+    args = parser.parse_args()
+    print(format_report(run_benchmark(args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
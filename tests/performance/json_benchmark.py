@@ -0,0 +1,107 @@
+"""
+JSON micro-benchmark for the upstream and tool-result paths.
+
+For realistic AiSensy payloads (the mock server's builders, scaled up to
+page sizes seen in production) it times, per call:
+- decoding the upstream body (stdlib json vs orjson)
+- encoding a request/response body (stdlib json vs orjson)
+- turning the tool's dict result into a ToolResult: FastMCP's own
+  conversion vs the pre-serialised result from `json_tool_result()`
+
+Run directly for a report:
+    python -m tests.performance.json_benchmark [--repeat N]
+"""
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict, List
+
+from fastmcp.tools import Tool
+
+from app.api.middleware.serialization import json_tool_result
+from app.utils import json_backend
+from tests.mock_aisensy import payloads
+
+
+def _scaled(builder: Callable[..., Any], key: str, factor: int) -> Dict[str, Any]:
+    """Repeat the list under `key` `factor` times."""
+    data = builder()
+    data[key] = data[key] * factor
+    return data
+
+
+def realistic_payloads() -> Dict[str, Dict[str, Any]]:
+    """Tool results as returned by the clients: {"success": True, "data": <upstream body>}."""
+    bodies = {
+        "business_profiles (200)": {"data": payloads.all_business_profiles() * 40},
+        "templates (250)": _scaled(payloads.templates, "data", 10),
+        "products (500)": _scaled(payloads.products, "data", 25),
+        "billing_records (400)": _scaled(payloads.billing_records, "data", 20),
+        "wcc_usage (90 days)": _scaled(payloads.wcc_usage_analytics, "wccAnalytics", 3),
+        "send_message (1)": payloads.message_sent(body={"to": "919999999999"}),
+    }
+    return {name: {"success": True, "data": body} for name, body in bodies.items()}
+
+
+def _tool_for(result: Dict[str, Any]) -> Tool:
+    async def tool_fn() -> Dict[str, Any]:
+        return result
+    return Tool.from_function(tool_fn, name="bench")
+
+
+def _per_call_us(fn: Callable[[], Any], repeat: int) -> float:
+    number = max(1, repeat)
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def run_benchmark(repeat: int = 200) -> List[Dict[str, Any]]:
+    """Time every path for every payload; returns one row per payload (times in µs)."""
+    previous = json_backend.backend_name
+    rows = []
+    try:
+        for name, result in realistic_payloads().items():
+            body = json.dumps(result["data"]).encode("utf-8")
+            tool = _tool_for(result)
+            row = {"payload": name, "bytes": len(body)}
+
+            for backend in ("stdlib", "orjson"):
+                if json_backend.set_backend(backend) != backend:
+                    continue
+                row[f"decode_{backend}"] = _per_call_us(lambda: json_backend.loads(body), repeat)
+                row[f"encode_{backend}"] = _per_call_us(lambda: json_backend.dumps(result), repeat)
+
+            json_backend.set_backend(previous)
+            row["result_fastmcp"] = _per_call_us(lambda: tool.convert_result(result), repeat)
+            row["result_fast"] = _per_call_us(lambda: json_tool_result(result), repeat)
+            rows.append(row)
+    finally:
+        json_backend.set_backend(previous)
+    return rows
+
+
+def format_report(rows: List[Dict[str, Any]]) -> str:
+    columns = ["decode_stdlib", "decode_orjson", "encode_stdlib", "encode_orjson",
+               "result_fastmcp", "result_fast"]
+    lines = [f"{'payload':<24}{'bytes':>9}" + "".join(f"{c:>16}" for c in columns)
+             + f"{'saved/call':>14}"]
+    for row in rows:
+        cells = "".join(
+            f"{row[c]:>16.1f}" if c in row else f"{'-':>16}" for c in columns
+        )
+        # One call decodes the upstream body and converts the tool result.
+        before = row.get("decode_stdlib", 0.0) + row["result_fastmcp"]
+        after = row.get("decode_orjson", row.get("decode_stdlib", 0.0)) + row["result_fast"]
+        lines.append(f"{row['payload']:<24}{row['bytes']:>9}{cells}{before - after:>11.1f} µs")
+    lines.append("(times in µs per call)")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200, help="calls per timing run")
+    args = parser.parse_args()
+    print(format_report(run_benchmark(args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""
+Load-test harness for the MCP servers against the local AiSensy mock.
+
+Starts `tests.mock_aisensy` with the requested latency/error profile, points
+a server at it, and drives a weighted tool mix over the chosen transport
+(stdio, http or in-memory) at fixed concurrency. Reports throughput and
+p50/p95/p99 latency overall and per tool.
+
+Run directly:
+    python -m tests.performance.load_test --server direct_api --transport stdio \\
+        --concurrency 32 --requests 2000 --latency lognormal:80:40 --error-rate 0.01
+
+This is the baseline every performance change is compared against; use
+--json to keep a report for comparison.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tests.mock_aisensy.server import (MockAiSensyServer, MockProfile, add_profile_arguments,
+                                       profile_from_args)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MCP_SERVERS_DIR = REPO_ROOT / "mcp_servers"
+
+SERVERS = {
+    "onboarding": {"package": "boarding_mcp", "script": "mcp_servers/onboardserver.py"},
+    "direct_api": {"package": "direct_api_mcp", "script": "mcp_servers/direct_api_server.py"},
+}
+
+# (tool, arguments, weight): a read-heavy mix with some sends
+WORKLOADS: Dict[str, List[Tuple[str, Dict[str, Any], int]]] = {
+    "direct_api": [
+        ("get_business_info", {}, 10),
+        ("get_templates", {}, 15),
+        ("get_template_by_id", {"template_id": "1000000007"}, 15),
+        ("get_profile", {}, 10),
+        ("get_phone_numbers", {}, 10),
+        ("get_flows", {}, 5),
+        ("get_messaging_health_status", {"node_id": "106540352242922"}, 5),
+        ("send_message", {"to": "919999999999", "text_body": "load test"}, 30),
+    ],
+    "onboarding": [
+        ("get_partner_details", {}, 20),
+        ("get_business_profile_by_id", {}, 15),
+        ("get_all_business_profiles", {}, 10),
+        ("get_project_by_id", {"project_id": "mock-project"}, 20),
+        ("get_billing_records", {"project_id": "mock-project"}, 10),
+        ("get_wcc_usage_analytics", {"project_id": "mock-project"}, 10),
+        ("get_business_verification_status", {"project_id": "mock-project"}, 15),
+    ],
+}
+
+
+# ==================== REPORT ====================
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class LatencyStats:
+    requests: int = 0
+    errors: int = 0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples: List[Tuple[float, bool]]) -> "LatencyStats":
+        latencies = sorted(s for s, _ in samples)
+        return cls(
+            requests=len(samples),
+            errors=sum(1 for _, ok in samples if not ok),
+            p50_ms=percentile(latencies, 50) * 1000,
+            p95_ms=percentile(latencies, 95) * 1000,
+            p99_ms=percentile(latencies, 99) * 1000,
+            max_ms=(latencies[-1] * 1000) if latencies else 0.0,
+        )
+
+
+@dataclass
+class LoadReport:
+    server: str
+    transport: str
+    concurrency: int
+    duration_s: float
+    throughput_rps: float
+    overall: LatencyStats
+    per_tool: Dict[str, LatencyStats] = field(default_factory=dict)
+    upstream_requests: Dict[str, int] = field(default_factory=dict)
+
+    def format(self) -> str:
+        lines = [
+            f"{self.server} over {self.transport}, concurrency {self.concurrency}: "
+            f"{self.overall.requests} calls in {self.duration_s:.2f}s = {self.throughput_rps:.1f} calls/s, "
+            f"{self.overall.errors} errors",
+            f"  {'tool':<36}{'calls':>7}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}",
+        ]
+        for name, stats in sorted(self.per_tool.items()) + [("ALL", self.overall)]:
+            lines.append(f"  {name:<36}{stats.requests:>7}{stats.errors:>8}"
+                         f"{stats.p50_ms:>9.1f}{stats.p95_ms:>9.1f}{stats.p99_ms:>9.1f}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ==================== SERVER ENVIRONMENT ====================
+
+def server_env(mock: MockAiSensyServer, log_level: str = "WARNING") -> Dict[str, str]:
+    """Environment for a server process: mock URLs plus placeholders for unused settings."""
+    from app.config.settings import Settings
+
+    env = {}
+    for name, info in Settings.model_fields.items():
+        # Settings validates defaults, so `x: int = None` fields need a value too
+        if info.is_required() or info.default is None:
+            env[name] = "0" if info.annotation in (int, float) else "load-test"
+    env.update(mock.settings_env())
+    env.update({"log_level": log_level, "LOG_DIR": "logs"})
+    return env
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+_HTTP_SERVER = """
+import sys
+sys.path[:0] = [{servers_dir!r}, {repo_root!r}]
+from {package} import mcp
+mcp.run(transport="http", host="127.0.0.1", port={port}, show_banner=False)
+"""
+
+
+class _ServerConnection:
+    """Async context manager yielding a connected fastmcp Client for one transport."""
+
+    def __init__(self, server: str, transport: str, env: Dict[str, str]):
+        self.server = server
+        self.transport = transport
+        self.env = env
+        self.workdir = tempfile.mkdtemp(prefix="mcp-load-")   # keeps logs/ out of the repo
+        self._process: Optional[subprocess.Popen] = None
+        self._client = None
+        self._saved_env: Dict[str, Optional[str]] = {}
+
+    def _process_env(self) -> Dict[str, str]:
+        pythonpath = os.pathsep.join(p for p in (str(REPO_ROOT), os.environ.get("PYTHONPATH", "")) if p)
+        return {**os.environ, **self.env, "PYTHONPATH": pythonpath}
+
+    async def __aenter__(self):
+        from fastmcp.client import Client
+
+        if self.transport == "stdio":
+            from fastmcp.client.transports import PythonStdioTransport
+            target = PythonStdioTransport(REPO_ROOT / SERVERS[self.server]["script"],
+                                          env=self._process_env(), cwd=self.workdir,
+                                          python_cmd=sys.executable)
+        elif self.transport == "http":
+            port = _free_port()
+            code = _HTTP_SERVER.format(servers_dir=str(MCP_SERVERS_DIR), repo_root=str(REPO_ROOT),
+                                       package=SERVERS[self.server]["package"], port=port)
+            self._process = subprocess.Popen([sys.executable, "-c", code], env=self._process_env(),
+                                             cwd=self.workdir, stdout=subprocess.DEVNULL,
+                                             stderr=subprocess.DEVNULL)
+            await self._wait_for_port(port)
+            target = f"http://127.0.0.1:{port}/mcp"
+        elif self.transport == "memory":
+            target = self._load_in_process()
+        else:
+            raise ValueError(f"Unknown transport: {self.transport}")
+
+        self._client = Client(target)
+        await self._client.__aenter__()
+        return self._client
+
+    def _load_in_process(self):
+        """Configure settings through the environment and import the server in-process."""
+        from importlib import import_module
+
+        from app.config.settings import get_settings
+
+        for key, value in self.env.items():
+            self._saved_env[key] = os.environ.get(key)
+            os.environ[key] = value
+        get_settings.cache_clear()
+        if str(MCP_SERVERS_DIR) not in sys.path:
+            sys.path.insert(0, str(MCP_SERVERS_DIR))
+        return import_module(SERVERS[self.server]["package"]).mcp
+
+    async def _wait_for_port(self, port: int, timeout: float = 30.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"{self.server} server exited with {self._process.returncode}")
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.close()
+                return
+            except OSError:
+                await asyncio.sleep(0.1)
+        raise TimeoutError(f"{self.server} server did not listen on port {port}")
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._client is not None:
+            await self._client.__aexit__(exc_type, exc_val, exc_tb)
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait(timeout=10)
+        for key, value in self._saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+# ==================== LOAD GENERATION ====================
+
+def _call_succeeded(result) -> bool:
+    if getattr(result, "is_error", False):
+        return False
+    structured = getattr(result, "structured_content", None)
+    if isinstance(structured, dict):
+        inner = structured.get("result", structured)
+        return not (isinstance(inner, dict) and inner.get("success") is False)
+    return True
+
+
+async def drive(client, workload: List[Tuple[str, Dict[str, Any], int]], concurrency: int,
+                total_requests: int, seed: Optional[int] = None) -> Tuple[Dict[str, List], float]:
+    """Issue `total_requests` weighted tool calls from `concurrency` workers."""
+    rng = random.Random(seed)
+    names = [w[0] for w in workload]
+    weights = [w[2] for w in workload]
+    arguments = {w[0]: w[1] for w in workload}
+    plan = rng.choices(names, weights=weights, k=total_requests)
+    samples: Dict[str, List[Tuple[float, bool]]] = {name: [] for name in names}
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index
+        while next_index < len(plan):
+            tool = plan[next_index]
+            next_index += 1
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(tool, arguments[tool], raise_on_error=False)
+                ok = _call_succeeded(result)
+            except Exception:
+                ok = False
+            samples[tool].append((time.perf_counter() - start, ok))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - start
+
+
+async def run_load_test(server: str = "direct_api", transport: str = "stdio", concurrency: int = 16,
+                        total_requests: int = 500, profile: Optional[MockProfile] = None,
+                        warmup_requests: int = 20, seed: Optional[int] = 0,
+                        log_level: str = "WARNING") -> LoadReport:
+    """Start the mock, connect to `server` over `transport` and run one load test."""
+    workload = WORKLOADS[server]
+    async with MockAiSensyServer(profile or MockProfile(), seed=seed) as mock:
+        async with _ServerConnection(server, transport, server_env(mock, log_level)) as client:
+            if warmup_requests:
+                await drive(client, workload, min(concurrency, warmup_requests), warmup_requests, seed)
+            mock.mock.reset_stats()
+            samples, duration = await drive(client, workload, concurrency, total_requests, seed)
+
+        all_samples = [s for tool_samples in samples.values() for s in tool_samples]
+        return LoadReport(
+            server=server,
+            transport=transport,
+            concurrency=concurrency,
+            duration_s=duration,
+            throughput_rps=len(all_samples) / duration if duration else 0.0,
+            overall=LatencyStats.from_samples(all_samples),
+            per_tool={tool: LatencyStats.from_samples(s) for tool, s in samples.items() if s},
+            upstream_requests=dict(mock.mock.requests),
+        )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the MCP servers against the AiSensy mock")
+    parser.add_argument("--server", choices=sorted(SERVERS), default="direct_api")
+    parser.add_argument("--transport", choices=("stdio", "http", "memory"), default="stdio")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="write the report as JSON to this path")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_load_test(
+        server=args.server,
+        transport=args.transport,
+        concurrency=args.concurrency,
+        total_requests=args.requests,
+        profile=profile_from_args(args),
+        warmup_requests=args.warmup,
+        seed=args.seed,
+    ))
+    print(report.format())
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
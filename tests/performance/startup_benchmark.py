@@ -0,0 +1,108 @@
+"""
+Startup benchmark for the MCP servers.
+
+Measures, in fresh interpreters:
+- import time of each server package (until the FastMCP server has every tool registered),
+  excluding fastmcp itself, whose import cost depends on the installed version
+- time to first response: spawning the server over stdio until `list_tools` answers
+
+Run directly for a report:
+    python -m tests.performance.startup_benchmark
+"""
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MCP_SERVERS_DIR = REPO_ROOT / "mcp_servers"
+
+SERVERS = {
+    "onboarding": {"package": "boarding_mcp", "script": "mcp_servers/onboardserver.py"},
+    "direct_api": {"package": "direct_api_mcp", "script": "mcp_servers/direct_api_server.py"},
+}
+
+# Modules that must not be imported just to start a server.
+HEAVY_MODULES = ("sqlalchemy", "sqlmodel", "psycopg", "psycopg2", "aiohttp", "fastapi")
+
+_IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, {servers_dir!r})
+sys.path.insert(0, {repo_root!r})
+start = time.perf_counter()
+import fastmcp.server.server
+fastmcp_elapsed = time.perf_counter() - start
+start = time.perf_counter()
+from {package} import mcp
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "fastmcp_seconds": fastmcp_elapsed,
+    "modules": sorted(m for m in sys.modules if m.split(".")[0] in {heavy!r}),
+}}))
+"""
+
+
+def measure_import(server: str) -> dict:
+    """Import one server package in a fresh interpreter and report the cost."""
+    probe = _IMPORT_PROBE.format(
+        servers_dir=str(MCP_SERVERS_DIR),
+        repo_root=str(REPO_ROOT),
+        package=SERVERS[server]["package"],
+        heavy=HEAVY_MODULES,
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def median_import_seconds(server: str, runs: int = 5) -> float:
+    return statistics.median(measure_import(server)["seconds"] for _ in range(runs))
+
+
+async def measure_first_response(server: str) -> float:
+    """Seconds from spawning the server until its first response (`list_tools`)."""
+    from fastmcp.client import Client
+    from fastmcp.client.transports import PythonStdioTransport
+
+    # The servers import `app` from the repository root, as in a deployment
+    # that runs them with the project on PYTHONPATH.
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(
+        p for p in (str(REPO_ROOT), os.environ.get("PYTHONPATH", "")) if p
+    )}
+    transport = PythonStdioTransport(
+        REPO_ROOT / SERVERS[server]["script"],
+        env=env,
+        cwd=str(REPO_ROOT),
+        python_cmd=sys.executable,
+    )
+    start = time.perf_counter()
+    async with Client(transport) as client:
+        await client.list_tools()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    os.chdir(REPO_ROOT)
+    for server in SERVERS:
+        imported = measure_import(server)
+        print(f"{server}: import median {median_import_seconds(server):.3f}s, "
+              f"heavy modules loaded: {imported['modules'] or 'none'}")
+        try:
+            first = asyncio.run(measure_first_response(server))
+            print(f"{server}: time to first response {first:.3f}s")
+        except Exception as e:  # server needs a configured .env to answer
+            print(f"{server}: time to first response unavailable ({e})")
+
+
+if __name__ == "__main__":
+    main()
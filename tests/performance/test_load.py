@@ -0,0 +1,26 @@
+"""
+Smoke run of the load-test harness against the local AiSensy mock.
+
+Full runs are made with `python -m tests.performance.load_test`; this only
+checks that both servers answer every tool in their workload through the mock.
+"""
+import pytest
+
+pytest.importorskip("fastmcp")
+pytest.importorskip("aiohttp")
+
+from .load_test import SERVERS, WORKLOADS, run_load_test  # noqa: E402
+
+
+@pytest.mark.parametrize("server", sorted(SERVERS))
+@pytest.mark.asyncio
+async def test_load_harness_runs_workload_without_errors(server: str):
+    report = await run_load_test(server=server, transport="stdio", concurrency=4,
+                                 total_requests=40, warmup_requests=5)
+
+    assert report.overall.requests == 40
+    assert report.overall.errors == 0
+    assert report.overall.p50_ms <= report.overall.p95_ms <= report.overall.p99_ms
+    # Cached lookups (app.services.response_cache) are mostly answered locally
+    assert sum(report.upstream_requests.values()) > 0
+    assert set(report.per_tool) <= {tool for tool, _, _ in WORKLOADS[server]}
@@ -0,0 +1,34 @@
+"""
+Startup regression budget for both MCP servers.
+
+Budgets can be overridden per machine with the environment variables
+STARTUP_IMPORT_BUDGET_S and STARTUP_FIRST_RESPONSE_BUDGET_S.
+"""
+import os
+
+import pytest
+
+from .startup_benchmark import (SERVERS, measure_import, median_import_seconds,
+                                measure_first_response)
+
+pytest.importorskip("fastmcp")
+
+IMPORT_BUDGET_S = float(os.getenv("STARTUP_IMPORT_BUDGET_S", "1.5"))
+FIRST_RESPONSE_BUDGET_S = float(os.getenv("STARTUP_FIRST_RESPONSE_BUDGET_S", "4.0"))
+
+
+@pytest.mark.parametrize("server", sorted(SERVERS))
+def test_server_import_skips_heavy_modules(server: str):
+    """Starting a server must not import the database stack or aiohttp."""
+    assert measure_import(server)["modules"] == []
+
+
+@pytest.mark.parametrize("server", sorted(SERVERS))
+def test_server_import_time_within_budget(server: str):
+    assert median_import_seconds(server) < IMPORT_BUDGET_S
+
+
+@pytest.mark.parametrize("server", sorted(SERVERS))
+@pytest.mark.asyncio
+async def test_time_to_first_response_within_budget(server: str):
+    assert await measure_first_response(server) < FIRST_RESPONSE_BUDGET_S
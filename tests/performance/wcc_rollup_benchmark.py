@@ -0,0 +1,114 @@
+"""
+Partner-wide WCC usage rollup benchmark.
+
+Simulates a partner with many projects, each answering
+get_wcc_usage_analytics with a year of daily usage after a fixed upstream
+latency, and times (app.services.wcc_rollup):
+
+- a cold report of last month: every project fetched, closed months cached
+- the same report again: closed months from the disk cache, no fetches
+- a report of the open current month: every project fetched again
+- a year grouped by project, exported as CSV (and Parquet with pyarrow)
+
+Run directly for a report:
+
+    python -m tests.performance.wcc_rollup_benchmark [--projects N] [--latency S] [--concurrency N]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from app.services import wcc_rollup
+from app.services.wcc_rollup import WccRollup, WccUsageCache, export_table
+
+NOW = datetime(2024, 6, 10, tzinfo=timezone.utc)
+
+
+def usage_days(days: int = 365) -> List[Dict[str, Any]]:
+    """Daily wccAnalytics records of one project up to NOW."""
+    first = NOW.date() - timedelta(days=days - 1)
+    records = []
+    for offset in range(days):
+        day: date = first + timedelta(days=offset)
+        records.append({
+            "dayDate": day.isoformat(), "totalChatCount": 120, "sentChatCount": 118,
+            "deliveredChatCount": 115, "readChatCount": 90, "failedChatCount": 3,
+            "centralBalanceUsedCount": 42.5, "centralBalanceMessagesCount": 50,
+            "templateMessagesCount": 50, "freeTierCount": 10,
+            "mcCentralBalanceMetrics": {"count": 30, "creditUsage": 30.0},
+            "ucCentralBalanceMetrics": {"count": 20, "creditUsage": 12.5},
+        })
+    return records
+
+
+class SimulatedPartner:
+    def __init__(self, projects: int, latency: float):
+        self.project_count = projects
+        self.latency = latency
+        self.days = usage_days()
+        self.calls = 0
+
+    def tenants(self):
+        return ["bench"]
+
+    async def projects(self, tenant, slots):
+        async with slots:
+            await asyncio.sleep(self.latency)
+        return [{"id": f"prj-{i:05d}", "business_id": f"biz-{i % 25}"} for i in range(self.project_count)]
+
+    async def wcc_usage(self, tenant, project_id):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return self.days
+
+
+def run_benchmark(projects: int = 500, latency: float = 0.15, concurrency: int = 16) -> List[Dict[str, Any]]:
+    """One row per scenario: seconds, upstream calls and result rows."""
+    source = SimulatedPartner(projects, latency)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        engine = WccRollup(source, WccUsageCache(directory), concurrency=concurrency, clock=NOW.timestamp)
+
+        def timed(name: str, **kwargs) -> Any:
+            calls, start = source.calls, time.perf_counter()
+            table, _ = asyncio.run(engine.report(**kwargs))
+            rows.append({"scenario": name, "seconds": time.perf_counter() - start,
+                         "calls": source.calls - calls, "rows": len(table)})
+            return table
+
+        timed("last month, cold", start_month="2024-05", end_month="2024-05")
+        timed("last month, cached", start_month="2024-05", end_month="2024-05")
+        timed("current month (open)")
+        table = timed("12 months by project, cached", start_month="2023-06", end_month="2024-05",
+                      group_by=["project"])
+
+        formats = ["csv"] + (["parquet", "arrow"] if wcc_rollup._pyarrow() is not None else [])
+        for export_format in formats:
+            start = time.perf_counter()
+            written = export_table(table, f"{directory}/usage", export_format)
+            rows.append({"scenario": f"export {export_format} ({written['bytes'] // 1024} KB)",
+                         "seconds": time.perf_counter() - start, "calls": 0, "rows": written["rows"]})
+    return rows
+
+
+def format_report(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'scenario':<34}{'seconds':>10}{'calls':>8}{'rows':>8}"]
+    for row in rows:
+        lines.append(f"{row['scenario']:<34}{row['seconds']:>10.3f}{row['calls']:>8}{row['rows']:>8}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=500, help="projects of the simulated partner")
+    parser.add_argument("--latency", type=float, default=0.15, help="upstream latency per call (seconds)")
+    parser.add_argument("--concurrency", type=int, default=16, help="WCC_ROLLUP_CONCURRENCY")
+    args = parser.parse_args()
+    print(format_report(run_benchmark(args.projects, args.latency, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Unit tests for the billing records sync (app.services.billing_sync) and
+BillingRecordRepository.
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.billing_sync import BillingSync, billing_row, parse_timestamp
+from app.services.scheduling import BULK, current_priority
+
+
+def _record(project_id, day, action="SUBTRACT", amount=100):
+    return {"_id": f"{project_id}-{day}-{action}", "partnerId": "partner-1", "clientId": "biz-1",
+            "assistantId": project_id, "action": action, "amount": amount, "reasonCode": "PLAN_RENEWED",
+            "createdAt": f"2024-0{1 + day // 30}-{1 + day % 30:02d}T10:00:00.000Z"}
+
+
+class PartnerSource:
+    """Two tenants; one project fails, another is listed by both tenants."""
+
+    def __init__(self):
+        self.records = {f"prj-{i}": [_record(f"prj-{i}", day) for day in range(40)] for i in range(6)}
+        self.failing = {"prj-5"}
+        self.calls = []
+        self.in_flight = self.peak = 0
+        self.priorities = set()
+
+    def tenants(self):
+        return ["acme", "globex"]
+
+    async def _request(self):
+        self.priorities.add(current_priority())
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def projects(self, tenant, slots):
+        async with slots:
+            await self._request()
+        ids = ["prj-0", "prj-1", "prj-2"] if tenant == "acme" else ["prj-2", "prj-3", "prj-4", "prj-5"]
+        return [{"id": project_id, "business_id": f"biz-{tenant}", "currency": "INR"} for project_id in ids]
+
+    async def billing_records(self, tenant, project_id):
+        self.calls.append(project_id)
+        await self._request()
+        if project_id in self.failing:
+            raise RuntimeError("Request timeout")
+        return [dict(record) for record in self.records[project_id]]
+
+
+class MemoryStore:
+    def __init__(self):
+        self.rows = {}
+        self.batches = []
+
+    def high_water_marks(self):
+        marks = {}
+        for row in self.rows.values():
+            marks[row["project_id"]] = max(marks.get(row["project_id"], row["created_at"]), row["created_at"])
+        return marks
+
+    def upsert(self, rows):
+        self.batches.append(len(rows))
+        self.rows.update((row["id"], row) for row in rows)
+        return len(rows)
+
+
+def test_billing_row():
+    row = billing_row(_record("prj-0", 35, "add", "12.5"), {"id": "prj-0", "currency": "INR"})
+    assert (row["id"], row["action"], row["amount"], row["currency"], row["month"]) == \
+        ("prj-0-35-add", "ADD", 12.5, "INR", "2024-02")
+    assert row["created_at"] == datetime(2024, 2, 6, 10, 0, tzinfo=timezone.utc) and row["business_id"] == "biz-1"
+    assert billing_row({"amount": 1}, {"id": "prj-0"}) is None
+    assert parse_timestamp(1714557600000) == datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+    assert parse_timestamp("2024-05-01") == parse_timestamp("2024-05-01T05:30:00+05:30")
+
+
+def test_sync_is_concurrent_and_incremental():
+    source, store = PartnerSource(), MemoryStore()
+    sync = BillingSync(source, store, concurrency=3)
+
+    first = asyncio.run(sync.sync())
+    assert 1 < source.peak <= 3 and source.priorities == {BULK}
+    assert sorted(source.calls) == [f"prj-{i}" for i in range(6)]     # prj-2 fetched once
+    assert (first["projects"], first["records_fetched"], first["records_stored"]) == (6, 200, 200)
+    assert first["outcome"] == "partial" and "Request timeout" in first["errors"]["prj-5"]
+
+    # Only the record on each mark and newer ones are written again
+    source.records["prj-0"].append(_record("prj-0", 45))
+    source.failing.clear()
+    second = asyncio.run(sync.sync())
+    assert (second["records_fetched"], second["records_stored"]) == (241, 2 + 4 + 40)
+    assert second["outcome"] == "ok" and len(store.rows) == 241
+    assert sync.last_sync is second
+
+
+def test_sync_stores_a_repeated_record_once():
+    source, store = PartnerSource(), MemoryStore()
+    source.failing.clear()
+    repeated = dict(source.records["prj-0"][0], amount=150)
+    source.records["prj-0"].append(repeated)
+    source.records["prj-1"].append(dict(repeated))
+    sync = BillingSync(source, store)
+
+    result = asyncio.run(sync.sync())
+    assert (result["records_fetched"], result["records_stored"]) == (242, 240)
+    assert sum(store.batches) == len(store.rows) == 240
+    assert store.rows[repeated["_id"]]["amount"] == 150
+
+
+def test_concurrent_syncs_share_one_run():
+    source, store = PartnerSource(), MemoryStore()
+    sync = BillingSync(source, store)
+
+    async def scenario():
+        return await asyncio.gather(sync.sync(), sync.sync())
+
+    first, second = asyncio.run(scenario())
+    assert first is second and len(source.calls) == 6
+
+
+def test_partner_source_lists_projects_within_the_slots(monkeypatch):
+    from mcp_servers.boarding_mcp.billing_sync import PartnerBillingSource
+
+    state = {"in_flight": 0, "peak": 0}
+
+    async def call(tenant_id, method, **kwargs):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        if method == "get_all_business_profiles":
+            return [{"id": f"biz-{i}", "currency": "INR"} for i in range(12)]
+        return [{"id": f"prj-{kwargs['business_id']}"}]
+
+    monkeypatch.setattr(PartnerBillingSource, "_call", staticmethod(call))
+
+    async def scenario():
+        return await PartnerBillingSource().projects("acme", asyncio.Semaphore(3))
+
+    projects = asyncio.run(scenario())
+    assert len(projects) == 12 and projects[0] == {"id": "prj-biz-0", "business_id": "biz-0", "currency": "INR"}
+    assert state["peak"] == 3
+
+
+def test_repository_on_sqlite():
+    pytest.importorskip("fastapi")
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.database.postgresql.models import BillingRecord
+    from app.database.postgresql.postgresql_repositories import BillingRecordRepository
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[BillingRecord.__table__])
+    rows = [billing_row(_record("prj-0", day), {"id": "prj-0", "currency": "INR"}) for day in range(40)]
+    rows += [billing_row(_record("prj-1", 0, "ADD", 500), {"id": "prj-1", "currency": "USD"})]
+    with Session(engine) as session:
+        repo = BillingRecordRepository(session=session)
+        repo.upsert(rows)
+        rows[0]["amount"] = 150.0
+        repo.upsert(rows[:1])                       # re-synced record is updated, not duplicated
+
+        marks = {project_id: parse_timestamp(mark) for project_id, mark in repo.high_water_marks().items()}
+        assert marks == {"prj-0": parse_timestamp("2024-02-10T10:00:00Z"),
+                         "prj-1": parse_timestamp("2024-01-01T10:00:00Z")}
+        by_month = repo.spend(group_by=["month"])
+        assert [(r["month"], r["currency"], r["spend"], r["credits"], r["records"]) for r in by_month] == [
+            ("2024-01", "INR", 3050.0, 0, 30), ("2024-01", "USD", 0, 500.0, 1), ("2024-02", "INR", 1000.0, 0, 10)]
+        assert repo.spend(since=parse_timestamp("2024-02-01"), project_id="prj-0")[0]["records"] == 10
+        with pytest.raises(ValueError):
+            repo.spend(group_by=["planet"])
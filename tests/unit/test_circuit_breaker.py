@@ -0,0 +1,118 @@
+"""
+Unit tests for the per-endpoint circuit breakers in app.services.circuit_breaker.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from app.services.circuit_breaker import (CLOSED, HALF_OPEN, OPEN, BreakerConfig,  # noqa: E402
+                                          CircuitBreaker, CircuitOpenError, circuit_breakers)
+from app.services.endpoints import endpoint_group  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from tests.mock_aisensy import MockAiSensyServer, MockProfile  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+CONFIG = BreakerConfig(window_seconds=10, minimum_calls=4, error_rate=0.5,
+                       slow_call_seconds=1.0, slow_call_rate=0.5, open_seconds=5)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(clock):
+    return CircuitBreaker("direct_api", "test", CONFIG, clock=clock)
+
+
+def test_endpoint_groups():
+    assert endpoint_group("get_flow_assets") == "flows"
+    assert endpoint_group("get_template_by_id") == "templates"
+    assert endpoint_group("get_catalog_products") == "catalog"
+    assert endpoint_group("get_business_info") == "account"
+
+
+def test_breaker_opens_on_error_rate_and_probes_half_open():
+    clock = _Clock()
+    breaker = _breaker(clock)
+
+    for failed in (False, True, False):
+        breaker.before_call()
+        breaker.record(failed, elapsed=0.1)
+    assert breaker.state == CLOSED  # below minimum_calls
+    breaker.before_call()
+    breaker.record(True, elapsed=0.1)
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError, match="'test' endpoints are failing"):
+        breaker.before_call()
+
+    clock.now = 6
+    breaker.before_call()  # the probe
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one probe at a time
+    breaker.record(True, elapsed=0.1)
+    assert breaker.state == OPEN
+
+    clock.now = 12
+    breaker.before_call()
+    breaker.release()  # a cancelled probe frees its slot
+    breaker.before_call()
+    breaker.record(False, elapsed=0.1)
+    assert breaker.state == CLOSED
+
+
+def test_breaker_opens_on_slow_calls_and_forgets_old_ones():
+    clock = _Clock()
+    breaker = _breaker(clock)
+
+    for _ in range(3):
+        breaker.record(False, elapsed=2.0)
+    clock.now = 11  # the slow calls leave the window
+    for _ in range(3):
+        breaker.record(False, elapsed=0.1)
+    assert breaker.state == CLOSED
+
+    for _ in range(3):
+        breaker.record(False, elapsed=2.0)
+    assert breaker.state == OPEN
+
+
+def test_sick_endpoint_group_does_not_affect_others(caplog):
+    circuit_breakers.reset(BreakerConfig(minimum_calls=3, open_seconds=0.2))
+
+    async def scenario():
+        async with MockAiSensyServer(endpoint_profiles={"get_flows": MockProfile(error_rate=1.0)}) as mock:
+            client = AiSensyDirectApiGetClient(_token=make_token(), BASE_URL=mock.direct_base_url)
+            try:
+                failing = [await client.get_flows() for _ in range(5)]
+                templates = await client.get_templates()
+                sent_while_open = mock.mock.requests["get_flows"]
+
+                mock.mock.endpoint_profiles["get_flows"] = MockProfile()
+                await asyncio.sleep(0.25)
+                recovered = await client.get_flows()
+            finally:
+                await client.close()
+            state = circuit_breakers.get("direct_api", "flows").state
+            return failing, templates, sent_while_open, (recovered, state)
+
+    try:
+        failing, templates, sent, recovered = asyncio.run(scenario())
+    finally:
+        circuit_breakers.reset()
+
+    assert not any(result["success"] for result in failing)
+    assert sent == 3  # the last two calls failed fast
+    assert "circuit open" in failing[-1]["error"]
+    rejected = [r for r in caplog.records if "rejected" in r.getMessage()]
+    assert len(rejected) == 2 and {r.levelname for r in rejected} == {"WARNING"}
+    assert not any(r.exc_info for r in caplog.records)   # fast fails log no traceback
+    assert templates["success"]
+    assert recovered[0]["success"] and recovered[1] == CLOSED
@@ -0,0 +1,126 @@
+"""
+Unit tests for the adaptive concurrency limiters in app.services.concurrency.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from app.services.concurrency import (AdaptiveLimiter, LimiterConfig,  # noqa: E402
+                                      concurrency_limiters)
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from tests.mock_aisensy import MockAiSensyServer, MockProfile  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter(clock, **overrides):
+    config = LimiterConfig(**{"initial_limit": 4, "min_limit": 2, "max_limit": 16,
+                              "interactive_reserve": 0, **overrides})
+    return AdaptiveLimiter("test", config, clock=clock)
+
+
+def test_limit_grows_while_latency_is_flat_and_backs_off_on_overload():
+    async def scenario():
+        clock = _Clock()
+        limiter = _limiter(clock)
+        for _ in range(4):
+            await limiter.acquire()
+        for _ in range(4):
+            limiter.release(rtt=0.1, in_flight=4)
+        assert limiter.limit == 8  # slow start: +1 per success
+
+        for _ in range(3):
+            await limiter.acquire()
+        for _ in range(3):
+            limiter.release(dropped=True)
+        # One decrease per round trip, not one per failed call in flight
+        assert limiter.limit == pytest.approx(8 * 0.7) and not limiter.slow_start
+
+        clock.now = 1
+        await limiter.acquire()
+        limiter.release(dropped=True)
+        assert limiter.limit == pytest.approx(8 * 0.7 * 0.7)
+        for _ in range(5):
+            clock.now += 1
+            await limiter.acquire()
+            limiter.release(dropped=True)
+        assert limiter.limit == 2  # min_limit
+
+    asyncio.run(scenario())
+
+
+def test_latency_inflation_backs_off():
+    async def scenario():
+        clock = _Clock()
+        limiter = _limiter(clock, initial_limit=8)
+        for _ in range(20):
+            await limiter.acquire()
+            limiter.release(rtt=0.05, in_flight=int(limiter.limit))
+        grown = limiter.limit
+        for _ in range(10):
+            clock.now += 1
+            await limiter.acquire()
+            limiter.release(rtt=0.5, in_flight=int(limiter.limit))
+        return grown, limiter.limit
+
+    grown, inflated = asyncio.run(scenario())
+    assert grown > 8
+    assert inflated < grown
+
+
+def test_requests_over_the_limit_wait_in_order():
+    async def scenario():
+        limiter = _limiter(_Clock(), initial_limit=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        order = []
+
+        async def waiter(name):
+            await limiter.acquire()
+            order.append(name)
+
+        first = asyncio.create_task(waiter("first"))
+        cancelled = asyncio.create_task(waiter("cancelled"))
+        last = asyncio.create_task(waiter("last"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        assert limiter.in_flight == 2 and not order
+
+        limiter.release()
+        limiter.release()
+        await asyncio.gather(first, last)
+        return order, limiter.in_flight
+
+    order, in_flight = asyncio.run(scenario())
+    assert order == ["first", "last"] and in_flight == 2
+
+
+def test_limit_backs_off_under_upstream_rate_limiting():
+    concurrency_limiters.reset(LimiterConfig(initial_limit=16, min_limit=2, max_limit=64))
+
+    async def scenario():
+        profile = MockProfile(rate_limit=50, burst=5)
+        async with MockAiSensyServer(profile) as mock:
+            client = AiSensyDirectApiGetClient(_token=make_token(), BASE_URL=mock.direct_base_url)
+            try:
+                results = await asyncio.gather(*(client.get_templates() for _ in range(64)))
+            finally:
+                await client.close()
+            return results, concurrency_limiters.get("direct_api")
+
+    try:
+        results, limiter = asyncio.run(scenario())
+    finally:
+        concurrency_limiters.reset()
+
+    assert any(not result["success"] for result in results)  # some calls were throttled
+    assert limiter.limit < 16 and limiter.in_flight == 0
@@ -0,0 +1,165 @@
+"""
+Unit tests for the 24-hour conversation window index
+(app.services.conversation_window).
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.services import conversation_window
+from app.utils.phone_numbers import normalize_number
+from app.services.conversation_window import ConversationWindows, free_form_blocked
+
+HOUR = 3600
+NOW = 1_700_000_000
+
+
+class _Clock:
+    def __init__(self, now=NOW):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_windows_open_for_24_hours_after_the_last_inbound_message():
+    clock = _Clock()
+    windows = ConversationWindows(clock=clock)
+    windows.record_inbound("+91 98000-00001", NOW - 2 * HOUR)
+    windows.record_inbound("919800000001", NOW - 5 * HOUR)  # older event arriving late
+
+    assert windows.expires_at("919800000001") == NOW + 22 * HOUR
+    assert windows.window("919800000001")["open"]
+    assert windows.expires_at("919800000002") is None
+    assert not windows.window("919800000002")["known"]
+
+    clock.now += 22 * HOUR
+    assert windows.expires_at("919800000001") is None
+
+
+def test_rejection_closes_the_window_until_the_recipient_writes_again():
+    clock = _Clock()
+    windows = ConversationWindows(clock=clock)
+    windows.record_inbound("919800000001", NOW - HOUR)
+    windows.record_send_result("919800000001", {"success": True})
+    assert windows.free_form_refusal("919800000001") is None
+
+    windows.record_send_result("919800000001", {
+        "success": False, "status_code": 400,
+        "details": '{"error": {"code": 131047, "message": "Re-engagement message"}}'})
+    assert windows.free_form_refusal("919800000001") == "rejected"
+
+    clock.now += 60
+    windows.record_inbound("919800000001", clock.now)
+    assert windows.free_form_refusal("919800000001") is None
+
+
+def test_unknown_recipients_are_only_refused_when_enforced(monkeypatch):
+    windows = ConversationWindows(clock=_Clock())
+    windows.record_inbound("919800000001", NOW - 30 * HOUR)
+
+    assert windows.free_form_refusal("919800000001") == "expired"
+    assert windows.free_form_refusal("919800000002") is None
+    monkeypatch.setenv("CONVERSATION_WINDOW_ENFORCE", "true")
+    assert windows.free_form_refusal("919800000002") == "expired"
+
+
+def test_partition():
+    windows = ConversationWindows(clock=_Clock())
+    windows.record_inbound("919800000001", NOW - HOUR)
+    windows.record_inbound("919800000003", NOW - 25 * HOUR)
+
+    assert windows.partition(["919800000001", "+919800000001", "919800000002", "919800000003", ""]) == {
+        "free_form": {"919800000001": NOW + 23 * HOUR},
+        "template_required": ["919800000002", "919800000003"],
+    }
+
+
+def test_windows_are_shared_through_the_database(tmp_path):
+    path = str(tmp_path / "windows.sqlite3")
+    clock = _Clock()
+    receiver = ConversationWindows(path=path, reload_seconds=0, clock=clock)
+    server = ConversationWindows(path=path, reload_seconds=0, clock=clock)
+    written_on = set()
+    write = receiver._write
+    receiver._write = lambda rows: (written_on.add(threading.get_ident()), write(rows))
+
+    async def scenario():
+        await server.refresh()
+        for i in range(50):         # a burst of deliveries: every one is written
+            receiver.record_inbound(f"9198000{i:05d}", NOW - HOUR)
+        server.record_rejection("919811111111", NOW - HOUR)
+        receiver.record_inbound("919811111111", NOW - 2 * HOUR)     # older, loses to the rejection
+        await receiver.flush()
+        await server.flush()
+        await server.refresh()
+
+    asyncio.run(scenario())
+    assert written_on and threading.get_ident() not in written_on
+    assert server.expires_at("919800000049") == NOW + 23 * HOUR
+    assert server.free_form_refusal("919811111111") == "rejected"
+
+    restarted = ConversationWindows(path=path, clock=clock)
+    restarted.load()
+    assert len(restarted.partition(f"9198000{i:05d}" for i in range(50))["free_form"]) == 50
+    assert restarted.free_form_refusal("919811111111") == "rejected"
+
+    clock.now += 31 * 24 * HOUR
+    restarted.prune_seconds = 0
+    restarted.record_inbound("919800000099", clock.now)     # the write prunes expired entries
+    reloaded = ConversationWindows(path=path, clock=clock)
+    reloaded.load()
+    assert list(reloaded._inbound) == ["919800000099"] and not reloaded._rejected
+
+
+def test_closed_windows_are_refused_whether_or_not_pruned():
+    clock = _Clock()
+    pruned, unpruned = ConversationWindows(clock=clock), ConversationWindows(clock=clock)
+    for windows in (pruned, unpruned):
+        windows.record_inbound("919800000001", NOW - 2 * HOUR)
+
+    clock.now += 2 * 24 * HOUR
+    pruned.prune()
+    assert pruned.free_form_refusal("919800000001") == unpruned.free_form_refusal("919800000001") == "expired"
+    assert pruned.window("919800000001")["known"]
+
+    clock.now += 30 * 24 * HOUR       # past the retention period: unknown either way
+    pruned.prune()
+    assert pruned.free_form_refusal("919800000001") is unpruned.free_form_refusal("919800000001") is None
+    assert not unpruned.window("919800000001")["known"]
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    path = str(tmp_path / "windows.sqlite3")
+    writers = [ConversationWindows(path=path, clock=_Clock()) for _ in range(4)]
+
+    def record(index, writer):
+        for i in range(100):
+            writer.record_inbound(f"91980{index}{i:05d}", NOW - HOUR + i)
+
+    threads = [threading.Thread(target=record, args=item) for item in enumerate(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reader = ConversationWindows(path=path, clock=_Clock())
+    reader.load()
+    assert len(reader._inbound) == 400
+
+
+def test_free_form_blocked(monkeypatch):
+    windows = ConversationWindows(clock=_Clock())
+    windows.record_inbound("919800000001", NOW - 26 * HOUR)
+    monkeypatch.setattr(conversation_window, "_windows", windows)
+
+    blocked = asyncio.run(free_form_blocked("919800000001"))
+    assert blocked["success"] is False and blocked["template_required"]
+    assert "26h ago" in blocked["error"]
+    assert asyncio.run(free_form_blocked("919800000002")) is None
+
+
+@pytest.mark.parametrize("number, key", [("+91 98000 00001", "919800000001"), ("", "")])
+def test_normalize_number(number, key):
+    assert normalize_number(number) == key
@@ -0,0 +1,96 @@
+"""
+Unit tests for timeout profiles and deadlines: app.services.deadlines and
+app.api.middleware.deadline.
+"""
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from fastmcp import Client, FastMCP  # noqa: E402
+
+from app.api.middleware.deadline import register_deadlines  # noqa: E402
+from app.services.deadlines import (DeadlineExceeded, deadline, remaining_time,  # noqa: E402
+                                    request_timeout)
+from app.services.monitoring_service import current_upstream_call  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from tests.mock_aisensy import MockAiSensyServer, MockProfile  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+
+def _timeout_of(method, seconds=None):
+    token = current_upstream_call.set(("partner", method))
+    try:
+        with deadline(seconds):
+            return request_timeout("partner")
+    finally:
+        current_upstream_call.reset(token)
+
+
+def test_endpoint_profiles_and_deadline_budgets():
+    lookup = _timeout_of("get_display_name_status")
+    upload = _timeout_of("upload_media")
+    assert lookup.total < upload.total and lookup.sock_connect <= upload.sock_connect
+
+    budget = _timeout_of("upload_media", seconds=2)
+    assert budget.total <= 2 and budget.sock_read <= 2
+    with pytest.raises(DeadlineExceeded):
+        _timeout_of("get_profile", seconds=-1)
+
+    # Nested deadlines can only shorten the outer one
+    with deadline(1):
+        with deadline(10):
+            assert remaining_time() <= 1
+    assert remaining_time() is None
+
+
+def test_deadline_aborts_stalled_requests_and_frees_their_connections():
+    async def scenario():
+        stalled = MockProfile(stall_rate=1.0, stall_seconds=2)
+        async with MockAiSensyServer(endpoint_profiles={"get_templates": stalled}) as mock:
+            client = AiSensyDirectApiGetClient(_token=make_token(), BASE_URL=mock.direct_base_url)
+            try:
+                start = time.perf_counter()
+                with deadline(0.3):
+                    timed_out = await client.get_templates()
+                elapsed = time.perf_counter() - start
+
+                # A cancelled tool call cancels its request too
+                call = asyncio.create_task(client.get_templates())
+                await asyncio.sleep(0.1)
+                call.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await call
+                connector = (await client._get_session()).connector
+                in_use = len(connector._acquired)
+            finally:
+                await client.close()
+            return timed_out, elapsed, in_use
+
+    timed_out, elapsed, in_use = asyncio.run(scenario())
+
+    assert timed_out == {"success": False, "error": "Request timeout"}
+    assert elapsed < 1
+    assert in_use == 0
+
+
+def test_tool_calls_run_under_the_callers_deadline():
+    mcp = FastMCP("deadlines")
+    register_deadlines(mcp)
+
+    @mcp.tool
+    async def budget() -> dict:
+        return {"remaining": remaining_time()}
+
+    async def scenario():
+        async with Client(mcp) as client:
+            with_meta = await client.call_tool("budget", {}, meta={"timeout": 2})
+            without = await client.call_tool("budget", {})
+            return with_meta.structured_content, without.structured_content
+
+    with_meta, without = asyncio.run(scenario())
+
+    assert 0 < with_meta["remaining"] <= 2
+    assert without["remaining"] is None
@@ -0,0 +1,117 @@
+"""
+Unit tests for Direct API token refresh (direct_api_mcp.clients.direct_api_token).
+"""
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_post_client import AiSensyDirectApiPostClient  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_token import (  # noqa: E402
+    DirectApiToken, jwt_expiry, token_from_response)
+from tests.mock_aisensy import MockAiSensyServer, MockProfile  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+
+def test_jwt_expiry_and_response_parsing():
+    token = make_token(ttl_seconds=600)
+
+    assert abs(jwt_expiry(token) - (time.time() + 600)) < 5
+    assert jwt_expiry("not-a-jwt") is None
+    assert token_from_response({"token": "a"}) == "a"
+    assert token_from_response({"users": [{"name": "x", "token": "b"}]}) == "b"
+    assert token_from_response({"data": {}}) is None
+
+
+def _run_with_mock(scenario):
+    async def run():
+        async with MockAiSensyServer(verify_tokens=True) as mock:
+            return await scenario(mock)
+    return asyncio.run(run())
+
+
+def test_concurrent_401s_trigger_one_refresh_and_replay():
+    async def scenario(mock):
+        client = AiSensyDirectApiGetClient(BASE_URL=mock.direct_base_url,
+                                           _token=make_token(ttl_seconds=-60))
+        # An already expired token is also caught by the proactive check;
+        # disable it to exercise the 401 path.
+        client._auth.refresh_margin = float("-inf")
+        try:
+            session = await client._get_session()
+            results = await asyncio.gather(
+                *(client.get_template_by_id(template_id=str(i)) for i in range(20))
+            )
+            same_session = session is await client._get_session()
+        finally:
+            await client.close()
+        return results, same_session, mock.mock
+
+    results, same_session, mock = _run_with_mock(scenario)
+
+    assert all(result["success"] for result in results)
+    assert same_session
+    assert mock.requests["regenerate_jwt_bearer_token"] == 1
+    assert mock.responses[("get_template_by_id", 200)] == 20
+
+
+def test_token_is_refreshed_before_it_expires():
+    async def scenario(mock):
+        client = AiSensyDirectApiGetClient(BASE_URL=mock.direct_base_url,
+                                           _token=make_token(ttl_seconds=30))
+        old_token = client._auth.token
+        try:
+            results = await asyncio.gather(*(client.get_templates() for _ in range(10)))
+        finally:
+            await client.close()
+        return results, old_token, client._auth, mock.mock
+
+    results, old_token, auth, mock = _run_with_mock(scenario)
+
+    assert all(result["success"] for result in results)
+    assert auth.token != old_token and not auth.expiring()
+    assert mock.requests["regenerate_jwt_bearer_token"] == 1
+    assert mock.responses[("get_templates", 401)] == 0
+
+
+def test_manual_regeneration_rotates_every_client_sharing_the_token():
+    async def scenario(mock):
+        auth = DirectApiToken(make_token(ttl_seconds=-60))
+        get_client = AiSensyDirectApiGetClient(BASE_URL=mock.direct_base_url, _token="")
+        post_client = AiSensyDirectApiPostClient(BASE_URL=mock.direct_base_url, _token="")
+        # What shared_direct_api_token() gives clients built from settings
+        get_client._auth = post_client._auth = auth
+        try:
+            regenerated = await post_client.regenerate_jwt_bearer_token()
+            info = await get_client.get_business_info()
+        finally:
+            await get_client.close()
+            await post_client.close()
+        return regenerated, info, auth, mock.mock
+
+    regenerated, info, auth, mock = _run_with_mock(scenario)
+
+    assert regenerated["success"] and regenerated["data"]["token"] == auth.token
+    assert info["success"]
+    assert mock.responses[("get_business_info", 401)] == 0
+
+
+def test_failed_refresh_returns_the_401_and_backs_off():
+    async def scenario(mock):
+        mock.mock.endpoint_profiles["regenerate_jwt_bearer_token"] = MockProfile(error_rate=1.0)
+        client = AiSensyDirectApiGetClient(BASE_URL=mock.direct_base_url,
+                                           _token=make_token(ttl_seconds=-60))
+        try:
+            first = await client.get_business_info()
+            second = await client.get_business_info()
+        finally:
+            await client.close()
+        return first, second, mock.mock
+
+    first, second, mock = _run_with_mock(scenario)
+
+    assert first["status_code"] == second["status_code"] == 401
+    assert mock.requests["regenerate_jwt_bearer_token"] == 1
@@ -0,0 +1,172 @@
+"""
+Unit tests for the endpoint tables (app.services.endpoints) and the
+generic executor app.services.upstream.call_endpoint.
+"""
+import asyncio
+import logging
+import re
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from app.services.endpoints import Endpoint, endpoint_registry  # noqa: E402
+from app.services.upstream import call_endpoint  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_delete_client import (  # noqa: E402
+    AiSensyDirectApiDeleteClient)
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_patch_client import (  # noqa: E402
+    AiSensyDirectApiPatchClient)
+from mcp_servers.direct_api_mcp.clients.direct_api_post_client import (  # noqa: E402
+    AiSensyDirectApiPostClient)
+from tests.mock_aisensy import ROUTES, MockAiSensyServer  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+logger = logging.getLogger("tests.endpoints")
+
+
+def _shape(path):
+    return re.sub(r"\{\w+\}", "{}", path)
+
+
+def test_tables_match_the_upstream_routes():
+    routes = {(route.service, route.name): (route.method, _shape(route.path)) for route in ROUTES}
+    table = endpoint_registry.table("direct_api")
+    assert table
+    for name, endpoint in table.items():
+        assert routes[("direct_api", name)] == (endpoint.verb, _shape(endpoint.path))
+
+
+def test_every_client_method_has_an_endpoint():
+    classes = (AiSensyDirectApiGetClient, AiSensyDirectApiPostClient,
+               AiSensyDirectApiPatchClient, AiSensyDirectApiDeleteClient)
+    methods = {name for cls in classes for name in vars(cls) if not name.startswith("_")}
+    assert methods - set(endpoint_registry.table("direct_api")) == {"regenerate_jwt_bearer_token"}
+
+
+def test_endpoint_defaults():
+    lookup = endpoint_registry.get("direct_api", "get_display_name_status")
+    assert (lookup.idempotent, lookup.group, lookup.timeout) == (True, "account", "lookup")
+    send = endpoint_registry.get("direct_api", "send_message")
+    assert (send.idempotent, send.group, send.timeout) == (False, "messages", "default")
+    assert endpoint_registry.get("direct_api", "upload_media").timeout == "transfer"
+    with pytest.raises(ValueError):
+        Endpoint("create_thing", "POST", "/things", hedged=True)
+
+
+class _Response:
+    status = 200
+
+    async def text(self):
+        return ""
+
+
+class _Session:
+    def __init__(self):
+        self.requests = []
+
+    def request(self, verb, url, **kwargs):
+        self.requests.append((verb, url, kwargs))
+
+        class _Context:
+            async def __aenter__(self):
+                return _Response()
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Context()
+
+
+class _Client:
+    BASE_URL = "https://aisensy.test"
+    partner_id = "partner-1"
+    business_id = ""
+
+    def __init__(self):
+        self.session = _Session()
+
+    async def _get_session(self):
+        return self.session
+
+    def _request_timeout(self):
+        return None
+
+    async def _read_json(self, response):
+        return {"ok": True}
+
+    def _handle_error(self, status, text):
+        return {"success": False, "status_code": status}
+
+
+def test_executor_builds_requests_from_the_table():
+    endpoint = Endpoint("update_widget", "PATCH", "/partner/{partner_id}/widgets/{widget_id}",
+                        params={"dryRun": "dry_run"},
+                        body={"name": "name", "style": {"color": "color"}, "note": "note"},
+                        optional=("note", "dryRun"), require_body=True)
+
+    async def scenario():
+        client = _Client()
+        ok = await call_endpoint(client, endpoint, {"widget_id": "w1", "name": "x", "color": "red",
+                                                    "note": None, "dry_run": None}, logger)
+        missing = await call_endpoint(client, endpoint, {"widget_id": ""}, logger)
+        partner = await call_endpoint(
+            client, Endpoint("get_business", "GET", "/partner/{partner_id}/business/{business_id}"),
+            {}, logger)
+        return client.session.requests, ok, missing, partner
+
+    requests, ok, missing, partner = asyncio.run(scenario())
+
+    assert ok == {"success": True, "data": {"ok": True}}
+    (verb, url, kwargs), = requests
+    assert (verb, url) == ("PATCH", "https://aisensy.test/partner/partner-1/widgets/w1")
+    assert kwargs["json"] == {"name": "x", "style": {"color": "red"}}
+    assert kwargs["params"] is None and kwargs["data"] is None
+    assert missing == {"success": False, "error": "Missing required field: widget_id"}
+    assert partner == {"success": False, "error": "Missing required field: business_id"}
+
+
+def test_falsy_optional_fields_are_left_out_like_the_original_clients():
+    product = endpoint_registry.get("direct_api", "create_product")
+    required = {name: "x" for name in product.required}
+
+    async def scenario():
+        client = _Client()
+        await call_endpoint(client, product, {**required, "description": "", "sale_price": 0,
+                                              "brand": None, "url": "https://shop.test"}, logger)
+        await call_endpoint(client, endpoint_registry.get("direct_api", "get_waba_analytics"),
+                            {"fields": ["sent"], "start": 1, "end": 2, "granularity": "DAY",
+                             "country_codes": []}, logger)
+        return [kwargs["json"] for _, _, kwargs in client.session.requests]
+
+    product_body, analytics_body = asyncio.run(scenario())
+    assert {"description", "sale_price", "brand", "sale_price_start_date"}.isdisjoint(product_body)
+    assert product_body["url"] == "https://shop.test"
+    assert "country_codes" not in analytics_body
+
+
+def test_thin_wrappers_against_the_mock():
+    async def scenario():
+        async with MockAiSensyServer() as mock:
+            client = AiSensyDirectApiPatchClient(_token=make_token(), BASE_URL=mock.direct_base_url)
+            post = AiSensyDirectApiPostClient(_token=make_token(), BASE_URL=mock.direct_base_url)
+            try:
+                results = [
+                    await client.update_flow_metadata("flow-1", name="renamed"),
+                    await client.update_flow_metadata("flow-1"),
+                    await post.send_message(to="", message_type="text", text_body="hi"),
+                    await post.upload_media("/nonexistent/file.png"),
+                ]
+            finally:
+                await client.close()
+                await post.close()
+            return results, mock.mock
+
+    (updated, empty, no_recipient, no_file), mock = asyncio.run(scenario())
+
+    assert updated["success"]
+    assert empty == {"success": False, "error": "No fields provided to update"}
+    assert no_recipient == {"success": False, "error": "Missing required field: to"}
+    assert no_file == {"success": False, "error": "File not found: /nonexistent/file.png"}
+    assert mock.requests["update_flow_metadata"] == 1
+    assert mock.requests["upload_media"] == 0
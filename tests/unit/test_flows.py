@@ -0,0 +1,108 @@
+"""
+Unit tests for the WhatsApp Flows data exchange (app.services.flow_service
+and the endpoint in app.api.v1.endpoints.flows).
+"""
+import asyncio
+import base64
+
+import pytest
+
+from app.services import flow_service
+from app.services.flow_service import (DECRYPTION_FAILED, INVALID_FLOW_TOKEN, FlowCrypto, FlowHandlers,
+                                       FlowTokenError)
+from tests.performance.flow_benchmark import decrypted_response, encrypted_request, private_key_pem
+
+PEM = private_key_pem()
+
+
+def _exchange(crypto, handlers, payload):
+    body, aes_key, iv = encrypted_request(PEM, payload)
+    status, text = asyncio.run(flow_service.handle_exchange(body, crypto, handlers))
+    return status, (decrypted_response(text, aes_key, iv) if text else None)
+
+
+def test_round_trip_and_dispatch():
+    handlers = FlowHandlers()
+
+    @handlers.init()
+    def init(request):
+        return {"screen": "APPOINTMENT", "data": {"flow_id": request.data.get("flow_id")}}
+
+    @handlers.screen("APPOINTMENT")
+    async def appointment(request):
+        if request.flow_token == "expired":
+            raise FlowTokenError("unknown token")
+        if request.data.get("date") == "boom":
+            raise RuntimeError("backend down")
+        return {"screen": "CONFIRM", "data": {"date": request.data["date"]}}
+
+    with pytest.raises(ValueError):
+        handlers.screen("APPOINTMENT")(appointment)
+
+    crypto = FlowCrypto(PEM)
+    assert _exchange(crypto, handlers, {"version": "3.0", "action": "ping"}) == \
+        (200, {"data": {"status": "active"}})
+    assert _exchange(crypto, handlers, {"action": "INIT", "data": {"flow_id": "f1"}, "flow_token": "t"}) == \
+        (200, {"screen": "APPOINTMENT", "data": {"flow_id": "f1"}})
+    assert _exchange(crypto, handlers, {"action": "data_exchange", "screen": "APPOINTMENT",
+                                        "data": {"date": "2026-01-01"}, "flow_token": "t"}) == \
+        (200, {"screen": "CONFIRM", "data": {"date": "2026-01-01"}})
+    assert _exchange(crypto, handlers, {"action": "data_exchange", "screen": "APPOINTMENT",
+                                        "data": {}, "flow_token": "expired"}) == (INVALID_FLOW_TOKEN, None)
+
+    status, failed = _exchange(crypto, handlers, {"action": "data_exchange", "screen": "APPOINTMENT",
+                                                  "data": {"date": "boom"}, "flow_token": "t"})
+    assert status == 200 and failed["screen"] == "APPOINTMENT" and failed["data"]["error_message"]
+    status, unknown = _exchange(crypto, handlers, {"action": "BACK", "screen": "NOWHERE", "flow_token": "t"})
+    assert status == 200 and unknown["data"]["error_message"]
+    assert _exchange(crypto, handlers, {"action": "data_exchange", "screen": "APPOINTMENT",
+                                        "data": {"error": "bad", "error_message": "x"}})[1] == \
+        {"data": {"acknowledged": True}}
+
+
+def test_large_payloads_are_handled_in_a_thread():
+    handlers = FlowHandlers()
+    handlers.screen("UPLOAD")(lambda request: {"screen": "DONE", "data": {"size": len(request.data["photo"])}})
+    crypto = FlowCrypto(PEM, thread_bytes=1024)
+    assert _exchange(crypto, handlers, {"action": "data_exchange", "screen": "UPLOAD",
+                                        "data": {"photo": "x" * 10_000}}) == \
+        (200, {"screen": "DONE", "data": {"size": 10_000}})
+
+
+def test_undecryptable_requests():
+    crypto = FlowCrypto(PEM)
+    body, _, _ = encrypted_request(private_key_pem(), {"action": "ping"})  # another key
+    assert asyncio.run(flow_service.handle_exchange(body, crypto)) == (DECRYPTION_FAILED, "")
+
+    body, _, _ = encrypted_request(PEM, {"action": "ping"})
+    tampered = bytearray(base64.b64decode(body["encrypted_flow_data"]))
+    tampered[0] ^= 1
+    body["encrypted_flow_data"] = base64.b64encode(bytes(tampered)).decode()
+    assert asyncio.run(flow_service.handle_exchange(body, crypto)) == (DECRYPTION_FAILED, "")
+    assert asyncio.run(flow_service.handle_exchange({}, crypto)) == (DECRYPTION_FAILED, "")
+
+
+def test_endpoint(monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api.v1.endpoints import flows
+    from tests.unit.test_webhooks import _sign
+
+    crypto = FlowCrypto(PEM)
+    monkeypatch.setattr(flow_service, "get_flow_crypto", lambda: crypto)
+    monkeypatch.setenv("WEBHOOK_SECRET", "s3cret")
+    app = FastAPI()
+    app.include_router(flows.router)
+    client = TestClient(app)
+
+    body, aes_key, iv = encrypted_request(PEM, {"action": "ping"})
+    raw = flows.json_backend.dumps_bytes(body)
+    assert client.post("/flows/data-exchange", content=raw).status_code == 432
+    response = client.post("/flows/data-exchange", content=raw,
+                           headers={"X-Hub-Signature-256": _sign(raw, "s3cret")})
+    assert response.status_code == 200
+    assert decrypted_response(response.text, aes_key, iv) == {"data": {"status": "active"}}
+    assert client.post("/flows/data-exchange", content=b"[]",
+                       headers={"X-Hub-Signature-256": _sign(b"[]", "s3cret")}).status_code == 421
@@ -0,0 +1,153 @@
+"""
+Unit tests for the phone number health monitor (app.services.health_monitor).
+"""
+import asyncio
+
+import pytest
+
+from app.services.health_monitor import HealthMonitor
+from app.services.scheduling import BULK, current_priority
+
+
+class FleetSource:
+    """Two tenants with a few numbers each; health answers can be changed between polls."""
+
+    def __init__(self):
+        self.numbers = {
+            "acme": [{"id": f"pn-{i}", "display_phone_number": f"+91 9800000{i:03}",
+                      "quality_rating": "GREEN", "messaging_limit_tier": "TIER_1K",
+                      "throughput": {"level": "STANDARD"}} for i in range(5)],
+            "globex": [{"id": "pn-g", "quality_rating": "GREEN", "messaging_limit_tier": "TIER_250"}],
+        }
+        self.can_send = {}
+        self.failing = set()
+        self.in_flight = self.peak = 0
+        self.priorities = set()
+
+    def tenants(self):
+        return list(self.numbers)
+
+    async def _request(self):
+        self.priorities.add(current_priority())
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def phone_numbers(self, tenant):
+        await self._request()
+        if tenant in self.failing:
+            raise RuntimeError("Unauthorized")
+        return [dict(number) for number in self.numbers[tenant]]
+
+    async def health(self, tenant, phone_number_id):
+        await self._request()
+        if phone_number_id in self.failing:
+            raise RuntimeError("Request timeout")
+        state = self.can_send.get(phone_number_id, "AVAILABLE")
+        entities = [{"entity_type": "PHONE_NUMBER", "id": phone_number_id, "can_send_message": state}]
+        if state != "AVAILABLE":
+            entities[0]["errors"] = [{"error_code": 141006, "error_description": "Payment issue"}]
+        return {"health_status": {"can_send_message": state, "entities": entities}, "id": phone_number_id}
+
+    async def display_name(self, tenant):
+        await self._request()
+        return {"id": self.numbers[tenant][0]["id"], "name_status": "APPROVED"}
+
+
+def test_polls_the_fleet_concurrently_and_reports_changes():
+    source = FleetSource()
+    monitor = HealthMonitor(source, concurrency=3, history_size=2)
+
+    async def scenario():
+        first = await monitor.poll()
+        source.numbers["acme"][1]["quality_rating"] = "YELLOW"
+        source.can_send["pn-2"] = "BLOCKED"
+        second = await monitor.poll()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == []
+    assert 1 < source.peak <= 3 and source.priorities == {BULK}
+    assert {(c.phone_number_id, c.field, c.previous, c.current) for c in second} == {
+        ("pn-1", "quality_rating", "GREEN", "YELLOW"), ("pn-2", "can_send_message", "AVAILABLE", "BLOCKED")}
+
+    snapshot = monitor.snapshot()
+    assert snapshot["summary"] == {"numbers": 6, "quality_rating": {"GREEN": 5, "YELLOW": 1},
+                                   "can_send_message": {"AVAILABLE": 5, "BLOCKED": 1}, "errors": 0}
+    blocked = next(n for n in snapshot["numbers"] if n["phone_number_id"] == "pn-2")
+    assert blocked["issues"][0]["errors"][0]["error_code"] == 141006
+    assert blocked["name_status"] == "" and snapshot["numbers"][0]["name_status"] == "APPROVED"
+    assert next(n for n in snapshot["numbers"] if n["tenant"] == "globex")["name_status"] == "APPROVED"
+    assert len(snapshot["recent_changes"]) == 2
+
+    one = monitor.snapshot(phone_number_id="pn-1", include_history=True)
+    assert [point["quality_rating"] for point in one["numbers"][0]["history"]] == ["GREEN", "YELLOW"]
+
+
+def test_failures_keep_the_last_known_state():
+    source = FleetSource()
+    monitor = HealthMonitor(source)
+    source.can_send["pn-0"] = "LIMITED"
+    asyncio.run(monitor.poll())
+
+    source.failing = {"pn-0", "globex"}
+    changes = asyncio.run(monitor.poll())
+
+    assert changes == []
+    snapshot = monitor.snapshot()
+    number = next(n for n in snapshot["numbers"] if n["phone_number_id"] == "pn-0")
+    assert number["can_send_message"] == "LIMITED" and "Request timeout" in number["error"]
+    assert "Unauthorized" in snapshot["tenant_errors"]["globex"]
+    assert snapshot["summary"]["numbers"] == 6      # globex numbers from the previous poll
+
+
+def test_changes_are_posted_to_the_webhook():
+    aiohttp = pytest.importorskip("aiohttp")
+    from aiohttp import web
+
+    received = []
+
+    async def scenario():
+        async def handler(request):
+            received.append(await request.json())
+            return web.Response(status=204)
+
+        app = web.Application()
+        app.router.add_post("/health", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            source = FleetSource()
+            monitor = HealthMonitor(source, webhook_url=f"http://127.0.0.1:{port}/health")
+            await monitor.poll()
+            source.numbers["globex"][0]["messaging_limit_tier"] = "TIER_1K"
+            await monitor.poll()
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(scenario())
+
+    assert len(received) == 1
+    change = received[0]["changes"][0]
+    assert (change["tenant"], change["field"], change["previous"], change["current"]) == \
+        ("globex", "messaging_limit_tier", "TIER_250", "TIER_1K")
+
+
+def test_scheduler_polls_in_the_background():
+    source = FleetSource()
+    monitor = HealthMonitor(source, interval_seconds=0.05)
+
+    async def scenario():
+        await monitor.start()
+        await asyncio.sleep(0.2)
+        await monitor.stop()
+        return monitor.snapshot()["summary"]["numbers"], len(monitor._history[("acme", "pn-0")])
+
+    numbers, polls = asyncio.run(scenario())
+    assert numbers == 6 and polls >= 2
+    assert asyncio.run(HealthMonitor(source, interval_seconds=0).start()) is None
@@ -0,0 +1,85 @@
+"""
+Unit tests for hedged reads in app.services.hedging.
+"""
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from app.services.hedging import HedgePolicy, Hedger, hedgers  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from tests.mock_aisensy import MockAiSensyServer, MockProfile  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+POLICY = HedgePolicy(min_samples=10, min_delay=0.02, budget_ratio=0.1, max_tokens=1)
+
+
+class _Upstream:
+    def __init__(self):
+        self.started = 0
+        self.cancelled = 0
+        self.slow = set()
+
+    async def attempt(self):
+        self.started += 1
+        number = self.started
+        try:
+            await asyncio.sleep(1.0 if number in self.slow else 0.005)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"success": True, "attempt": number}
+
+
+def test_slow_reads_are_hedged_within_budget():
+    async def scenario():
+        hedger, upstream = Hedger("test", "get_thing", POLICY), _Upstream()
+        for _ in range(10):
+            await hedger.call(upstream.attempt)
+        assert hedger.delay() == pytest.approx(0.02, abs=0.01)
+
+        upstream.slow = {11}
+        start = time.perf_counter()
+        result = await hedger.call(upstream.attempt)
+        hedged_in = time.perf_counter() - start
+        assert result["attempt"] == 12 and hedged_in < 0.5
+        await asyncio.sleep(0)
+        assert upstream.cancelled == 1  # the slow attempt was abandoned
+
+        # The budget (0.1 per call, one saved at most) is spent
+        upstream.slow = {13}
+        result = await hedger.call(upstream.attempt)
+        return result, upstream.started
+
+    result, started = asyncio.run(scenario())
+    assert result["attempt"] == 13 and started == 13
+
+
+def test_hedging_trims_the_tail_of_a_client_read():
+    hedgers.reset(enabled=True, policy=HedgePolicy(min_samples=20, budget_ratio=0.2))
+
+    async def scenario():
+        stalls = MockProfile(stall_rate=0.03, stall_seconds=0.5)
+        async with MockAiSensyServer(endpoint_profiles={"get_template_by_id": stalls},
+                                     seed=3) as mock:
+            client = AiSensyDirectApiGetClient(_token=make_token(), BASE_URL=mock.direct_base_url)
+            latencies = []
+            try:
+                for i in range(200):
+                    start = time.perf_counter()
+                    assert (await client.get_template_by_id(f"t{i}"))["success"]
+                    latencies.append(time.perf_counter() - start)
+            finally:
+                await client.close()
+            return latencies[20:], mock.mock.requests["get_template_by_id"]
+
+    try:
+        latencies, sent = asyncio.run(scenario())
+    finally:
+        hedgers.reset()
+
+    # After warm-up no call waits out a 0.5s stall
+    assert max(latencies) < 0.25
+    assert 200 < sent <= 200 + 40
@@ -0,0 +1,88 @@
+"""
+Unit tests for app.utils.json_backend and the fast tool-result path.
+"""
+import asyncio
+import json
+from datetime import date
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from app.api.middleware.serialization import json_tool_result, register_fast_tool_results
+from app.utils import json_backend
+
+PAYLOAD = {"success": True, "data": {"name": "ऑर्डर", "items": [1, 2.5, None], "ok": False}}
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request):
+    previous = json_backend.backend_name
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    json_backend.set_backend(request.param)
+    yield request.param
+    json_backend.set_backend(previous)
+
+
+def test_round_trip_matches_stdlib(backend):
+    text = json_backend.dumps(PAYLOAD)
+
+    assert isinstance(text, str)
+    assert json.loads(text) == PAYLOAD
+    assert json_backend.loads(text.encode("utf-8")) == PAYLOAD
+    assert json_backend.loads(memoryview(text.encode("utf-8"))) == PAYLOAD
+    assert json_backend.dumps_bytes(PAYLOAD) == text.encode("utf-8")
+
+
+def test_lenient_and_strict_dumps(backend):
+    assert json.loads(json_backend.dumps({"day": date(2024, 5, 1)})) == {"day": "2024-05-01"}
+    with pytest.raises(TypeError):
+        json_backend.dumps_strict({"client": object()})
+
+
+def test_unknown_backend_falls_back_to_stdlib():
+    previous = json_backend.backend_name
+    try:
+        assert json_backend.set_backend("simdjson") == "stdlib"
+    finally:
+        json_backend.set_backend(previous)
+
+
+def test_json_tool_result_only_for_plain_json():
+    result = json_tool_result(PAYLOAD)
+
+    assert result.structured_content is PAYLOAD
+    assert json.loads(result.content[0].text) == PAYLOAD
+
+    odd = {"client": object()}
+    assert json_tool_result(odd) is odd
+
+
+def test_registered_tools_return_same_result_as_fastmcp():
+    plain, fast = FastMCP("plain"), FastMCP("fast")
+    register_fast_tool_results(fast)
+
+    for server in (plain, fast):
+        @server.tool
+        async def get_payload(name: str) -> dict:
+            """Return the payload."""
+            return {**PAYLOAD, "name": name}
+
+        @server.tool(name="get_text")
+        async def get_text() -> str:
+            return "plain text"
+
+    async def call_all(server):
+        async with Client(server) as client:
+            tools = {tool.name: tool.output_schema for tool in await client.list_tools()}
+            payload = await client.call_tool("get_payload", {"name": "x"})
+            text = await client.call_tool("get_text", {})
+            return tools, payload, text
+
+    plain_tools, plain_payload, plain_text = asyncio.run(call_all(plain))
+    fast_tools, fast_payload, fast_text = asyncio.run(call_all(fast))
+
+    assert fast_tools == plain_tools
+    assert fast_payload.structured_content == plain_payload.structured_content
+    assert json.loads(fast_payload.content[0].text) == json.loads(plain_payload.content[0].text)
+    assert fast_text.content[0].text == plain_text.content[0].text == "plain text"
@@ -0,0 +1,65 @@
+"""
+Unit tests for the queue-based logging pipeline in app.config.logging.
+"""
+import json
+import logging
+
+from app.config.logging import JsonFormatter, RateLimitFilter, parse_logger_levels
+
+
+def _record(msg="API error: %s - %s", args=(500, "boom"), level=logging.WARNING):
+    return logging.LogRecord("direct_api_mcp.clients", level, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_filter_keys_on_message_template():
+    rate_filter = RateLimitFilter(burst=2, period=60)
+
+    allowed = [rate_filter.filter(_record(args=(status, "x"))) for status in (400, 404, 500)]
+
+    assert allowed == [True, True, False]
+    assert rate_filter.filter(_record(msg="Another message")) is True
+
+
+def test_rate_limit_filter_reports_suppressed_count_on_next_window(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.config.logging.time.monotonic", lambda: now[0])
+    rate_filter = RateLimitFilter(burst=1, period=60)
+    assert [rate_filter.filter(_record()) for _ in range(3)] == [True, False, False]
+
+    now[0] += 60
+    record = _record()
+    assert rate_filter.filter(record) is True
+    assert record.getMessage() == "API error: 500 - boom [2 similar messages suppressed]"
+
+
+def test_rate_limit_filter_evicts_expired_windows(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.config.logging.time.monotonic", lambda: now[0])
+    rate_filter = RateLimitFilter(burst=1, period=60)
+    for i in range(100):
+        rate_filter.filter(_record(msg=f"one-off {i}", args=()))
+    rate_filter.filter(_record())
+    rate_filter.filter(_record())
+    assert len(rate_filter._windows) == 101
+
+    now[0] += 61
+    rate_filter.filter(_record(msg="later", args=()))
+    assert len(rate_filter._windows) == 2       # the suppressed window outlives the one-offs
+
+    now[0] += 121
+    rate_filter.filter(_record(msg="later", args=()))
+    assert len(rate_filter._windows) == 1
+
+
+def test_json_formatter_renders_lazy_args():
+    payload = json.loads(JsonFormatter().format(_record()))
+
+    assert payload["message"] == "API error: 500 - boom"
+    assert payload["level"] == "WARNING"
+    assert payload["logger"] == "direct_api_mcp.clients"
+
+
+def test_parse_logger_levels_ignores_invalid_entries():
+    levels = parse_logger_levels("direct_api_mcp.clients=warning, aiohttp=ERROR,bad,x=NOPE")
+
+    assert levels == {"direct_api_mcp.clients": logging.WARNING, "aiohttp": logging.ERROR}
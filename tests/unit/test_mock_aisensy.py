@@ -0,0 +1,78 @@
+"""
+Unit tests for the local AiSensy mock in tests.mock_aisensy.
+"""
+import ast
+import asyncio
+import random
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+import aiohttp  # noqa: E402
+
+from tests.mock_aisensy import ROUTES, Latency, MockAiSensyServer, MockProfile  # noqa: E402
+
+CLIENT_DIRS = [
+    Path(__file__).resolve().parents[2] / "mcp_servers" / "boarding_mcp" / "clients",
+    Path(__file__).resolve().parents[2] / "mcp_servers" / "direct_api_mcp" / "clients",
+]
+
+
+def _client_endpoint_methods():
+    """Public async methods of the concrete clients, read from source."""
+    names = set()
+    for directory in CLIENT_DIRS:
+        for path in directory.glob("*.py"):
+            if any(part in path.name for part in ("base", "manager", "token")):
+                continue
+            for node in ast.walk(ast.parse(path.read_text())):
+                if isinstance(node, ast.AsyncFunctionDef) and not node.name.startswith("_"):
+                    names.add(node.name)
+    return names - {"close"}
+
+
+def test_every_client_endpoint_is_mocked():
+    assert _client_endpoint_methods() <= {route.name for route in ROUTES}
+
+
+def test_latency_parse_and_sample():
+    rng = random.Random(1)
+    assert Latency.parse("constant:20").sample(rng) == pytest.approx(0.02)
+    samples = [Latency.parse("lognormal:80:40").sample(rng) for _ in range(2000)]
+    assert sum(samples) / len(samples) == pytest.approx(0.08, rel=0.1)
+    with pytest.raises(ValueError):
+        Latency.parse("weibull:1")
+
+
+async def _statuses(profile, calls, endpoint_profiles=None):
+    async with MockAiSensyServer(profile, endpoint_profiles, seed=7) as server:
+        headers = {"Authorization": "Bearer test"}
+        async with aiohttp.ClientSession(headers=headers) as session:
+            statuses = []
+            for _ in range(calls):
+                async with session.get(server.direct_base_url + "/get-business-info") as response:
+                    statuses.append(response.status)
+            async with session.get(server.direct_base_url + "/get-profile",
+                                   headers={"Authorization": ""}) as response:
+                unauthorized = response.status
+        return statuses, unauthorized
+
+
+def test_mock_injects_throttling_and_errors():
+    statuses, unauthorized = asyncio.run(_statuses(MockProfile(throttle_rate=0.2, error_rate=0.2), 200))
+
+    assert unauthorized == 401
+    assert 20 < statuses.count(429) < 60
+    assert 20 < sum(1 for s in statuses if s >= 500) < 60
+    assert statuses.count(200) > 100
+
+
+def test_mock_rate_limit_applies_per_endpoint_profile():
+    statuses, _ = asyncio.run(_statuses(
+        MockProfile(), 10, endpoint_profiles={"get_business_info": MockProfile(rate_limit=1, burst=3)}
+    ))
+
+    assert statuses[:3] == [200, 200, 200]
+    assert statuses[3:] == [429] * 7
@@ -2,3 +2,20 @@
 test_models.py - Auto-generated
 Implement your logic here
 """
+import pytest
+
+from mcp_servers.direct_api_mcp.models import SendMessageRequest
+
+
+@pytest.mark.parametrize("to, expected", [
+    ("6591234567", "6591234567"),           # a Singapore WhatsApp ID, not an Indian number
+    ("+91 98000-00001", "919800000001"),
+    ("09800000001", "919800000001"),
+])
+def test_send_message_request_keeps_whatsapp_ids(to, expected):
+    assert SendMessageRequest(to=to, text_body="hi").to == expected
+
+
+def test_send_message_request_rejects_invalid_numbers():
+    with pytest.raises(ValueError, match="not a valid phone number"):
+        SendMessageRequest(to="98000abc01", text_body="hi")
@@ -0,0 +1,45 @@
+"""
+Unit tests for the Prometheus helpers in app.services.monitoring_service.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from app.services.monitoring_service import (REGISTRY, current_upstream_call,  # noqa: E402
+                                             instrument_client_methods)
+
+
+class _FakeClient:
+    async def get_profile(self):
+        return current_upstream_call.get()
+
+    async def _private(self):
+        return current_upstream_call.get()
+
+
+instrument_client_methods(_FakeClient, service="unit")
+
+
+def test_public_methods_are_instrumented_once():
+    assert getattr(_FakeClient.get_profile, "__instrumented__", False)
+    assert not getattr(_FakeClient._private, "__instrumented__", False)
+
+    wrapped = _FakeClient.get_profile
+    instrument_client_methods(_FakeClient, service="unit")
+    assert _FakeClient.get_profile is wrapped
+
+
+def test_instrumented_call_sets_context_and_records_latency():
+    client = _FakeClient()
+
+    assert asyncio.run(client.get_profile()) == ("unit", "get_profile")
+    assert asyncio.run(client._private()) is None
+    assert current_upstream_call.get() is None
+
+    count = REGISTRY.get_sample_value(
+        "aisensy_upstream_request_duration_seconds_count",
+        {"service": "unit", "method": "get_profile"},
+    )
+    assert count == 1
@@ -0,0 +1,115 @@
+"""
+Unit tests for local QR images: the encoder in app.utils.qr_code, the
+cache in app.services.qr_images and the qr:// resources of the Direct API
+server.
+"""
+import asyncio
+import base64
+import struct
+import zlib
+
+import pytest
+
+from app.utils import qr_code
+from app.services.qr_images import QrImageCache
+
+URL = "https://wa.me/message/ANED2T5QRU7HG1"
+
+
+def _format_bits(matrix):
+    """Level and mask read back from the first copy of the format information."""
+    bits = [matrix[i][8] for i in range(6)] + [matrix[7][8], matrix[8][8], matrix[8][7]] + \
+        [matrix[8][14 - i] for i in range(9, 15)]
+    value = sum(1 << i for i, dark in enumerate(bits) if dark) ^ 0x5412
+    level = {bits: name for name, bits in qr_code.ERROR_CORRECTION.items()}[value >> 13]
+    return level, (value >> 10) & 7
+
+
+def test_capacity_matches_the_standard():
+    # data codewords of ISO/IEC 18004 table 7
+    expected = {(1, "L"): 19, (1, "H"): 9, (2, "M"): 28, (5, "Q"): 62, (10, "M"): 216,
+                (20, "H"): 385, (40, "L"): 2956, (40, "M"): 2334, (40, "Q"): 1666, (40, "H"): 1276}
+    assert {key: qr_code.data_codewords(*key) for key in expected} == expected
+
+
+def test_encode_structure():
+    matrix = qr_code.encode(URL)
+    assert len(matrix) == 29                      # version 3 holds 36 bytes at level M
+    finder = [[True] * 7, [True, False, False, False, False, False, True]]
+    assert matrix[0][:7] == matrix[0][-7:] == matrix[-7][:7] == finder[0]
+    assert matrix[1][:7] == finder[1]
+    assert [matrix[6][x] for x in range(8, 21)] == [x % 2 == 0 for x in range(8, 21)]
+    assert matrix[len(matrix) - 8][8]             # dark module
+
+    for level in "LMQH":
+        for mask in (0, 5):
+            assert _format_bits(qr_code.encode(URL, level, mask)) == (level, mask)
+
+    assert len(qr_code.encode("x" * 200, "H")) > len(qr_code.encode("x" * 200, "L"))
+    with pytest.raises(qr_code.QrCodeError):
+        qr_code.encode("x" * 3000)
+
+
+def test_png_and_svg():
+    matrix = qr_code.encode(URL)
+    png = qr_code.to_png(matrix, scale=2, border=4)
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+    width, height = struct.unpack(">II", png[16:24])
+    assert width == height == (29 + 8) * 2
+    idat_length = struct.unpack(">I", png[33:37])[0]
+    pixels = zlib.decompress(png[41:41 + idat_length])
+    assert len(pixels) == height * (width + 1)
+    row = pixels[8 * (width + 1):9 * (width + 1)]  # first row of modules
+    assert row[1 + 8:1 + 10] == b"\x00\x00" and row[1:1 + 8] == b"\xff" * 8
+
+    svg = qr_code.to_svg(matrix, scale=8)
+    assert 'viewBox="0 0 37 37"' in svg and svg.count("h1v1h-1z") == sum(map(sum, matrix))
+
+
+def test_cache_renders_once_and_follows_updates(tmp_path, monkeypatch):
+    cache = QrImageCache(str(tmp_path))
+    assert cache.image("CODE1", "png") is None
+
+    annotated = cache.annotate({"data": [{"code": "CODE1", "prefilled_message": "Hi", "deep_link_url": URL}]})
+    assert annotated["data"][0]["qr_images"] == {"png": "qr://CODE1.png", "svg": "qr://CODE1.svg"}
+    first_key = cache.current_key("CODE1")
+
+    png = cache.image("CODE1", "png")
+    assert png == qr_code.to_png(qr_code.encode(URL))
+    monkeypatch.setattr("app.services.qr_images.encode", lambda *args: pytest.fail("re-rendered"))
+    assert cache.image("CODE1", "png") == png     # now a file read
+    monkeypatch.undo()
+
+    # An update moves the code to new content; the old image stays addressable by key
+    updated = cache.annotate({"deep_link_url": URL}, code="CODE1", prefilled_message="Hello")
+    assert updated["qr_images"]["png"] == "qr://CODE1.png"
+    assert cache.current_key("CODE1") != first_key
+    assert (tmp_path / "objects" / first_key[:2] / f"{first_key}.png").exists()
+
+    assert QrImageCache(str(tmp_path)).image("CODE1", "svg").startswith(b"<?xml")
+    with pytest.raises(ValueError):
+        cache.image("../etc", "png")
+    with pytest.raises(ValueError):
+        cache.image("CODE1", "gif")
+
+
+def test_qr_resources(tmp_path, monkeypatch):
+    from fastmcp import Client
+
+    from mcp_servers.direct_api_mcp.resources import qr_images
+    from mcp_servers.direct_api_mcp.tools import mcp
+
+    cache = QrImageCache(str(tmp_path))
+    cache.remember("CODE2", "Hi", URL)
+    monkeypatch.setattr(qr_images, "get_qr_image_cache", lambda: cache)
+
+    async def scenario():
+        async with Client(mcp) as client:
+            png = await client.read_resource("qr://CODE2.png")
+            svg = await client.read_resource("qr://CODE2.svg")
+            return png[0], svg[0]
+
+    png, svg = asyncio.run(scenario())
+    assert png.mime_type == "image/png"
+    assert base64.b64decode(png.blob) == cache.image("CODE2", "png")
+    assert svg.mime_type == "image/svg+xml"
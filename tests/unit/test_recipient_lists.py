@@ -0,0 +1,99 @@
+"""
+Unit tests for E.164 normalisation (app.utils.phone_numbers) and recipient
+list cleaning (app.services.recipient_lists).
+"""
+import csv
+
+import pytest
+
+from app.services.recipient_lists import clean_recipient_list, iter_recipients
+from app.services.suppression import SuppressionList
+from app.utils.phone_numbers import to_e164
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("+91 98000-00001", ("919800000001", None)),
+    ("09800000001", ("919800000001", None)),
+    ("9800000001", ("919800000001", None)),
+    ("919800000001", ("919800000001", None)),
+    ("0091 98000 00001", ("919800000001", None)),
+    ("+1 (415) 555-2671", ("14155552671", None)),
+    ("+999 1234567890", ("9991234567890", None)),
+    ("+91 98000 0001", (None, "invalid length")),
+    ("98000abc01", (None, "invalid characters")),
+    ("  ", (None, "empty")),
+])
+def test_to_e164(value, expected):
+    assert to_e164(value, "91") == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("6591234567", "6591234567"),           # not a national number of the default country
+    ("4930123456", "4930123456"),
+    ("919800000001", "919800000001"),
+    ("09800000001", "919800000001"),
+    ("98000 00001", "919800000001"),
+    ("+65 9123 4567", "6591234567"),
+])
+def test_to_e164_bare_digits_international(value, expected):
+    assert to_e164(value, "91", bare_digits_international=True) == (expected, None)
+
+
+def _write(path, rows):
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+
+def test_clean_recipient_list(tmp_path, monkeypatch):
+    source = tmp_path / "campaign.csv"
+    _write(source, [
+        ("Name", "Mobile Number"),
+        ("Asha", "+91 98000 00001"),
+        ("Ravi", "09800000002"),
+        ("Asha again", "919800000001"),
+        ("Junk", "call me"),
+        ("", ""),
+        ("Opted out", "9800000003"),
+        ("Short", "12345"),
+    ])
+    suppression = SuppressionList()
+    suppression.add(["919800000003"])
+    monkeypatch.setattr("app.services.suppression._suppression_list", suppression)
+
+    report = clean_recipient_list(str(source))
+
+    assert (report.rows, report.valid, report.duplicates, report.invalid, report.suppressed,
+            report.recipients) == (6, 4, 1, 2, 1, 2)
+    assert list(iter_recipients(report.output_path)) == ["919800000001", "919800000002"]
+    assert report.invalid_sample == [
+        {"line": 5, "value": "call me", "reason": "invalid characters"},
+        {"line": 8, "value": "12345", "reason": "invalid length"},
+    ]
+    with open(report.invalid_path) as f:
+        assert list(csv.reader(f))[1:] == [["5", "call me", "invalid characters"],
+                                          ["8", "12345", "invalid length"]]
+
+
+def test_lists_bigger_than_memory_are_sorted_externally(tmp_path):
+    source = tmp_path / "numbers.txt"
+    numbers = [f"98{i % 700:08d}" for i in range(2_000)]
+    source.write_text("\n".join(numbers) + "\n")
+
+    report = clean_recipient_list(str(source), exclude_suppressed=False, max_in_memory=100)
+
+    cleaned = list(iter_recipients(report.output_path))
+    assert report.spilled
+    assert (report.rows, report.duplicates, report.recipients) == (2_000, 1_300, 700)
+    assert cleaned == sorted(set(cleaned)) and len(cleaned) == 700
+    assert not list(tmp_path.glob("*.run"))
+
+
+def test_column_by_name_and_index(tmp_path):
+    source = tmp_path / "list.csv"
+    _write(source, [("id", "to"), ("1", "9800000001"), ("2", "9800000002")])
+
+    by_name = clean_recipient_list(str(source), column="to", exclude_suppressed=False)
+    by_index = clean_recipient_list(str(source), column="1", exclude_suppressed=False)
+    assert by_name.recipients == by_index.recipients == 2
+    with pytest.raises(ValueError):
+        clean_recipient_list(str(source), column="phone", exclude_suppressed=False)
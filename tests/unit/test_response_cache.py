@@ -0,0 +1,145 @@
+"""
+Unit tests for cached lookups with stale serving in app.services.response_cache.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from app.services.response_cache import CachePolicy, ResponseCache, response_caches  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_patch_client import (  # noqa: E402
+    AiSensyDirectApiPatchClient)
+from tests.mock_aisensy import MockAiSensyServer, MockProfile  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+POLICY = CachePolicy(soft_ttl=10, hard_ttl=60, stale_if_error_ttl=600)
+SERVER_ERROR = {"success": False, "error": "Internal server error", "status_code": 500}
+NOT_FOUND = {"success": False, "error": "Resource not found", "status_code": 404}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Upstream:
+    def __init__(self):
+        self.calls = 0
+        self.answer = None
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.answer or {"success": True, "data": {"version": self.calls}}
+
+
+def test_fresh_stale_and_expired_entries():
+    async def scenario():
+        clock, upstream = _Clock(), _Upstream()
+        cache = ResponseCache("test", POLICY, clock=clock)
+        key = ("scope", (), ())
+
+        first = await cache.lookup(key, upstream.fetch)
+        clock.now = 5
+        assert await cache.lookup(key, upstream.fetch) == first
+        assert upstream.calls == 1
+
+        # Stale but valid: answered at once, refreshed in the background
+        clock.now = 20
+        assert (await cache.lookup(key, upstream.fetch))["data"]["version"] == 1
+        await asyncio.sleep(0.05)
+        assert upstream.calls == 2
+        assert (await cache.lookup(key, upstream.fetch))["data"]["version"] == 2
+
+        # Past the hard TTL while upstream fails: the old entry, flagged
+        clock.now = 100
+        upstream.answer = SERVER_ERROR
+        stale = await cache.lookup(key, upstream.fetch)
+        assert stale["stale"] is True and stale["data"]["version"] == 2
+        assert stale["age_seconds"] == 80
+
+        # Errors that are not outages are not hidden
+        upstream.answer = NOT_FOUND
+        assert await cache.lookup(key, upstream.fetch) == NOT_FOUND
+
+        clock.now = 1000
+        upstream.answer = SERVER_ERROR
+        assert await cache.lookup(key, upstream.fetch) == SERVER_ERROR
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_share_one_request():
+    async def scenario():
+        upstream = _Upstream()
+        cache = ResponseCache("test", POLICY)
+        results = await asyncio.gather(*(cache.lookup(("scope",), upstream.fetch) for _ in range(10)))
+        return upstream.calls, results
+
+    calls, results = asyncio.run(scenario())
+    assert calls == 1 and all(result["success"] for result in results)
+
+
+def test_clients_cache_per_scope_and_writes_invalidate():
+    response_caches.reset()
+
+    async def scenario():
+        async with MockAiSensyServer() as mock:
+            token = make_token()
+            clients = [AiSensyDirectApiGetClient(_token=token, BASE_URL=mock.direct_base_url)
+                       for _ in range(2)]
+            patch = AiSensyDirectApiPatchClient(_token="", BASE_URL=mock.direct_base_url)
+            patch._auth = clients[0]._auth
+            try:
+                for client in clients:
+                    assert (await client.get_business_info())["success"]
+                    await client.get_business_info()
+
+                await clients[0].get_profile()
+                await clients[0].get_profile()
+                assert (await patch.update_business_profile_details(whatsapp_about="hi"))["success"]
+                await clients[0].get_profile()
+            finally:
+                for client in (*clients, patch):
+                    await client.close()
+            return mock.mock
+
+    try:
+        mock = asyncio.run(scenario())
+    finally:
+        response_caches.reset()
+
+    # Each client has its own token store, hence its own scope
+    assert mock.requests["get_business_info"] == 2
+    assert mock.requests["get_profile"] == 2
+
+
+def test_outage_is_served_from_the_cache():
+    response_caches.reset()
+    clock = _Clock()
+
+    async def scenario():
+        async with MockAiSensyServer() as mock:
+            client = AiSensyDirectApiGetClient(_token=make_token(), BASE_URL=mock.direct_base_url)
+            response_caches.get("get_business_info").clock = clock
+            try:
+                fresh = await client.get_business_info()
+                mock.mock.endpoint_profiles["get_business_info"] = MockProfile(error_rate=1.0)
+                clock.now = 3600 * 0.5
+                during_outage = await client.get_business_info()
+            finally:
+                await client.close()
+            return fresh, during_outage
+
+    try:
+        fresh, during_outage = asyncio.run(scenario())
+    finally:
+        response_caches.reset()
+
+    assert during_outage["stale"] is True
+    assert during_outage["data"] == fresh["data"]
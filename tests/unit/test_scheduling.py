@@ -0,0 +1,111 @@
+"""
+Unit tests for request priorities: app.services.scheduling and the
+priority-aware waiting of app.services.concurrency.
+"""
+import asyncio
+import time
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from app.services.concurrency import AdaptiveLimiter, LimiterConfig, concurrency_limiters  # noqa: E402
+from app.services.scheduling import (BULK, INTERACTIVE, NORMAL, PRIORITIES, FairQueue,  # noqa: E402
+                                     request_priority)
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from tests.mock_aisensy import Latency, MockAiSensyServer, MockProfile  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+
+def _fixed(limit):
+    return LimiterConfig(initial_limit=limit, min_limit=limit, max_limit=limit,
+                         interactive_reserve=0.25)
+
+
+def test_fair_queue_shares_dequeues_by_weight():
+    queue = FairQueue()
+    for priority in PRIORITIES:
+        for i in range(40):
+            queue.push(priority, (priority, i))
+
+    served = Counter(queue.pop(PRIORITIES)[0] for _ in range(24))
+    assert served == {INTERACTIVE: 16, NORMAL: 6, BULK: 2}
+    # Order within a class is kept, and ineligible classes are skipped
+    assert queue.pop([BULK]) == (BULK, 2)
+    assert queue.pop([]) is None
+
+
+def test_idle_class_does_not_bank_credit():
+    queue = FairQueue()
+    for i in range(20):
+        queue.push(BULK, i)
+    for _ in range(20):
+        queue.pop(PRIORITIES)
+    queue.push(BULK, "bulk")
+    queue.push(NORMAL, "normal")
+    # Normal was idle while bulk was served alone: it starts from the current virtual time
+    assert queue.pop(PRIORITIES) == "normal"
+
+
+def test_reserved_slots_admit_interactive_requests_at_once():
+    async def scenario():
+        limiter = AdaptiveLimiter("test", _fixed(4))
+        for _ in range(3):
+            assert await limiter.acquire(BULK) == 0.0
+        bulk = asyncio.create_task(limiter.acquire(BULK))
+        await asyncio.sleep(0)
+        assert not bulk.done()  # the fourth slot is reserved
+
+        await limiter.acquire(INTERACTIVE)
+        assert limiter.in_flight == 4
+        with request_priority(INTERACTIVE):
+            interactive = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        limiter.release()
+        await asyncio.sleep(0)
+        # The freed slot goes to the interactive waiter; bulk stays over its share
+        assert interactive.done() and not bulk.done()
+        limiter.release()
+        limiter.release()
+        await bulk
+
+    asyncio.run(scenario())
+
+
+def test_interactive_calls_stay_fast_during_a_bulk_job():
+    concurrency_limiters.reset(_fixed(4))
+
+    async def scenario():
+        profile = MockProfile(latency=Latency.parse("constant:20"))
+        async with MockAiSensyServer(profile) as mock:
+            client = AiSensyDirectApiGetClient(_token=make_token(), BASE_URL=mock.direct_base_url)
+
+            async def bulk_job():
+                with request_priority(BULK):
+                    return await asyncio.gather(*(client.get_flows() for _ in range(150)))
+
+            try:
+                job = asyncio.create_task(bulk_job())
+                await asyncio.sleep(0.1)
+                latencies = []
+                with request_priority(INTERACTIVE):
+                    for _ in range(5):
+                        start = time.perf_counter()
+                        assert (await client.get_templates())["success"]
+                        latencies.append(time.perf_counter() - start)
+                job_running = not job.done()
+                results = await job
+            finally:
+                await client.close()
+            return latencies, job_running, results
+
+    try:
+        latencies, job_running, results = asyncio.run(scenario())
+    finally:
+        concurrency_limiters.reset()
+
+    assert job_running and all(result["success"] for result in results)
+    # 150 bulk calls over 3 slots take ~1s; interactive calls skip that queue
+    assert max(latencies) < 0.25
@@ -0,0 +1,104 @@
+"""
+Unit tests for the opt-out / suppression list (app.services.suppression).
+"""
+import asyncio
+import threading
+
+from app.services import suppression
+from app.services.suppression import BloomFilter, SuppressionList, suppressed_send
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    members = [f"9198{i:08d}" for i in range(10_000)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    false_positives = sum(f"9197{i:08d}" in bloom for i in range(10_000))
+    assert false_positives < 300
+
+
+def test_membership_filter_and_removal():
+    numbers = SuppressionList(capacity=100)
+    assert numbers.add(["+91 98000-00001", "919800000002", "919800000002", "n/a"]) == 2
+    assert numbers.add(["919800000001"]) == 0
+
+    assert "919800000001" in numbers
+    assert "919800000003" not in numbers
+    assert numbers.filter(["919800000003", "+919800000001", "919800000002", "919800000003"]) == (
+        ["919800000003"], ["919800000001", "919800000002"])
+
+    assert numbers.remove(["919800000001", "919800000009"]) == 1
+    # Still set in the filter, answered by the exact set
+    assert "919800000001" not in numbers
+    assert numbers.entry("919800000002")["reason"] == "opt_out"
+
+
+def test_filter_grows_past_its_capacity():
+    numbers = SuppressionList(capacity=10)
+    numbers.add(f"9198{i:08d}" for i in range(2_500))
+
+    assert numbers._bloom.capacity >= 2_500
+    assert len(numbers) == 2_500
+    allowed, suppressed = numbers.filter(f"9198{i:08d}" for i in range(2_000, 3_000))
+    assert len(allowed) == len(suppressed) == 500
+
+
+def test_import_export_and_restart(tmp_path):
+    path = str(tmp_path / "suppression.sqlite3")
+    source = tmp_path / "optouts.csv"
+    source.write_text("phone,name\n+91 98000 00001,Asha\n919800000002,Ravi\n\n")
+
+    first = SuppressionList(path)
+    other_process = SuppressionList(path, refresh_seconds=0)
+    assert first.import_file(str(source)) == 2
+    first.add(["919800000003"], reason="complaint")
+    # Numbers added by another process reach this one's filter
+    assert "919800000003" in other_process
+    first.close()
+
+    restarted = SuppressionList(path)
+    assert restarted._load_bloom() is not None
+    assert "919800000001" in restarted and "919800000003" in restarted
+
+    target = tmp_path / "export.csv"
+    assert restarted.export_file(str(target)) == 3
+    lines = target.read_text().splitlines()
+    assert lines[0] == "number,reason,added_at"
+    assert lines[3].startswith("919800000003,complaint,")
+
+
+def test_suppressed_send(monkeypatch):
+    numbers = SuppressionList()
+    numbers.add(["919800000001"])
+    monkeypatch.setattr(suppression, "_suppression_list", numbers)
+
+    refused = asyncio.run(suppressed_send("+91 98000 00001", "send_message"))
+    assert refused == {"success": False, "suppressed": True,
+                       "error": "919800000001 has opted out of messages; nothing was sent"}
+    assert asyncio.run(suppressed_send("919800000002", "send_message")) is None
+
+
+def test_list_is_opened_and_queried_off_the_event_loop(monkeypatch, tmp_path):
+    opened_on, queried_on = [], []
+
+    def opened():
+        opened_on.append(threading.get_ident())
+        return SuppressionList(str(tmp_path / "suppression.sqlite3"), refresh_seconds=0)
+
+    monkeypatch.setattr(suppression, "_suppression_list", None)
+    monkeypatch.setattr(SuppressionList, "from_settings", staticmethod(opened))
+    stored = SuppressionList._stored
+    monkeypatch.setattr(SuppressionList, "_stored",
+                        lambda self, key: queried_on.append(threading.get_ident()) or stored(self, key))
+
+    async def scenario():
+        numbers = await suppression.load_suppression_list()
+        numbers.add(["919800000001"])
+        return threading.get_ident(), await numbers.contains("919800000001"), \
+            await numbers.contains("919800000002")
+
+    loop_thread, hit, miss = asyncio.run(scenario())
+    assert (hit, miss) == (True, False)
+    assert opened_on and queried_on and loop_thread not in opened_on + queried_on
@@ -0,0 +1,134 @@
+"""
+Unit tests for the template renderer (app.services.template_renderer).
+"""
+import csv
+
+import pytest
+
+from app.services.suppression import SuppressionList
+from app.services.template_renderer import (TemplateCompileError, compile_template,
+                                            compiled_template, iter_payloads, render_rows,
+                                            render_template_file)
+from tests.mock_aisensy import payloads
+
+PROMO = {
+    "name": "promo",
+    "language": "en_US",
+    "status": "APPROVED",
+    "components": [
+        {"type": "HEADER", "format": "IMAGE"},
+        {"type": "BODY", "text": "Hi {{1}}, use {{2}} before {{2}} expires"},
+        {"type": "BUTTONS", "buttons": [
+            {"type": "QUICK_REPLY", "text": "Stop"},
+            {"type": "URL", "text": "Shop", "url": "https://shop.test/{{1}}"},
+            {"type": "COPY_CODE", "example": "SAVE10"},
+        ]},
+    ],
+}
+
+
+def test_compile_the_mock_template():
+    compiled = compile_template(payloads.template())
+
+    assert compiled.columns == ("header_1", "body_1", "body_2", "body_3")
+    payload = compiled.render("919800000001", {"header_1": "#42", "body_1": "Asha",
+                                               "body_2": "#42", "body_3": "Monday"})
+    assert payload == {
+        "messaging_product": "whatsapp", "recipient_type": "individual",
+        "to": "919800000001", "type": "template",
+        "template": {"name": "order_update_7890", "language": {"code": "en"}, "components": [
+            {"type": "header", "parameters": [{"type": "text", "text": "#42"}]},
+            {"type": "body", "parameters": [{"type": "text", "text": "Asha"},
+                                            {"type": "text", "text": "#42"},
+                                            {"type": "text", "text": "Monday"}]},
+        ]},
+    }
+
+
+def test_media_header_and_buttons():
+    compiled = compile_template(PROMO)
+    assert compiled.columns == ("header_image", "body_1", "body_2", "button_1", "button_2")
+
+    components = compiled.render("919800000001", {
+        "header_image": "https://cdn.test/a.png", "body_1": "Asha", "body_2": "SAVE10",
+        "button_1": "asha", "button_2": "SAVE10"})["template"]["components"]
+    assert components[0] == {"type": "header", "parameters": [
+        {"type": "image", "image": {"link": "https://cdn.test/a.png"}}]}
+    assert components[2] == {"type": "button", "sub_type": "url", "index": "1",
+                             "parameters": [{"type": "text", "text": "asha"}]}
+    assert components[3]["parameters"] == [{"type": "coupon_code", "coupon_code": "SAVE10"}]
+
+
+def test_named_parameters():
+    compiled = compile_template({"name": "welcome", "parameter_format": "NAMED", "components": [
+        {"type": "BODY", "text": "Hi {{first_name}}, welcome to {{ shop }}"}]})
+    body = compiled.render("919800000001", {"body_first_name": "Asha", "body_shop": "Mock"})
+    assert body["template"]["components"][0]["parameters"] == [
+        {"type": "text", "text": "Asha", "parameter_name": "first_name"},
+        {"type": "text", "text": "Mock", "parameter_name": "shop"}]
+
+
+@pytest.mark.parametrize("template", [
+    {**PROMO, "status": "REJECTED"},
+    {"name": "gap", "components": [{"type": "BODY", "text": "{{1}} and {{3}}"}]},
+    {"name": "where", "components": [{"type": "HEADER", "format": "LOCATION"}]},
+])
+def test_unsendable_templates(template):
+    with pytest.raises(TemplateCompileError):
+        compile_template(template)
+
+
+def test_bad_rows_are_rejected():
+    compiled = compiled_template(PROMO)
+    assert compiled_template(dict(PROMO)) is compiled
+    good = {"to": "9800000001", "header_image": "4490", "body_1": "Asha", "body_2": "X",
+            "button_1": "a", "button_2": "SAVE10"}
+    rows = [
+        good,
+        {**good, "to": "12"},
+        {**good, "body_1": "two\nlines"},
+        {**good, "body_2": ""},
+        {**good, "header_image": "a.png"},
+        {**good, "button_2": "X" * 16},
+    ]
+
+    results = list(render_rows(compiled, rows, default_country="91"))
+
+    assert results[0][0]["template"]["components"][0]["parameters"][0]["image"] == {"id": "4490"}
+    assert [(error.column, error.reason) for _, error in results[1:]] == [
+        ("to", "invalid length"),
+        ("body_1", "contains new lines, tabs or more than 4 consecutive spaces"),
+        ("body_2", "missing value"),
+        ("header_image", "must be a media link (http/https) or media id"),
+        ("button_2", "longer than 15 characters"),
+    ]
+
+
+def test_render_template_file(tmp_path, monkeypatch):
+    compiled = compile_template(payloads.template())
+    source = tmp_path / "campaign.csv"
+    with open(source, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["to", "header_1", "body_1", "body_2", "body_3", "notes"])
+        writer.writerow(["+91 98000 00001", "#1", "Asha", "#1", "Mon", ""])
+        writer.writerow(["9800000002", "#2", "Ravi", "#2", "", "no date"])
+        writer.writerow(["9800000003", "#3", "Opted", "#3", "Tue", ""])
+        writer.writerow(["9800000004", "#4", "Meera", "#4", "Wed", ""])
+    suppression = SuppressionList()
+    suppression.add(["919800000003"])
+
+    monkeypatch.setattr("app.services.suppression._suppression_list", suppression)
+
+    report = render_template_file(compiled, str(source))
+
+    assert (report.rows, report.rendered, report.rejected) == (4, 2, 2)
+    assert [p["to"] for p in iter_payloads(report.output_path)] == ["919800000001", "919800000004"]
+    assert report.rejected_sample == [
+        {"line": 3, "to": "9800000002", "column": "body_3", "reason": "missing value"},
+        {"line": 4, "to": "9800000003", "column": "to", "reason": "opted out"},
+    ]
+
+    with open(source, "w") as f:
+        f.write("to,body_1\n9800000001,Asha\n")
+    with pytest.raises(ValueError, match="header_1, body_2, body_3"):
+        render_template_file(compiled, str(source), exclude_suppressed=False)
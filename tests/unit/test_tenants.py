@@ -0,0 +1,161 @@
+"""
+Unit tests for multi-tenant clients: app.services.tenant_service, the
+tenant-aware client managers and app.api.middleware.tenant.
+"""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from fastmcp import Client, FastMCP  # noqa: E402
+
+from app.api.middleware.tenant import register_tenancy  # noqa: E402
+from app.services import tenant_service  # noqa: E402
+from app.services.tenant_service import Tenant, TenantRegistry, UnknownTenantError  # noqa: E402
+from mcp_servers.direct_api_mcp.clients.direct_api_client_manager import (  # noqa: E402
+    BaseDirectApiClientManager)
+from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient  # noqa: E402
+from tests.mock_aisensy import MockAiSensyServer  # noqa: E402
+from tests.mock_aisensy.payloads import make_token  # noqa: E402
+
+DEFAULT = Tenant("default", partner_id="partner", business_id="biz-0", api_key="key")
+TENANTS = {"acme": {"business_id": "biz-acme"},
+           "globex": {"partner_id": "partner-2", "business_id": "biz-globex"}}
+
+
+@pytest.fixture
+def tenants_file(tmp_path, monkeypatch):
+    path = tmp_path / "tenants.json"
+    path.write_text(json.dumps(TENANTS))
+    monkeypatch.setenv("TENANTS_FILE", str(path))
+    tenant_service.get_tenant_registry.cache_clear()
+    yield path
+    tenant_service.get_tenant_registry.cache_clear()
+
+
+def test_registry_inherits_default_credentials(tmp_path):
+    path = tmp_path / "tenants.json"
+    path.write_text(json.dumps(TENANTS))
+    registry = TenantRegistry.from_file(DEFAULT, str(path))
+
+    assert registry.multi_tenant and registry.ids() == ["acme", "default", "globex"]
+    assert registry.get() is DEFAULT
+    assert registry.get("acme") == Tenant("acme", "partner", "biz-acme", "key")
+    assert registry.get("globex").partner_id == "partner-2"
+    with pytest.raises(UnknownTenantError):
+        registry.get("initech")
+
+    path.write_text(json.dumps({"bad": {"password": "x"}}))
+    with pytest.raises(ValueError):
+        TenantRegistry.from_file(DEFAULT, str(path))
+
+
+class _FakeClient:
+    def __init__(self, tenant):
+        self.tenant = tenant
+        self.closed = False
+
+    @classmethod
+    def for_tenant(cls, tenant):
+        return cls(tenant)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeManager(BaseDirectApiClientManager):
+    _instance = None
+    _client_class = _FakeClient
+    _client_name = "FAKE"
+
+
+def test_manager_keeps_a_bounded_lru_of_tenant_clients():
+    async def scenario():
+        manager = _FakeManager(max_tenants=2, idle_seconds=3600)
+        a, b, c = (Tenant(name) for name in "abc")
+
+        first = await manager._ensure_client(a)
+        assert await manager._ensure_client(a) is first
+        await manager._release_client(a)
+        await manager._release_client(a)
+
+        await manager._ensure_client(b)
+        await manager._release_client(b)
+        # a is least recently used and unreferenced: evicted for capacity
+        await manager._ensure_client(c)
+        assert first.closed and list(manager._clients) == ["b", "c"]
+        await manager._release_client(c)
+
+        # Referenced tenants are never evicted, the pool overflows instead
+        await manager._ensure_client(b)
+        await manager._ensure_client(c)
+        await manager._ensure_client(a)
+        assert list(manager._clients) == ["b", "c", "a"]
+        for tenant in (a, b, c):
+            await manager._release_client(tenant)
+        # a was the only unreferenced client while the pool was over capacity
+        assert list(manager._clients) == ["b", "c"]
+
+        manager.idle_seconds = 0
+        await asyncio.sleep(0.01)
+        await manager._ensure_client(b)
+        return manager
+
+    manager = asyncio.run(scenario())
+    assert list(manager._clients) == ["b"]
+
+
+def test_tenant_clients_share_one_connector():
+    async def scenario():
+        async with MockAiSensyServer(verify_tokens=True) as mock:
+            acme = Tenant("acme-connector", bearer_token=make_token())
+            globex = Tenant("globex-connector", bearer_token=make_token(ttl_seconds=-60))
+            clients = [AiSensyDirectApiGetClient.for_tenant(t, BASE_URL=mock.direct_base_url)
+                       for t in (acme, globex)]
+            try:
+                results = [await client.get_business_info() for client in clients]
+                connectors = {id((await client._get_session()).connector) for client in clients}
+            finally:
+                for client in clients:
+                    await client.close()
+            return results, connectors, mock.mock
+
+    results, connectors, mock = asyncio.run(scenario())
+
+    assert all(result["success"] for result in results)
+    assert len(connectors) == 1
+    # Only globex's expired token needed regenerating
+    assert mock.requests["regenerate_jwt_bearer_token"] == 1
+
+
+def test_tool_calls_run_with_the_selected_tenant(tenants_file):
+    mcp = FastMCP("tenants")
+    register_tenancy(mcp)
+
+    @mcp.tool
+    async def whoami() -> dict:
+        tenant = tenant_service.current_tenant()
+        return {"tenant": tenant.tenant_id, "business_id": tenant.business_id}
+
+    async def scenario():
+        # Session state needs a session: the handshake-era protocol
+        async with Client(mcp, mode="legacy") as client:
+            tools = {tool.name: tool for tool in await client.list_tools()}
+            calls = [
+                await client.call_tool("whoami", {}),
+                await client.call_tool("whoami", {"tenant_id": "acme"}),
+                await client.call_tool("select_tenant", {"tenant_id": "globex"}),
+                await client.call_tool("whoami", {}),
+                await client.call_tool("whoami", {"tenant_id": "initech"}),
+            ]
+            return tools, [call.structured_content for call in calls]
+
+    tools, (default, acme, selected, session, unknown) = asyncio.run(scenario())
+
+    assert "tenant_id" in tools["whoami"].input_schema["properties"]
+    assert default["tenant"] == "default"
+    assert acme == {"tenant": "acme", "business_id": "biz-acme"}
+    assert selected["success"] and session["tenant"] == "globex"
+    assert unknown["success"] is False and "acme" in unknown["tenants"]
@@ -0,0 +1,71 @@
+"""
+Unit tests for the OpenTelemetry span chain in app.services.tracing_service.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from app.services import tracing_service  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def memory_tracing():
+    assert tracing_service.setup_tracing("unit-tests", exporter="memory", sample_ratio=1.0)
+    yield
+    tracing_service._tracer = None
+    tracing_service._memory_exporter = None
+
+
+def _spans_by_name():
+    return {s.name: s for s in tracing_service.get_finished_spans()}
+
+
+def test_span_is_noop_when_disabled(monkeypatch):
+    monkeypatch.setattr(tracing_service, "_tracer", None)
+    with tracing_service.span("anything") as s:
+        assert s is None
+
+
+def test_tool_validation_client_and_http_spans_are_nested(memory_tracing):
+    from mcp_servers.direct_api_mcp.clients.direct_api_get_client import AiSensyDirectApiGetClient
+    from mcp_servers.direct_api_mcp.models import TemplateIdRequest
+
+    received_headers = {}
+
+    async def handler(request):
+        received_headers.update(request.headers)
+        return web.json_response({"id": request.match_info["template_id"]})
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/get-template/{template_id}", handler)
+        async with TestServer(app) as server:
+            client = AiSensyDirectApiGetClient(BASE_URL=str(server.make_url("")).rstrip("/"),
+                                               _token="test")
+            try:
+                with tracing_service.span("tool get_template_by_id"):
+                    request = TemplateIdRequest(template_id="tpl-1")
+                    return await client.get_template_by_id(template_id=request.template_id)
+            finally:
+                await client.close()
+
+    result = asyncio.run(scenario())
+
+    assert result["success"] is True
+    spans = _spans_by_name()
+    tool = spans["tool get_template_by_id"]
+    validate = spans["validate TemplateIdRequest"]
+    method = spans["direct_api.get_template_by_id"]
+    http = spans["HTTP GET"]
+
+    assert validate.parent.span_id == tool.context.span_id
+    assert method.parent.span_id == tool.context.span_id
+    assert http.parent.span_id == method.context.span_id
+    assert http.attributes["http.response.status_code"] == 200
+    assert format(http.context.trace_id, "032x") in received_headers["traceparent"]
@@ -0,0 +1,113 @@
+"""
+Unit tests for the partner-wide WCC usage rollup (app.services.wcc_rollup).
+"""
+import asyncio
+import csv
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services import wcc_rollup
+from app.services.scheduling import BULK, current_priority
+from app.services.wcc_rollup import (METRIC_NAMES, WccRollup, WccUsageCache, export_table, month_range,
+                                     monthly_usage, rollup)
+
+NOW = datetime(2024, 6, 10, tzinfo=timezone.utc).timestamp()
+
+
+def _day(date, chats=10, credit=1.5):
+    return {"dayDate": date, "totalChatCount": chats, "sentChatCount": chats, "centralBalanceUsedCount": credit,
+            "mcCentralBalanceMetrics": {"count": 2, "creditUsage": 1.0}}
+
+
+class UsageSource:
+    """Eight projects in two businesses with usage from April to June 2024."""
+
+    def __init__(self):
+        self.days = [_day(f"2024-{month:02d}-{day:02d}") for month in (4, 5) for day in range(1, 31)]
+        self.days += [_day(f"2024-06-{day:02d}") for day in range(1, 10)]
+        self.calls = []
+        self.in_flight = self.peak = 0
+        self.priorities = set()
+
+    def tenants(self):
+        return ["acme"]
+
+    async def projects(self, tenant, slots):
+        return [{"id": f"prj-{i}", "business_id": f"biz-{i % 2}"} for i in range(8)]
+
+    async def wcc_usage(self, tenant, project_id):
+        self.calls.append(project_id)
+        self.priorities.add(current_priority())
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [dict(day) for day in self.days]
+
+
+def test_monthly_usage_and_rollup():
+    months = monthly_usage([_day("2024-05-01"), _day("2024-05-02", chats=5), _day("2024-06-01"), {"dayDate": None}])
+    assert sorted(months) == ["2024-05", "2024-06"]
+    days, values = months["2024-05"]
+    assert days == 2 and values[METRIC_NAMES.index("total_chats")] == 15
+    assert values[METRIC_NAMES.index("mc_credit_used")] == 2.0
+
+    usage = [({"project_id": f"prj-{i}", "business_id": "biz"}, month, value)
+             for i in range(3) for month, value in months.items()]
+    by_month = rollup(usage)
+    assert [row["month"] for row in by_month.rows()] == ["2024-05", "2024-06"]
+    assert by_month.rows()[0]["total_chats"] == 45 and by_month.rows()[0]["days"] == 6
+    assert by_month.totals()["credit_used"] == 13.5
+    assert len(rollup(usage, ["project", "business"])) == 6
+    with pytest.raises(ValueError):
+        rollup(usage, ["planet"])
+
+    assert month_range("2023-11", "2024-02") == ["2023-11", "2023-12", "2024-01", "2024-02"]
+    with pytest.raises(ValueError):
+        month_range("2024-03", "2024-01")
+
+
+def test_closed_months_are_never_refetched(tmp_path):
+    source = UsageSource()
+    rollup_engine = WccRollup(source, WccUsageCache(str(tmp_path)), concurrency=3, clock=lambda: NOW)
+    assert rollup_engine.last_closed_month() == "2024-05"
+    assert not WccRollup(source, None, close_days=12, clock=lambda: NOW).closed("2024-05")
+
+    table, summary = asyncio.run(rollup_engine.report("2024-04", "2024-05", ["business"]))
+    assert 1 < source.peak <= 3 and source.priorities == {BULK}
+    assert summary["projects_fetched"] == 8 and summary["open_months"] == []
+    assert [(row["month"], row["business_id"], row["total_chats"]) for row in table.rows()] == [
+        ("2024-04", "biz-0", 1200), ("2024-04", "biz-1", 1200), ("2024-05", "biz-0", 1200), ("2024-05", "biz-1", 1200)]
+
+    source.calls.clear()
+    _, summary = asyncio.run(rollup_engine.report("2024-01", "2024-05"))
+    assert source.calls == [] and summary["projects_from_cache"] == 8
+
+    # The open month is always fetched, and so is everything on refresh
+    table, summary = asyncio.run(rollup_engine.report())
+    assert summary["months"] == ["2024-06"] and summary["open_months"] == ["2024-06"]
+    assert len(source.calls) == 8 and table.rows()[0]["days"] == 8 * 9
+    asyncio.run(rollup_engine.report("2024-04", refresh=True))
+    assert len(source.calls) == 16
+
+
+def test_export(tmp_path, monkeypatch):
+    usage = [({"project_id": "prj-1", "business_id": None}, "2024-05", monthly_usage([_day("2024-05-01")])["2024-05"])]
+    table = rollup(usage, ["project"])
+
+    written = export_table(table, str(tmp_path / "usage"), "csv")
+    assert written["format"] == "csv" and written["rows"] == 1
+    with open(written["path"], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["project_id"] == "prj-1" and float(rows[0]["total_chats"]) == 10
+
+    monkeypatch.setattr(wcc_rollup, "_pyarrow", lambda: None)
+    assert export_table(table, str(tmp_path / "auto"))["format"] == "csv"
+    with pytest.raises(ValueError):
+        export_table(table, str(tmp_path / "usage"), "parquet")
+    monkeypatch.undo()
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    written = export_table(table, str(tmp_path / "usage"), "parquet")
+    assert pq.read_table(written["path"]).column("total_chats").to_pylist() == [10.0]
@@ -0,0 +1,164 @@
+"""
+Unit tests for webhook ingestion (app.services.webhook_service, the
+receiver in app.api.v1.endpoints.webhooks and WebhookEventRepository).
+"""
+import asyncio
+import hashlib
+import hmac
+
+import pytest
+
+from app.services.webhook_service import WebhookBuffer, parse_events, signature_valid
+
+PAYLOAD = {
+    "object": "whatsapp_business_account",
+    "entry": [{
+        "id": "waba-1",
+        "changes": [{
+            "field": "messages",
+            "value": {
+                "metadata": {"phone_number_id": "pn-1"},
+                "contacts": [{"wa_id": "919800000001", "profile": {"name": "Asha"}}],
+                "messages": [
+                    {"id": "wamid.in1", "from": "919800000001", "timestamp": "1700000100",
+                     "type": "text", "text": {"body": "hello"}},
+                    {"id": "wamid.in2", "from": "919800000001", "timestamp": "1700000200",
+                     "type": "interactive",
+                     "interactive": {"type": "button_reply", "button_reply": {"id": "b1", "title": "Yes"}}},
+                ],
+                "statuses": [
+                    {"id": "wamid.out1", "status": "sent", "timestamp": "1700000000",
+                     "recipient_id": "919800000001", "conversation": {"id": "conv-1"},
+                     "pricing": {"category": "utility"}},
+                    {"id": "wamid.out1", "status": "delivered", "timestamp": "1700000005"},
+                    {"status": "read", "timestamp": "1700000009"},
+                ],
+            },
+        }],
+    }],
+}
+
+
+def _sign(body: bytes, secret: str) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def test_signature_check():
+    body = b'{"entry": []}'
+    assert signature_valid(body, _sign(body, "s3cret"), "s3cret")
+    assert not signature_valid(body, _sign(body, "other"), "s3cret")
+    assert not signature_valid(body + b" ", _sign(body, "s3cret"), "s3cret")
+    assert not signature_valid(body, None, "s3cret")
+    assert not signature_valid(body, _sign(body, "s3cret")[len("sha256="):], "s3cret")
+
+
+def test_parse_events():
+    statuses, messages = parse_events(PAYLOAD)
+
+    assert [(row["message_id"], row["status"], row["timestamp"]) for row in statuses] == [
+        ("wamid.out1", "sent", 1700000000), ("wamid.out1", "delivered", 1700000005)]
+    assert statuses[0]["conversation_id"] == "conv-1"
+    assert statuses[0]["pricing_category"] == "utility"
+    assert statuses[1]["phone_number_id"] == "pn-1"
+    assert [(row["message_id"], row["text"], row["contact_name"]) for row in messages] == [
+        ("wamid.in1", "hello", "Asha"), ("wamid.in2", "Yes", "Asha")]
+    assert parse_events([]) == ([], [])
+
+
+def test_parse_events_skips_malformed_events():
+    value = PAYLOAD["entry"][0]["changes"][0]["value"]
+    payload = {"entry": ["waba-2", {"changes": [None, {"value": dict(
+        value,
+        contacts=[{"wa_id": "919800000001", "profile": "Asha"}],
+        statuses=value["statuses"] + ["wamid.out2", {"id": "wamid.out3", "status": "sent",
+                                                   "timestamp": "2024-01-01T00:00:00Z"}],
+        messages=value["messages"] + [{"id": "wamid.in3", "timestamp": {"seconds": 1}}],
+    )}]}]}
+
+    statuses, messages = parse_events(payload)
+
+    assert [row["message_id"] for row in statuses] == ["wamid.out1", "wamid.out1"]
+    assert [(row["message_id"], row["contact_name"]) for row in messages] == [
+        ("wamid.in1", None), ("wamid.in2", None)]
+
+
+def test_buffer_writes_in_batches_and_retries():
+    batches = []
+    failures = [True]
+
+    def writer(statuses, messages):
+        if failures and failures.pop():
+            raise RuntimeError("database is down")
+        batches.append((len(statuses), len(messages)))
+
+    statuses, messages = parse_events(PAYLOAD)
+
+    async def scenario():
+        buffer = WebhookBuffer(writer=writer, batch_size=3, flush_seconds=0.01,
+                               max_buffered=5, retry_seconds=0.01)
+        await buffer.start()
+        assert buffer.add(statuses, messages)
+        accepted_when_full = buffer.add(statuses, messages)
+        pending = buffer.pending_statuses("wamid.out1")
+        await asyncio.sleep(0.1)
+        await buffer.stop()
+        return accepted_when_full, pending, len(buffer)
+
+    accepted_when_full, pending, left = asyncio.run(scenario())
+
+    assert not accepted_when_full
+    assert [row["status"] for row in pending] == ["sent", "delivered"]
+    # The failed batch was put back and written again, oldest events first
+    assert batches == [(2, 1), (0, 1)]
+    assert left == 0
+
+
+def test_repository_on_sqlite():
+    pytest.importorskip("fastapi")
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.database.postgresql.models import InboundMessage, MessageStatusEvent
+    from app.database.postgresql.postgresql_repositories import WebhookEventRepository
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[MessageStatusEvent.__table__, InboundMessage.__table__])
+    statuses, messages = parse_events(PAYLOAD)
+    with Session(engine) as session:
+        repo = WebhookEventRepository(session=session)
+        repo.insert_batch(statuses, messages)
+        repo.insert_batch(statuses, messages)  # redelivery
+
+        assert [row.status for row in repo.status_history("wamid.out1")] == ["sent", "delivered"]
+        assert [row.message_id for row in repo.recent_inbound(limit=1)] == ["wamid.in2"]
+        assert len(repo.recent_inbound(since=1700000150)) == 1
+
+
+def test_receiver(monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api.v1.endpoints import webhooks
+
+    buffer = WebhookBuffer(writer=lambda statuses, messages: None, max_buffered=4)
+    monkeypatch.setattr(webhooks, "get_webhook_buffer", lambda: buffer)
+    monkeypatch.setenv("WEBHOOK_SECRET", "s3cret")
+    monkeypatch.setenv("WEBHOOK_VERIFY_TOKEN", "token")
+    app = FastAPI()
+    app.include_router(webhooks.router)
+    client = TestClient(app)
+
+    body = webhooks.json_backend.dumps_bytes(PAYLOAD)
+    signed = {"X-Hub-Signature-256": _sign(body, "s3cret")}
+
+    challenge = client.get("/webhooks/aisensy", params={
+        "hub.mode": "subscribe", "hub.verify_token": "token", "hub.challenge": "42"})
+    assert (challenge.status_code, challenge.text) == (200, "42")
+    assert client.get("/webhooks/aisensy", params={
+        "hub.mode": "subscribe", "hub.verify_token": "wrong", "hub.challenge": "42"}).status_code == 403
+
+    assert client.post("/webhooks/aisensy", content=body).status_code == 401
+    accepted = client.post("/webhooks/aisensy", content=body, headers=signed)
+    assert accepted.json() == {"success": True, "received": 4}
+    full = client.post("/webhooks/aisensy", content=body, headers=signed)
+    assert full.status_code == 503 and full.headers["Retry-After"] == "5"